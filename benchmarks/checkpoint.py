@@ -0,0 +1,95 @@
+"""
+Compares :meth:`Game.checkpoint <hearthbreaker.game_objects.Game.checkpoint>` and
+:meth:`Game.rollback <hearthbreaker.game_objects.Game.rollback>` with
+:meth:`Game.copy <hearthbreaker.game_objects.Game.copy>` for trying an action and undoing it, as a search would.
+
+Both players have seven minions on the board.  Each attack the current player could make is tried in turn, either on
+a copy of the game, or on the game itself followed by a rollback.  The benchmark fails unless making a checkpoint and
+rolling back to it is faster than copying the game, and trying the attacks is faster with rollbacks than with copies.
+
+Run with ``python -m benchmarks.checkpoint``
+"""
+import random
+import timeit
+
+from hearthbreaker.actions import Attack
+from hearthbreaker.agents.basic_agents import DoNothingBot
+from hearthbreaker.constants import CHARACTER_CLASS
+from hearthbreaker.game_objects import Game, Deck, card_lookup
+
+
+#: The minions each player has on the board
+MINIONS = [["Chillwind Yeti", "Boulderfist Ogre", "Stormwind Champion", "Knife Juggler", "Harvest Golem",
+            "Dire Wolf Alpha", "Sen'jin Shieldmasta"],
+           ["War Golem", "Fen Creeper", "Raid Leader", "Amani Berserker", "Scarlet Crusader", "Loot Hoarder",
+            "Water Elemental"]]
+
+
+def full_board():
+    """
+    Creates a game in which each player has seven minions which can attack.
+
+    :rtype: hearthbreaker.game_objects.Game
+    """
+    random.seed(1857)
+    decks = [Deck([card_lookup("Wisp") for i in range(0, 30)], CHARACTER_CLASS.MAGE) for i in range(0, 2)]
+    game = Game(decks, [DoNothingBot(), DoNothingBot()])
+    game.pre_game()
+    game.current_player = game.players[1]
+    game.play_single_turn()
+    game.play_single_turn()
+    game.play_single_turn()
+    for player, names in zip(game.players, MINIONS):
+        for name in names:
+            card_lookup(name).summon(player, game, len(player.minions))
+    for minion in game.current_player.minions:
+        minion.active = True
+        minion.exhausted = False
+    game.epoch += 1
+    return game
+
+
+def try_with_copies(game):
+    actions = [action for action in game.legal_actions() if isinstance(action, Attack)]
+    for index in range(0, len(actions)):
+        copied_game = game.copy()
+        [action for action in copied_game.legal_actions() if isinstance(action, Attack)][index].perform(copied_game)
+
+
+def try_with_rollback(game):
+    actions = [action for action in game.legal_actions() if isinstance(action, Attack)]
+    checkpoint = game.checkpoint()
+    # The minions are the same objects after each rollback, so the actions can be reused
+    for action in actions:
+        action.perform(game)
+        game.rollback(checkpoint)
+
+
+def per_second(functions, game, number, repeat=11):
+    # The functions are timed in turn, rather than one after the other, so that they are compared at the same speed of
+    # the machine, and the median of the times is taken, which a single fast or slow run doesn't change
+    times = [[] for function in functions]
+    for iteration in range(0, repeat):
+        for function, function_times in zip(functions, times):
+            function_times.append(timeit.timeit(lambda: function(game), number=number))
+    return [number / sorted(function_times)[repeat // 2] for function_times in times]
+
+
+def main():
+    game = full_board()
+    attacks = len([action for action in game.legal_actions() if isinstance(action, Attack)])
+    print("{0} v {1} minions, {2} attacks tried per search".format(len(game.players[0].minions),
+                                                                   len(game.players[1].minions), attacks))
+    copies, checkpoints = per_second([lambda g: g.copy(), lambda g: g.rollback(g.checkpoint())], game, 500)
+    print("{0:>28} {1:>12,.0f}".format("copies/sec", copies))
+    print("{0:>28} {1:>12,.0f}".format("checkpoint+rollback/sec", checkpoints))
+    copy_searches, rollback_searches = per_second([try_with_copies, try_with_rollback], game, 50)
+    print("{0:>28} {1:>12,.1f}".format("searches/sec with copies", copy_searches))
+    print("{0:>28} {1:>12,.1f}".format("searches/sec with rollback", rollback_searches))
+    print("{0:>28} {1:>11.2f}x".format("speedup", rollback_searches / copy_searches))
+    assert checkpoints > copies, "Making a checkpoint and rolling back to it was slower than copying the game"
+    assert rollback_searches > copy_searches, "Trying the attacks was slower with rollbacks than with copies"
+
+
+if __name__ == "__main__":
+    main()
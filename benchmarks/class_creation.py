@@ -0,0 +1,82 @@
+"""
+Counts the class objects created while simulating games.
+
+Defining a class inside a function creates a new class object each time the function is called, which is far more
+expensive than creating an instance, and leaves behind reference cycles for the garbage collector.  Once every card
+module the decks use has been imported, a game should not create any classes at all.
+
+Each hero class plays one game to warm up, and then the classes created by a further set of games are counted.
+
+Run with ``python -m benchmarks.class_creation``
+"""
+import gc
+import time
+
+from hearthbreaker.agents.basic_agents import RandomAgent
+from hearthbreaker.batch import load_deck, play_game
+from hearthbreaker.constants import CHARACTER_CLASS
+
+
+#: The hero classes whose powers are used in the measured games
+HERO_CLASSES = [CHARACTER_CLASS.DRUID, CHARACTER_CLASS.HUNTER, CHARACTER_CLASS.MAGE, CHARACTER_CLASS.PALADIN,
+                CHARACTER_CLASS.PRIEST, CHARACTER_CLASS.ROGUE, CHARACTER_CLASS.SHAMAN, CHARACTER_CLASS.WARLOCK,
+                CHARACTER_CLASS.WARRIOR]
+
+
+def count_classes():
+    """
+    :return: The number of class objects currently tracked by the garbage collector
+    """
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, type))
+
+
+def classes_created(function):
+    """
+    Counts the classes created by calling a function.  The garbage collector is disabled while it runs, so that
+    classes which are created and discarded are still counted.
+
+    :param function function: The function to call, with no arguments
+    :return: The number of class objects created
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        before = count_classes()
+        function()
+        return count_classes() - before
+    finally:
+        gc.enable()
+
+
+def play_games(deck1, deck2, seeds):
+    """
+    Plays one game between two decks for each hero class and each seed, with the first deck taking on that hero
+    class.
+
+    :param hearthbreaker.game_objects.Deck deck1: The deck whose hero class is changed
+    :param hearthbreaker.game_objects.Deck deck2: The opposing deck
+    :param list seeds: The seeds to play a game with
+    """
+    opponent = ([card.name for card in deck2.cards], deck2.character_class)
+    names = [card.name for card in deck1.cards]
+    for seed in seeds:
+        for character_class in HERO_CLASSES:
+            play_game([(names, character_class), opponent], [RandomAgent, RandomAgent], seed)
+
+
+def main():
+    deck1 = load_deck("zoo.hsdeck")
+    deck2 = load_deck("example.hsdeck")
+    warm_up = classes_created(lambda: play_games(deck1, deck2, [0]))
+    games = 10
+    start = time.time()
+    created = classes_created(lambda: play_games(deck1, deck2, range(1, games + 1)))
+    elapsed = time.time() - start
+    game_count = games * len(HERO_CLASSES)
+    print("classes created while warming up: {0}".format(warm_up))
+    print("classes created in {0} games: {1} ({2:.2f} per game)".format(game_count, created, created / game_count))
+    print("games per second: {0:.1f}".format(game_count / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Checks that copying a game costs the same however many times it has already been copied, as in the long chains of
+copies made by a tree search or by self play.
+
+The board is full of minions whose state is carried from each game to its copy by handlers and effects: permanent
+buffs from :meth:`change_attack <hearthbreaker.game_objects.Character.change_attack>`, :meth:`increase_health
+<hearthbreaker.game_objects.Character.increase_health>` and :meth:`decrease_health
+<hearthbreaker.game_objects.Character.decrease_health>`, auras, an adjacency aura, a charge aura which has charged a
+beast, and Knife Juggler.  The game is copied, then the copy is copied, and so on, and the time per copy and the
+memory still in use are measured as the chain grows.  The benchmark fails if either grows from the start of the chain
+to its end.
+
+Run with ``python -m benchmarks.copy_depth``
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from benchmarks.suite import board
+
+
+#: The minions on each side of the board.  The crocolisk and the boar are on the board before the rhino, so that its
+#: charge aura charges them as it is applied.
+MINIONS = [["River Crocolisk", "Stonetusk Boar", "Tundra Rhino", "Dire Wolf Alpha", "Raid Leader", "Knife Juggler",
+            "Chillwind Yeti"],
+           ["Murloc Warleader", "Grimscale Oracle", "Stormwind Champion", "Sen'jin Shieldmasta"]]
+
+
+def buffed_board():
+    """
+    Creates the board copied by the benchmark, with buffs on the current player's yeti and the opponent's shieldmasta.
+
+    :rtype: hearthbreaker.game_objects.Game
+    """
+    game = board(MINIONS)
+    for minion in [game.current_player.minions[-1], game.other_player.minions[-1]]:
+        minion.change_attack(2)
+        minion.increase_health(3)
+        minion.decrease_health(1)
+        minion.change_attack(-1)
+    return game
+
+
+def copy_chain(game, generations, window, measure_memory=False):
+    """
+    Copies a game, then its copy, and so on.
+
+    :param hearthbreaker.game_objects.Game game: The game to start from
+    :param int generations: The number of copies to make
+    :param int window: The number of copies between each measurement
+    :param boolean measure_memory: If True, the memory in use is measured after each window, which slows copying
+    :return: A list with a tuple for each window, of the average time per copy in seconds, and the memory in use at
+             the end of the window in bytes, or None if memory wasn't measured
+    """
+    measurements = []
+    if measure_memory:
+        tracemalloc.start()
+    try:
+        for start in range(0, generations, window):
+            start_time = time.perf_counter()
+            for generation in range(0, window):
+                game = game.copy()
+            elapsed = (time.perf_counter() - start_time) / window
+            memory = None
+            if measure_memory:
+                gc.collect()
+                memory = tracemalloc.get_traced_memory()[0]
+            measurements.append((elapsed, memory))
+    finally:
+        if measure_memory:
+            tracemalloc.stop()
+    return measurements
+
+
+def _median(values):
+    return sorted(values)[len(values) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that copying a game doesn't slow down as copies are copied")
+    parser.add_argument("-n", "--generations", type=int, default=10000, help="the length of the chain of copies")
+    parser.add_argument("-w", "--window", type=int, default=500, help="the number of copies between measurements")
+    parser.add_argument("--time-tolerance", type=float, default=1.5,
+                        help="how many times slower the end of the chain may be than the start (default: 1.5)")
+    parser.add_argument("--memory-tolerance", type=int, default=16,
+                        help="how many bytes the memory in use may grow by per copy (default: 16)")
+    args = parser.parse_args()
+
+    timings = [elapsed for elapsed, memory in copy_chain(buffed_board(), args.generations, args.window)]
+    memory = [memory for elapsed, memory in copy_chain(buffed_board(), args.generations, args.window, True)]
+    print("{0:>12} {1:>12} {2:>14}".format("generation", "us/copy", "bytes in use"))
+    for index in range(0, len(timings)):
+        print("{0:>12} {1:>12.1f} {2:>14,}".format((index + 1) * args.window, timings[index] * 1000000,
+                                                   memory[index]))
+
+    # The first few and last few windows are compared, so that a single slow window doesn't count
+    count = max(1, len(timings) // 5)
+    start_time = _median(timings[0:count])
+    end_time = _median(timings[-count:])
+    growth = (memory[-1] - memory[0]) / (args.generations - args.window)
+    print("time per copy: {0:.1f}us at the start, {1:.1f}us at the end".format(
+        start_time * 1000000, end_time * 1000000))
+    print("memory in use grew by {0:.1f} bytes per copy".format(growth))
+    assert end_time <= start_time * args.time_tolerance, "Copying slowed down along the chain"
+    assert growth <= args.memory_tolerance, "The memory in use grew along the chain"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Measures how quickly :meth:`Game.copy <hearthbreaker.game_objects.Game.copy>` copies games in progress, and how much
+memory each copy takes.
+
+The games are played between the zoo and example decks by random agents, and copied after a number of turns, so that
+both players have minions on the board, cards in hand and cards drawn from their decks.
+
+Run with ``python -m benchmarks.game_copy``
+"""
+import random
+import timeit
+import tracemalloc
+
+from hearthbreaker.agents.basic_agents import RandomAgent
+from hearthbreaker.batch import load_deck
+from hearthbreaker.game_objects import Game, Deck, card_lookup
+
+
+def play_turns(deck1, deck2, turns, seed):
+    """
+    Plays the first turns of a seeded game.
+
+    :param hearthbreaker.game_objects.Deck deck1: The deck for the first player.  It is not modified.
+    :param hearthbreaker.game_objects.Deck deck2: The deck for the second player.  It is not modified.
+    :param int turns: The number of turns to play, unless the game ends first
+    :param int seed: The seed for the game
+    :rtype: hearthbreaker.game_objects.Game
+    """
+    random.seed(seed)
+    decks = [Deck([card_lookup(card.name) for card in deck.cards], deck.character_class) for deck in [deck1, deck2]]
+    game = Game(decks, [RandomAgent(), RandomAgent()])
+    game.pre_game()
+    game.current_player = game.players[1]
+    for turn in range(0, turns):
+        if game.game_ended:
+            break
+        game.play_single_turn()
+    return game
+
+
+def copies_per_second(game, number=500):
+    """
+    :param hearthbreaker.game_objects.Game game: The game to copy
+    :param int number: How many copies to time
+    :return: The number of copies made per second
+    """
+    elapsed = min(timeit.repeat(game.copy, number=number, repeat=5))
+    return number / elapsed
+
+
+def bytes_per_copy(game, number=100):
+    """
+    :param hearthbreaker.game_objects.Game game: The game to copy
+    :param int number: How many copies to keep while measuring
+    :return: The average amount of memory allocated for each copy, and still in use
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    copies = [game.copy() for i in range(0, number)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del copies
+    return (after - before) / number
+
+
+def main():
+    deck1 = load_deck("zoo.hsdeck")
+    deck2 = load_deck("example.hsdeck")
+    print("{0:>6} {1:>8} {2:>8} {3:>12} {4:>12}".format("turns", "minions", "hand", "copies/sec", "bytes/copy"))
+    for turns in [6, 10, 14]:
+        for seed in [1, 2, 3]:
+            game = play_turns(deck1, deck2, turns, seed)
+            minions = sum(len(player.minions) for player in game.players)
+            hand = sum(len(player.hand) for player in game.players)
+            speed = copies_per_second(game)
+            size = bytes_per_copy(game)
+            print("{0:>6} {1:>8} {2:>8} {3:>12,.0f} {4:>12,.0f}".format(turns, minions, hand, speed, size))
+
+
+if __name__ == "__main__":
+    main()
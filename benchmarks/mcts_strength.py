@@ -0,0 +1,86 @@
+"""
+Checks that :class:`~hearthbreaker.agents.mcts.MCTSAgent` plays better than
+:class:`~hearthbreaker.agents.basic_agents.RandomAgent`.
+
+The two agents play a number of seeded games with the same deck, taking turns at playing the first deck, and the
+benchmark fails unless the tree search wins significantly more of the games that aren't drawn, by a one-sided sign
+test.  The games take longer as the search is given more iterations, and the search should win more of them.
+
+Run with ``python -m benchmarks.mcts_strength``
+"""
+import argparse
+import functools
+import math
+import time
+
+from hearthbreaker.agents.basic_agents import RandomAgent
+from hearthbreaker.agents.mcts import MCTSAgent
+from hearthbreaker.batch import load_deck, play_game, WIN, LOSS
+
+
+def play_match(deck, games, iterations, rollout_turns=2, seed=0):
+    """
+    Plays games between a tree search and a random agent, with the same deck on both sides.
+
+    :param hearthbreaker.game_objects.Deck deck: The deck both agents play
+    :param int games: The number of games to play
+    :param int iterations: The number of iterations the search runs before each action
+    :param int rollout_turns: How many turns the search plays at random after the end of its turn
+    :param int seed: The seed for the first game.  Each game after it is seeded with the next number.
+    :return: A tuple of the number of games the search won, lost and drew
+    """
+    spec = ([card.name for card in deck.cards], deck.character_class)
+    wins = losses = draws = 0
+    for game_seed in range(seed, seed + games):
+        search = functools.partial(MCTSAgent, iterations=iterations, rollout_turns=rollout_turns, seed=game_seed)
+        if game_seed % 2 == 0:
+            outcome = play_game([spec, spec], [search, RandomAgent], game_seed)[0]
+        else:
+            outcome = -play_game([spec, spec], [RandomAgent, search], game_seed)[0]
+        if outcome == WIN:
+            wins += 1
+        elif outcome == LOSS:
+            losses += 1
+        else:
+            draws += 1
+    return wins, losses, draws
+
+
+def sign_test(wins, losses):
+    """
+    Finds how likely it is that a player who is no better than their opponent wins at least as many games as they
+    did, leaving out draws.
+
+    :param int wins: The number of games the player won
+    :param int losses: The number of games the player lost
+    :rtype: float
+    """
+    games = wins + losses
+    return sum(math.factorial(games) // (math.factorial(won) * math.factorial(games - won))
+               for won in range(wins, games + 1)) / 2 ** games
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that the tree search agent beats a random agent")
+    parser.add_argument("-n", "--games", type=int, default=40, help="the number of games to play (default: 40)")
+    parser.add_argument("-i", "--iterations", type=int, default=50,
+                        help="the number of iterations the search runs before each action (default: 50)")
+    parser.add_argument("-d", "--deck", default="zoo.hsdeck", help="the deck both agents play (default: zoo.hsdeck)")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="the seed for the first game (default: 0)")
+    parser.add_argument("--significance", type=float, default=0.01,
+                        help="the largest chance of the result for agents of equal strength (default: 0.01)")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    wins, losses, draws = play_match(load_deck(args.deck), args.games, args.iterations, seed=args.seed)
+    elapsed = time.perf_counter() - start_time
+    chance = sign_test(wins, losses)
+    print("{0} iterations per action, {1} games in {2:.1f} seconds".format(args.iterations, args.games, elapsed))
+    print("won {0}, lost {1}, drew {2}: {3:.1%} of decided games won".format(
+        wins, losses, draws, wins / max(1, wins + losses)))
+    print("chance of winning as many if no stronger: {0:.2g}".format(chance))
+    assert chance <= args.significance, "The tree search didn't beat the random agent"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Measures how much memory games in progress, and the objects they are made of, take up.  This is what limits how
+many games a search, such as Monte Carlo tree search, can hold at once.
+
+Each game is measured by the memory allocated for a copy of it made by
+:meth:`Game.copy <hearthbreaker.game_objects.Game.copy>`, as that is how a search holds games.  The games are played
+by random agents between the zoo and example decks, as in :mod:`benchmarks.game_copy`.  Each kind of object is
+measured by the memory allocated for many of them, as they are first created, before any functions are bound to them.
+
+To compare two versions of the code, run this with each.
+
+Run with ``python -m benchmarks.memory``
+"""
+import tracemalloc
+
+from benchmarks.game_copy import play_turns, bytes_per_copy
+from hearthbreaker.batch import load_deck
+from hearthbreaker.game_objects import card_lookup
+
+
+def bytes_each(create, number=2000):
+    """
+    :param function create: Creates one object, with no arguments
+    :param int number: How many objects to keep while measuring
+    :return: The average amount of memory allocated for each object, and still in use
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [create() for i in range(0, number)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / number
+
+
+def main():
+    deck1 = load_deck("zoo.hsdeck")
+    deck2 = load_deck("example.hsdeck")
+    game = play_turns(deck1, deck2, 10, 1)
+    player = game.players[0]
+    raptor = card_lookup("Bloodfen Raptor")
+    weapon = card_lookup("Fiery War Axe")
+
+    print("{0:>24} {1:>12}".format("object", "bytes"))
+    print("{0:>24} {1:>12,.0f}".format("card", bytes_each(lambda: card_lookup("Bloodfen Raptor"))))
+    print("{0:>24} {1:>12,.0f}".format("vanilla minion", bytes_each(lambda: raptor.create_minion(player))))
+    print("{0:>24} {1:>12,.0f}".format("minion on the board", bytes_each(lambda: player.minions[0].copy(player))))
+    print("{0:>24} {1:>12,.0f}".format("weapon", bytes_each(lambda: weapon.create_weapon(player))))
+    print("{0:>24} {1:>12,.0f}".format("player", bytes_each(lambda: player.copy(game), 200)))
+
+    print()
+    print("{0:>6} {1:>8} {2:>8} {3:>12}".format("turns", "minions", "hand", "bytes/game"))
+    for turns in [6, 10, 14]:
+        sizes = []
+        for seed in [1, 2, 3]:
+            game = play_turns(deck1, deck2, turns, seed)
+            minions = sum(len(player.minions) for player in game.players)
+            hand = sum(len(player.hand) for player in game.players)
+            size = bytes_per_copy(game)
+            sizes.append(size)
+            print("{0:>6} {1:>8} {2:>8} {3:>12,.0f}".format(turns, minions, hand, size))
+        print("{0:>6} {1:>8} {2:>8} {3:>12,.0f}".format(turns, "", "mean", sum(sizes) / len(sizes)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,438 @@
+"""
+The standard benchmarks, run together so that their results can be saved as a baseline and compared with later runs.
+
+The suite covers:
+
+ * whole games between random agents, for several matchups
+ * :meth:`Game.copy <hearthbreaker.game_objects.Game.copy>` early, midway through and late in a game
+ * :meth:`Bindable.trigger <hearthbreaker.game_objects.Bindable.trigger>` with a few and with many handlers
+ * :meth:`Game.play_card <hearthbreaker.game_objects.Game.play_card>` for representative spells, minions and weapons
+ * :meth:`Character.attack <hearthbreaker.game_objects.Character.attack>` into a board of taunt minions
+ * parsing replays in both formats, and playing them back
+
+Everything is seeded, so each benchmark does the same work on every run.  Each benchmark is timed ``repeat`` times,
+and every timing is kept as a sample of the time taken per operation.  Two runs are compared benchmark by benchmark
+with a one-sided Mann-Whitney U test on their samples: a benchmark has regressed if its samples are significantly
+slower than the baseline's, and its median is slower by more than a threshold.  The samples are only comparable
+between runs on the same machine.
+
+Run with ``python -m benchmarks.suite run -o baseline.json``, and compare a later run with it with
+``python -m benchmarks.suite compare baseline.json``
+"""
+import argparse
+import io
+import json
+import math
+import platform
+import random
+import sys
+import time
+
+from benchmarks.game_copy import play_turns
+from hearthbreaker.agents.basic_agents import RandomAgent, DoNothingBot
+from hearthbreaker.batch import load_deck, play_game
+from hearthbreaker.binary_replay import BinaryReplayWriter, BinaryReplayReader
+from hearthbreaker.constants import CHARACTER_CLASS
+from hearthbreaker.game_objects import Bindable, Game, Deck, card_lookup
+from hearthbreaker.replay import Replay, RecordingGame, SavedGame
+
+
+#: The version of the format results are saved in
+FORMAT_VERSION = 1
+
+#: The minions on each side of the board for :func:`attack_taunts`.  Every minion defending is a taunt.
+TAUNT_MINIONS = [["Chillwind Yeti", "Boulderfist Ogre", "Stormwind Champion", "Knife Juggler", "Harvest Golem",
+                  "Dire Wolf Alpha", "Amani Berserker"],
+                 ["Sen'jin Shieldmasta", "Goldshire Footman", "Frostwolf Grunt", "Ironfur Grizzly",
+                  "Booty Bay Bodyguard", "Silverback Patriarch", "Mogu'shan Warden"]]
+
+#: The cards timed by :func:`play_card`
+CARDS = ["Fireball", "Flamestrike", "Arcane Missiles", "Chillwind Yeti", "Knife Juggler", "Shattered Sun Cleric",
+         "Fiery War Axe"]
+
+
+def _decks(deck_files):
+    # The decks are given to play_game as the names of their cards and their class
+    return [([card.name for card in deck.cards], deck.character_class)
+            for deck in [load_deck(deck_file) for deck_file in deck_files]]
+
+
+def games(deck1, deck2):
+    """
+    Plays seeded games between random agents.
+
+    :param string deck1: The path of the first deck
+    :param string deck2: The path of the second deck
+    :return: A function which plays the given number of games, returning the time taken
+    """
+    deck_specs = _decks([deck1, deck2])
+
+    def run(number):
+        start = time.perf_counter()
+        for seed in range(0, number):
+            play_game(deck_specs, [RandomAgent, RandomAgent], seed)
+        return time.perf_counter() - start
+    return run
+
+
+def copy_game(turns):
+    """
+    Copies a game between the zoo and example decks after the given number of turns.
+
+    :param int turns: The number of turns played before the game is copied
+    :return: A function which copies the game the given number of times, returning the time taken
+    """
+    game = play_turns(load_deck("zoo.hsdeck"), load_deck("example.hsdeck"), turns, 1)
+
+    def run(number):
+        start = time.perf_counter()
+        for i in range(0, number):
+            game.copy()
+        return time.perf_counter() - start
+    return run
+
+
+def _handler(amount):
+    pass
+
+
+def trigger(handler_count):
+    """
+    Triggers an event with the given number of handlers.
+
+    :param int handler_count: How many handlers are bound to the event
+    :return: A function which triggers the event the given number of times, returning the time taken
+    """
+    bindable = Bindable()
+    for i in range(0, handler_count):
+        bindable.bind("damaged", _handler)
+
+    def run(number):
+        start = time.perf_counter()
+        for i in range(0, number):
+            bindable.trigger("damaged", 1)
+        return time.perf_counter() - start
+    return run
+
+
+def board(minions):
+    """
+    Creates a game with the given minions on each side of the board, in which the current player has ten mana and
+    their minions can attack.
+
+    :param list minions: Two lists of the names of the minions for each player, the current player's first
+    :rtype: hearthbreaker.game_objects.Game
+    """
+    random.seed(1857)
+    decks = [Deck([card_lookup("Wisp") for i in range(0, 30)], CHARACTER_CLASS.MAGE) for i in range(0, 2)]
+    game = Game(decks, [DoNothingBot(), DoNothingBot()])
+    game.pre_game()
+    game.current_player = game.players[1]
+    game.play_single_turn()
+    for player, names in zip(game.players, minions):
+        for name in names:
+            card_lookup(name).summon(player, game, len(player.minions))
+    for minion in game.current_player.minions:
+        minion.active = True
+        minion.exhausted = False
+    game.current_player.max_mana = 10
+    game.current_player.mana = 10
+    game.epoch += 1
+    return game
+
+
+def play_card(name):
+    """
+    Plays a card onto a board where each player has four minions.  The card is played on a fresh copy of the board
+    each time, and only playing it is timed.
+
+    :param string name: The name of the card
+    :return: A function which plays the card the given number of times, returning the time taken
+    """
+    game = board([minions[0:4] for minions in TAUNT_MINIONS])
+
+    def run(number):
+        elapsed = 0.0
+        for i in range(0, number):
+            copied_game = game.copy()
+            card = card_lookup(name)
+            copied_game.current_player.hand.append(card)
+            start = time.perf_counter()
+            copied_game.play_card(card)
+            elapsed += time.perf_counter() - start
+        return elapsed
+    return run
+
+
+def attack_taunts():
+    """
+    Attacks with a minion into a full board of taunt minions.  The attack is made on a fresh copy of the board each
+    time, and only the attack is timed.
+
+    :return: A function which makes the attack the given number of times, returning the time taken
+    """
+    game = board(TAUNT_MINIONS)
+
+    def run(number):
+        elapsed = 0.0
+        for i in range(0, number):
+            copied_game = game.copy()
+            attacker = copied_game.current_player.minions[0]
+            start = time.perf_counter()
+            attacker.attack()
+            elapsed += time.perf_counter() - start
+        return elapsed
+    return run
+
+
+def _recorded_replay():
+    # The text of the replay of a seeded game between the zoo and example decks
+    random.seed(1857)
+    game = RecordingGame([load_deck("zoo.hsdeck"), load_deck("example.hsdeck")], [RandomAgent(), RandomAgent()])
+    game.start()
+    output = io.StringIO()
+    game.replay.write_replay(output)
+    return output.getvalue()
+
+
+def parse_replay(binary):
+    """
+    Parses the replay of a whole game.
+
+    :param boolean binary: If True, the replay is in the binary format, and otherwise in the text format
+    :return: A function which parses the replay the given number of times, returning the time taken
+    """
+    text = _recorded_replay()
+    replay = Replay()
+    replay.parse_replay(io.StringIO(text))
+    output = io.BytesIO()
+    writer = BinaryReplayWriter(output)
+    writer.write_replay(replay)
+    data = output.getvalue()
+
+    def run(number):
+        start = time.perf_counter()
+        for i in range(0, number):
+            if binary:
+                BinaryReplayReader(io.BytesIO(data)).read_replay()
+            else:
+                Replay().parse_replay(io.StringIO(text))
+        return time.perf_counter() - start
+    return run
+
+
+def play_replay():
+    """
+    Plays back the replay of a whole game, including parsing it.
+
+    :return: A function which plays the replay the given number of times, returning the time taken
+    """
+    text = _recorded_replay()
+
+    def run(number):
+        start = time.perf_counter()
+        for i in range(0, number):
+            game = SavedGame(io.StringIO(text))
+            game.seek(0)
+            while not game.game_ended:
+                game.play_single_turn()
+        return time.perf_counter() - start
+    return run
+
+
+#: Each benchmark in the suite, as its name, the function which sets it up, the arguments to that function and the
+#: number of operations timed in each sample
+BENCHMARKS = [
+    ("game.zoo_v_example", games, ["zoo.hsdeck", "example.hsdeck"], 20),
+    ("game.example_v_example", games, ["example.hsdeck", "example.hsdeck"], 20),
+    ("game.zoo_v_zoo", games, ["zoo.hsdeck", "zoo.hsdeck"], 20),
+    ("copy.early", copy_game, [4], 500),
+    ("copy.mid", copy_game, [10], 200),
+    ("copy.late", copy_game, [16], 200),
+    ("trigger.1", trigger, [1], 50000),
+    ("trigger.8", trigger, [8], 20000),
+] + [("play_card.{0}".format(name), play_card, [name], 200) for name in CARDS] + [
+    ("attack.taunts", attack_taunts, [], 200),
+    ("replay.parse_text", parse_replay, [False], 100),
+    ("replay.parse_binary", parse_replay, [True], 100),
+    ("replay.playback", play_replay, [], 20),
+]
+
+
+def run_suite(repeat=10, names=None, progress=None):
+    """
+    Runs the benchmarks in the suite.  The samples are taken in rounds, one of each benchmark in each round, so that
+    anything else slowing the machine down for a while slows all of the benchmarks down alike.
+
+    :param int repeat: The number of samples to take of each benchmark
+    :param list[str] names: If given, only the benchmarks whose names start with one of these are run
+    :param function progress: Called with the name of each benchmark and its samples, once they have all been taken
+    :return: The results, in the form saved by :func:`save_results`
+    """
+    benchmarks = []
+    for name, setup, args, number in BENCHMARKS:
+        if names is None or any(name.startswith(prefix) for prefix in names):
+            run = setup(*args)
+            # The first run warms up any caches, so that every sample does the same work
+            run(1)
+            benchmarks.append((name, run, number, []))
+    for i in range(0, repeat):
+        for name, run, number, samples in benchmarks:
+            samples.append(run(number) / number)
+
+    results = {"version": FORMAT_VERSION, "python": platform.python_version(), "platform": platform.platform(),
+               "repeat": repeat, "benchmarks": {}}
+    for name, run, number, samples in benchmarks:
+        results["benchmarks"][name] = {"number": number, "samples": samples}
+        if progress is not None:
+            progress(name, samples)
+    return results
+
+
+def save_results(results, file):
+    """
+    Saves the results of a run as JSON
+
+    :param dict results: The results, as returned by :func:`run_suite`
+    :param string file: The path of the file to write
+    """
+    output = open(file, "w")
+    json.dump(results, output, indent=2, sort_keys=True)
+    output.close()
+
+
+def load_results(file):
+    """
+    :param string file: The path of the results, as saved by :func:`save_results`
+    :rtype: dict
+    """
+    results_file = open(file, "r")
+    results = json.load(results_file)
+    results_file.close()
+    if results.get("version") != FORMAT_VERSION:
+        raise ValueError("{0} is not in version {1} of the results format".format(file, FORMAT_VERSION))
+    return results
+
+
+def median(samples):
+    ordered = sorted(samples)
+    middle = len(ordered) // 2
+    if len(ordered) % 2 == 1:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def slower_probability(baseline, current):
+    """
+    The p-value of a one-sided Mann-Whitney U test of whether the current samples are slower than the baseline's,
+    using the normal approximation to the distribution of U.
+
+    :param list[float] baseline: The baseline's samples
+    :param list[float] current: The current samples
+    :return: The probability of samples at least this much slower, if the two were drawn from the same distribution
+    :rtype: float
+    """
+    u = 0.0
+    for time_taken in current:
+        for baseline_time in baseline:
+            if time_taken > baseline_time:
+                u += 1
+            elif time_taken == baseline_time:
+                u += 0.5
+    count = len(baseline) * len(current)
+    deviation = math.sqrt(count * (len(baseline) + len(current) + 1) / 12)
+    if deviation == 0:
+        return 1.0
+    z = (u - count / 2) / deviation
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+REGRESSED = "regressed"
+IMPROVED = "improved"
+UNCHANGED = "unchanged"
+
+
+def compare_results(baseline, current, alpha=0.01, threshold=0.05):
+    """
+    Compares the benchmarks two runs have in common.
+
+    :param dict baseline: The results to compare against
+    :param dict current: The results to compare
+    :param float alpha: The significance level of the test
+    :param float threshold: The fraction by which the median must have changed, as well as the change being significant
+    :return: A list of tuples of each benchmark's name, the baseline's median, the current median, the p-value of its
+             being slower, and :const:`REGRESSED`, :const:`IMPROVED` or :const:`UNCHANGED`
+    """
+    comparisons = []
+    for name in sorted(baseline["benchmarks"]):
+        if name not in current["benchmarks"]:
+            continue
+        baseline_samples = baseline["benchmarks"][name]["samples"]
+        current_samples = current["benchmarks"][name]["samples"]
+        before = median(baseline_samples)
+        after = median(current_samples)
+        p_slower = slower_probability(baseline_samples, current_samples)
+        p_faster = slower_probability(current_samples, baseline_samples)
+        if p_slower < alpha and after > before * (1 + threshold):
+            verdict = REGRESSED
+        elif p_faster < alpha and after < before * (1 - threshold):
+            verdict = IMPROVED
+        else:
+            verdict = UNCHANGED
+        comparisons.append((name, before, after, p_slower, verdict))
+    return comparisons
+
+
+def _print_samples(name, samples):
+    print("{0:<32} {1:>14.2f}".format(name, median(samples) * 1000000))
+    sys.stdout.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the standard benchmarks, or compare runs of them")
+    commands = parser.add_subparsers(dest="command")
+    run_parser = commands.add_parser("run", help="run the benchmarks, optionally saving the results")
+    run_parser.add_argument("-o", "--output", default=None, help="the file to save the results to")
+    compare_parser = commands.add_parser("compare", help="compare a run with a baseline")
+    compare_parser.add_argument("baseline", help="the results to compare against")
+    compare_parser.add_argument("current", nargs="?", default=None,
+                                help="the results to compare.  If not given, the benchmarks are run now")
+    compare_parser.add_argument("--alpha", type=float, default=0.01, help="the significance level (default: 0.01)")
+    compare_parser.add_argument("--threshold", type=float, default=0.05,
+                                help="the smallest change in the median reported (default: 0.05)")
+    for command_parser in [run_parser, compare_parser]:
+        command_parser.add_argument("-r", "--repeat", type=int, default=10,
+                                    help="the number of samples to take of each benchmark (default: 10)")
+        command_parser.add_argument("-b", "--benchmark", action="append", default=None,
+                                    help="only run the benchmarks whose names start with this.  May be repeated")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        print("{0:<32} {1:>14}".format("benchmark", "median (us)"))
+        results = run_suite(args.repeat, args.benchmark, _print_samples)
+        if args.output is not None:
+            save_results(results, args.output)
+    elif args.command == "compare":
+        baseline = load_results(args.baseline)
+        if args.current is None:
+            names = args.benchmark or list(baseline["benchmarks"])
+            current = run_suite(args.repeat, names)
+        else:
+            current = load_results(args.current)
+        print("{0:<32} {1:>14} {2:>14} {3:>8} {4:>8}  {5}".format("benchmark", "baseline (us)", "current (us)",
+                                                                  "change", "p", "verdict"))
+        regressions = 0
+        for name, before, after, p, verdict in compare_results(baseline, current, args.alpha, args.threshold):
+            print("{0:<32} {1:>14.2f} {2:>14.2f} {3:>+7.1f}% {4:>8.4f}  {5}".format(
+                name, before * 1000000, after * 1000000, (after / before - 1) * 100, p, verdict))
+            if verdict == REGRESSED:
+                regressions += 1
+        if regressions > 0:
+            print("{0} benchmarks regressed".format(regressions))
+            sys.exit(1)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Measures how many times per second :meth:`Bindable.trigger <hearthbreaker.game_objects.Bindable.trigger>` can
+dispatch an event, for a range of handler counts.
+
+The dispatch used before handlers were kept in tuples (copying the handler list on each trigger, then checking each
+handler is still in the list) is reproduced in :class:`ListBindable`, so both can be compared on the same machine.
+
+Run with ``python -m benchmarks.trigger``
+"""
+import copy
+import timeit
+
+from hearthbreaker.game_objects import Bindable
+
+
+class ListBindable(Bindable):
+    """
+    A :class:`Bindable` which dispatches events the way it did when its handlers were kept in lists
+    """
+
+    def __init__(self):
+        super().__init__()
+        # The events are changed directly, so can't start out as the shared empty events
+        self.events = {}
+
+    def bind(self, event, function):
+        self.events[event] = tuple(self.events.get(event, ()))
+        super().bind(event, function)
+        self.events[event] = list(self.events[event])
+
+    def trigger(self, event, *args):
+        if event in self.events:
+            for handler in copy.copy(self.events[event]):
+                if not handler.active and handler in self.events[event]:
+                    handler.active = True
+                    handler.function(*args)
+                    handler.active = False
+                    if handler.remove:
+                        self.events[event].remove(handler)
+                        if len(self.events[event]) == 0:
+                            del (self.events[event])
+
+
+def _handler(amount):
+    pass
+
+
+def triggers_per_second(bindable_type, handler_count, number=50000):
+    """
+    :param bindable_type: The class of :class:`Bindable` to measure
+    :param int handler_count: How many handlers are bound to the triggered event
+    :param int number: How many triggers to time
+    :return: The number of triggers dispatched per second
+    """
+    bindable = bindable_type()
+    for i in range(0, handler_count):
+        bindable.bind("damaged", _handler)
+    elapsed = min(timeit.repeat(lambda: bindable.trigger("damaged", 1), number=number, repeat=5))
+    return number / elapsed
+
+
+def main():
+    print("{0:>9} {1:>14} {2:>14} {3:>8}".format("handlers", "lists/sec", "tuples/sec", "speedup"))
+    for handler_count in [0, 1, 2, 4, 8, 16, 32]:
+        before = triggers_per_second(ListBindable, handler_count)
+        after = triggers_per_second(Bindable, handler_count)
+        print("{0:>9} {1:>14,.0f} {2:>14,.0f} {3:>7.2f}x".format(handler_count, before, after, after / before))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import argparse
+import sys
+import time
+
+from hearthbreaker.replay_check import check_replays, PASSED, DIVERGED, FAILED, NO_GOLDEN, UPDATED
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check a directory tree of replays against their goldens")
+    parser.add_argument("directory", nargs="?", default="tests/replays", help="the directory to find replays in")
+    parser.add_argument("-p", "--processes", type=int, default=None,
+                        help="the number of worker processes (default: one per CPU)")
+    parser.add_argument("-u", "--update", action="store_true",
+                        help="write the goldens from the replays, rather than checking them")
+    parser.add_argument("-q", "--quiet", action="store_true", help="only report replays which didn't pass")
+    args = parser.parse_args()
+
+    counts = dict((status, 0) for status in [PASSED, DIVERGED, FAILED, NO_GOLDEN, UPDATED])
+    start_time = time.time()
+    for result in check_replays(args.directory, args.processes, args.update):
+        counts[result.status] += 1
+        if not args.quiet or result.status not in (PASSED, UPDATED):
+            print(result)
+            sys.stdout.flush()
+
+    print("{0} replays: {1} passed, {2} diverged, {3} failed, {4} without goldens, {5} updated in {6:.2f} seconds"
+          .format(sum(counts.values()), counts[PASSED], counts[DIVERGED], counts[FAILED], counts[NO_GOLDEN],
+                  counts[UPDATED], time.time() - start_time))
+    if counts[DIVERGED] > 0 or counts[FAILED] > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+The actions a player can take on their turn, as listed by :meth:`hearthbreaker.game_objects.Game.legal_actions`.
+
+Each action records every choice needed to take it, and can be taken with :meth:`perform`.  The choices are made by
+answering the questions the engine asks the player's agent while the action is taken, so any question an action
+doesn't have an answer for, such as the target of a battlecry, is still asked of the agent.  While an action is taken,
+the player's agent is a stand-in which holds the action's choices, and the player's own agent is put back afterwards,
+even if the action raises an exception.
+"""
+import hearthbreaker.game_objects
+
+
+class _AnsweringAgent:
+    """
+    Stands in for a player's agent while an action is taken.  The first question of each kind which the action has an
+    answer for is answered with it, and every other question is passed on to the agent.
+    """
+
+    def __init__(self, agent, target=None, index=None, option=None):
+        #: The agent being stood in for
+        self.agent = agent
+        self.target = target
+        self.index = index
+        self.option = option
+
+    def choose_target(self, targets):
+        target = self.target
+        self.target = None
+        # If the targets have changed since the action was found, the agent must choose
+        if target is not None and target in targets:
+            return target
+        return self.agent.choose_target(targets)
+
+    def choose_index(self, card, player):
+        index = self.index
+        self.index = None
+        if index is not None:
+            return index
+        return self.agent.choose_index(card, player)
+
+    def choose_option(self, *options):
+        option = self.option
+        self.option = None
+        if option is not None:
+            return options[option]
+        return self.agent.choose_option(*options)
+
+    def __getattr__(self, name):
+        return getattr(self.agent, name)
+
+
+def _perform(game, function, target=None, index=None, option=None):
+    """
+    Calls a function, with the current player's agent answering questions with the choices given.
+
+    :param hearthbreaker.game_objects.Game game: The game the function changes
+    :param function function: The function to call, with no arguments
+    :param hearthbreaker.game_objects.Character target: The answer to the first choice of target, or None to leave it
+                                                        to the agent
+    :param int index: The answer to the first choice of where to place a minion, or None to leave it to the agent
+    :param int option: The index of the answer to the first choice of option, or None to leave it to the agent
+    """
+    player = game.current_player
+    agent = player.agent
+    player.agent = _AnsweringAgent(agent, target, index, option)
+    try:
+        function()
+    finally:
+        player.agent = agent
+
+
+class PlayCard:
+    """
+    Plays a card from the current player's hand
+    """
+    __slots__ = ["card", "target", "index", "option"]
+
+    def __init__(self, card, target=None, index=None, option=None):
+        #: The :class:`~hearthbreaker.game_objects.Card` to play
+        self.card = card
+        #: The :class:`~hearthbreaker.game_objects.Character` the card targets, or None if it has no target
+        self.target = target
+        #: Where on the board a minion is placed, or None if the card is not a minion
+        self.index = index
+        #: The index of the option chosen for a "Choose One" card, or None if the card has no options
+        self.option = option
+
+    def perform(self, game):
+        _perform(game, lambda: game.play_card(self.card), self.target, self.index, self.option)
+
+    def __str__(self):  # pragma: no cover
+        return "PlayCard({0}, {1}, {2}, {3})".format(self.card.name, self.target, self.index, self.option)
+
+
+class Attack:
+    """
+    Attacks with one of the current player's characters
+    """
+    __slots__ = ["attacker", "target"]
+
+    def __init__(self, attacker, target):
+        #: The :class:`~hearthbreaker.game_objects.Character` attacking
+        self.attacker = attacker
+        #: The :class:`~hearthbreaker.game_objects.Character` being attacked
+        self.target = target
+
+    def perform(self, game):
+        _perform(game, self.attacker.attack, self.target)
+
+    def __str__(self):  # pragma: no cover
+        return "Attack({0}, {1})".format(self.attacker, self.target)
+
+
+class UsePower:
+    """
+    Uses the current player's hero power
+    """
+    __slots__ = ["target"]
+
+    def __init__(self, target=None):
+        #: The :class:`~hearthbreaker.game_objects.Character` the power targets, or None if it has no target
+        self.target = target
+
+    def perform(self, game):
+        _perform(game, game.current_player.hero.power.use, self.target)
+
+    def __str__(self):  # pragma: no cover
+        return "UsePower({0})".format(self.target)
+
+
+class EndTurn:
+    """
+    Ends the current player's turn.  Once this is performed no other action is legal, and the turn ends when the
+    agent returns from ``do_turn``.
+    """
+    __slots__ = []
+
+    def perform(self, game):
+        game.turn_over = True
+        game.epoch += 1
+
+    def __str__(self):  # pragma: no cover
+        return "EndTurn()"
+
+
+def find_legal_actions(game):
+    """
+    Lists every action the current player can take.  Rather than calling this directly, use
+    :meth:`Game.legal_actions <hearthbreaker.game_objects.Game.legal_actions>`, which remembers the actions until the
+    game changes.
+
+    :param hearthbreaker.game_objects.Game game: The game to find actions in
+    :return: The actions, or an empty tuple if the game or the current player's turn has ended
+    :rtype: tuple
+    """
+    if game.game_ended or game.turn_over:
+        return ()
+    actions = []
+    player = game.current_player
+    for card in player.hand:
+        if not card.can_use(player, game):
+            continue
+        targets = card.targets if card.targetable and card.targets is not None else [None]
+        if isinstance(card, hearthbreaker.game_objects.MinionCard):
+            indices = range(0, len(player.minions) + 1)
+        else:
+            indices = [None]
+        options = range(0, card.choose_one) if card.choose_one else [None]
+        for target in targets:
+            for index in indices:
+                for option in options:
+                    actions.append(PlayCard(card, target, index, option))
+
+    attackers = [minion for minion in player.minions if minion.can_attack()]
+    if player.hero.can_attack():
+        attackers.append(player.hero)
+    for attacker in attackers:
+        for target in attacker.attack_targets():
+            actions.append(Attack(attacker, target))
+
+    power = player.hero.power
+    if power.can_use():
+        if power.targeted:
+            for target in player.hero.power_targets():
+                actions.append(UsePower(target))
+        else:
+            actions.append(UsePower())
+
+    actions.append(EndTurn())
+    return tuple(actions)
@@ -2,6 +2,8 @@ import copy
 
 import random
 
+import hearthbreaker.actions
+
 
 class DoNothingBot:
     def __init__(self):
@@ -93,3 +95,21 @@ class RandomAgent(DoNothingBot):
 
     def choose_option(self, *options):
         return options[random.randint(0, len(options) - 1)]
+
+
+class RandomActionAgent(RandomAgent):
+    """
+    Takes a random action from :meth:`Game.legal_actions <hearthbreaker.game_objects.Game.legal_actions>` until it
+    chooses to end its turn.  Questions the actions don't answer, such as the targets of battlecries, are answered
+    at random.
+    """
+
+    def do_turn(self, player):
+        while True:
+            actions = player.game.legal_actions()
+            if len(actions) == 0:
+                return
+            action = actions[random.randint(0, len(actions) - 1)]
+            if isinstance(action, hearthbreaker.actions.EndTurn):
+                return
+            action.perform(player.game)
@@ -0,0 +1,400 @@
+"""
+An agent which chooses its actions by Monte Carlo tree search.
+
+Each action the agent takes on its turn is chosen by a search over the rest of that turn.  The search is made of
+iterations, each of which plays out a copy of the game made by :meth:`Game.copy
+<hearthbreaker.game_objects.Game.copy>`: the actions of the turn are chosen from the tree built so far, the rest of
+the turn and then a number of following turns are played at random, and the result is recorded against each action
+taken.  Every copy is given random numbers of its own, so the cards drawn and the results of random effects are
+sampled afresh each iteration, and the tree records how well each sequence of actions does on average.
+
+The agent doesn't see what it couldn't see at the table.  Decks are drawn from at random, so the order of the cards
+left in them is never known, and each copy is also determinized: the cards in the opponent's hand which came from their
+deck, and the secrets they have in play, are swapped for cards drawn at random from those the agent hasn't seen (see
+:func:`determinize`).  The tree is therefore built over the hands the opponent could hold, rather than the one they do.
+
+The tree is kept between the actions of a turn, so the iterations spent choosing one action also count towards the
+next.  A search can be limited by a number of iterations, a number of seconds, or both, and the agent gets stronger
+with either.
+
+With more than one process, each action is chosen by searches run in separate processes (root parallelization), whose
+counts for the first action are added together.  This needs the ``fork`` start method, as the game is handed to the
+processes as they are created, and the tree is not kept between actions.
+
+Example::
+
+    from hearthbreaker.agents.basic_agents import RandomAgent
+    from hearthbreaker.agents.mcts import MCTSAgent
+
+    game = Game([deck1, deck2], [MCTSAgent(iterations=200), RandomAgent()])
+    game.start()
+"""
+import math
+import multiprocessing
+import random
+import time
+
+import hearthbreaker.actions
+from hearthbreaker.agents.basic_agents import DoNothingBot
+from hearthbreaker.game_objects import Minion, SecretCard
+
+
+class _Node:
+    """
+    The results of the iterations which took one sequence of actions from the start of the search
+    """
+    __slots__ = ["visits", "score", "children"]
+
+    def __init__(self):
+        #: The number of iterations which took this sequence of actions
+        self.visits = 0
+        #: The total score of those iterations, each between 0 (a loss) and 1 (a win)
+        self.score = 0.0
+        #: Maps the key of each action taken next (see :func:`action_key`) to its node
+        self.children = {}
+
+
+class _RolloutAgent(DoNothingBot):
+    """
+    Plays each turn of a rollout at random, with a random number generator of its own
+    """
+
+    def __init__(self, random_state):
+        super().__init__()
+        self.random = random_state
+
+    def do_turn(self, player):
+        while True:
+            actions = player.game.legal_actions()
+            if len(actions) == 0:
+                return
+            action = actions[self.random.randint(0, len(actions) - 1)]
+            if isinstance(action, hearthbreaker.actions.EndTurn):
+                return
+            action.perform(player.game)
+
+    def choose_target(self, targets):
+        return targets[self.random.randint(0, len(targets) - 1)]
+
+    def choose_index(self, card, player):
+        return self.random.randint(0, len(player.minions))
+
+    def choose_option(self, *options):
+        return options[self.random.randint(0, len(options) - 1)]
+
+
+def _character_key(game, character):
+    if character is None:
+        return None
+    player_index = 0 if character.player is game.players[0] else 1
+    if isinstance(character, Minion):
+        return player_index, character.index
+    return player_index, -1
+
+
+def action_key(game, action):
+    """
+    Describes an action by the positions of the cards and characters it uses, so that the same action can be found
+    in copies of the game.
+
+    :param hearthbreaker.game_objects.Game game: The game the action can be taken in
+    :param action: One of the actions returned by :meth:`Game.legal_actions
+                   <hearthbreaker.game_objects.Game.legal_actions>`
+    :rtype: tuple
+    """
+    if isinstance(action, hearthbreaker.actions.PlayCard):
+        return ("play", game.current_player.hand.index(action.card), _character_key(game, action.target),
+                action.index, action.option)
+    elif isinstance(action, hearthbreaker.actions.Attack):
+        return "attack", _character_key(game, action.attacker), _character_key(game, action.target)
+    elif isinstance(action, hearthbreaker.actions.UsePower):
+        return "power", _character_key(game, action.target)
+    return "end",
+
+
+def evaluate(game, player_index):
+    """
+    Scores a game from one player's point of view.
+
+    :param hearthbreaker.game_objects.Game game: The game to score
+    :param int player_index: The index in :attr:`Game.players <hearthbreaker.game_objects.Game.players>` of the player
+    :return: 1 if the player has won, 0 if they have lost and 0.5 for a draw.  If the game has not ended, a number in
+             between, from the health and armor of each player's hero and the attack and health of their minions.
+    :rtype: float
+    """
+    player = game.players[player_index]
+    opponent = game.players[1 - player_index]
+    if game.game_ended:
+        if player.hero.dead == opponent.hero.dead:
+            return 0.5
+        return 0.0 if player.hero.dead else 1.0
+
+    def strength(player):
+        total = player.hero.health + player.hero.armor
+        for minion in player.minions:
+            total += minion.calculate_attack() + minion.health
+        return total
+
+    ours = strength(player)
+    return ours / (ours + strength(opponent))
+
+
+def _drawn_indices(deck, name, taken):
+    # The indices of the drawn cards in a deck with a name, other than those already taken
+    return [index for index in range(0, len(deck.cards))
+            if deck.used[index] and index not in taken and deck.cards[index].name == name]
+
+
+def determinize(game, player_index, random_state):
+    """
+    Hides a player's opponent's cards from them.  The cards in the opponent's hand which came from their deck, and
+    their secrets, are returned to the deck, and the same number of each drawn from it again at random: cards for the
+    hand, and secrets for the secrets, so that the opponent is seen to hold what they could hold.  No events are
+    triggered.
+
+    :param hearthbreaker.game_objects.Game game: The game to change, which should be a copy made for the purpose, as
+                                                 the cards are not put back as they were
+    :param int player_index: The index in :attr:`Game.players <hearthbreaker.game_objects.Game.players>` of the player
+                             the cards are hidden from
+    :param random.Random random_state: The random number generator to draw the cards with
+    """
+    opponent = game.players[1 - player_index]
+    deck = opponent.deck
+    # Cards which didn't come from the deck, such as The Coin, are known, so they are kept.  A card is taken to come
+    # from the deck if one of the same name has been drawn from it, and any such card will do, as they are alike.
+    taken = set()
+    hidden_hand = []
+    for position in range(0, len(opponent.hand)):
+        indices = _drawn_indices(deck, opponent.hand[position].name, taken)
+        if len(indices) > 0:
+            taken.add(indices[0])
+            hidden_hand.append(position)
+    hidden_secrets = []
+    for secret in opponent.secrets:
+        indices = _drawn_indices(deck, secret.name, taken)
+        if len(indices) > 0:
+            taken.add(indices[0])
+            hidden_secrets.append(secret)
+    if len(taken) == 0:
+        return
+    for index in taken:
+        deck.restore(index)
+
+    for secret in hidden_secrets:
+        secret.deactivate(opponent)
+        opponent.secrets.remove(secret)
+    for secret in hidden_secrets:
+        # A player can't have two of the same secret in play
+        names = [kept.name for kept in opponent.secrets]
+        candidates = [index for index in range(0, len(deck.cards)) if not deck.used[index] and
+                      isinstance(deck.cards[index], SecretCard) and deck.cards[index].name not in names]
+        drawn = deck.take(candidates[random_state.randint(0, len(candidates) - 1)])
+        drawn.player = opponent
+        opponent.secrets.append(drawn)
+        drawn.activate(opponent)
+    for position in hidden_hand:
+        opponent.hand[position] = deck.draw(random_state.randint)
+    game.epoch += 1
+
+
+class _Search:
+    """
+    Runs the iterations of a search from one game
+    """
+
+    def __init__(self, game, random_state, exploration, rollout_turns):
+        self.game = game
+        self.player_index = 0 if game.current_player is game.players[0] else 1
+        self.random = random_state
+        self.exploration = exploration
+        self.rollout_turns = rollout_turns
+
+    def run(self, root, iterations, time_limit):
+        """
+        Runs iterations until either limit is reached.
+
+        :param _Node root: The node to search from, which may already have results
+        :param int iterations: The number of iterations to run, or None for no limit
+        :param float time_limit: The number of seconds to search for, or None for no limit
+        :return: The number of iterations run
+        """
+        deadline = None if time_limit is None else time.time() + time_limit
+        count = 0
+        while (iterations is None or count < iterations) and (deadline is None or time.time() < deadline):
+            self.iterate(root)
+            count += 1
+        return count
+
+    def copy_game(self):
+        game = self.game.copy()
+        determinize(game, self.player_index, self.random)
+        agent = _RolloutAgent(self.random)
+        game.random = self.random.randint
+        for player in game.players:
+            player.random = self.random.randint
+            player.agent = agent
+        return game
+
+    def iterate(self, root):
+        game = self.copy_game()
+        path = [root]
+        node = root
+        turn_ended = False
+        while not game.game_ended:
+            actions = game.legal_actions()
+            keys = [action_key(game, action) for action in actions]
+            unexplored = [index for index, key in enumerate(keys) if key not in node.children]
+            if len(unexplored) > 0:
+                index = unexplored[self.random.randint(0, len(unexplored) - 1)]
+                node.children[keys[index]] = _Node()
+            else:
+                index = self.select(node, keys)
+            node = node.children[keys[index]]
+            path.append(node)
+            if isinstance(actions[index], hearthbreaker.actions.EndTurn):
+                turn_ended = True
+                break
+            actions[index].perform(game)
+            if len(unexplored) > 0:
+                break
+
+        self.rollout(game, turn_ended)
+        score = evaluate(game, self.player_index)
+        for node in path:
+            node.visits += 1
+            node.score += score
+
+    def select(self, node, keys):
+        # Upper confidence bound for trees (UCT), over the actions which can be taken now
+        log_visits = math.log(node.visits)
+        best_index = 0
+        best_value = -1.0
+        for index, key in enumerate(keys):
+            child = node.children[key]
+            value = child.score / child.visits + self.exploration * math.sqrt(log_visits / child.visits)
+            if value > best_value:
+                best_index = index
+                best_value = value
+        return best_index
+
+    def rollout(self, game, turn_ended):
+        if game.game_ended:
+            return
+        if not turn_ended:
+            game.current_player.agent.do_turn(game.current_player)
+        game._end_turn()
+        for turn in range(0, self.rollout_turns):
+            if game.game_ended:
+                return
+            game.play_single_turn()
+
+
+# The game searched by the worker processes of a root parallel search, which they inherit when they are forked
+_worker_search = None
+
+
+def _start_worker(game, exploration, rollout_turns):
+    global _worker_search
+    _worker_search = _Search(game, None, exploration, rollout_turns)
+
+
+def _run_worker(arguments):
+    seed, iterations, time_limit = arguments
+    _worker_search.random = random.Random(seed)
+    root = _Node()
+    _worker_search.run(root, iterations, time_limit)
+    return dict((key, (child.visits, child.score)) for key, child in root.children.items())
+
+
+class MCTSAgent(DoNothingBot):
+    """
+    Chooses each of its actions by Monte Carlo tree search over the rest of its turn.  Questions the actions don't
+    answer, such as the targets of battlecries, are answered at random.
+    """
+
+    def __init__(self, iterations=None, time_limit=None, exploration=0.7, rollout_turns=4, processes=1, seed=None):
+        """
+        :param int iterations: The number of iterations to run before each action.  If neither this nor `time_limit`
+                               is given, 200 iterations are run.
+        :param float time_limit: The number of seconds to search for before each action
+        :param float exploration: How much the search favours actions which have been tried less often.  Scores are
+                                  between 0 and 1.
+        :param int rollout_turns: How many turns are played at random after the end of this agent's turn before the
+                                  game is scored with :func:`evaluate`, if it hasn't ended by then
+        :param int processes: The number of processes to search in.  Each runs the whole budget of iterations or time.
+        :param int seed: The seed for the agent's random numbers, or None to seed them from the system
+        """
+        super().__init__()
+        if iterations is None and time_limit is None:
+            iterations = 200
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.rollout_turns = rollout_turns
+        self.processes = processes
+        self.random = random.Random(seed)
+        #: The number of iterations run in the searches for the last action chosen, including those kept from the
+        #: search for the action before it
+        self.last_iterations = 0
+
+    def do_turn(self, player):
+        game = player.game
+        root = _Node()
+        while not game.game_ended:
+            actions = game.legal_actions()
+            if len(actions) == 0:
+                return
+            root = self.search(game, root)
+            self.last_iterations = root.visits
+            by_key = dict((action_key(game, action), action) for action in actions)
+            best_key = None
+            best_visits = -1
+            for key, child in root.children.items():
+                if key in by_key and child.visits > best_visits:
+                    best_key = key
+                    best_visits = child.visits
+            if best_key is None or isinstance(by_key[best_key], hearthbreaker.actions.EndTurn):
+                return
+            by_key[best_key].perform(game)
+            # The rest of the tree is kept for the next action
+            root = root.children[best_key]
+
+    def search(self, game, root):
+        """
+        Searches the rest of the current turn.
+
+        :param hearthbreaker.game_objects.Game game: The game to search, which is not changed
+        :param _Node root: The results of earlier searches from this point in the turn
+        :return: The root of the search's tree, which is `root` unless the search ran in several processes
+        """
+        if self.processes <= 1:
+            search = _Search(game, self.random, self.exploration, self.rollout_turns)
+            search.run(root, self.iterations, self.time_limit)
+            return root
+
+        context = multiprocessing.get_context("fork")
+        pool = context.Pool(self.processes, _start_worker, (game, self.exploration, self.rollout_turns))
+        try:
+            arguments = [(self.random.getrandbits(64), self.iterations, self.time_limit)
+                         for i in range(0, self.processes)]
+            results = pool.map(_run_worker, arguments)
+        finally:
+            pool.terminate()
+        root = _Node()
+        for children in results:
+            for key, (visits, score) in children.items():
+                child = root.children.setdefault(key, _Node())
+                child.visits += visits
+                child.score += score
+                root.visits += visits
+                root.score += score
+        return root
+
+    def choose_target(self, targets):
+        return targets[self.random.randint(0, len(targets) - 1)]
+
+    def choose_index(self, card, player):
+        return self.random.randint(0, len(player.minions))
+
+    def choose_option(self, *options):
+        return options[self.random.randint(0, len(options) - 1)]
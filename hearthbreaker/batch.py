@@ -0,0 +1,269 @@
+"""
+Runs many games of a single matchup, spread over a pool of worker processes.
+
+Each game is given its own seed, drawn from a single stream generated from the batch's seed.  The seeds are
+handed out to the workers in chunks, so a batch played with the same seed produces the same results no matter how
+many processes are used to play it.
+
+Example::
+
+    from hearthbreaker.batch import load_deck, run_batch
+    from hearthbreaker.agents.basic_agents import RandomAgent
+
+    result = run_batch(load_deck("zoo.hsdeck"), load_deck("example.hsdeck"), RandomAgent, RandomAgent,
+                       games=10000, processes=32, seed=1857)
+    print(result)
+
+With ``profile_events=True``, each worker profiles the events triggered in its games with an
+:class:`EventProfiler <hearthbreaker.profiling.EventProfiler>`, and the profiles are combined in the result's
+:attr:`BatchResult.event_profile`.  Likewise ``profile_cards=True`` attributes the time spent to the cards responsible
+with a :class:`CardProfiler <hearthbreaker.profiling.CardProfiler>`, combined in :attr:`BatchResult.card_profile`.
+"""
+import multiprocessing
+import random
+import re
+import time
+
+import hearthbreaker.agents.basic_agents
+import hearthbreaker.cards
+import hearthbreaker.profiling
+from hearthbreaker.constants import CHARACTER_CLASS
+from hearthbreaker.game_objects import Game, Deck, card_lookup, GameException
+
+
+WIN = 1
+LOSS = -1
+DRAW = 0
+
+
+def load_deck(filename):
+    """
+    Loads a deck from a file in cockatrice format, with a card name in English on each line, preceded by a number to
+    specify how many of that card are in the deck.  The character class is inferred from the cards present, or
+    defaults to mage.
+
+    :param string filename: The path to the deck file
+    :rtype: hearthbreaker.game_objects.Deck
+    """
+    deck_file = open(filename, "r")
+    contents = deck_file.read()
+    items = re.split('\n', contents)
+    cards = []
+    character_class = CHARACTER_CLASS.MAGE
+    for line in items[0:]:
+        line = line.strip(" \n\t\r")
+        if len(line) == 0:
+            continue
+        parts = line.split(" ", 1)
+        count = int(parts[0])
+        for i in range(0, count):
+            card = card_lookup(parts[1])
+            if card.character_class != CHARACTER_CLASS.ALL:
+                character_class = card.character_class
+            cards.append(card)
+
+    deck_file.close()
+
+    return Deck(cards, character_class)
+
+
+def find_agent(agent_name):
+    """
+    Finds an agent class by name in :mod:`hearthbreaker.agents.basic_agents`
+
+    :param string agent_name: The name of the agent's class, such as "RandomAgent"
+    :return: The agent class
+    """
+    agent = getattr(hearthbreaker.agents.basic_agents, agent_name, None)
+    if agent is None:
+        raise GameException("No agent named {0}".format(agent_name))
+    return agent
+
+
+class BatchResult:
+    """
+    The aggregated outcome of a batch of games.  Wins, losses and draws are counted from the point of view of the
+    first deck.
+    """
+
+    def __init__(self):
+        #: The number of games won by the first deck
+        self.wins = 0
+        #: The number of games won by the second deck
+        self.losses = 0
+        #: The number of games where both heroes died at once
+        self.draws = 0
+        #: The number of turns each game lasted, in the order of the games' seeds
+        self.lengths = []
+        #: The wall clock time the batch took, in seconds
+        self.elapsed = 0.0
+        #: The events triggered in every game of the batch, as a :class:`hearthbreaker.profiling.EventProfiler`, or
+        #: None if the batch was not profiled
+        self.event_profile = None
+        #: The time spent on each card in every game of the batch, as a :class:`hearthbreaker.profiling.CardProfiler`,
+        #: or None if the batch was not profiled
+        self.card_profile = None
+
+    @property
+    def games(self):
+        return len(self.lengths)
+
+    @property
+    def games_per_second(self):
+        if self.elapsed == 0:
+            return 0.0
+        return self.games / self.elapsed
+
+    @property
+    def mean_length(self):
+        if self.games == 0:
+            return 0.0
+        return sum(self.lengths) / self.games
+
+    def add(self, outcome, length):
+        if outcome == WIN:
+            self.wins += 1
+        elif outcome == LOSS:
+            self.losses += 1
+        else:
+            self.draws += 1
+        self.lengths.append(length)
+
+    def __str__(self):  # pragma: no cover
+        if self.games == 0:
+            return "0 games"
+        summary = "{0} games: {1} wins, {2} losses, {3} draws\n" \
+                  "game length: {4:.2f} turns (min {5}, max {6})\n" \
+                  "{7:.2f} seconds, {8:.2f} games/second"
+        return summary.format(self.games, self.wins, self.losses, self.draws, self.mean_length, min(self.lengths),
+                              max(self.lengths), self.elapsed, self.games_per_second)
+
+
+def _deck_spec(deck):
+    # Card objects hold lambdas for their targeting, so decks are sent to the workers as names and rebuilt there
+    return [card.name for card in deck.cards], deck.character_class
+
+
+def _build_deck(spec):
+    names, character_class = spec
+    return Deck([card_lookup(name) for name in names], character_class)
+
+
+def play_game(deck_specs, agent_types, seed):
+    """
+    Plays a single seeded game to completion.
+
+    :param list deck_specs: Two tuples of (card names, character class), one for each deck
+    :param list agent_types: Two agent classes, the first playing the first deck
+    :param int seed: The seed for the game's random number generator
+    :return: A tuple of the outcome for the first deck (:const:`WIN`, :const:`LOSS` or :const:`DRAW`) and the number
+             of turns played
+    """
+    random.seed(seed)
+    decks = [_build_deck(deck_specs[0]), _build_deck(deck_specs[1])]
+    game = Game(decks, [agent_types[0](), agent_types[1]()])
+    turns = 0
+
+    def count_turn():
+        nonlocal turns
+        turns += 1
+
+    for player in game.players:
+        player.bind("turn_started", count_turn)
+
+    game.start()
+
+    if game.players[0].deck is decks[0]:
+        mine, theirs = game.players
+    else:
+        theirs, mine = game.players
+
+    if mine.hero.dead and theirs.hero.dead:
+        return DRAW, turns
+    elif theirs.hero.dead:
+        return WIN, turns
+    return LOSS, turns
+
+
+def _play_chunk(task):
+    deck_specs, agent_types, seeds, profiler_types = task
+    profilers = [profiler_type() for profiler_type in profiler_types]
+    for profiler in profilers:
+        profiler.start()
+    try:
+        outcomes = [play_game(deck_specs, agent_types, seed) for seed in seeds]
+    finally:
+        for profiler in reversed(profilers):
+            profiler.stop()
+    return outcomes, profilers
+
+
+def run_batch(deck1, deck2, agent1=hearthbreaker.agents.basic_agents.RandomAgent,
+              agent2=hearthbreaker.agents.basic_agents.RandomAgent, games=1000, processes=None, seed=None,
+              chunk_size=None, profile_events=False, profile_cards=False):
+    """
+    Plays a batch of games between two decks, spread over a pool of processes.
+
+    :param hearthbreaker.game_objects.Deck deck1: The first deck.  Results are reported from its point of view
+    :param hearthbreaker.game_objects.Deck deck2: The second deck
+    :param agent1: The agent class playing the first deck.  Must be importable by the worker processes
+    :param agent2: The agent class playing the second deck
+    :param int games: The number of games to play
+    :param int processes: The number of worker processes.  Defaults to the number of CPUs.  If 1, the games are
+                          played in this process
+    :param int seed: The seed the per game seeds are generated from.  If None, a random seed is used
+    :param int chunk_size: The number of games handed to a worker at a time.  By default, each worker receives
+                           about four chunks
+    :param boolean profile_events: If True, the events triggered in the games are profiled, and the profile is
+                                   returned in :attr:`BatchResult.event_profile`
+    :param boolean profile_cards: If True, the time spent in the games is attributed to the cards responsible, and the
+                                  profile is returned in :attr:`BatchResult.card_profile`
+    :rtype: BatchResult
+    """
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    if chunk_size is None:
+        chunk_size = max(1, -(-games // (processes * 4)))
+
+    seed_stream = random.Random(seed)
+    seeds = [seed_stream.getrandbits(32) for i in range(0, games)]
+    deck_specs = [_deck_spec(deck1), _deck_spec(deck2)]
+    agent_types = [agent1, agent2]
+    profiler_types = []
+    if profile_events:
+        profiler_types.append(hearthbreaker.profiling.EventProfiler)
+    if profile_cards:
+        profiler_types.append(hearthbreaker.profiling.CardProfiler)
+    tasks = [(deck_specs, agent_types, seeds[start:start + chunk_size], profiler_types)
+             for start in range(0, games, chunk_size)]
+
+    result = BatchResult()
+    if profile_events:
+        result.event_profile = hearthbreaker.profiling.EventProfiler()
+    if profile_cards:
+        result.card_profile = hearthbreaker.profiling.CardProfiler()
+
+    def add_chunk(chunk):
+        outcomes, profilers = chunk
+        for outcome, length in outcomes:
+            result.add(outcome, length)
+        for profiler in profilers:
+            if isinstance(profiler, hearthbreaker.profiling.EventProfiler):
+                result.event_profile.add(profiler)
+            else:
+                result.card_profile.add(profiler)
+
+    start_time = time.time()
+    if processes == 1:
+        for chunk in map(_play_chunk, tasks):
+            add_chunk(chunk)
+    else:
+        pool = multiprocessing.Pool(processes)
+        try:
+            for chunk in pool.imap(_play_chunk, tasks):
+                add_chunk(chunk)
+        finally:
+            pool.close()
+            pool.join()
+    result.elapsed = time.time() - start_time
+    return result
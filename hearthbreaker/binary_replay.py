@@ -0,0 +1,475 @@
+"""
+A compact binary replay format, holding the same information as the text format described in ``replay_format.md``.
+
+A binary replay starts with a header:
+
+ * The four bytes ``HBRP``, followed by the version of the format as a varint (currently 2)
+ * The card table: the number of distinct cards in the decks, followed by the name of each, in the order they first
+   appear.  Each name is its length in bytes followed by its UTF-8 encoding.
+ * The decks: the number of decks, followed by the class of each, the number of cards in it and the index of each of
+   its cards in the card table.
+
+Everything after the header is a series of records, each starting with a byte which gives its kind:
+
+ * ``RANDOM``: The number of random numbers which follow, followed by the numbers.  The random numbers of a replay are
+   the numbers of all of its ``RANDOM`` records, in order.  If they run out, 0 is used, so a replay without random
+   numbers uses 0 every time, as ``random()`` does in the text format.
+ * ``KEEP``: The number of indices which follow, followed by the indices of the cards kept by a player.  If a replay
+   has fewer ``KEEP`` records than players, the other players keep all of their cards.
+ * ``SNAPSHOT``: A :class:`snapshot <hearthbreaker.replay.GameSnapshot>` of the game at the start of a turn: the number
+   of the turn, the state hash of the game, and the length of the saved state followed by the state itself.  A
+   snapshot follows the ``END`` record of the turn before it.  Version 1 replays have no snapshots.
+ * ``PLAY``, ``SUMMON``, ``ATTACK``, ``POWER``, ``END`` and ``CONCEDE``: The actions of the text format, each stored
+   in five more bytes: the index of the card in the player's hand, the option chosen, the index on the board, the
+   character acting and the character targeted.  Fields an action doesn't use are 255 for indices and 0 for
+   characters.  A character is stored as 16 for the first player and 32 for the second, plus one more than the index
+   of the minion, if it is a minion.
+
+All numbers other than those in action records are unsigned varints: seven bits to a byte, least significant first,
+with the top bit set on every byte but the last.
+
+Since the random numbers and actions are written as records, a replay can be written while the game is played, with
+a :class:`BinaryReplayWriter` given to :class:`RecordingGame <hearthbreaker.replay.RecordingGame>`, and read while it
+is replayed, as :class:`SavedGame <hearthbreaker.replay.SavedGame>` does with a :class:`BinaryReplayReader`.
+
+Replays are converted between the two formats by running::
+
+    python -m hearthbreaker.binary_replay game.rep game.hbr
+    python -m hearthbreaker.binary_replay game.hbr game.rep
+
+which reads either format and writes the other.  With ``--snapshots N``, the replay written has a snapshot of the game
+every N turns, taken by :func:`take_snapshots <hearthbreaker.replay.take_snapshots>`.
+"""
+import argparse
+import collections
+import struct
+
+import hearthbreaker.replay
+from hearthbreaker.game_objects import Deck, card_lookup
+
+
+#: The bytes every binary replay starts with
+MAGIC = b"HBRP"
+
+#: The version of the format written by :class:`BinaryReplayWriter`
+VERSION = 2
+
+RANDOM = 1
+KEEP = 2
+SNAPSHOT = 3
+PLAY = 16
+SUMMON = 17
+ATTACK = 18
+POWER = 19
+END = 20
+CONCEDE = 21
+
+_ACTION = struct.Struct("6B")
+_NONE = 255
+_READ_SIZE = 65536
+
+
+def _write_varint(output, number):
+    while number > 127:
+        output.append((number & 127) | 128)
+        number >>= 7
+    output.append(number)
+
+
+def _encode_character(character):
+    if character is None or str(character) == "":
+        return 0
+    ref = str(character).split(":")
+    if ref[0] not in ("p1", "p2"):
+        raise hearthbreaker.replay.ReplayException("Unknown character {0}".format(character))
+    code = 16 if ref[0] == "p1" else 32
+    if len(ref) > 1:
+        code += int(ref[1]) + 1
+    return code
+
+
+def _decode_character(code):
+    if code == 0:
+        return None
+    ref = "p1" if code & 16 else "p2"
+    if code & 15:
+        ref += ":" + str((code & 15) - 1)
+    return ref
+
+
+def _encode_card(card):
+    ref = str(card).split(":")
+    if len(ref) > 1:
+        return int(ref[0]), int(ref[1])
+    return int(ref[0]), _NONE
+
+
+def _decode_card(index, option):
+    if option == _NONE:
+        return hearthbreaker.replay.ProxyCard(str(index))
+    return hearthbreaker.replay.ProxyCard("{0}:{1}".format(index, option))
+
+
+class BinaryReplayWriter:
+    """
+    Writes a binary replay record by record, so that a game can be written as it is played without keeping its
+    replay in memory.  The header is written by :meth:`write_header`, which must be called first.
+    """
+
+    def __init__(self, file):
+        """
+        :param file: The file to write to, either as a path or as a file open for writing bytes
+        """
+        if isinstance(file, str):
+            file = open(file, "wb")
+            self._owns_file = True
+        else:
+            self._owns_file = False
+        self.file = file
+        self._cards = {}
+
+    def write_header(self, decks):
+        """
+        Writes the header of the replay.
+
+        :param list[hearthbreaker.game_objects.Deck] decks: The decks of the two players
+        """
+        output = bytearray(MAGIC)
+        _write_varint(output, VERSION)
+        names = []
+        for deck in decks:
+            for card in deck.cards:
+                if card.name not in self._cards:
+                    self._cards[card.name] = len(names)
+                    names.append(card.name)
+        _write_varint(output, len(names))
+        for name in names:
+            encoded = name.encode("utf-8")
+            _write_varint(output, len(encoded))
+            output.extend(encoded)
+        _write_varint(output, len(decks))
+        for deck in decks:
+            _write_varint(output, deck.character_class)
+            _write_varint(output, len(deck.cards))
+            for card in deck.cards:
+                _write_varint(output, self._cards[card.name])
+        self.file.write(output)
+
+    def write_random(self, numbers):
+        """
+        Writes random numbers used by the game.
+
+        :param list[int] numbers: The numbers, in the order they were used
+        """
+        if len(numbers) == 0:
+            return
+        output = bytearray([RANDOM])
+        _write_varint(output, len(numbers))
+        for number in numbers:
+            _write_varint(output, number)
+        self.file.write(output)
+
+    def write_keep(self, keep):
+        """
+        Writes the cards kept by a player at the start of the game.
+
+        :param list[int] keep: The indices of the cards kept
+        """
+        output = bytearray([KEEP])
+        indices = [int(index) for index in keep if index != ""]
+        _write_varint(output, len(indices))
+        for index in indices:
+            _write_varint(output, index)
+        self.file.write(output)
+
+    def write_snapshot(self, snapshot):
+        """
+        Writes a snapshot of the game, which should follow the end of the turn before it.
+
+        :param hearthbreaker.replay.GameSnapshot snapshot: The snapshot
+        """
+        output = bytearray([SNAPSHOT])
+        _write_varint(output, snapshot.turn)
+        _write_varint(output, snapshot.state_hash)
+        _write_varint(output, len(snapshot.data))
+        output.extend(snapshot.data)
+        self.file.write(output)
+
+    def write_action(self, action):
+        """
+        Writes an action taken by a player.
+
+        :param hearthbreaker.replay.ReplayAction action: The action
+        """
+        card = option = index = _NONE
+        character = target = 0
+        if isinstance(action, hearthbreaker.replay.SpellAction):
+            kind = PLAY
+            card, option = _encode_card(action.card)
+            target = _encode_character(action.target)
+        elif isinstance(action, hearthbreaker.replay.MinionAction):
+            kind = SUMMON
+            card, option = _encode_card(action.card)
+            index = action.index
+            target = _encode_character(action.target)
+        elif isinstance(action, hearthbreaker.replay.AttackAction):
+            kind = ATTACK
+            character = _encode_character(action.character)
+            target = _encode_character(action.target)
+        elif isinstance(action, hearthbreaker.replay.PowerAction):
+            kind = POWER
+            target = _encode_character(action.target)
+        elif isinstance(action, hearthbreaker.replay.TurnEndAction):
+            kind = END
+        elif isinstance(action, hearthbreaker.replay.ConcedeAction):
+            kind = CONCEDE
+        else:
+            raise hearthbreaker.replay.ReplayException("Unknown action {0}".format(type(action).__name__))
+        try:
+            self.file.write(_ACTION.pack(kind, card, option, index, character, target))
+        except struct.error:
+            raise hearthbreaker.replay.ReplayException("Action {0} does not fit in a record".format(
+                action.to_output_string()))
+
+    def write_replay(self, replay):
+        """
+        Writes a whole replay, header and all.
+
+        :param hearthbreaker.replay.Replay replay: The replay to write
+        """
+        self.write_header(replay.decks)
+        self.write_random(replay.random_numbers)
+        for keep in replay.keeps:
+            self.write_keep(keep)
+        snapshots = iter(replay.snapshots)
+        snapshot = next(snapshots, None)
+        turn = 0
+        for action in replay.actions:
+            while snapshot is not None and snapshot.turn <= turn:
+                self.write_snapshot(snapshot)
+                snapshot = next(snapshots, None)
+            self.write_action(action)
+            if isinstance(action, hearthbreaker.replay.TurnEndAction):
+                turn += 1
+        while snapshot is not None:
+            self.write_snapshot(snapshot)
+            snapshot = next(snapshots, None)
+
+    def close(self):
+        """
+        Closes the file written to, if it was opened by this writer
+        """
+        if self._owns_file:
+            self.file.close()
+
+
+class BinaryReplayReader:
+    """
+    Reads a binary replay record by record.  The header is read as soon as the reader is created.
+
+    The random numbers, kept cards and actions of the replay are each read by a generator of their own, which reads as
+    far through the file as it needs to.  Records of the other kinds found along the way are held until their own
+    generator asks for them, which in a replay written as the game was played is never more than a turn's worth.
+    """
+
+    def __init__(self, file):
+        """
+        :param file: The file to read, either as a path or as a file open for reading bytes
+        """
+        if isinstance(file, str):
+            file = open(file, "rb")
+            self._owns_file = True
+        else:
+            self._owns_file = False
+        self.file = file
+        self._buffer = b""
+        self._position = 0
+        self._random_numbers = collections.deque()
+        self._keeps = collections.deque()
+        self._snapshots = collections.deque()
+        self._actions = collections.deque()
+        self._ended = False
+
+        if self._read(len(MAGIC)) != MAGIC:
+            raise hearthbreaker.replay.ReplayException("Not a binary replay")
+        #: The version of the format the replay was written in
+        self.version = self._read_varint()
+        if self.version > VERSION:
+            raise hearthbreaker.replay.ReplayException("Unsupported binary replay version {0}".format(self.version))
+        names = [self._read(self._read_varint()).decode("utf-8") for i in range(0, self._read_varint())]
+        #: The decks of the two players
+        self.decks = []
+        for deck_index in range(0, self._read_varint()):
+            character_class = self._read_varint()
+            cards = [card_lookup(names[self._read_varint()]) for i in range(0, self._read_varint())]
+            self.decks.append(Deck(cards, character_class))
+
+    def _fill(self):
+        # Returns False if there is nothing more to read
+        data = self.file.read(_READ_SIZE)
+        if len(data) == 0:
+            return False
+        self._buffer = self._buffer[self._position:] + data
+        self._position = 0
+        return True
+
+    def _read(self, length):
+        while len(self._buffer) - self._position < length:
+            if not self._fill():
+                raise hearthbreaker.replay.ReplayException("Binary replay ends part way through a record")
+        data = self._buffer[self._position:self._position + length]
+        self._position += length
+        return data
+
+    def _read_varint(self):
+        number = 0
+        shift = 0
+        while True:
+            if self._position == len(self._buffer) and not self._fill():
+                raise hearthbreaker.replay.ReplayException("Binary replay ends part way through a record")
+            byte = self._buffer[self._position]
+            self._position += 1
+            number |= (byte & 127) << shift
+            if byte < 128:
+                return number
+            shift += 7
+
+    def _read_record(self):
+        # Reads the next record into its queue, returning False if there are no more records
+        if self._position == len(self._buffer) and not self._fill():
+            self._ended = True
+            if self._owns_file:
+                self.file.close()
+            return False
+        kind = self._buffer[self._position]
+        if kind == RANDOM or kind == KEEP:
+            self._position += 1
+            numbers = [self._read_varint() for i in range(0, self._read_varint())]
+            if kind == RANDOM:
+                self._random_numbers.extend(numbers)
+            else:
+                self._keeps.append(numbers)
+            return True
+        if kind == SNAPSHOT:
+            self._position += 1
+            turn = self._read_varint()
+            state_hash = self._read_varint()
+            data = self._read(self._read_varint())
+            self._snapshots.append(hearthbreaker.replay.GameSnapshot(turn, state_hash, data))
+            return True
+
+        kind, card, option, index, character, target = _ACTION.unpack(self._read(_ACTION.size))
+        if kind == PLAY:
+            action = hearthbreaker.replay.SpellAction(_decode_card(card, option), _decode_character(target))
+        elif kind == SUMMON:
+            action = hearthbreaker.replay.MinionAction(_decode_card(card, option), index, _decode_character(target))
+        elif kind == ATTACK:
+            action = hearthbreaker.replay.AttackAction(_decode_character(character), _decode_character(target))
+        elif kind == POWER:
+            action = hearthbreaker.replay.PowerAction(_decode_character(target))
+        elif kind == END:
+            action = hearthbreaker.replay.TurnEndAction()
+        elif kind == CONCEDE:
+            action = hearthbreaker.replay.ConcedeAction()
+        else:
+            raise hearthbreaker.replay.ReplayException("Unknown record kind {0}".format(kind))
+        self._actions.append(action)
+        return True
+
+    def _records(self, queue):
+        while True:
+            while len(queue) == 0:
+                if self._ended or not self._read_record():
+                    return
+            yield queue.popleft()
+
+    def random_numbers(self):
+        """
+        :return: A generator of the random numbers of the replay
+        """
+        return self._records(self._random_numbers)
+
+    def keeps(self):
+        """
+        :return: A generator of the indices of the cards kept by each player, as a list for each
+        """
+        return self._records(self._keeps)
+
+    def snapshots(self):
+        """
+        :return: A generator of the snapshots embedded in the replay, as :class:`hearthbreaker.replay.GameSnapshot`
+        """
+        return self._records(self._snapshots)
+
+    def actions(self):
+        """
+        :return: A generator of the actions of the replay, as :class:`hearthbreaker.replay.ReplayAction`
+        """
+        return self._records(self._actions)
+
+    def read_replay(self):
+        """
+        Reads the rest of the replay into memory.
+
+        :rtype: hearthbreaker.replay.Replay
+        """
+        replay = hearthbreaker.replay.Replay()
+        replay.decks = self.decks
+        replay.actions = list(self.actions())
+        replay.random_numbers = list(self.random_numbers())
+        replay.keeps = list(self.keeps())
+        replay.snapshots = list(self.snapshots())
+        return replay
+
+
+def is_binary(replay_file):
+    """
+    Checks whether a replay is in the binary format.
+
+    :param replay_file: The replay, either as a path or as an open file, which is left where it was
+    :rtype: bool
+    """
+    if isinstance(replay_file, str):
+        file = open(replay_file, "rb")
+        magic = file.read(len(MAGIC))
+        file.close()
+        return magic == MAGIC
+    return isinstance(replay_file.read(0), bytes)
+
+
+def convert(source, destination, snapshot_interval=None):
+    """
+    Converts a replay from either format to the other.  No information is lost either way, so converting a replay
+    and then converting the result back gives the same replay.
+
+    :param string source: The path of the replay to convert
+    :param string destination: The path to write the converted replay to
+    :param int snapshot_interval: If given, the snapshots in the converted replay are replaced with a snapshot every
+                                  this many turns (see :func:`hearthbreaker.replay.take_snapshots`)
+    """
+    if is_binary(source):
+        replay = BinaryReplayReader(source).read_replay()
+    else:
+        replay = hearthbreaker.replay.Replay()
+        replay.parse_replay(source)
+    if snapshot_interval is not None:
+        replay.snapshots = hearthbreaker.replay.take_snapshots(source, snapshot_interval)
+    if is_binary(source):
+        output = open(destination, "w")
+        replay.write_replay(output)
+        output.close()
+    else:
+        writer = BinaryReplayWriter(destination)
+        writer.write_replay(replay)
+        writer.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m hearthbreaker.binary_replay",
+                                     description="Converts a replay from either format to the other")
+    parser.add_argument("source", help="The replay to convert")
+    parser.add_argument("destination", help="The path to write the converted replay to")
+    parser.add_argument("--snapshots", type=int, metavar="N",
+                        help="Embed a snapshot of the game every N turns in the converted replay")
+    args = parser.parse_args()
+    convert(args.source, args.destination, args.snapshots)
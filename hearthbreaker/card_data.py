@@ -0,0 +1,424 @@
+"""
+The columns of the table of implemented cards used by :mod:`hearthbreaker.card_table`.
+
+Generated from cards.csv by ``python -m hearthbreaker.card_table``.  Do not edit by hand.
+"""
+NAME = (
+    'Abomination', 'Abusive Sergeant', 'Acidic Swamp Ooze', 'Acolyte of Pain', "Al'Akir the Windlord", 'Alarm-o-Bot',
+    'Aldor Peacekeeper', 'Alexstrasza', 'Amani Berserker', 'Ancestral Healing', 'Ancestral Spirit',
+    'Ancient Brewmaster', 'Ancient Mage', 'Ancient of Lore', 'Ancient of War', 'Ancient Watcher', 'Angry Chicken',
+    'Animal Companion', "Anub'ar Ambusher", 'Arathi Weaponsmith', 'Arcane Explosion', 'Arcane Golem',
+    'Arcane Intellect', 'Arcane Missiles', 'Arcane Shot', 'Arcanite Reaper', 'Archmage', 'Archmage Antonidas',
+    'Argent Commander', 'Argent Protector', 'Argent Squire', 'Armorsmith', "Assassin's Blade", 'Assassinate',
+    'Auchenai Soulpriest', 'Avenging Wrath', 'Azure Drake', 'Backstab', 'Bane of Doom', 'Baron Geddon',
+    'Baron Rivendare', 'Battle Rage', 'Bestial Wrath', 'Betrayal', 'Big Game Hunter', 'Bite', 'Blade Flurry',
+    'Blessed Champion', 'Blessing of Kings', 'Blessing of Might', 'Blessing of Wisdom', 'Blizzard', 'Blood Imp',
+    'Blood Knight', 'Bloodfen Raptor', 'Bloodlust', 'Bloodmage Thalnos', 'Bloodsail Corsair', 'Bloodsail Raider',
+    'Bluegill Warrior', 'Booty Bay Bodyguard', 'Boulderfist Ogre', 'Brawl', 'Cabal Shadow Priest', 'Cairne Bloodhoof',
+    'Captain Greenskin', "Captain's Parrot", 'Cenarius', 'Charge', 'Chillwind Yeti', 'Circle of Healing', 'Claw',
+    'Cleave', 'Cold Blood', 'Coldlight Oracle', 'Coldlight Seer', 'Commanding Shout', 'Conceal', 'Cone of Cold',
+    'Consecration', 'Core Hound', 'Corruption', 'Counterspell', 'Crazed Alchemist', 'Cruel Taskmaster', 'Cult Master',
+    'Dalaran Mage', 'Dancing Swords', 'Dark Cultist', 'Dark Iron Dwarf', 'Darkscale Healer', 'Deadly Poison',
+    'Deadly Shot', 'Deathlord', 'Deathwing', 'Defender of Argus', 'Defias Ringleader', 'Demolisher', 'Demonfire',
+    'Dire Wolf Alpha', 'Divine Favor', 'Divine Spirit', 'Doomguard', 'Doomhammer', 'Doomsayer', 'Dragonling Mechanic',
+    'Drain Life', 'Dread Corsair', 'Dread Infernal', 'Druid of the Claw', 'Duplicate', 'Dust Devil', 'Eaglehorn Bow',
+    'Earth Elemental', 'Earth Shock', 'Earthen Ring Farseer', 'Edwin VanCleef', 'Elite Tauren Chieftain',
+    'Elven Archer', 'Emperor Cobra', 'Equality', 'Ethereal Arcanist', 'Eviscerate', 'Execute', 'Explosive Shot',
+    'Explosive Trap', 'Eye for an Eye', 'Faceless Manipulator', 'Faerie Dragon', 'Fan of Knives', 'Far Sight',
+    'Felguard', 'Fen Creeper', 'Feral Spirit', 'Fiery War Axe', 'Fire Elemental', 'Fireball', 'Flame Imp',
+    'Flamestrike', 'Flametongue Totem', 'Flare', 'Flesheating Ghoul', 'Force of Nature', 'Forked Lightning',
+    'Freezing Trap', 'Frost Elemental', 'Frost Nova', 'Frost Shock', 'Frostbolt', 'Frostwolf Grunt',
+    'Frostwolf Warlord', 'Frothing Berserker', 'Feugen', 'Gadgetzan Auctioneer', 'Gelbin Mekkatorque',
+    "Gladiator's Longbow", 'Gnomish Inventor', 'Goldshire Footman', 'Gorehowl', 'Grimscale Oracle',
+    'Grommash Hellscream', 'Gruul', 'Guardian of Kings', 'Gurubashi Berserker', 'Hammer of Wrath', 'Hand of Protection',
+    'Harrison Jones', 'Harvest Golem', 'Haunted Creeper', 'Headcrack', 'Healing Touch', 'Hellfire', 'Heroic Strike',
+    'Hex', 'Hogger', 'Holy Fire', 'Holy Light', 'Holy Nova', 'Holy Smite', 'Holy Wrath', 'Houndmaster', 'Humility',
+    'Hungry Crab', "Hunter's Mark", 'Ice Barrier', 'Ice Block', 'Ice Lance', 'Illidan Stormrage', 'Imp Master',
+    'Injured Blademaster', 'Inner Fire', 'Inner Rage', 'Innervate', 'Ironbark Protector', 'Ironbeak Owl',
+    'Ironforge Rifleman', 'Ironfur Grizzly', 'Jungle Panther', 'Keeper of the Grove', 'Kidnapper', 'Kill Command',
+    'King Krush', 'King Mukla', 'Kirin Tor Mage', 'Knife Juggler', 'Kobold Geomancer', "Kor'kron Elite", 'Lava Burst',
+    'Lay on Hands', 'Leeroy Jenkins', 'Leper Gnome', "Light's Justice", 'Lightning Bolt', 'Lightning Storm',
+    'Lightspawn', 'Lightwarden', 'Lightwell', 'Loatheb', 'Loot Hoarder', 'Lord Jaraxxus', 'Lord of the Arena',
+    'Lorewalker Cho', 'Mad Bomber', 'Mad Scientist', 'Maexxna', 'Magma Rager', 'Malygos', 'Mana Addict',
+    'Mana Tide Totem', 'Mana Wraith', 'Mana Wyrm', 'Mark of Nature', 'Mark of the Wild', 'Mass Dispel',
+    'Master of Disguise', 'Master Swordsmith', 'Millhouse Manastorm', 'Mind Blast', 'Mind Control', 'Mind Control Tech',
+    'Mind Vision', 'Mindgames', 'Mirror Entity', 'Mirror Image', 'Misdirection', "Mogu'shan Warden", 'Molten Giant',
+    'Moonfire', 'Mortal Coil', 'Mortal Strike', 'Mountain Giant', 'Multi-Shot', 'Murloc Raider', 'Murloc Tidecaller',
+    'Murloc Tidehunter', 'Murloc Warleader', 'Nat Pagle', 'Naturalize', "Nerub'ar Weblord", 'Nerubian Egg',
+    'Nightblade', 'Noble Sacrifice', 'Northshire Cleric', 'Nourish', 'Novice Engineer', 'Nozdormu', 'Oasis Snapjaw',
+    'Ogre Magi', 'Old Murk-Eye', 'Onyxia', 'Patient Assassin', "Perdition's Blade", 'Pint-Sized Summoner', 'Pit Lord',
+    'Polymorph', 'Poison Seeds', 'Power of the Wild', 'Power Overwhelming', 'Power Word: Shield', 'Preparation',
+    'Priestess of Elune', 'Prophet Velen', 'Pyroblast', 'Questing Adventurer', 'Raging Worgen', 'Ragnaros the Firelord',
+    'Raid Leader', 'Rampage', 'Ravenholdt Assassin', 'Razorfen Hunter', 'Reckless Rocketeer', 'Redemption',
+    'Reincarnate', 'Repentance', 'River Crocolisk', 'Rockbiter Weapon', 'Sacrificial Pact', 'Sap', 'Savage Roar',
+    'Savagery', 'Savannah Highmane', 'Scarlet Crusader', 'Scavenging Hyena', 'Sea Giant', 'Secretkeeper',
+    "Sen'jin Shieldmasta", 'Sense Demons', 'Shadow Bolt', 'Shadow Madness', 'Shadow Word: Death', 'Shadow Word: Pain',
+    'Shadowflame', 'Shadowform', 'Shadowstep', 'Shattered Sun Cleric', 'Shield Block', 'Shield Slam', 'Shieldbearer',
+    'Shiv', 'SI:7 Agent', 'Silence', 'Silver Hand Knight', 'Silverback Patriarch', 'Silvermoon Guardian',
+    'Sinister Strike', 'Siphon Soul', 'Slam', 'Sludge Belcher', 'Snake Trap', 'Snipe', "Sorcerer's Apprentice",
+    'Soul of the Forest', 'Soulfire', 'Southsea Captain', 'Southsea Deckhand', 'Spectral Knight', 'Spellbender',
+    'Spellbreaker', 'Spiteful Smith', 'Sprint', 'Stalagg', 'Stampeding Kodo', 'Starfall', 'Starfire',
+    'Starving Buzzard', 'Stoneskin Gargoyle', 'Stonetusk Boar', 'Stormforged Axe', 'Stormpike Commando',
+    'Stormwind Champion', 'Stormwind Knight', 'Stranglethorn Tiger', 'Succubus', 'Summoning Portal',
+    'Sunfury Protector', 'Sunwalker', 'Swipe', 'Sword of Justice', 'Sylvanas Windrunner', 'Tauren Warrior',
+    'Temple Enforcer', 'The Beast', 'The Black Knight', 'Thoughtsteal', 'Thrallmar Farseer', 'Timber Wolf',
+    'Tinkmaster Overspark', 'Tirion Fordring', 'Totemic Might', 'Tracking', 'Truesilver Champion', 'Tundra Rhino',
+    'Twilight Drake', 'Twisting Nether', 'Unbound Elemental', 'Undertaker', 'Unleash the Hounds', 'Unstable Ghoul',
+    'Upgrade!', 'Vanish', 'Vaporize', 'Venture Co. Mercenary', 'Violet Teacher', 'Voidcaller', 'Void Terror',
+    'Voidwalker', 'Voodoo Doctor', 'Wailing Soul', 'War Golem', 'Warsong Commander', 'Water Elemental', 'Webspinner',
+    'Whirlwind', 'Wild Growth', 'Wild Pyromancer', 'Windfury', 'Windfury Harpy', 'Windspeaker', 'Wisp', 'Wolfrider',
+    'Worgen Infiltrator', 'Wrath', 'Young Dragonhawk', 'Young Priestess', 'Youthful Brewmaster', 'Ysera', 'Zombie Chow',
+)
+TEXT = (
+    'Taunt. Deathrattle: Deal 2 damage to ALL characters.', 'Battlecry: Give a minion +2 Attack this turn.',
+    "Battlecry: Destroy your opponent's weapon.", 'Whenever this minion takes damage, draw a card.',
+    'Windfury, Charge, Divine Shield, Taunt',
+    'At the start of your turn, swap this minion with a random one in your hand.',
+    "Battlecry: Change an enemy minion's Attack to 1.", "Battlecry: Set a hero's remaining Health to 15.",
+    'Enrage: +3 Attack', 'Restore a minion to full Health and give it Taunt.',
+    'Choose a minion. When that minion is destroyed, return it to the battlefield.',
+    'Battlecry: Return a friendly minion from the battlefield to your hand.',
+    'Battlecry: Give adjacent minions Spell Damage +1.', 'Choose One - Draw 2 cards; or Restore 5 Health.',
+    'Choose One - +5 Attack; or +5 Health and Taunt.', "Can't Attack.", 'Enrage: +5 Attack.',
+    'Summon a random Beast Companion.', 'Deathrattle: Return a random friendly minion to your hand',
+    'Battlecry: Equip a 2/2 weapon.', 'Deal 1 damage to all enemy minions.',
+    'Charge. Battlecry: Give your opponent a Mana Crystal.', 'Draw 2 cards.',
+    'Deal 3 damage randomly split among enemy characters.', 'Deal 2 damage.', '', 'Spell Damage +1',
+    "Whenever you cast a spell, put a 'Fireball' spell into your hand.", 'Charge, Divine Shield',
+    'Battlecry: Give a friendly minion Divine Shield.', 'Divine Shield',
+    'Whenever a friendly minion takes damage, gain 1 Armor.', '', 'Destroy an enemy minion.',
+    'Your cards and powers that restore Health now deal damage instead.',
+    'Deal 8 damage randomly split among enemy characters.', 'Spell Damage +1. Battlecry: Draw a card.',
+    'Deal 2 damage to an undamaged minion.', 'Deal 2 damage to a character. If that kills it, summon a random Demon.',
+    'At the end of your turn, deal 2 damage to ALL other characters.', 'Your minions trigger their Deathrattles twice.',
+    'Draw a card for each damaged friendly character.', 'Give a Beast +2 Attack and Immune this turn.',
+    'Force an enemy minion to deal its damage to the minions next to it.',
+    'Battlecry: Destroy a minion with an Attack of 7 or more.', 'Give your hero +4 Attack this turn and 4 Armor.',
+    'Destroy your weapon and deal its damage to all enemies.', "Double a minion's Attack.",
+    'Give a minion +4/+4. (+4 Attack/+4 Health)', 'Give a minion +3 Attack.',
+    'Choose a minion. Whenever it attacks, draw a card.', 'Deal 2 damage to all enemy minions and Freeze them.',
+    'Stealth. At the end of your turn, give another random friendly minion +1 Health.',
+    'Battlecry: All minions lose Divine Shield. Gain +3/+3 for each Shield lost.', '',
+    'Give your minions +3 Attack this turn.', 'Spell Damage +1. Deathrattle: Draw a card.',
+    "Battlecry: Remove 1 Durability from your opponent's weapon.",
+    'Battlecry: Gain Attack equal to the Attack of your weapon.', 'Charge', 'Taunt', '',
+    'Destroy all minions except one. (chosen randomly)',
+    'Battlecry: Take control of an enemy minion that has 2 or less Attack.',
+    'Deathrattle: Summon a 4/5 Baine Bloodhoof.', 'Battlecry: Give your weapon +1/+1.',
+    'Battlecry: Put a random Pirate from your deck into your hand.',
+    'Choose One - Give your other minions +2/+2; or Summon two 2/2 Treants with Taunt.',
+    'Give a friendly minion +2 Attack and Charge.', '', 'Restore 4 Health to ALL minions.',
+    'Give your hero +2 Attack this turn and 2 Armor.', 'Deal 2 damage to two random enemy minions.',
+    'Give a minion +2 Attack. Combo: +4 Attack instead.', 'Battlecry: Each player draws 2 cards.',
+    'Battlecry: Give ALL other Murlocs +2 Health.',
+    "Your minions can't be reduced below 1 Health this turn. Draw a card.",
+    'Give your minions Stealth until your next turn.',
+    'Freeze a minion and the minions next to it, and deal 1 damage to them.', 'Deal 2 damage to all enemies.', '',
+    'Choose an enemy minion. At the start of your turn, destroy it.',
+    'Secret: When your opponent casts a spell, Counter it.', 'Battlecry: Swap the Attack and Health of a minion.',
+    'Battlecry: Deal 1 damage to a minion and give it +2 Attack.',
+    'Whenever one of your other minions dies, draw a card.', 'Spell Damage +1',
+    'Deathrattle: Your opponent draws a card.', 'Deathrattle: Give a random friendly minion +3 Health.',
+    'Battlecry: Give a minion +2 Attack this turn.', 'Battlecry: Restore 2 Health to all friendly characters.',
+    'Give your weapon +2 Attack.', 'Destroy a random enemy minion.',
+    'Taunt. Deathrattle: Your opponent puts a minion from their deck into the battlefield',
+    'Battlecry: Destroy all other minions and discard your hand.', 'Battlecry: Give adjacent minions +1/+1 and Taunt.',
+    'Combo: Summon a 2/1 Defias Bandit.', 'At the start of your turn, deal 2 damage to a random enemy.',
+    'Deal 2 damage to a minion. If it?s a friendly Demon, give it +2/+2 instead.', 'Adjacent minions have +1 Attack.',
+    'Draw cards until you have as many in hand as your opponent.', "Double a minion's Health.",
+    'Charge. Battlecry: Discard two random cards.', 'Windfury, Overload: (2)',
+    'At the start of your turn, destroy ALL minions.', 'Battlecry: Summon a 2/1 Mechanical Dragonling.',
+    'Deal 2 damage. Restore 2 Health to your hero.', 'Taunt. Costs (1) less per Attack of your weapon.',
+    'Battlecry: Deal 1 damage to ALL other characters.', 'Choose One - Charge; or +2 Health and Taunt.',
+    'Secret: when a friendly minion dies, put two copies of it into your hand.', 'Windfury. Overload: (2)',
+    'Whenever a Secret is revealed, gain +1 Durability.', 'Taunt. Overload: (3)',
+    'Silence a minion, then deal 1 damage to it.', 'Battlecry: Restore 3 Health.',
+    'Combo: Gain +2/+2 for each card played earlier this turn.',
+    'Battlecry: Give both players the power to ROCK! (with a Power Chord card)', 'Battlecry: Deal 1 damage.',
+    'Destroy any minion damaged by this minion.', 'Change the Health of ALL minions to 1.',
+    'If you control a Secret at the end of your turn, gain +2/+2.', 'Deal 2 damage. Combo: Deal 4 damage instead.',
+    'Destroy a damaged enemy minion.', 'Deal 5 damage to a minion and 2 damage to adjacent ones.',
+    'Secret: When your hero is attacked, deal 2 damage to all enemies.',
+    'Secret: When your hero takes damage, deal that much damage to the enemy hero.',
+    'Battlecry: Choose a minion and become a copy of it.', "Can't be targeted by Spells or Hero Powers.",
+    'Deal 1 damage to all enemy minions. Draw a card.', 'Draw a card. That card costs (3) less.',
+    'Taunt. Battlecry: Destroy one of your Mana Crystals.', 'Taunt',
+    'Summon two 2/3 Spirit Wolves with Taunt. Overload: (2)', '', 'Battlecry: Deal 3 damage.', 'Deal 6 damage.',
+    'Battlecry: Deal 3 damage to your hero.', 'Deal 4 damage to all enemy minions.', 'Adjacent minions have +2 Attack.',
+    'All minions lose Stealth. Destroy all enemy Secrets. Draw a card.', 'Whenever a minion dies, gain +1 Attack.',
+    'Summon three 2/2 Treants with Charge that die at the end of the turn.',
+    'Deal 2 damage to 2 random enemy minions. Overload: (2)',
+    "Secret: When an enemy minion attacks, return it to its owner's hand and it costs (2) more.",
+    'Battlecry: Freeze a character.', 'Freeze all enemy minions.', 'Deal 1 damage to an enemy character and Freeze it.',
+    'Deal 3 damage to a character and Freeze it.', 'Taunt',
+    'Battlecry: Gain +1/+1 for each other friendly minion on the battlefield.',
+    'Whenever a minion takes damage, gain +1 Attack.', 'Deathrattle: If Stalagg also died this game, summon Thaddius.',
+    'Whenever you cast a spell, draw a card.', 'Battlecry: Summon an AWESOME invention.',
+    'Your hero is Immune while attacking.', 'Battlecry: Draw a card.', 'Taunt',
+    'Attacking a minion costs 1 Attack instead of 1 Durability.', 'ALL other Murlocs have +1 Attack.',
+    'Charge. Enrage: +6 Attack', 'At the end of each turn, gain +1/+1 .', 'Battlecry: Restore 6 Health to your hero.',
+    'Whenever this minion takes damage, gain +3 Attack.', 'Deal 3 damage. Draw a card.', 'Give a minion Divine Shield.',
+    "Battlecry: Destroy your opponent's weapon and draw cards equal to its Durability.",
+    'Deathrattle: Summon a 2/1 Damaged Golem.', 'Deathrattle: Summon two 1/1 Spectral Spiders.',
+    'Deal 2 damage to the enemy hero. Combo: Return this to your hand next turn.', 'Restore 8 Health.',
+    'Deal 3 damage to ALL characters.', 'Give your hero +4 Attack this turn.',
+    'Transform a minion into a 0/1 Frog with Taunt.', 'At the end of your turn, summon a 2/2 Gnoll with Taunt.',
+    'Deal 5 damage. Restore 5 Health to your hero.', 'Restore 6 Health.',
+    'Deal 2 damage to all enemies. Restore 2 Health to all friendly characters.', 'Deal 2 damage.',
+    'Draw a card and deal damage equal to its cost.', 'Battlecry: Give a friendly Beast +2/+2 and Taunt.',
+    "Change a minion's Attack to 1.", 'Battlecry: Destroy a Murloc and gain +2/+2.', "Change a minion's Health to 1.",
+    'Secret: As soon as your hero is attacked, gain 8 Armor.',
+    'Secret: When your hero takes fatal damage, prevent it and become Immune this turn.',
+    'Freeze a character. If it was already Frozen, deal 4 damage instead.',
+    'Whenever you play a card, summon a 2/1 Flame of Azzinoth.',
+    'At the end of your turn, deal 1 damage to this minion and summon a 1/1 Imp.',
+    'Battlecry: Deal 4 damage to HIMSELF.', "Change a minion's Attack to be equal to its Health.",
+    'Deal 1 damage to a minion and give it +2 Attack.', 'Gain 2 Mana Crystals this turn only.', 'Taunt',
+    'Battlecry: Silence a minion.', 'Battlecry: Deal 1 damage.', 'Taunt', 'Stealth',
+    'Choose One - Deal 2 damage; or Silence a minion.', "Combo: Return a minion to its owner's hand.",
+    'Deal 3 damage. If you have a Beast, deal 5 damage instead.', 'Charge', 'Battlecry: Give your opponent 2 Bananas.',
+    'Battlecry: The next Secret you play this turn costs (0).',
+    'After you summon a minion, deal 1 damage to a random enemy.', 'Spell Damage +1', 'Charge',
+    'Deal 5 damage. Overload: (2)', 'Restore 8 Health. Draw 3 cards.',
+    'Charge. Battlecry: Summon two 1/1 Whelps for your opponent.', 'Deathrattle: Deal 2 damage to the enemy hero.', '',
+    'Deal 3 damage. Overload: (1)', 'Deal 2-3 damage to all enemy minions. Overload: (2)',
+    "This minion's Attack is always equal to its Health.", 'Whenever a character is healed, gain +2 Attack.',
+    'At the start of your turn, restore 3 Health to a damaged friendly character.',
+    'Battlecry: Enemy spells cost (5) more next turn.', 'Deathrattle: Draw a card.',
+    'Battlecry: Destroy your hero and replace him with Lord Jaraxxus.', 'Taunt',
+    'Whenever a player casts a spell, put a copy into the other player?s hand.',
+    'Battlecry: Deal 3 damage randomly split between all other characters.',
+    'Deathrattle: Put a Secret from your deck onto the battlefield.', 'Destroy any minions damaged by this minion.', '',
+    'Spell Damage +5', 'Whenever you cast a spell, gain +2 Attack this turn.', 'At the end of your turn, draw a card.',
+    'ALL minions cost (1) more.', 'Whenever you cast a spell, gain +1 Attack.',
+    'Choose One - Give a minion +4 Attack; or +4 Health and Taunt.',
+    'Give a minion Taunt and +2/+2. (+2 Attack/+2 Health)', 'Silence all enemy minions. Draw a card.',
+    'Battlecry: Give a friendly minion Stealth.',
+    'At the end of your turn, give another random friendly minion +1 Attack.',
+    'Battlecry: Enemy spells cost (0) next turn.', 'Deal 5 damage to the enemy hero.',
+    'Take control of an enemy minion.',
+    'Battlecry: If your opponent has 4 or more minions, take control of one at random.',
+    "Put a copy of a random card in your opponent's hand into your hand.",
+    "Put a copy of a random minion from your opponent's deck into the battlefield.",
+    'Secret: When your opponent plays a minion, summon a copy of it.', 'Summon two 0/2 minions with Taunt.',
+    'Secret: When a character attacks your hero, instead he attacks another random character.', 'Taunt',
+    'Costs (1) less for each damage your hero has taken.', 'Deal 1 damage.',
+    'Deal 1 damage to a minion. If that kills it, draw a card.',
+    'Deal 4 damage. If you have 12 or less Health, deal 6 instead.', 'Costs (1) less for each other card in your hand.',
+    'Deal 3 damage to two random enemy minions.', '', 'Whenever a Murloc is summoned, gain +1 Attack.',
+    'Battlecry: Summon a 1/1 Murloc Scout.', 'ALL other Murlocs have +2/+1.',
+    'At the start of your turn, you have a 50% chance to draw an extra card.',
+    'Destroy a minion. Your opponent draws 2 cards.', 'Minions with Battlecry cost (2) more.',
+    'Deathrattle: Summon a 4/4 Nerubian.', 'Battlecry: Deal 3 damage to the enemy hero.',
+    'Secret: When an enemy attacks, summon a 2/1 Defender as the new target.',
+    'Whenever a minion is healed, draw a card.', 'Choose One - Gain 2 Mana Crystals; or Draw 3 cards.',
+    'Battlecry: Draw a card.', 'Players only have 15 seconds to take their turns.', '', 'Spell Damage +1',
+    'Charge. Has +1 Attack for each other Murloc on the battlefield.',
+    'Battlecry: Summon 1/1 Whelps until your side of the battlefield is full.',
+    'Stealth. Destroy any minion damaged by this minion.', 'Battlecry: Deal 1 damage. Combo: Deal 2 instead.',
+    'The first minion you play each turn costs (1) less.', 'Battlecry: Deal 5 damage to your hero.',
+    'Transform a minion into a 1/1 Sheep.', 'Destroy all minions and summon 2/2 Treants to replace them.',
+    'Choose One - Give your minions +1/+1; or Summon a 3/2 Panther.',
+    'Give a friendly minion +4/+4 until end of turn. Then, it dies. Horribly.', 'Give a minion +2 Health. Draw a card.',
+    'The next spell you cast this turn costs (3) less.', 'Battlecry: Restore 4 Health to your hero.',
+    'Double the damage and healing of your spells and Hero Power.', 'Deal 10 damage.',
+    'Whenever you play a card, gain +1/+1.', 'Enrage: Windfury and +1 Attack',
+    "Can't Attack. At the end of your turn, deal 8 damage to a random enemy.", 'Your other minions have +1 Attack.',
+    'Give a damaged minion +3/+3.', 'Stealth', 'Battlecry: Summon a 1/1 Boar.', 'Charge',
+    'Secret: When one of your minions dies, return it to life with 1 Health.',
+    'Destroy one of your minions, then return it to life with full Health',
+    'Secret: When your opponent plays a minion, reduce its Health to 1.', '',
+    'Give a friendly character +3 Attack this turn.', 'Destroy a Demon. Restore 5 Health to your hero.',
+    "Return an enemy minion to your opponent's hand.", 'Give your characters +2 Attack this turn.',
+    "Deal damage equal to your hero's Attack to a minion.", 'Deathrattle: Summon two 2/2 Hyenas.', 'Divine Shield',
+    'Whenever a friendly Beast dies, gain +2/+1.', 'Costs (1) less for each other minion on the battlefield.',
+    'Whenever a Secret is played, gain +1/+1.', 'Taunt', 'Put 2 random Demons from your deck into your hand.',
+    'Deal 4 damage to a minion.', 'Gain control of an enemy minion with 3 or less Attack until end of turn.',
+    'Destroy a minion with an Attack of 5 or more.', 'Destroy a minion with 3 or less Attack.',
+    'Destroy a friendly minion and deal its Attack damage to all enemy minions.',
+    "Your Hero Power becomes 'Deal 2 damage'. If already in Shadowform: 3 damage.",
+    'Return a friendly minion to your hand. It costs (2) less.', 'Battlecry: Give a friendly minion +1/+1.',
+    'Gain 5 Armor. Draw a card.', 'Deal 1 damage to a minion for each Armor you have.', 'Taunt',
+    'Deal 1 damage. Draw a card.', 'Combo: Deal 2 damage.', 'Silence a minion.', 'Battlecry: Summon a 2/2 Squire.',
+    'Taunt', 'Divine Shield', 'Deal 3 damage to the enemy hero.', 'Destroy a minion. Restore 3 Health to your hero.',
+    'Deal 2 damage to a minion. If it survives, draw a card.', 'Taunt. Deathrattle: Summon a 1/2 Slime with Taunt.',
+    'Secret: When one of your minions is attacked, summon three 1/1 Snakes.',
+    'Secret: When your opponent plays a minion, deal 4 damage to it.', 'Your spells cost (1) less.',
+    'Give your minions "Deathrattle: Summon a 2/2 Treant."', 'Deal 4 damage. Discard a random card.',
+    'Your other Pirates have +1/+1.', 'Has Charge while you have a weapon equipped.',
+    "Can't be targeted by spells or hero powers.",
+    'Secret: When an enemy casts a spell on a minion, summon a 1/3 as the new target.', 'Battlecry: Silence a minion.',
+    'Enrage: Your weapon has +2 Attack.', 'Draw 4 cards.',
+    'Deathrattle: If Feugen also died this game, summon Thaddius.',
+    'Battlecry: Destroy a random enemy minion with 2 or less Attack.',
+    'Choose One - Deal 5 damage to a minion; or 2 damage to all enemy minions.', 'Deal 5 damage. Draw a card.',
+    'Whenever you summon a Beast, draw a card.', 'At the start of your turn, restore this minion to full Health.',
+    'Charge', 'Overload: (1)', 'Battlecry: Deal 2 damage.', 'Your other minions have +1/+1.', 'Charge', 'Stealth',
+    'Battlecry: Discard a random card.', 'Your minions cost (2) less, but not less than (1).',
+    'Battlecry: Give adjacent minions Taunt.', 'Taunt. Divine Shield',
+    'Deal 4 damage to an enemy and 1 damage to all other enemies.',
+    'Whenever you summon a minion, give it +1/+1 and this loses 1 Durability.',
+    'Deathrattle: Take control of a random enemy minion.', 'Taunt. Enrage: +3 Attack',
+    'Battlecry: Give a friendly minion +3 Health.', 'Deathrattle: Summon a 3/3 Finkle Einhorn for your opponent.',
+    'Battlecry: Destroy an enemy minion with Taunt.',
+    "Copy 2 cards from your opponent's deck and put them into your hand.", 'Windfury',
+    'Your other Beasts have +1 Attack.',
+    'Battlecry: Transform another random minion into a 5/5 Devilsaur or a 1/1 Squirrel.',
+    'Divine Shield. Taunt. Deathrattle: Equip a 5/3 Ashbringer.', 'Give your Totems +2 Health.',
+    'Look at the top three cards of your deck. Draw one and discard the others.',
+    'Whenever your hero attacks, restore 2 Health to it.', 'Your Beasts have Charge.',
+    'Battlecry: Gain +1 Health for each card in your hand.', 'Destroy all minions.',
+    'Whenever you play a card with Overload, gain +1/+1.', 'Whenever you summon a minion with Deathrattle, gain +1/+1.',
+    'For each enemy minion, summon a 1/1 Hound with Charge.', 'Taunt. Deathrattle: Deal 1 damage to all minions.',
+    'If you have a weapon, give it +1/+1. Otherwise equip a 1/3 weapon.', "Return all minions to their owner's hand.",
+    'Secret: When a minion attacks your hero, destroy it.', 'Your minions cost (3) more.',
+    'Whenever you cast a spell, summon a 1/1 Violet Apprentice.',
+    'Deathrattle: Put a random demon from your hand into the battlefield.',
+    'Battlecry: Destroy the minions on either side of this minion and gain their Attack and Health.', 'Taunt',
+    'Battlecry: Restore 2 Health.', 'Battlecry: Silence your other minions.', '',
+    'Whenever you summon a minion with 3 or less Attack, give it Charge.',
+    'Freeze any character damaged by this minion.', 'Deathrattle: Add a random Beast card to your hand.',
+    'Deal 1 damage to ALL minions.', 'Gain an empty Mana Crystal.',
+    'After you cast a spell, deal 1 damage to ALL minions.', 'Give a minion Windfury.', 'Windfury',
+    'Battlecry: Give a friendly minion Windfury.', '', 'Charge', 'Stealth',
+    'Choose One - Deal 3 damage to a minion; or 1 damage and draw a card.', 'Windfury',
+    'At the end of your turn, give another random friendly minion +1 Health.',
+    'Battlecry: Return a friendly minion from the battlefield to your hand.',
+    'At the end of your turn, draw a Dream Card.', 'Deathrattle: Restore 5 Health to the enemy hero.',
+)
+MANA = (
+    5, 1, 2, 3, 8, 3, 3, 9, 2, 0, 2, 4, 4, 7, 7, 2, 1, 3, 4, 4, 2, 3, 3, 1, 1, 5, 6, 7, 6, 2, 1, 2, 5, 5, 4, 6, 5, 0, 5,
+    7, 4, 2, 1, 2, 3, 4, 2, 5, 4, 1, 1, 6, 1, 3, 2, 5, 2, 1, 2, 2, 5, 6, 5, 6, 6, 5, 2, 9, 3, 4, 0, 1, 2, 1, 3, 3, 2, 1,
+    4, 4, 7, 1, 3, 2, 2, 4, 3, 3, 3, 4, 5, 1, 3, 3, 10, 4, 2, 3, 2, 2, 3, 2, 5, 5, 2, 4, 3, 4, 6, 5, 3, 1, 3, 5, 1, 3,
+    3, 5, 1, 3, 2, 4, 2, 1, 5, 2, 1, 5, 2, 3, 3, 3, 5, 3, 2, 6, 4, 1, 7, 2, 1, 3, 6, 1, 2, 6, 3, 1, 2, 2, 5, 3, 5, 5, 6,
+    7, 4, 1, 7, 1, 8, 8, 7, 5, 4, 1, 5, 3, 2, 3, 3, 4, 2, 3, 6, 6, 2, 5, 1, 5, 4, 1, 1, 0, 3, 3, 1, 6, 3, 3, 1, 0, 0, 8,
+    2, 3, 3, 3, 4, 6, 3, 9, 3, 3, 2, 2, 4, 3, 8, 4, 1, 1, 1, 3, 4, 1, 2, 5, 2, 9, 6, 2, 2, 2, 6, 3, 9, 2, 3, 2, 1, 3, 2,
+    4, 4, 2, 2, 2, 10, 3, 1, 4, 3, 1, 2, 4, 20, 0, 1, 4, 12, 4, 1, 1, 2, 3, 2, 1, 2, 2, 5, 1, 1, 5, 2, 9, 4, 4, 4, 9, 2,
+    3, 2, 4, 4, 4, 2, 1, 1, 0, 6, 7, 10, 3, 3, 8, 3, 2, 7, 3, 6, 1, 2, 1, 2, 1, 0, 2, 3, 1, 6, 3, 2, 10, 1, 4, 3, 3, 4,
+    3, 2, 4, 3, 0, 3, 3, 1, 1, 2, 3, 0, 5, 3, 4, 1, 6, 2, 5, 2, 2, 2, 4, 0, 3, 1, 5, 3, 4, 5, 7, 5, 5, 5, 6, 2, 3, 1, 2,
+    5, 7, 4, 5, 2, 4, 2, 6, 4, 3, 6, 3, 6, 6, 6, 3, 3, 1, 3, 8, 0, 1, 4, 5, 4, 8, 3, 1, 3, 2, 1, 6, 3, 5, 4, 4, 3, 1, 1,
+    4, 7, 3, 4, 1, 1, 2, 2, 2, 6, 4, 0, 3, 1, 2, 1, 1, 2, 9, 1,
+)
+ATTACK = (
+    4, 2, 3, 1, 3, 0, 3, 8, 2, None, None, 5, 2, 5, 5, 4, 1, None, 5, 3, None, 4, None, None, None, 5, 4, 5, 4, 2, 1, 1,
+    3, None, 3, None, 4, None, None, 7, 1, None, None, None, 4, None, None, None, None, None, None, None, 0, 3, 3, None,
+    1, 1, 2, 2, 5, 6, None, 4, 4, 5, 1, 5, None, 4, None, None, None, None, 2, 2, None, None, None, None, 9, None, None,
+    2, 2, 4, 1, 4, 3, 4, 4, None, None, 2, 12, 2, 2, 1, None, 2, None, None, 5, 2, 0, 2, None, 3, 6, 4, None, 3, 3, 7,
+    None, 3, 2, 5, 1, 2, None, 3, None, None, None, None, None, 3, 3, None, None, 3, 3, None, 3, 6, None, 3, None, 0,
+    None, 2, None, None, None, 5, None, None, None, 2, 4, 2, 4, 4, 6, 5, 2, 1, 7, 1, 4, 7, 5, 2, None, None, 5, 2, 1,
+    None, None, None, None, None, 4, None, None, None, None, None, 4, None, 1, None, None, None, None, 7, 1, 4, None,
+    None, None, 8, 2, 2, 3, 4, 2, 5, None, 8, 5, 4, 3, 2, 4, None, None, 6, 2, 1, None, None, 0, 1, 0, 5, 2, 3, 6, 0, 3,
+    2, 2, 5, 4, 1, 0, 2, 1, None, None, None, 4, 1, 4, None, None, 3, None, None, None, None, None, 1, 8, None, None,
+    None, 8, None, 2, 1, 2, 3, 0, None, 1, 0, 4, None, 1, None, 1, 8, 2, 4, 2, 8, 1, 2, 2, 5, None, None, None, None,
+    None, None, 5, 7, None, 2, 3, 8, 2, None, 7, 2, 5, None, None, None, 2, None, None, None, None, None, 6, 3, 2, 8, 1,
+    3, None, None, None, None, None, None, None, None, 3, None, None, 0, None, 3, None, 4, 1, 3, None, None, None, 3,
+    None, None, 3, None, None, 3, 2, 4, None, 4, 4, None, 7, 3, None, None, 2, 1, 1, 2, 4, 6, 2, 5, 4, 0, 2, 4, None, 1,
+    5, 2, 6, 9, 4, None, 2, 1, 3, 6, None, None, 4, 2, 4, None, 2, 1, None, 1, None, None, None, 7, 3, 3, 3, 1, 2, 3, 7,
+    2, 3, 1, None, None, 3, None, 4, 3, 1, 3, 2, None, 1, 2, 3, 4, 2,
+)
+HEALTH = (
+    4, 1, 2, 3, 5, 3, 3, 8, 3, None, None, 4, 5, 5, 5, 5, 1, None, 5, 3, None, 2, None, None, None, 2, 7, 7, 2, 2, 1, 4,
+    4, None, 5, None, 4, None, None, 5, 7, None, None, None, 2, None, None, None, None, None, None, None, 1, 3, 2, None,
+    1, 2, 3, 1, 4, 7, None, 5, 5, 4, 1, 8, None, 5, None, None, None, None, 2, 3, None, None, None, None, 5, None, None,
+    2, 2, 2, 4, 4, 4, 4, 5, None, None, 8, 12, 3, 2, 4, None, 2, None, None, 7, 8, 7, 4, None, 3, 6, 4, None, 1, 2, 8,
+    None, 3, 2, 5, 1, 3, None, 3, None, None, None, None, None, 3, 2, None, None, 5, 6, None, 2, 5, None, 2, None, 3,
+    None, 3, None, None, None, 5, None, None, None, 2, 4, 4, 7, 4, 6, 2, 4, 2, 1, 1, 9, 7, 6, 7, None, None, 4, 3, 2,
+    None, None, None, None, None, 4, None, None, None, None, None, 3, None, 2, None, None, None, None, 5, 5, 7, None,
+    None, None, 8, 1, 2, 3, 2, 4, 3, None, 8, 5, 3, 2, 2, 3, None, None, 2, 1, 4, None, None, 5, 2, 5, 5, 1, 15, 5, 4,
+    2, 2, 8, 1, 12, 3, 3, 2, 3, None, None, None, 4, 3, 4, None, None, 3, None, None, None, None, None, 7, 8, None,
+    None, None, 8, None, 1, 2, 1, 3, 4, None, 4, 2, 4, None, 3, None, 1, 8, 7, 4, 4, 8, 1, 2, 2, 6, None, None, None,
+    None, None, None, 4, 7, None, 2, 3, 8, 2, None, 5, 3, 2, None, None, None, 3, None, None, None, None, None, 5, 1, 2,
+    8, 2, 5, None, None, None, None, None, None, None, None, 2, None, None, 4, None, 3, None, 4, 4, 3, None, None, None,
+    5, None, None, 2, None, None, 3, 1, 6, None, 3, 6, None, 4, 5, None, None, 1, 4, 1, 3, 2, 6, 5, 5, 3, 4, 3, 5, None,
+    5, 5, 3, 6, 7, 5, None, 3, 1, 3, 6, None, None, 2, 5, 1, None, 4, 2, None, 3, None, None, None, 6, 5, 4, 3, 3, 1, 5,
+    7, 3, 6, 1, None, None, 2, None, 5, 3, 1, 1, 1, None, 1, 1, 2, 12, 3,
+)
+CHARACTER_CLASS = (
+    0, 0, 0, 0, 3, 0, 7, 0, 0, 3, 3, 0, 0, 5, 5, 0, 0, 2, 8, 4, 1, 0, 1, 1, 2, 4, 0, 1, 0, 7, 0, 4, 8, 8, 6, 7, 0, 8, 9,
+    0, 0, 4, 2, 8, 0, 5, 8, 7, 7, 7, 7, 1, 9, 0, 0, 3, 0, 0, 0, 0, 0, 0, 4, 6, 0, 0, 0, 5, 4, 0, 6, 5, 4, 8, 0, 0, 4, 8,
+    1, 7, 0, 9, 1, 0, 4, 0, 0, 0, 6, 0, 0, 8, 2, 0, 0, 0, 8, 0, 9, 0, 7, 6, 9, 3, 0, 0, 9, 0, 9, 5, 1, 3, 2, 3, 3, 0, 8,
+    0, 0, 0, 7, 1, 8, 4, 2, 2, 7, 0, 0, 8, 3, 9, 0, 3, 4, 3, 1, 9, 1, 3, 2, 0, 5, 3, 2, 0, 1, 3, 1, 0, 0, 4, 0, 0, 0, 2,
+    0, 0, 4, 0, 4, 0, 7, 0, 7, 7, 0, 0, 0, 8, 5, 9, 4, 3, 0, 6, 7, 6, 6, 7, 2, 7, 0, 2, 1, 1, 1, 0, 0, 0, 6, 4, 5, 5, 0,
+    0, 0, 0, 5, 8, 2, 2, 0, 1, 0, 0, 4, 3, 7, 0, 0, 7, 3, 3, 6, 0, 6, 0, 0, 9, 0, 0, 0, 0, 0, 0, 0, 0, 3, 0, 1, 5, 5, 6,
+    8, 0, 0, 6, 6, 0, 6, 6, 1, 1, 2, 0, 0, 5, 9, 4, 0, 2, 0, 0, 0, 0, 0, 5, 0, 0, 0, 7, 6, 5, 0, 0, 0, 0, 0, 0, 8, 8, 0,
+    9, 1, 5, 5, 9, 6, 8, 0, 6, 1, 0, 0, 0, 0, 4, 0, 0, 0, 7, 3, 7, 0, 3, 9, 8, 5, 5, 2, 0, 2, 0, 0, 0, 9, 9, 6, 6, 6, 9,
+    6, 8, 0, 4, 4, 0, 8, 8, 6, 0, 0, 0, 8, 9, 4, 0, 2, 2, 1, 5, 9, 0, 0, 0, 1, 0, 0, 8, 0, 0, 5, 5, 2, 0, 0, 3, 0, 0, 0,
+    0, 9, 9, 0, 0, 5, 7, 0, 0, 6, 0, 0, 6, 0, 2, 0, 7, 3, 2, 7, 2, 0, 9, 3, 0, 2, 0, 4, 8, 1, 0, 0, 9, 9, 9, 0, 0, 0, 4,
+    1, 2, 4, 5, 0, 3, 0, 3, 0, 0, 0, 5, 0, 0, 0, 0, 0,
+)
+MINION_TYPE = (
+    0, 0, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 5, 0, 1, 0, 0, 6, 6, 2, 0, 0, 0, 0, 0, 6, 1, 0, 0, 0, 0, 0, 0, 0, 2, 2, 0, 0,
+    0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 0, 0, 0, 0, 1, 0, 0, 5, 0, 0, 0, 0, 6, 5, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 3, 0, 0, 5, 0, 0, 0, 0, 0, 5, 0, 7, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 5, 0, 0, 0, 0, 0, 0, 1,
+    0, 1, 1, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 5, 0, 0, 0, 0, 1, 0, 3, 0, 7, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 1, 0, 2, 3, 0, 0, 0,
+    5, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6, 6, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0, 1, 0, 0, 0, 0,
+    1, 5, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 1, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 5, 5, 5, 0, 0, 0, 0,
+    0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 3, 0,
+)
+RARITY = (
+    3, 2, 2, 2, 5, 3, 3, 5, 2, 1, 3, 2, 3, 4, 4, 3, 3, 2, 2, 2, 1, 3, 1, 1, 1, 2, 2, 5, 3, 2, 2, 3, 2, 1, 3, 4, 3, 1, 4,
+    5, 5, 2, 4, 2, 4, 3, 3, 3, 2, 1, 2, 3, 2, 4, 1, 2, 5, 3, 2, 2, 2, 1, 4, 4, 5, 5, 4, 5, 1, 2, 2, 1, 2, 2, 3, 3, 3, 2,
+    2, 2, 2, 2, 3, 3, 2, 2, 2, 2, 2, 2, 2, 1, 2, 3, 5, 3, 2, 3, 2, 2, 3, 2, 3, 4, 4, 2, 1, 2, 2, 2, 2, 2, 3, 4, 2, 2, 5,
+    5, 2, 3, 3, 3, 2, 1, 3, 2, 2, 4, 2, 2, 4, 3, 2, 3, 1, 2, 1, 2, 2, 2, 3, 2, 4, 2, 2, 2, 2, 1, 2, 2, 2, 3, 5, 3, 5, 4,
+    2, 2, 4, 2, 5, 5, 2, 2, 1, 1, 5, 2, 2, 3, 1, 1, 1, 1, 5, 3, 1, 2, 1, 3, 1, 2, 4, 2, 2, 4, 2, 5, 3, 3, 2, 2, 1, 2, 2,
+    2, 2, 2, 3, 4, 2, 5, 5, 3, 3, 2, 2, 3, 4, 5, 2, 1, 2, 3, 2, 3, 3, 5, 2, 5, 2, 5, 2, 2, 5, 1, 5, 3, 3, 3, 2, 2, 1, 3,
+    3, 3, 5, 1, 2, 3, 2, 4, 2, 2, 3, 2, 4, 2, 2, 3, 4, 1, 1, 3, 2, 4, 5, 2, 2, 3, 1, 2, 1, 3, 1, 5, 1, 2, 5, 5, 4, 3, 3,
+    4, 1, 2, 2, 2, 1, 4, 2, 5, 4, 3, 2, 5, 1, 2, 3, 2, 1, 2, 2, 2, 1, 1, 2, 1, 2, 3, 3, 2, 2, 4, 3, 1, 2, 1, 3, 2, 1, 3,
+    4, 2, 2, 2, 4, 2, 2, 3, 2, 2, 2, 2, 1, 3, 2, 2, 4, 2, 2, 2, 2, 4, 2, 2, 4, 2, 2, 2, 5, 3, 3, 2, 2, 2, 1, 2, 2, 2, 2,
+    2, 1, 2, 3, 3, 2, 4, 5, 2, 2, 5, 5, 2, 2, 1, 5, 5, 2, 1, 2, 2, 3, 4, 2, 2, 2, 2, 3, 2, 3, 2, 3, 2, 3, 1, 1, 3, 2, 1,
+    2, 2, 2, 1, 3, 1, 2, 2, 2, 1, 2, 2, 2, 3, 2, 5, 2,
+)
+TYPE = (
+    'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'spell', 'spell',
+    'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'spell', 'minion', 'minion', 'spell', 'minion', 'spell',
+    'spell', 'spell', 'weapon', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'weapon', 'spell', 'minion',
+    'spell', 'minion', 'spell', 'spell', 'minion', 'minion', 'spell', 'spell', 'spell', 'minion', 'spell', 'spell',
+    'spell', 'spell', 'spell', 'spell', 'spell', 'minion', 'minion', 'minion', 'spell', 'minion', 'minion', 'minion',
+    'minion', 'minion', 'minion', 'spell', 'minion', 'minion', 'minion', 'minion', 'minion', 'spell', 'minion', 'spell',
+    'spell', 'spell', 'spell', 'minion', 'minion', 'spell', 'spell', 'spell', 'spell', 'minion', 'spell', 'spell',
+    'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'spell', 'spell', 'minion',
+    'minion', 'minion', 'minion', 'minion', 'spell', 'minion', 'spell', 'spell', 'minion', 'weapon', 'minion', 'minion',
+    'spell', 'minion', 'minion', 'minion', 'spell', 'minion', 'weapon', 'minion', 'spell', 'minion', 'minion', 'minion',
+    'minion', 'minion', 'spell', 'minion', 'spell', 'spell', 'spell', 'spell', 'spell', 'minion', 'minion', 'spell',
+    'spell', 'minion', 'minion', 'spell', 'weapon', 'minion', 'spell', 'minion', 'spell', 'minion', 'spell', 'minion',
+    'spell', 'spell', 'spell', 'minion', 'spell', 'spell', 'spell', 'minion', 'minion', 'minion', 'minion', 'minion',
+    'minion', 'weapon', 'minion', 'minion', 'weapon', 'minion', 'minion', 'minion', 'minion', 'minion', 'spell',
+    'spell', 'minion', 'minion', 'minion', 'spell', 'spell', 'spell', 'spell', 'spell', 'minion', 'spell', 'spell',
+    'spell', 'spell', 'spell', 'minion', 'spell', 'minion', 'spell', 'spell', 'spell', 'spell', 'minion', 'minion',
+    'minion', 'spell', 'spell', 'spell', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'spell',
+    'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'spell', 'spell', 'minion', 'minion', 'weapon', 'spell',
+    'spell', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion',
+    'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'spell', 'spell', 'spell', 'minion', 'minion',
+    'minion', 'spell', 'spell', 'minion', 'spell', 'spell', 'spell', 'spell', 'spell', 'minion', 'minion', 'spell',
+    'spell', 'spell', 'minion', 'spell', 'minion', 'minion', 'minion', 'minion', 'minion', 'spell', 'minion', 'minion',
+    'minion', 'spell', 'minion', 'spell', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion',
+    'weapon', 'minion', 'minion', 'spell', 'spell', 'spell', 'spell', 'spell', 'spell', 'minion', 'minion', 'spell',
+    'minion', 'minion', 'minion', 'minion', 'spell', 'minion', 'minion', 'minion', 'spell', 'spell', 'spell', 'minion',
+    'spell', 'spell', 'spell', 'spell', 'spell', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'spell',
+    'spell', 'spell', 'spell', 'spell', 'spell', 'spell', 'spell', 'minion', 'spell', 'spell', 'minion', 'spell',
+    'minion', 'spell', 'minion', 'minion', 'minion', 'spell', 'spell', 'spell', 'minion', 'spell', 'spell', 'minion',
+    'spell', 'spell', 'minion', 'minion', 'minion', 'spell', 'minion', 'minion', 'spell', 'minion', 'minion', 'spell',
+    'spell', 'minion', 'minion', 'minion', 'weapon', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion',
+    'minion', 'minion', 'spell', 'weapon', 'minion', 'minion', 'minion', 'minion', 'minion', 'spell', 'minion',
+    'minion', 'minion', 'minion', 'spell', 'spell', 'weapon', 'minion', 'minion', 'spell', 'minion', 'minion', 'spell',
+    'minion', 'spell', 'spell', 'spell', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion', 'minion',
+    'minion', 'minion', 'minion', 'spell', 'spell', 'minion', 'spell', 'minion', 'minion', 'minion', 'minion', 'minion',
+    'spell', 'minion', 'minion', 'minion', 'minion', 'minion',
+)
+SET = (
+    2, 2, 1, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 1, 5, 2, 1, 2, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 1, 1, 2, 2, 2, 1, 2,
+    2, 5, 2, 2, 2, 2, 2, 2, 2, 1, 1, 2, 2, 2, 2, 1, 1, 2, 2, 2, 1, 1, 1, 2, 2, 2, 2, 3, 2, 1, 1, 2, 1, 1, 2, 2, 2, 2, 2,
+    2, 1, 1, 1, 2, 2, 2, 2, 1, 5, 5, 2, 1, 1, 2, 5, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 1, 1, 2, 1, 2, 5, 2, 2, 2, 2, 2, 2,
+    4, 1, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 1, 1, 1, 2, 1, 1, 2, 2, 2, 2, 2, 2, 1, 1, 1, 1, 1, 2, 5, 2, 4, 2,
+    1, 1, 2, 1, 2, 2, 1, 1, 1, 1, 2, 2, 5, 2, 1, 1, 1, 1, 2, 2, 1, 1, 1, 2, 1, 1, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 1, 1, 2,
+    1, 1, 2, 2, 2, 1, 2, 2, 2, 2, 1, 1, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 5, 2, 2, 1, 2, 2, 5, 5, 1, 2, 2, 2, 2, 2, 2, 1, 2,
+    2, 2, 2, 1, 1, 2, 1, 2, 2, 1, 2, 2, 2, 1, 1, 2, 2, 1, 1, 2, 1, 2, 2, 2, 5, 5, 1, 2, 1, 2, 1, 2, 1, 1, 3, 2, 2, 2, 2,
+    2, 1, 5, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 1, 1, 2, 5, 2, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 1, 2, 1, 2, 1, 1, 2,
+    2, 2, 1, 1, 2, 2, 1, 2, 2, 2, 1, 2, 1, 2, 2, 5, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2, 1, 5, 2, 2, 1, 1, 5, 1, 2, 1, 1, 1,
+    2, 1, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2, 2, 2, 1, 2, 2, 1, 1, 1, 1, 2, 2, 2, 5, 2, 5, 2, 1, 2, 2, 2, 5, 2, 1, 1, 5, 1, 1,
+    1, 5, 1, 1, 2, 1, 2, 1, 2, 1, 2, 2, 2, 2, 2, 2, 5,
+)
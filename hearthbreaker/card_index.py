@@ -0,0 +1,478 @@
+"""
+The table of implemented cards used by :mod:`hearthbreaker.card_registry`.
+
+Generated by ``python -m hearthbreaker.card_registry``.  Do not edit by hand.
+"""
+CARDS = [
+    ('Ancient of Lore', 'hearthbreaker.cards.minions.druid', 'AncientOfLore', 7, 5, 4, 0, 'minion', False),
+    ('Ancient of War', 'hearthbreaker.cards.minions.druid', 'AncientOfWar', 7, 5, 4, 0, 'minion', False),
+    ('Cenarius', 'hearthbreaker.cards.minions.druid', 'Cenarius', 9, 5, 5, 0, 'minion', False),
+    ('Druid of the Claw', 'hearthbreaker.cards.minions.druid', 'DruidOfTheClaw', 5, 5, 2, 0, 'minion', False),
+    ('Ironbark Protector', 'hearthbreaker.cards.minions.druid', 'IronbarkProtector', 8, 5, 2, 0, 'minion', False),
+    ('Keeper of the Grove', 'hearthbreaker.cards.minions.druid', 'KeeperOfTheGrove', 4, 5, 3, 0, 'minion', False),
+    ('Houndmaster', 'hearthbreaker.cards.minions.hunter', 'Houndmaster', 4, 2, 1, 0, 'minion', True),
+    ('Hyena', 'hearthbreaker.cards.minions.hunter', 'Hyena', 2, 2, -1, 1, 'minion', False),
+    ('King Krush', 'hearthbreaker.cards.minions.hunter', 'KingKrush', 9, 2, 5, 1, 'minion', False),
+    ('Savannah Highmane', 'hearthbreaker.cards.minions.hunter', 'SavannahHighmane', 6, 2, 3, 1, 'minion', False),
+    ('Scavenging Hyena', 'hearthbreaker.cards.minions.hunter', 'ScavengingHyena', 2, 2, 2, 1, 'minion', False),
+    ('Starving Buzzard', 'hearthbreaker.cards.minions.hunter', 'StarvingBuzzard', 2, 2, 2, 1, 'minion', False),
+    ('Timber Wolf', 'hearthbreaker.cards.minions.hunter', 'TimberWolf', 1, 2, 1, 1, 'minion', False),
+    ('Tundra Rhino', 'hearthbreaker.cards.minions.hunter', 'TundraRhino', 5, 2, 2, 1, 'minion', False),
+    ('Webspinner', 'hearthbreaker.cards.minions.hunter', 'Webspinner', 1, 2, 2, 1, 'minion', False),
+    ('Archmage Antonidas', 'hearthbreaker.cards.minions.mage', 'ArchmageAntonidas', 7, 1, 5, 0, 'minion', False),
+    ('Ethereal Arcanist', 'hearthbreaker.cards.minions.mage', 'EtherealArcanist', 4, 1, 3, 0, 'minion', False),
+    ('Kirin Tor Mage', 'hearthbreaker.cards.minions.mage', 'KirinTorMage', 3, 1, 3, 0, 'minion', True),
+    ('Mana Wyrm', 'hearthbreaker.cards.minions.mage', 'ManaWyrm', 1, 1, 2, 0, 'minion', False),
+    ("Sorcerer's Apprentice", 'hearthbreaker.cards.minions.mage', 'SorcerersApprentice', 2, 1, 2, 0, 'minion', False),
+    ('Water Elemental', 'hearthbreaker.cards.minions.mage', 'WaterElemental', 4, 1, 2, 0, 'minion', False),
+    ('Abomination', 'hearthbreaker.cards.minions.neutral', 'Abomination', 5, 0, 3, 0, 'minion', False),
+    ('Abusive Sergeant', 'hearthbreaker.cards.minions.neutral', 'AbusiveSergeant', 1, 0, 2, 0, 'minion', True),
+    ('Acidic Swamp Ooze', 'hearthbreaker.cards.minions.neutral', 'AcidicSwampOoze', 2, 0, 2, 0, 'minion', True),
+    ('Acolyte of Pain', 'hearthbreaker.cards.minions.neutral', 'AcolyteOfPain', 3, 0, 2, 0, 'minion', False),
+    ('Alarm-o-Bot', 'hearthbreaker.cards.minions.neutral', 'AlarmoBot', 3, 0, 3, 0, 'minion', False),
+    ('Alexstrasza', 'hearthbreaker.cards.minions.neutral', 'Alexstrasza', 9, 0, 5, 3, 'minion', True),
+    ('Amani Berserker', 'hearthbreaker.cards.minions.neutral', 'AmaniBerserker', 2, 0, 2, 0, 'minion', False),
+    ('Ancient Brewmaster', 'hearthbreaker.cards.minions.neutral', 'AncientBrewmaster', 4, 0, 2, 0, 'minion', True),
+    ('Ancient Mage', 'hearthbreaker.cards.minions.neutral', 'AncientMage', 4, 0, 3, 0, 'minion', True),
+    ('Ancient Watcher', 'hearthbreaker.cards.minions.neutral', 'AncientWatcher', 2, 0, 3, 0, 'minion', False),
+    ('Angry Chicken', 'hearthbreaker.cards.minions.neutral', 'AngryChicken', 1, 0, 3, 1, 'minion', False),
+    ('Arcane Golem', 'hearthbreaker.cards.minions.neutral', 'ArcaneGolem', 3, 0, 3, 0, 'minion', True),
+    ('Archmage', 'hearthbreaker.cards.minions.neutral', 'Archmage', 6, 0, 2, 0, 'minion', False),
+    ('Argent Commander', 'hearthbreaker.cards.minions.neutral', 'ArgentCommander', 6, 0, 3, 0, 'minion', False),
+    ('Argent Squire', 'hearthbreaker.cards.minions.neutral', 'ArgentSquire', 1, 0, 2, 0, 'minion', False),
+    ('Azure Drake', 'hearthbreaker.cards.minions.neutral', 'AzureDrake', 5, 0, 3, 3, 'minion', True),
+    ('Baine Bloodhoof', 'hearthbreaker.cards.minions.neutral', 'BaineBloodhoof', 4, 0, -1, 0, 'minion', False),
+    ('Bananas', 'hearthbreaker.cards.minions.neutral', 'Bananas', 1, 0, -1, None, 'spell', False),
+    ('Baron Geddon', 'hearthbreaker.cards.minions.neutral', 'BaronGeddon', 7, 0, 5, 0, 'minion', False),
+    ('Baron Rivendare', 'hearthbreaker.cards.minions.neutral', 'BaronRivendare', 4, 0, 5, 0, 'minion', False),
+    ('Big Game Hunter', 'hearthbreaker.cards.minions.neutral', 'BigGameHunter', 3, 0, 4, 0, 'minion', True),
+    ('Blood Knight', 'hearthbreaker.cards.minions.neutral', 'BloodKnight', 3, 0, 4, 0, 'minion', True),
+    ('Bloodfen Raptor', 'hearthbreaker.cards.minions.neutral', 'BloodfenRaptor', 2, 0, 1, 1, 'minion', False),
+    ('Bloodmage Thalnos', 'hearthbreaker.cards.minions.neutral', 'BloodmageThalnos', 2, 0, 5, 0, 'minion', False),
+    ('Bloodsail Corsair', 'hearthbreaker.cards.minions.neutral', 'BloodsailCorsair', 1, 0, 3, 6, 'minion', True),
+    ('Bloodsail Raider', 'hearthbreaker.cards.minions.neutral', 'BloodsailRaider', 2, 0, 2, 6, 'minion', True),
+    ('Bluegill Warrior', 'hearthbreaker.cards.minions.neutral', 'BluegillWarrior', 2, 0, 2, 2, 'minion', False),
+    ('Boar', 'hearthbreaker.cards.minions.neutral', 'Boar', 1, 0, -1, 1, 'minion', False),
+    ('Booty Bay Bodyguard', 'hearthbreaker.cards.minions.neutral', 'BootyBayBodyguard', 5, 0, 2, 0, 'minion', False),
+    ('Boulderfist Ogre', 'hearthbreaker.cards.minions.neutral', 'BoulderfistOgre', 6, 0, 1, 0, 'minion', False),
+    ('Cairne Bloodhoof', 'hearthbreaker.cards.minions.neutral', 'CairneBloodhoof', 6, 0, 5, 0, 'minion', False),
+    ('Captain Greenskin', 'hearthbreaker.cards.minions.neutral', 'CaptainGreenskin', 5, 0, 5, 6, 'minion', True),
+    ("Captain's Parrot", 'hearthbreaker.cards.minions.neutral', 'CaptainsParrot', 2, 0, 4, 1, 'minion', True),
+    ('Chicken', 'hearthbreaker.cards.minions.neutral', 'Chicken', 0, 0, -1, 1, 'minion', False),
+    ('Chillwind Yeti', 'hearthbreaker.cards.minions.neutral', 'ChillwindYeti', 4, 0, 2, 0, 'minion', False),
+    ('Coldlight Oracle', 'hearthbreaker.cards.minions.neutral', 'ColdlightOracle', 3, 0, 3, 2, 'minion', True),
+    ('Coldlight Seer', 'hearthbreaker.cards.minions.neutral', 'ColdlightSeer', 3, 0, 3, 2, 'minion', True),
+    ('Core Hound', 'hearthbreaker.cards.minions.neutral', 'CoreHound', 7, 0, 2, 1, 'minion', False),
+    ('Crazed Alchemist', 'hearthbreaker.cards.minions.neutral', 'CrazedAlchemist', 2, 0, 3, 0, 'minion', True),
+    ('Cult Master', 'hearthbreaker.cards.minions.neutral', 'CultMaster', 4, 0, 2, 0, 'minion', False),
+    ('Dalaran Mage', 'hearthbreaker.cards.minions.neutral', 'DalaranMage', 3, 0, 2, 0, 'minion', False),
+    ('Damaged Golem', 'hearthbreaker.cards.minions.neutral', 'DamagedGolem', 1, 0, -1, 0, 'minion', False),
+    ('Dancing Swords', 'hearthbreaker.cards.minions.neutral', 'DancingSwords', 3, 0, 2, 0, 'minion', False),
+    ('Dark Iron Dwarf', 'hearthbreaker.cards.minions.neutral', 'DarkIronDwarf', 4, 0, 2, 0, 'minion', True),
+    ('Darkscale Healer', 'hearthbreaker.cards.minions.neutral', 'DarkscaleHealer', 5, 0, 2, 0, 'minion', True),
+    ('Deathlord', 'hearthbreaker.cards.minions.neutral', 'Deathlord', 3, 0, 3, 0, 'minion', False),
+    ('Deathwing', 'hearthbreaker.cards.minions.neutral', 'Deathwing', 10, 0, 5, 3, 'minion', True),
+    ('Defender of Argus', 'hearthbreaker.cards.minions.neutral', 'DefenderOfArgus', 4, 0, 3, 0, 'minion', True),
+    ('Demolisher', 'hearthbreaker.cards.minions.neutral', 'Demolisher', 3, 0, 3, 0, 'minion', False),
+    ('Devilsaur', 'hearthbreaker.cards.minions.neutral', 'Devilsaur', 5, 0, -1, 1, 'minion', False),
+    ('Dire Wolf Alpha', 'hearthbreaker.cards.minions.neutral', 'DireWolfAlpha', 2, 0, 2, 1, 'minion', False),
+    ('Doomsayer', 'hearthbreaker.cards.minions.neutral', 'Doomsayer', 2, 0, 4, 0, 'minion', False),
+    ('Dragonling Mechanic', 'hearthbreaker.cards.minions.neutral', 'DragonlingMechanic', 4, 0, 2, 0, 'minion', True),
+    ('Dread Corsair', 'hearthbreaker.cards.minions.neutral', 'DreadCorsair', 4, 0, 2, 6, 'minion', False),
+    ('Dream', 'hearthbreaker.cards.minions.neutral', 'Dream', 0, 0, -1, None, 'spell', False),
+    ('Earthen Ring Farseer', 'hearthbreaker.cards.minions.neutral', 'EarthenRingFarseer', 3, 0, 2, 0, 'minion', True),
+    ('Elite Tauren Chieftain', 'hearthbreaker.cards.minions.neutral', 'EliteTaurenChieftain', 5, 0, 5, 0, 'minion',
+     True),
+    ('Elven Archer', 'hearthbreaker.cards.minions.neutral', 'ElvenArcher', 1, 0, 2, 0, 'minion', True),
+    ('Emboldener 3000', 'hearthbreaker.cards.minions.neutral', 'Emboldener3000', 1, 0, -1, 0, 'minion', False),
+    ('Emerald Drake', 'hearthbreaker.cards.minions.neutral', 'EmeraldDrake', 4, 0, -1, 3, 'minion', False),
+    ('Emperor Cobra', 'hearthbreaker.cards.minions.neutral', 'EmperorCobra', 3, 0, 3, 1, 'minion', False),
+    ('Faceless Manipulator', 'hearthbreaker.cards.minions.neutral', 'FacelessManipulator', 5, 0, 4, 0, 'minion', True),
+    ('Faerie Dragon', 'hearthbreaker.cards.minions.neutral', 'FaerieDragon', 2, 0, 2, 3, 'minion', False),
+    ('Fen Creeper', 'hearthbreaker.cards.minions.neutral', 'FenCreeper', 5, 0, 2, 0, 'minion', False),
+    ('Feugen', 'hearthbreaker.cards.minions.neutral', 'Feugen', 5, 0, 5, 0, 'minion', False),
+    ('Finkle Einhorn', 'hearthbreaker.cards.minions.neutral', 'FinkleEinhorn', 2, 0, -1, 0, 'minion', False),
+    ('Flame of Azzinoth', 'hearthbreaker.cards.minions.neutral', 'FlameOfAzzinoth', 1, 0, -1, 0, 'minion', False),
+    ('Flesheating Ghoul', 'hearthbreaker.cards.minions.neutral', 'FlesheatingGhoul', 3, 0, 2, 0, 'minion', False),
+    ('Frost Elemental', 'hearthbreaker.cards.minions.neutral', 'FrostElemental', 6, 0, 2, 0, 'minion', True),
+    ('Frostwolf Grunt', 'hearthbreaker.cards.minions.neutral', 'FrostwolfGrunt', 2, 0, 2, 0, 'minion', False),
+    ('Frostwolf Warlord', 'hearthbreaker.cards.minions.neutral', 'FrostwolfWarlord', 5, 0, 2, 0, 'minion', True),
+    ('Gadgetzan Auctioneer', 'hearthbreaker.cards.minions.neutral', 'GadgetzanAuctioneer', 5, 0, 3, 0, 'minion', False),
+    ('Gelbin Mekkatorque', 'hearthbreaker.cards.minions.neutral', 'GelbinMekkatorque', 6, 0, 5, 0, 'minion', True),
+    ('Gnoll', 'hearthbreaker.cards.minions.neutral', 'Gnoll', 2, 0, -1, 0, 'minion', False),
+    ('Gnomish Inventor', 'hearthbreaker.cards.minions.neutral', 'GnomishInventor', 4, 0, 2, 0, 'minion', True),
+    ('Goldshire Footman', 'hearthbreaker.cards.minions.neutral', 'GoldshireFootman', 1, 0, 2, 0, 'minion', False),
+    ('Grimscale Oracle', 'hearthbreaker.cards.minions.neutral', 'GrimscaleOracle', 1, 0, 2, 2, 'minion', False),
+    ('Gruul', 'hearthbreaker.cards.minions.neutral', 'Gruul', 8, 0, 5, 0, 'minion', False),
+    ('Gurubashi Berserker', 'hearthbreaker.cards.minions.neutral', 'GurubashiBerserker', 5, 0, 2, 0, 'minion', False),
+    ('Harrison Jones', 'hearthbreaker.cards.minions.neutral', 'HarrisonJones', 5, 0, 5, 0, 'minion', True),
+    ('Harvest Golem', 'hearthbreaker.cards.minions.neutral', 'HarvestGolem', 3, 0, 2, 0, 'minion', False),
+    ('Haunted Creeper', 'hearthbreaker.cards.minions.neutral', 'HauntedCreeper', 2, 0, 2, 1, 'minion', False),
+    ('Hogger', 'hearthbreaker.cards.minions.neutral', 'Hogger', 6, 0, 5, 0, 'minion', False),
+    ('Homing Chicken', 'hearthbreaker.cards.minions.neutral', 'HomingChicken', 1, 0, -1, 0, 'minion', False),
+    ('Hungry Crab', 'hearthbreaker.cards.minions.neutral', 'HungryCrab', 1, 0, 4, 1, 'minion', True),
+    ('I Am Murloc', 'hearthbreaker.cards.minions.neutral', 'IAmMurloc', 4, 0, -1, None, 'spell', False),
+    ('Illidan Stormrage', 'hearthbreaker.cards.minions.neutral', 'IllidanStormrage', 6, 0, 5, 5, 'minion', False),
+    ('Imp', 'hearthbreaker.cards.minions.neutral', 'Imp', 1, 0, -1, 5, 'minion', False),
+    ('Imp Master', 'hearthbreaker.cards.minions.neutral', 'ImpMaster', 3, 0, 3, 0, 'minion', False),
+    ('Injured Blademaster', 'hearthbreaker.cards.minions.neutral', 'InjuredBlademaster', 3, 0, 3, 0, 'minion', True),
+    ('Ironbeak Owl', 'hearthbreaker.cards.minions.neutral', 'IronbeakOwl', 2, 0, 2, 1, 'minion', True),
+    ('Ironforge Rifleman', 'hearthbreaker.cards.minions.neutral', 'IronforgeRifleman', 3, 0, 2, 0, 'minion', True),
+    ('Ironfur Grizzly', 'hearthbreaker.cards.minions.neutral', 'IronfurGrizzly', 3, 0, 2, 1, 'minion', False),
+    ('Jungle Panther', 'hearthbreaker.cards.minions.neutral', 'JunglePanther', 3, 0, 2, 1, 'minion', False),
+    ('King Mukla', 'hearthbreaker.cards.minions.neutral', 'KingMukla', 3, 0, 5, 1, 'minion', True),
+    ('Knife Juggler', 'hearthbreaker.cards.minions.neutral', 'KnifeJuggler', 2, 0, 3, 0, 'minion', False),
+    ('Kobold Geomancer', 'hearthbreaker.cards.minions.neutral', 'KoboldGeomancer', 2, 0, 2, 0, 'minion', False),
+    ('Leeroy Jenkins', 'hearthbreaker.cards.minions.neutral', 'LeeroyJenkins', 4, 0, 5, 0, 'minion', True),
+    ('Leper Gnome', 'hearthbreaker.cards.minions.neutral', 'LeperGnome', 1, 0, 2, 0, 'minion', False),
+    ('Lightwarden', 'hearthbreaker.cards.minions.neutral', 'Lightwarden', 1, 0, 3, 0, 'minion', False),
+    ('Loatheb', 'hearthbreaker.cards.minions.neutral', 'Loatheb', 5, 0, 5, 0, 'minion', True),
+    ('Loot Hoarder', 'hearthbreaker.cards.minions.neutral', 'LootHoarder', 2, 0, 2, 0, 'minion', False),
+    ('Lord of the Arena', 'hearthbreaker.cards.minions.neutral', 'LordOfTheArena', 6, 0, 2, 0, 'minion', False),
+    ('Lorewalker Cho', 'hearthbreaker.cards.minions.neutral', 'LorewalkerCho', 2, 0, 5, 0, 'minion', False),
+    ('Mad Bomber', 'hearthbreaker.cards.minions.neutral', 'MadBomber', 2, 0, 2, 0, 'minion', True),
+    ('Mad Scientist', 'hearthbreaker.cards.minions.neutral', 'MadScientist', 2, 0, 2, 0, 'minion', False),
+    ('Maexxna', 'hearthbreaker.cards.minions.neutral', 'Maexxna', 6, 0, 5, 1, 'minion', False),
+    ('Magma Rager', 'hearthbreaker.cards.minions.neutral', 'MagmaRager', 3, 0, 1, 0, 'minion', False),
+    ('Malygos', 'hearthbreaker.cards.minions.neutral', 'Malygos', 9, 0, 5, 3, 'minion', False),
+    ('Mana Addict', 'hearthbreaker.cards.minions.neutral', 'ManaAddict', 2, 0, 3, 0, 'minion', False),
+    ('Mana Wraith', 'hearthbreaker.cards.minions.neutral', 'ManaWraith', 2, 0, 3, 0, 'minion', False),
+    ('Master Swordsmith', 'hearthbreaker.cards.minions.neutral', 'MasterSwordsmith', 2, 0, 3, 0, 'minion', False),
+    ('Mechanical Dragonling', 'hearthbreaker.cards.minions.neutral', 'MechanicalDragonling', 1, 0, -1, 0, 'minion',
+     False),
+    ('Millhouse Manastorm', 'hearthbreaker.cards.minions.neutral', 'MillhouseManastorm', 2, 0, 5, 0, 'minion', True),
+    ('Mind Control Tech', 'hearthbreaker.cards.minions.neutral', 'MindControlTech', 3, 0, 3, 0, 'minion', True),
+    ("Mogu'shan Warden", 'hearthbreaker.cards.minions.neutral', 'MogushanWarden', 4, 0, 2, 0, 'minion', False),
+    ('Molten Giant', 'hearthbreaker.cards.minions.neutral', 'MoltenGiant', 20, 0, 4, 0, 'minion', False),
+    ('Mountain Giant', 'hearthbreaker.cards.minions.neutral', 'MountainGiant', 12, 0, 4, 0, 'minion', False),
+    ('Murloc', 'hearthbreaker.cards.minions.neutral', 'Murloc', 1, 0, -1, 2, 'minion', False),
+    ('Murloc Raider', 'hearthbreaker.cards.minions.neutral', 'MurlocRaider', 1, 0, 1, 2, 'minion', False),
+    ('Murloc Scout', 'hearthbreaker.cards.minions.neutral', 'MurlocScout', 0, 0, -1, 2, 'minion', False),
+    ('Murloc Tidecaller', 'hearthbreaker.cards.minions.neutral', 'MurlocTidecaller', 1, 0, 3, 2, 'minion', False),
+    ('Murloc Tidehunter', 'hearthbreaker.cards.minions.neutral', 'MurlocTidehunter', 2, 0, 2, 2, 'minion', True),
+    ('Murloc Warleader', 'hearthbreaker.cards.minions.neutral', 'MurlocWarleader', 3, 0, 4, 2, 'minion', False),
+    ('Nat Pagle', 'hearthbreaker.cards.minions.neutral', 'NatPagle', 2, 0, 5, 0, 'minion', False),
+    ("Nerub'ar Weblord", 'hearthbreaker.cards.minions.neutral', 'NerubarWeblord', 2, 0, 2, 0, 'minion', False),
+    ('Nerubian', 'hearthbreaker.cards.minions.neutral', 'Nerubian', 3, 0, -1, 0, 'minion', False),
+    ('Nerubian Egg', 'hearthbreaker.cards.minions.neutral', 'NerubianEgg', 2, 0, 3, 0, 'minion', False),
+    ('Nightblade', 'hearthbreaker.cards.minions.neutral', 'Nightblade', 5, 0, 1, 0, 'minion', True),
+    ('Nightmare', 'hearthbreaker.cards.minions.neutral', 'Nightmare', 0, 0, -1, None, 'spell', False),
+    ('Novice Engineer', 'hearthbreaker.cards.minions.neutral', 'NoviceEngineer', 2, 0, 1, 0, 'minion', True),
+    ('Nozdormu', 'hearthbreaker.cards.minions.neutral', 'Nozdormu', 9, 0, 5, 3, 'minion', False),
+    ('Oasis Snapjaw', 'hearthbreaker.cards.minions.neutral', 'OasisSnapjaw', 4, 0, 1, 1, 'minion', False),
+    ('Ogre Magi', 'hearthbreaker.cards.minions.neutral', 'OgreMagi', 4, 0, 2, 0, 'minion', False),
+    ('Old Murk-Eye', 'hearthbreaker.cards.minions.neutral', 'OldMurkEye', 4, 0, 5, 2, 'minion', True),
+    ('Onyxia', 'hearthbreaker.cards.minions.neutral', 'Onyxia', 9, 0, 5, 3, 'minion', True),
+    ('Pint-Sized Summoner', 'hearthbreaker.cards.minions.neutral', 'PintSizedSummoner', 2, 0, 3, 0, 'minion', False),
+    ('Playful Sister', 'hearthbreaker.cards.minions.neutral', 'PlayfulSister', 3, 0, -1, 0, 'minion', False),
+    ('Poultryizer', 'hearthbreaker.cards.minions.neutral', 'Poultryizer', 1, 0, -1, 0, 'minion', False),
+    ('Power of the Horde', 'hearthbreaker.cards.minions.neutral', 'PowerOfTheHorde', 4, 0, -1, None, 'spell', False),
+    ('Priestess of Elune', 'hearthbreaker.cards.minions.neutral', 'PriestessOfElune', 6, 0, 2, 0, 'minion', True),
+    ('Questing Adventurer', 'hearthbreaker.cards.minions.neutral', 'QuestingAdventurer', 3, 0, 3, 0, 'minion', False),
+    ('Raging Worgen', 'hearthbreaker.cards.minions.neutral', 'RagingWorgen', 3, 0, 2, 0, 'minion', False),
+    ('Ragnaros the Firelord', 'hearthbreaker.cards.minions.neutral', 'RagnarosTheFirelord', 8, 0, 5, 0, 'minion',
+     False),
+    ('Raid Leader', 'hearthbreaker.cards.minions.neutral', 'RaidLeader', 3, 0, 1, 0, 'minion', False),
+    ('Ravenholdt Assassin', 'hearthbreaker.cards.minions.neutral', 'RavenholdtAssassin', 7, 0, 3, 0, 'minion', False),
+    ('Razorfen Hunter', 'hearthbreaker.cards.minions.neutral', 'RazorfenHunter', 3, 0, 2, 0, 'minion', True),
+    ('Reckless Rocketeer', 'hearthbreaker.cards.minions.neutral', 'RecklessRocketeer', 6, 0, 1, 0, 'minion', False),
+    ('Repair Bot', 'hearthbreaker.cards.minions.neutral', 'RepairBot', 1, 0, -1, 0, 'minion', False),
+    ('River Crocolisk', 'hearthbreaker.cards.minions.neutral', 'RiverCrocolisk', 2, 0, 1, 1, 'minion', False),
+    ('Rogues Do It...', 'hearthbreaker.cards.minions.neutral', 'RoguesDoIt', 4, 0, -1, None, 'spell', False),
+    ('Scarlet Crusader', 'hearthbreaker.cards.minions.neutral', 'ScarletCrusader', 3, 0, 2, 0, 'minion', False),
+    ('Sea Giant', 'hearthbreaker.cards.minions.neutral', 'SeaGiant', 10, 0, 4, 0, 'minion', False),
+    ('Secretkeeper', 'hearthbreaker.cards.minions.neutral', 'Secretkeeper', 1, 0, 3, 0, 'minion', False),
+    ("Sen'jin Shieldmasta", 'hearthbreaker.cards.minions.neutral', 'SenjinShieldmasta', 4, 0, 1, 0, 'minion', False),
+    ('Shattered Sun Cleric', 'hearthbreaker.cards.minions.neutral', 'ShatteredSunCleric', 3, 0, 2, 0, 'minion', True),
+    ('Shieldbearer', 'hearthbreaker.cards.minions.neutral', 'Shieldbearer', 1, 0, 2, 0, 'minion', False),
+    ('Silver Hand Knight', 'hearthbreaker.cards.minions.neutral', 'SilverHandKnight', 5, 0, 2, 0, 'minion', True),
+    ('Silverback Patriarch', 'hearthbreaker.cards.minions.neutral', 'SilverbackPatriarch', 3, 0, 2, 1, 'minion', False),
+    ('Silvermoon Guardian', 'hearthbreaker.cards.minions.neutral', 'SilvermoonGuardian', 4, 0, 2, 0, 'minion', False),
+    ('Slime', 'hearthbreaker.cards.minions.neutral', 'Slime', 1, 0, -1, 0, 'minion', False),
+    ('Sludge Belcher', 'hearthbreaker.cards.minions.neutral', 'SludgeBelcher', 5, 0, 2, 0, 'minion', False),
+    ('Southsea Captain', 'hearthbreaker.cards.minions.neutral', 'SouthseaCaptain', 3, 0, 4, 6, 'minion', False),
+    ('Southsea Deckhand', 'hearthbreaker.cards.minions.neutral', 'SouthseaDeckhand', 1, 0, 2, 6, 'minion', True),
+    ('Spectral Knight', 'hearthbreaker.cards.minions.neutral', 'SpectralKnight', 5, 0, 2, 0, 'minion', False),
+    ('Spectral Spider', 'hearthbreaker.cards.minions.neutral', 'SpectralSpider', 1, 0, -1, 0, 'minion', False),
+    ('Spellbreaker', 'hearthbreaker.cards.minions.neutral', 'Spellbreaker', 4, 0, 2, 0, 'minion', True),
+    ('Spiteful Smith', 'hearthbreaker.cards.minions.neutral', 'SpitefulSmith', 5, 0, 2, 0, 'minion', False),
+    ('Squire', 'hearthbreaker.cards.minions.neutral', 'Squire', 1, 0, -1, 0, 'minion', False),
+    ('Squirrel', 'hearthbreaker.cards.minions.neutral', 'Squirrel', 1, 0, -1, 1, 'minion', False),
+    ('Stalagg', 'hearthbreaker.cards.minions.neutral', 'Stalagg', 5, 0, 5, 0, 'minion', False),
+    ('Stampeding Kodo', 'hearthbreaker.cards.minions.neutral', 'StampedingKodo', 5, 0, 3, 1, 'minion', True),
+    ('Stoneskin Gargoyle', 'hearthbreaker.cards.minions.neutral', 'StoneskinGargoyle', 3, 0, 2, 0, 'minion', False),
+    ('Stonetusk Boar', 'hearthbreaker.cards.minions.neutral', 'StonetuskBoar', 1, 0, 1, 1, 'minion', False),
+    ('Stormpike Commando', 'hearthbreaker.cards.minions.neutral', 'StormpikeCommando', 5, 0, 2, 0, 'minion', True),
+    ('Stormwind Champion', 'hearthbreaker.cards.minions.neutral', 'StormwindChampion', 7, 0, 2, 0, 'minion', False),
+    ('Stormwind Knight', 'hearthbreaker.cards.minions.neutral', 'StormwindKnight', 4, 0, 2, 0, 'minion', False),
+    ('Stranglethorn Tiger', 'hearthbreaker.cards.minions.neutral', 'StranglethornTiger', 5, 0, 2, 1, 'minion', False),
+    ('Sunfury Protector', 'hearthbreaker.cards.minions.neutral', 'SunfuryProtector', 2, 0, 3, 0, 'minion', True),
+    ('Sunwalker', 'hearthbreaker.cards.minions.neutral', 'Sunwalker', 6, 0, 3, 0, 'minion', False),
+    ('Sylvanas Windrunner', 'hearthbreaker.cards.minions.neutral', 'SylvanasWindrunner', 6, 0, 5, 0, 'minion', False),
+    ('Tauren Warrior', 'hearthbreaker.cards.minions.neutral', 'TaurenWarrior', 3, 0, 2, 0, 'minion', False),
+    ('Thaddius', 'hearthbreaker.cards.minions.neutral', 'Thaddius', 10, 0, -1, 0, 'minion', False),
+    ('The Beast', 'hearthbreaker.cards.minions.neutral', 'TheBeast', 6, 0, 5, 1, 'minion', False),
+    ('The Black Knight', 'hearthbreaker.cards.minions.neutral', 'TheBlackKnight', 6, 0, 5, 0, 'minion', True),
+    ('Thrallmar Farseer', 'hearthbreaker.cards.minions.neutral', 'ThrallmarFarseer', 3, 0, 2, 0, 'minion', False),
+    ('Tinkmaster Overspark', 'hearthbreaker.cards.minions.neutral', 'TinkmasterOverspark', 3, 0, 5, 0, 'minion', True),
+    ('Twilight Drake', 'hearthbreaker.cards.minions.neutral', 'TwilightDrake', 4, 0, 3, 3, 'minion', True),
+    ('Undertaker', 'hearthbreaker.cards.minions.neutral', 'Undertaker', 1, 0, 2, 0, 'minion', False),
+    ('Unstable Ghoul', 'hearthbreaker.cards.minions.neutral', 'UnstableGhoul', 2, 0, 2, 0, 'minion', False),
+    ('Venture Co. Mercenary', 'hearthbreaker.cards.minions.neutral', 'VentureCoMercenary', 5, 0, 2, 0, 'minion', False),
+    ('Violet Apprentice', 'hearthbreaker.cards.minions.neutral', 'VioletApprentice', 0, 0, -1, 0, 'minion', False),
+    ('Violet Teacher', 'hearthbreaker.cards.minions.neutral', 'VioletTeacher', 4, 0, 3, 0, 'minion', False),
+    ('Voodoo Doctor', 'hearthbreaker.cards.minions.neutral', 'VoodooDoctor', 1, 0, 1, 0, 'minion', True),
+    ('Wailing Soul', 'hearthbreaker.cards.minions.neutral', 'WailingSoul', 4, 0, 3, 0, 'minion', True),
+    ('War Golem', 'hearthbreaker.cards.minions.neutral', 'WarGolem', 7, 0, 2, 0, 'minion', False),
+    ('Whelp', 'hearthbreaker.cards.minions.neutral', 'Whelp', 1, 0, -1, 3, 'minion', False),
+    ('Wild Pyromancer', 'hearthbreaker.cards.minions.neutral', 'WildPyromancer', 2, 0, 3, 0, 'minion', False),
+    ('Windfury Harpy', 'hearthbreaker.cards.minions.neutral', 'WindfuryHarpy', 6, 0, 2, 0, 'minion', False),
+    ('Wisp', 'hearthbreaker.cards.minions.neutral', 'Wisp', 0, 0, 2, 0, 'minion', False),
+    ('Wolfrider', 'hearthbreaker.cards.minions.neutral', 'Wolfrider', 3, 0, 1, 0, 'minion', False),
+    ('Worgen Infiltrator', 'hearthbreaker.cards.minions.neutral', 'WorgenInfiltrator', 1, 0, 2, 0, 'minion', False),
+    ('Young Dragonhawk', 'hearthbreaker.cards.minions.neutral', 'YoungDragonhawk', 1, 0, 2, 1, 'minion', False),
+    ('Young Priestess', 'hearthbreaker.cards.minions.neutral', 'YoungPriestess', 1, 0, 3, 0, 'minion', False),
+    ('Youthful Brewmaster', 'hearthbreaker.cards.minions.neutral', 'YouthfulBrewmaster', 2, 0, 2, 0, 'minion', True),
+    ('Ysera', 'hearthbreaker.cards.minions.neutral', 'Ysera', 9, 0, 5, 3, 'minion', False),
+    ('Ysera Awakens', 'hearthbreaker.cards.minions.neutral', 'YseraAwakens', 2, 0, -1, None, 'spell', False),
+    ('Zombie Chow', 'hearthbreaker.cards.minions.neutral', 'ZombieChow', 1, 0, 2, 0, 'minion', False),
+    ('Aldor Peacekeeper', 'hearthbreaker.cards.minions.paladin', 'AldorPeacekeeper', 3, 7, 3, 0, 'minion', True),
+    ('Argent Protector', 'hearthbreaker.cards.minions.paladin', 'ArgentProtector', 2, 7, 2, 0, 'minion', True),
+    ('Ashbringer', 'hearthbreaker.cards.minions.paladin', 'Ashbringer', 5, 7, 5, None, 'weapon', False),
+    ('Guardian of Kings', 'hearthbreaker.cards.minions.paladin', 'GuardianOfKings', 7, 7, 2, 0, 'minion', True),
+    ('Silver Hand Recruit', 'hearthbreaker.cards.minions.paladin', 'SilverHandRecruit', 1, 7, -1, 0, 'minion', False),
+    ('Tirion Fordring', 'hearthbreaker.cards.minions.paladin', 'TirionFordring', 8, 7, 5, 0, 'minion', False),
+    ('Auchenai Soulpriest', 'hearthbreaker.cards.minions.priest', 'AuchenaiSoulpriest', 4, 6, 3, 0, 'minion', False),
+    ('Cabal Shadow Priest', 'hearthbreaker.cards.minions.priest', 'CabalShadowPriest', 6, 6, 4, 0, 'minion', True),
+    ('Dark Cultist', 'hearthbreaker.cards.minions.priest', 'DarkCultist', 3, 6, 2, 0, 'minion', False),
+    ('Lightspawn', 'hearthbreaker.cards.minions.priest', 'Lightspawn', 4, 6, 2, 0, 'minion', False),
+    ('Lightwell', 'hearthbreaker.cards.minions.priest', 'Lightwell', 2, 6, 3, 0, 'minion', False),
+    ('Northshire Cleric', 'hearthbreaker.cards.minions.priest', 'NorthshireCleric', 1, 6, 1, 0, 'minion', False),
+    ('Prophet Velen', 'hearthbreaker.cards.minions.priest', 'ProphetVelen', 7, 6, 5, 0, 'minion', False),
+    ('Temple Enforcer', 'hearthbreaker.cards.minions.priest', 'TempleEnforcer', 6, 6, 2, 0, 'minion', True),
+    ("Anub'ar Ambusher", 'hearthbreaker.cards.minions.rogue', 'AnubarAmbusher', 4, 8, 2, 0, 'minion', False),
+    ('Defias Bandit', 'hearthbreaker.cards.minions.rogue', 'DefiasBandit', 1, 8, -1, 0, 'minion', False),
+    ('Defias Ringleader', 'hearthbreaker.cards.minions.rogue', 'DefiasRingleader', 2, 8, 2, 0, 'minion', False),
+    ('Edwin VanCleef', 'hearthbreaker.cards.minions.rogue', 'EdwinVanCleef', 3, 8, 5, 0, 'minion', False),
+    ('Kidnapper', 'hearthbreaker.cards.minions.rogue', 'Kidnapper', 6, 8, 4, 0, 'minion', False),
+    ('Master of Disguise', 'hearthbreaker.cards.minions.rogue', 'MasterOfDisguise', 4, 8, 3, 0, 'minion', True),
+    ('Patient Assassin', 'hearthbreaker.cards.minions.rogue', 'PatientAssassin', 2, 8, 4, 0, 'minion', False),
+    ('SI:7 Agent', 'hearthbreaker.cards.minions.rogue', 'SI7Agent', 3, 8, 3, 0, 'minion', False),
+    ("Al'Akir the Windlord", 'hearthbreaker.cards.minions.shaman', 'AlAkirTheWindlord', 8, 3, 5, 0, 'minion', False),
+    ('Dust Devil', 'hearthbreaker.cards.minions.shaman', 'DustDevil', 1, 3, 2, 0, 'minion', False),
+    ('Earth Elemental', 'hearthbreaker.cards.minions.shaman', 'EarthElemental', 5, 3, 4, 0, 'minion', False),
+    ('Fire Elemental', 'hearthbreaker.cards.minions.shaman', 'FireElemental', 6, 3, 2, 0, 'minion', True),
+    ('Flametongue Totem', 'hearthbreaker.cards.minions.shaman', 'FlametongueTotem', 2, 3, 2, 7, 'minion', False),
+    ('Healing Totem', 'hearthbreaker.cards.minions.shaman', 'HealingTotem', 1, 3, -1, 7, 'minion', False),
+    ('Mana Tide Totem', 'hearthbreaker.cards.minions.shaman', 'ManaTideTotem', 3, 3, 3, 7, 'minion', False),
+    ('Searing Totem', 'hearthbreaker.cards.minions.shaman', 'SearingTotem', 1, 3, -1, 7, 'minion', False),
+    ('Stoneclaw Totem', 'hearthbreaker.cards.minions.shaman', 'StoneclawTotem', 1, 3, -1, 7, 'minion', False),
+    ('Unbound Elemental', 'hearthbreaker.cards.minions.shaman', 'UnboundElemental', 3, 3, 2, 0, 'minion', False),
+    ('Windspeaker', 'hearthbreaker.cards.minions.shaman', 'Windspeaker', 4, 3, 2, 0, 'minion', True),
+    ('Wrath of Air Totem', 'hearthbreaker.cards.minions.shaman', 'WrathOfAirTotem', 1, 3, -1, 7, 'minion', False),
+    ('Blood Fury', 'hearthbreaker.cards.minions.warlock', 'BloodFury', 3, 10, -1, None, 'weapon', False),
+    ('Blood Imp', 'hearthbreaker.cards.minions.warlock', 'BloodImp', 1, 9, 2, 5, 'minion', False),
+    ('Doomguard', 'hearthbreaker.cards.minions.warlock', 'Doomguard', 5, 9, 3, 5, 'minion', True),
+    ('Dread Infernal', 'hearthbreaker.cards.minions.warlock', 'DreadInfernal', 6, 9, 2, 5, 'minion', True),
+    ('Felguard', 'hearthbreaker.cards.minions.warlock', 'Felguard', 3, 9, 3, 5, 'minion', True),
+    ('Flame Imp', 'hearthbreaker.cards.minions.warlock', 'FlameImp', 1, 9, 2, 5, 'minion', True),
+    ('Infernal', 'hearthbreaker.cards.minions.warlock', 'Infernal', 6, 10, -1, 5, 'minion', False),
+    ('Lord Jaraxxus', 'hearthbreaker.cards.minions.warlock', 'LordJaraxxus', 9, 9, 5, 5, 'minion', True),
+    ('Pit Lord', 'hearthbreaker.cards.minions.warlock', 'PitLord', 4, 9, 4, 5, 'minion', True),
+    ('Succubus', 'hearthbreaker.cards.minions.warlock', 'Succubus', 2, 9, 1, 5, 'minion', True),
+    ('Summoning Portal', 'hearthbreaker.cards.minions.warlock', 'SummoningPortal', 4, 9, 2, 0, 'minion', False),
+    ('Void Terror', 'hearthbreaker.cards.minions.warlock', 'VoidTerror', 3, 9, 3, 5, 'minion', True),
+    ('Voidwalker', 'hearthbreaker.cards.minions.warlock', 'VoidWalker', 1, 9, 1, 5, 'minion', False),
+    ('Voidcaller', 'hearthbreaker.cards.minions.warlock', 'Voidcaller', 4, 9, 2, 5, 'minion', False),
+    ('Arathi Weaponsmith', 'hearthbreaker.cards.minions.warrior', 'ArathiWeaponsmith', 4, 4, 2, 0, 'minion', True),
+    ('Armorsmith', 'hearthbreaker.cards.minions.warrior', 'Armorsmith', 2, 4, 3, 0, 'minion', False),
+    ('Battle Axe', 'hearthbreaker.cards.minions.warrior', 'BattleAxe', 1, 4, -1, None, 'weapon', False),
+    ('Cruel Taskmaster', 'hearthbreaker.cards.minions.warrior', 'CruelTaskmaster', 2, 4, 2, 0, 'minion', True),
+    ('Frothing Berserker', 'hearthbreaker.cards.minions.warrior', 'FrothingBerserker', 3, 4, 3, 0, 'minion', False),
+    ('Grommash Hellscream', 'hearthbreaker.cards.minions.warrior', 'GrommashHellscream', 8, 4, 5, 0, 'minion', False),
+    ("Kor'kron Elite", 'hearthbreaker.cards.minions.warrior', 'KorkronElite', 4, 4, 2, 0, 'minion', False),
+    ('Warsong Commander', 'hearthbreaker.cards.minions.warrior', 'WarsongCommander', 3, 4, 1, 0, 'minion', False),
+    ('Bite', 'hearthbreaker.cards.spells.druid', 'Bite', 4, 5, 3, None, 'spell', False),
+    ('Claw', 'hearthbreaker.cards.spells.druid', 'Claw', 1, 5, 1, None, 'spell', False),
+    ('Excess Mana', 'hearthbreaker.cards.spells.druid', 'ExcessMana', 0, 5, -1, None, 'spell', False),
+    ('Force of Nature', 'hearthbreaker.cards.spells.druid', 'ForceOfNature', 6, 5, 4, None, 'spell', False),
+    ('Healing Touch', 'hearthbreaker.cards.spells.druid', 'HealingTouch', 3, 5, 1, None, 'spell', False),
+    ('Innervate', 'hearthbreaker.cards.spells.druid', 'Innervate', 0, 5, 1, None, 'spell', False),
+    ('Mark of Nature', 'hearthbreaker.cards.spells.druid', 'MarkOfNature', 3, 5, 2, None, 'spell', False),
+    ('Mark of the Wild', 'hearthbreaker.cards.spells.druid', 'MarkOfTheWild', 2, 5, 1, None, 'spell', False),
+    ('Moonfire', 'hearthbreaker.cards.spells.druid', 'Moonfire', 0, 5, 2, None, 'spell', False),
+    ('Naturalize', 'hearthbreaker.cards.spells.druid', 'Naturalize', 1, 5, 2, None, 'spell', False),
+    ('Nourish', 'hearthbreaker.cards.spells.druid', 'Nourish', 5, 5, 3, None, 'spell', False),
+    ('Panther', 'hearthbreaker.cards.spells.druid', 'Panther', 2, 5, -1, 1, 'minion', False),
+    ('Poison Seeds', 'hearthbreaker.cards.spells.druid', 'PoisionSeeds', 4, 5, 2, None, 'spell', False),
+    ('Power of the Wild', 'hearthbreaker.cards.spells.druid', 'PowerOfTheWild', 2, 5, 2, None, 'spell', False),
+    ('Savage Roar', 'hearthbreaker.cards.spells.druid', 'SavageRoar', 3, 5, 2, None, 'spell', False),
+    ('Savagery', 'hearthbreaker.cards.spells.druid', 'Savagery', 1, 5, 3, None, 'spell', False),
+    ('Soul of the Forest', 'hearthbreaker.cards.spells.druid', 'SoulOfTheForest', 4, 5, 2, None, 'spell', False),
+    ('Starfall', 'hearthbreaker.cards.spells.druid', 'Starfall', 5, 5, 3, None, 'spell', False),
+    ('Starfire', 'hearthbreaker.cards.spells.druid', 'Starfire', 6, 5, 2, None, 'spell', False),
+    ('Swipe', 'hearthbreaker.cards.spells.druid', 'Swipe', 4, 5, 2, None, 'spell', False),
+    ('Wild Growth', 'hearthbreaker.cards.spells.druid', 'WildGrowth', 2, 5, 1, None, 'spell', False),
+    ('Wrath', 'hearthbreaker.cards.spells.druid', 'Wrath', 2, 5, 2, None, 'spell', False),
+    ('Animal Companion', 'hearthbreaker.cards.spells.hunter', 'AnimalCompanion', 3, 2, 2, None, 'spell', False),
+    ('Arcane Shot', 'hearthbreaker.cards.spells.hunter', 'ArcaneShot', 1, 2, 1, None, 'spell', False),
+    ('Bestial Wrath', 'hearthbreaker.cards.spells.hunter', 'BestialWrath', 1, 2, 4, None, 'spell', False),
+    ('Deadly Shot', 'hearthbreaker.cards.spells.hunter', 'DeadlyShot', 3, 2, 2, None, 'spell', False),
+    ('Explosive Shot', 'hearthbreaker.cards.spells.hunter', 'ExplosiveShot', 5, 2, 3, None, 'spell', False),
+    ('Explosive Trap', 'hearthbreaker.cards.spells.hunter', 'ExplosiveTrap', 2, 2, 2, None, 'secret', False),
+    ('Flare', 'hearthbreaker.cards.spells.hunter', 'Flare', 1, 2, 3, None, 'spell', False),
+    ('Freezing Trap', 'hearthbreaker.cards.spells.hunter', 'FreezingTrap', 2, 2, 2, None, 'secret', False),
+    ('Hound', 'hearthbreaker.cards.spells.hunter', 'Hound', 1, 2, -1, 1, 'minion', False),
+    ('Huffer', 'hearthbreaker.cards.spells.hunter', 'Huffer', 3, 2, -1, 1, 'minion', False),
+    ("Hunter's Mark", 'hearthbreaker.cards.spells.hunter', 'HuntersMark', 0, 2, 2, None, 'spell', False),
+    ('Kill Command', 'hearthbreaker.cards.spells.hunter', 'KillCommand', 3, 2, 2, None, 'spell', False),
+    ('Leokk', 'hearthbreaker.cards.spells.hunter', 'Leokk', 3, 2, -1, 1, 'minion', False),
+    ('Misdirection', 'hearthbreaker.cards.spells.hunter', 'Misdirection', 2, 2, 3, None, 'secret', False),
+    ('Misha', 'hearthbreaker.cards.spells.hunter', 'Misha', 3, 2, -1, 1, 'minion', False),
+    ('Multi-Shot', 'hearthbreaker.cards.spells.hunter', 'MultiShot', 4, 2, 1, None, 'spell', False),
+    ('Snake', 'hearthbreaker.cards.spells.hunter', 'Snake', 1, 2, -1, 1, 'minion', False),
+    ('Snake Trap', 'hearthbreaker.cards.spells.hunter', 'SnakeTrap', 2, 2, 4, None, 'secret', False),
+    ('Snipe', 'hearthbreaker.cards.spells.hunter', 'Snipe', 2, 2, 2, None, 'secret', False),
+    ('Tracking', 'hearthbreaker.cards.spells.hunter', 'Tracking', 1, 2, 1, None, 'spell', False),
+    ('Unleash the Hounds', 'hearthbreaker.cards.spells.hunter', 'UnleashTheHounds', 3, 2, 2, None, 'spell', False),
+    ('Arcane Explosion', 'hearthbreaker.cards.spells.mage', 'ArcaneExplosion', 2, 1, 1, None, 'spell', False),
+    ('Arcane Intellect', 'hearthbreaker.cards.spells.mage', 'ArcaneIntellect', 3, 1, 1, None, 'spell', False),
+    ('Arcane Missiles', 'hearthbreaker.cards.spells.mage', 'ArcaneMissiles', 1, 1, 1, None, 'spell', False),
+    ('Blizzard', 'hearthbreaker.cards.spells.mage', 'Blizzard', 6, 1, 3, None, 'spell', False),
+    ('Cone of Cold', 'hearthbreaker.cards.spells.mage', 'ConeOfCold', 4, 1, 2, None, 'spell', False),
+    ('Counterspell', 'hearthbreaker.cards.spells.mage', 'Counterspell', 3, 1, 3, None, 'secret', False),
+    ('Duplicate', 'hearthbreaker.cards.spells.mage', 'Duplicate', 3, 1, 2, None, 'secret', False),
+    ('Fireball', 'hearthbreaker.cards.spells.mage', 'Fireball', 4, 1, 1, None, 'spell', False),
+    ('Flamestrike', 'hearthbreaker.cards.spells.mage', 'Flamestrike', 7, 1, 2, None, 'spell', False),
+    ('Frost Nova', 'hearthbreaker.cards.spells.mage', 'FrostNova', 3, 1, 2, None, 'spell', False),
+    ('Frostbolt', 'hearthbreaker.cards.spells.mage', 'Frostbolt', 2, 1, 2, None, 'spell', False),
+    ('Ice Barrier', 'hearthbreaker.cards.spells.mage', 'IceBarrier', 3, 1, 2, None, 'secret', False),
+    ('Ice Block', 'hearthbreaker.cards.spells.mage', 'IceBlock', 3, 1, 4, None, 'secret', False),
+    ('Ice Lance', 'hearthbreaker.cards.spells.mage', 'IceLance', 1, 1, 2, None, 'spell', False),
+    ('Mirror Entity', 'hearthbreaker.cards.spells.mage', 'MirrorEntity', 3, 1, 2, None, 'secret', False),
+    ('Mirror Image', 'hearthbreaker.cards.spells.mage', 'MirrorImage', 1, 1, 2, None, 'spell', False),
+    ('Polymorph', 'hearthbreaker.cards.spells.mage', 'Polymorph', 4, 1, 1, None, 'spell', False),
+    ('Pyroblast', 'hearthbreaker.cards.spells.mage', 'Pyroblast', 10, 1, 4, None, 'spell', False),
+    ('Sheep', 'hearthbreaker.cards.spells.mage', 'Sheep', 0, 0, -1, 1, 'minion', False),
+    ('Spellbender', 'hearthbreaker.cards.spells.mage', 'Spellbender', 3, 1, 4, None, 'secret', False),
+    ('Vaporize', 'hearthbreaker.cards.spells.mage', 'Vaporize', 3, 1, 3, None, 'secret', False),
+    ('Avenging Wrath', 'hearthbreaker.cards.spells.paladin', 'AvengingWrath', 6, 7, 4, None, 'spell', False),
+    ('Blessed Champion', 'hearthbreaker.cards.spells.paladin', 'BlessedChampion', 5, 7, 3, None, 'spell', False),
+    ('Blessing of Kings', 'hearthbreaker.cards.spells.paladin', 'BlessingOfKings', 4, 7, 2, None, 'spell', False),
+    ('Blessing of Might', 'hearthbreaker.cards.spells.paladin', 'BlessingOfMight', 1, 7, 1, None, 'spell', False),
+    ('Blessing of Wisdom', 'hearthbreaker.cards.spells.paladin', 'BlessingOfWisdom', 1, 7, 2, None, 'spell', False),
+    ('Consecration', 'hearthbreaker.cards.spells.paladin', 'Consecration', 4, 7, 2, None, 'spell', False),
+    ('Defender', 'hearthbreaker.cards.spells.paladin', 'Defender', 1, 7, -1, 0, 'minion', False),
+    ('Divine Favor', 'hearthbreaker.cards.spells.paladin', 'DivineFavor', 3, 7, 3, None, 'spell', False),
+    ('Equality', 'hearthbreaker.cards.spells.paladin', 'Equality', 2, 7, 3, None, 'spell', False),
+    ('Eye for an Eye', 'hearthbreaker.cards.spells.paladin', 'EyeForAnEye', 1, 7, 2, None, 'secret', False),
+    ('Hammer of Wrath', 'hearthbreaker.cards.spells.paladin', 'HammerOfWrath', 4, 7, 1, None, 'spell', False),
+    ('Hand of Protection', 'hearthbreaker.cards.spells.paladin', 'HandOfProtection', 1, 7, 1, None, 'spell', False),
+    ('Holy Light', 'hearthbreaker.cards.spells.paladin', 'HolyLight', 2, 7, 1, None, 'spell', False),
+    ('Holy Wrath', 'hearthbreaker.cards.spells.paladin', 'HolyWrath', 5, 7, 3, None, 'spell', False),
+    ('Humility', 'hearthbreaker.cards.spells.paladin', 'Humility', 1, 7, 2, None, 'spell', False),
+    ('Lay on Hands', 'hearthbreaker.cards.spells.paladin', 'LayOnHands', 8, 7, 4, None, 'spell', False),
+    ('Noble Sacrifice', 'hearthbreaker.cards.spells.paladin', 'NobleSacrifice', 1, 7, 2, None, 'secret', False),
+    ('Redemption', 'hearthbreaker.cards.spells.paladin', 'Redemption', 1, 7, 2, None, 'secret', False),
+    ('Repentance', 'hearthbreaker.cards.spells.paladin', 'Repentance', 1, 7, 2, None, 'secret', False),
+    ('Circle of Healing', 'hearthbreaker.cards.spells.priest', 'CircleOfHealing', 0, 6, 2, None, 'spell', False),
+    ('Divine Spirit', 'hearthbreaker.cards.spells.priest', 'DivineSpirit', 2, 6, 2, None, 'spell', False),
+    ('Holy Fire', 'hearthbreaker.cards.spells.priest', 'HolyFire', 6, 6, 3, None, 'spell', False),
+    ('Holy Nova', 'hearthbreaker.cards.spells.priest', 'HolyNova', 5, 6, 2, None, 'spell', False),
+    ('Holy Smite', 'hearthbreaker.cards.spells.priest', 'HolySmite', 1, 6, 1, None, 'spell', False),
+    ('Inner Fire', 'hearthbreaker.cards.spells.priest', 'InnerFire', 1, 6, 2, None, 'spell', False),
+    ('Mass Dispel', 'hearthbreaker.cards.spells.priest', 'MassDispel', 4, 6, 3, None, 'spell', False),
+    ('Mind Blast', 'hearthbreaker.cards.spells.priest', 'MindBlast', 2, 6, 1, None, 'spell', False),
+    ('Mind Control', 'hearthbreaker.cards.spells.priest', 'MindControl', 10, 6, 2, None, 'spell', False),
+    ('Mind Vision', 'hearthbreaker.cards.spells.priest', 'MindVision', 1, 6, 2, None, 'spell', False),
+    ('Mindgames', 'hearthbreaker.cards.spells.priest', 'Mindgames', 4, 6, 4, None, 'spell', False),
+    ('Power Word: Shield', 'hearthbreaker.cards.spells.priest', 'PowerWordShield', 1, 6, 1, None, 'spell', False),
+    ('Shadow Madness', 'hearthbreaker.cards.spells.priest', 'ShadowMadness', 4, 6, 3, None, 'spell', False),
+    ('Shadow of Nothing', 'hearthbreaker.cards.spells.priest', 'ShadowOfNothing', 0, 6, -1, 0, 'minion', False),
+    ('Shadow Word: Death', 'hearthbreaker.cards.spells.priest', 'ShadowWordDeath', 3, 6, 2, None, 'spell', False),
+    ('Shadow Word: Pain', 'hearthbreaker.cards.spells.priest', 'ShadowWordPain', 2, 6, 1, None, 'spell', False),
+    ('Shadowform', 'hearthbreaker.cards.spells.priest', 'Shadowform', 3, 6, 4, None, 'spell', False),
+    ('Silence', 'hearthbreaker.cards.spells.priest', 'Silence', 0, 6, 2, None, 'spell', False),
+    ('Thoughtsteal', 'hearthbreaker.cards.spells.priest', 'Thoughtsteal', 3, 6, 2, None, 'spell', False),
+    ('Assassinate', 'hearthbreaker.cards.spells.rogue', 'Assassinate', 5, 8, 1, None, 'spell', False),
+    ('Backstab', 'hearthbreaker.cards.spells.rogue', 'Backstab', 0, 8, 1, None, 'spell', False),
+    ('Betrayal', 'hearthbreaker.cards.spells.rogue', 'Betrayal', 2, 8, 2, None, 'spell', False),
+    ('Blade Flurry', 'hearthbreaker.cards.spells.rogue', 'BladeFlurry', 2, 8, 3, None, 'spell', False),
+    ('Cold Blood', 'hearthbreaker.cards.spells.rogue', 'ColdBlood', 1, 8, 2, None, 'spell', False),
+    ('Conceal', 'hearthbreaker.cards.spells.rogue', 'Conceal', 1, 8, 2, None, 'spell', False),
+    ('Deadly Poison', 'hearthbreaker.cards.spells.rogue', 'DeadlyPoison', 1, 8, 1, None, 'spell', False),
+    ('Eviscerate', 'hearthbreaker.cards.spells.rogue', 'Eviscerate', 2, 8, 2, None, 'spell', False),
+    ('Fan of Knives', 'hearthbreaker.cards.spells.rogue', 'FanOfKnives', 3, 8, 2, None, 'spell', False),
+    ('Headcrack', 'hearthbreaker.cards.spells.rogue', 'Headcrack', 3, 8, 3, None, 'spell', False),
+    ('Preparation', 'hearthbreaker.cards.spells.rogue', 'Preparation', 0, 8, 4, None, 'spell', False),
+    ('Sap', 'hearthbreaker.cards.spells.rogue', 'Sap', 2, 8, 1, None, 'spell', False),
+    ('Shadowstep', 'hearthbreaker.cards.spells.rogue', 'Shadowstep', 0, 8, 2, None, 'spell', False),
+    ('Shiv', 'hearthbreaker.cards.spells.rogue', 'Shiv', 2, 8, 2, None, 'spell', False),
+    ('Sinister Strike', 'hearthbreaker.cards.spells.rogue', 'SinisterStrike', 1, 8, 1, None, 'spell', False),
+    ('Sprint', 'hearthbreaker.cards.spells.rogue', 'Sprint', 7, 8, 2, None, 'spell', False),
+    ('Vanish', 'hearthbreaker.cards.spells.rogue', 'Vanish', 6, 8, 2, None, 'spell', False),
+    ('Ancestral Healing', 'hearthbreaker.cards.spells.shaman', 'AncestralHealing', 0, 3, 1, None, 'spell', False),
+    ('Ancestral Spirit', 'hearthbreaker.cards.spells.shaman', 'AncestralSpirit', 2, 3, 3, None, 'spell', False),
+    ('Bloodlust', 'hearthbreaker.cards.spells.shaman', 'Bloodlust', 5, 3, 2, None, 'spell', False),
+    ('Earth Shock', 'hearthbreaker.cards.spells.shaman', 'EarthShock', 1, 3, 2, None, 'spell', False),
+    ('Far Sight', 'hearthbreaker.cards.spells.shaman', 'FarSight', 3, 3, 4, None, 'spell', False),
+    ('Feral Spirit', 'hearthbreaker.cards.spells.shaman', 'FeralSpirit', 3, 3, 3, None, 'spell', False),
+    ('Forked Lightning', 'hearthbreaker.cards.spells.shaman', 'ForkedLightning', 1, 3, 2, None, 'spell', False),
+    ('Frog', 'hearthbreaker.cards.spells.shaman', 'Frog', 0, 0, -1, 1, 'minion', False),
+    ('Frost Shock', 'hearthbreaker.cards.spells.shaman', 'FrostShock', 1, 3, 1, None, 'spell', False),
+    ('Hex', 'hearthbreaker.cards.spells.shaman', 'Hex', 3, 3, 1, None, 'spell', False),
+    ('Lava Burst', 'hearthbreaker.cards.spells.shaman', 'LavaBurst', 3, 3, 3, None, 'spell', False),
+    ('Lightning Bolt', 'hearthbreaker.cards.spells.shaman', 'LightningBolt', 1, 3, 2, None, 'spell', False),
+    ('Lightning Storm', 'hearthbreaker.cards.spells.shaman', 'LightningStorm', 3, 3, 3, None, 'spell', False),
+    ('Reincarnate', 'hearthbreaker.cards.spells.shaman', 'Reincarnate', 2, 3, 2, None, 'spell', False),
+    ('Rockbiter Weapon', 'hearthbreaker.cards.spells.shaman', 'RockbiterWeapon', 1, 3, 1, None, 'spell', False),
+    ('Spirit Wolf', 'hearthbreaker.cards.spells.shaman', 'SpiritWolf', 2, 3, -1, 0, 'minion', False),
+    ('Totemic Might', 'hearthbreaker.cards.spells.shaman', 'TotemicMight', 0, 3, 2, None, 'spell', False),
+    ('Windfury', 'hearthbreaker.cards.spells.shaman', 'Windfury', 2, 3, 1, None, 'spell', False),
+    ('Bane of Doom', 'hearthbreaker.cards.spells.warlock', 'BaneOfDoom', 5, 9, 4, None, 'spell', False),
+    ('Corruption', 'hearthbreaker.cards.spells.warlock', 'Corruption', 1, 9, 2, None, 'spell', False),
+    ('Demonfire', 'hearthbreaker.cards.spells.warlock', 'Demonfire', 2, 9, 2, None, 'spell', False),
+    ('Drain Life', 'hearthbreaker.cards.spells.warlock', 'DrainLife', 3, 9, 1, None, 'spell', False),
+    ('Hellfire', 'hearthbreaker.cards.spells.warlock', 'Hellfire', 4, 9, 1, None, 'spell', False),
+    ('Mortal Coil', 'hearthbreaker.cards.spells.warlock', 'MortalCoil', 1, 9, 2, None, 'spell', False),
+    ('Power Overwhelming', 'hearthbreaker.cards.spells.warlock', 'PowerOverwhelming', 1, 9, 2, None, 'spell', False),
+    ('Sacrificial Pact', 'hearthbreaker.cards.spells.warlock', 'SacrificialPact', 0, 9, 2, None, 'spell', False),
+    ('Sense Demons', 'hearthbreaker.cards.spells.warlock', 'SenseDemons', 3, 9, 2, None, 'spell', False),
+    ('Shadow Bolt', 'hearthbreaker.cards.spells.warlock', 'ShadowBolt', 3, 9, 1, None, 'spell', False),
+    ('Shadowflame', 'hearthbreaker.cards.spells.warlock', 'Shadowflame', 4, 9, 3, None, 'spell', False),
+    ('Siphon Soul', 'hearthbreaker.cards.spells.warlock', 'SiphonSoul', 6, 9, 3, None, 'spell', False),
+    ('Soulfire', 'hearthbreaker.cards.spells.warlock', 'Soulfire', 0, 9, 2, None, 'spell', False),
+    ('Twisting Nether', 'hearthbreaker.cards.spells.warlock', 'TwistingNether', 8, 9, 4, None, 'spell', False),
+    ('Worthless Imp', 'hearthbreaker.cards.spells.warlock', 'WorthlessImp', 1, 9, -1, 5, 'minion', False),
+    ('Battle Rage', 'hearthbreaker.cards.spells.warrior', 'BattleRage', 2, 4, 2, None, 'spell', False),
+    ('Brawl', 'hearthbreaker.cards.spells.warrior', 'Brawl', 5, 4, 4, None, 'spell', False),
+    ('Charge', 'hearthbreaker.cards.spells.warrior', 'Charge', 3, 4, 1, None, 'spell', False),
+    ('Cleave', 'hearthbreaker.cards.spells.warrior', 'Cleave', 2, 4, 2, None, 'spell', False),
+    ('Commanding Shout', 'hearthbreaker.cards.spells.warrior', 'CommandingShout', 2, 4, 3, None, 'spell', False),
+    ('Execute', 'hearthbreaker.cards.spells.warrior', 'Execute', 1, 4, 1, None, 'spell', False),
+    ('Heavy Axe', 'hearthbreaker.cards.spells.warrior', 'HeavyAxe', 1, 4, -1, None, 'weapon', False),
+    ('Heroic Strike', 'hearthbreaker.cards.spells.warrior', 'HeroicStrike', 2, 4, 1, None, 'spell', False),
+    ('Inner Rage', 'hearthbreaker.cards.spells.warrior', 'InnerRage', 0, 4, 2, None, 'spell', False),
+    ('Mortal Strike', 'hearthbreaker.cards.spells.warrior', 'MortalStrike', 4, 4, 3, None, 'spell', False),
+    ('Rampage', 'hearthbreaker.cards.spells.warrior', 'Rampage', 2, 4, 2, None, 'spell', False),
+    ('Shield Block', 'hearthbreaker.cards.spells.warrior', 'ShieldBlock', 3, 4, 2, None, 'spell', False),
+    ('Shield Slam', 'hearthbreaker.cards.spells.warrior', 'ShieldSlam', 1, 4, 4, None, 'spell', False),
+    ('Slam', 'hearthbreaker.cards.spells.warrior', 'Slam', 2, 4, 2, None, 'spell', False),
+    ('Upgrade!', 'hearthbreaker.cards.spells.warrior', 'Upgrade', 1, 4, 3, None, 'spell', False),
+    ('Whirlwind', 'hearthbreaker.cards.spells.warrior', 'Whirlwind', 1, 4, 2, None, 'spell', False),
+    ('Eaglehorn Bow', 'hearthbreaker.cards.weapons.hunter', 'EaglehornBow', 3, 2, 3, None, 'weapon', False),
+    ("Gladiator's Longbow", 'hearthbreaker.cards.weapons.hunter', 'GladiatorsLongbow', 7, 2, 4, None, 'weapon', False),
+    ("Light's Justice", 'hearthbreaker.cards.weapons.paladin', 'LightsJustice', 1, 7, 1, None, 'weapon', False),
+    ('Sword of Justice', 'hearthbreaker.cards.weapons.paladin', 'SwordOfJustice', 3, 7, 4, None, 'weapon', False),
+    ('Truesilver Champion', 'hearthbreaker.cards.weapons.paladin', 'TruesilverChampion', 4, 7, 2, None, 'weapon',
+     False),
+    ("Assassin's Blade", 'hearthbreaker.cards.weapons.rogue', 'AssassinsBlade', 5, 8, 2, None, 'weapon', False),
+    ("Perdition's Blade", 'hearthbreaker.cards.weapons.rogue', 'PerditionsBlade', 3, 8, 3, None, 'weapon', False),
+    ('Wicked Knife', 'hearthbreaker.cards.weapons.rogue', 'WickedKnife', 1, 8, -1, None, 'weapon', False),
+    ('Doomhammer', 'hearthbreaker.cards.weapons.shaman', 'Doomhammer', 5, 3, 4, None, 'weapon', False),
+    ('Stormforged Axe', 'hearthbreaker.cards.weapons.shaman', 'StormforgedAxe', 2, 3, 2, None, 'weapon', False),
+    ('Arcanite Reaper', 'hearthbreaker.cards.weapons.warrior', 'ArcaniteReaper', 5, 4, 2, None, 'weapon', False),
+    ('Fiery War Axe', 'hearthbreaker.cards.weapons.warrior', 'FieryWarAxe', 2, 4, 1, None, 'weapon', False),
+    ('Gorehowl', 'hearthbreaker.cards.weapons.warrior', 'Gorehowl', 7, 4, 4, None, 'weapon', False),
+    ('The Coin', 'hearthbreaker.game_objects', 'TheCoin', 0, 0, -1, None, 'spell', False),
+]
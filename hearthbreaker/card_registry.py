@@ -0,0 +1,224 @@
+"""
+A registry of every card implemented in Hearthbreaker, which can be searched without instantiating any cards.
+
+The registry is built when this module is imported from the table in :mod:`hearthbreaker.card_index`.  Each entry
+records the card's name, cost, character class, rarity, minion type and whether it has a battlecry along with the
+module and class implementing it.  The class itself is only imported the first time it is asked for, so looking up one
+card does not require importing every card module.
+
+:mod:`hearthbreaker.card_index` is generated from the card implementations by running::
+
+    python -m hearthbreaker.card_registry
+
+which must be done whenever a card is added or changed.  The unit tests check that the index is up to date.
+"""
+import importlib
+import io
+
+import hearthbreaker.card_index
+
+
+SPELL = "spell"
+MINION = "minion"
+SECRET = "secret"
+WEAPON = "weapon"
+
+
+class CardInfo:
+    """
+    The static description of a single card.
+    """
+    __slots__ = ["name", "module", "class_name", "mana", "character_class", "rarity", "minion_type", "type",
+                 "battlecry", "_card_class"]
+
+    def __init__(self, name, module, class_name, mana, character_class, rarity, minion_type, card_type,
+                 battlecry=False):
+        #: The name of the card in English
+        self.name = name
+        #: The name of the module the card is implemented in
+        self.module = module
+        #: The name of the class implementing the card
+        self.class_name = class_name
+        #: The base mana cost of the card
+        self.mana = mana
+        #: A member of :class:`hearthbreaker.constants.CHARACTER_CLASS`
+        self.character_class = character_class
+        #: A member of :class:`hearthbreaker.constants.CARD_RARITY`
+        self.rarity = rarity
+        #: A member of :class:`hearthbreaker.constants.MINION_TYPE`, or None if the card is not a minion
+        self.minion_type = minion_type
+        #: One of :const:`SPELL`, :const:`MINION`, :const:`SECRET` or :const:`WEAPON`
+        self.type = card_type
+        #: True if the card is a minion with a battlecry
+        self.battlecry = battlecry
+        self._card_class = None
+
+    @property
+    def card_class(self):
+        """
+        The class implementing this card.  Its module is imported the first time this is accessed.
+        """
+        if self._card_class is None:
+            self._card_class = getattr(importlib.import_module(self.module), self.class_name)
+        return self._card_class
+
+
+class CardRegistry:
+    """
+    Indexes a table of :class:`CardInfo` by name, character class, cost, rarity and minion type.  Every index is a
+    dictionary, so each query is a single lookup.
+    """
+
+    def __init__(self, rows):
+        """
+        :param list rows: Tuples of (name, module, class name, mana, character class, rarity, minion type, type,
+                          battlecry), as found in :data:`hearthbreaker.card_index.CARDS`
+        """
+        #: Maps a card's name to its :class:`CardInfo`
+        self.by_name = {}
+        #: Maps a member of :class:`hearthbreaker.constants.CHARACTER_CLASS` to a list of :class:`CardInfo`
+        self.by_class = {}
+        #: Maps a mana cost to a list of :class:`CardInfo`
+        self.by_cost = {}
+        #: Maps a member of :class:`hearthbreaker.constants.CARD_RARITY` to a list of :class:`CardInfo`
+        self.by_rarity = {}
+        #: Maps a member of :class:`hearthbreaker.constants.MINION_TYPE` to a list of minion :class:`CardInfo`
+        self.by_minion_type = {}
+        for row in rows:
+            self.add(CardInfo(*row))
+
+    def add(self, info):
+        self.by_name[info.name] = info
+        self.by_class.setdefault(info.character_class, []).append(info)
+        self.by_cost.setdefault(info.mana, []).append(info)
+        self.by_rarity.setdefault(info.rarity, []).append(info)
+        if info.minion_type is not None:
+            self.by_minion_type.setdefault(info.minion_type, []).append(info)
+
+    def __contains__(self, card_name):
+        return card_name in self.by_name
+
+    def __len__(self):
+        return len(self.by_name)
+
+    def info(self, card_name):
+        """
+        :param string card_name: The name of a card in English
+        :rtype: CardInfo
+        """
+        return self.by_name[card_name]
+
+    def card_class(self, card_name):
+        """
+        :param string card_name: The name of a card in English
+        :return: The class implementing the card, without creating an instance of it
+        """
+        return self.by_name[card_name].card_class
+
+
+#: The registry of all of the cards listed in :mod:`hearthbreaker.card_index`
+registry = CardRegistry(hearthbreaker.card_index.CARDS)
+
+
+#: The longest line written to the card index, so that it passes flake8
+MAX_LINE_LENGTH = 120
+
+# The game minions are created in by find_battlecry, which is only created when first needed
+_battlecry_game = None
+
+
+def _indexable(card_type):
+    return not card_type.__name__.startswith("_") and "<locals>" not in card_type.__qualname__
+
+
+def find_battlecry(card):
+    """
+    Finds out if the minion a card creates has a battlecry, by creating the minion in a game of its own.  This is how
+    the battlecries in the index are found, and how they are found for cards which aren't in the index.
+
+    :param hearthbreaker.game_objects.MinionCard card: The card to examine
+    :rtype: bool
+    """
+    global _battlecry_game
+    if _battlecry_game is None:
+        from hearthbreaker.agents.basic_agents import DoNothingBot
+        from hearthbreaker.constants import CHARACTER_CLASS
+        from hearthbreaker.game_objects import TheCoin, Deck, Game
+
+        decks = [Deck([TheCoin() for i in range(0, 30)], CHARACTER_CLASS.MAGE) for i in range(0, 2)]
+        _battlecry_game = Game(decks, [DoNothingBot(), DoNothingBot()])
+    return card.create_minion(_battlecry_game.players[0]).battlecry is not None
+
+
+def generate_rows():
+    """
+    Builds the rows of the card index by examining every card implementation.  This is the only place cards are
+    instantiated to read their details, and it is only used to regenerate :mod:`hearthbreaker.card_index`.
+
+    :return: A list of rows, sorted by module and class name
+    """
+    importlib.import_module("hearthbreaker.cards")
+    from hearthbreaker.game_objects import Card, MinionCard, SecretCard, WeaponCard
+
+    def leaf_classes(card_type):
+        subclasses = card_type.__subclasses__()
+        # Private cards (choose one options, and tokens sharing their name with another card) aren't indexed, nor
+        # are cards defined inside functions, which can't be imported
+        if len(subclasses) == 0 and _indexable(card_type):
+            yield card_type
+        for sub_type in subclasses:
+            for leaf in leaf_classes(sub_type):
+                yield leaf
+
+    rows = []
+    for card_class in set(leaf_classes(Card)):
+        card = card_class()
+        battlecry = False
+        if isinstance(card, MinionCard):
+            card_type = MINION
+            minion_type = card.minion_type
+            battlecry = find_battlecry(card)
+        else:
+            minion_type = None
+            if isinstance(card, SecretCard):
+                card_type = SECRET
+            elif isinstance(card, WeaponCard):
+                card_type = WEAPON
+            else:
+                card_type = SPELL
+        rows.append((card.name, card_class.__module__, card_class.__name__, card.mana, card.character_class,
+                     card.rarity, minion_type, card_type, battlecry))
+
+    return sorted(rows, key=lambda row: (row[1], row[2]))
+
+
+def write_index(file):
+    """
+    Writes a freshly generated card index module to the given file.
+    """
+    file.write('"""\n'
+               'The table of implemented cards used by :mod:`hearthbreaker.card_registry`.\n\n'
+               'Generated by ``python -m hearthbreaker.card_registry``.  Do not edit by hand.\n'
+               '"""\n'
+               'CARDS = [\n')
+    for row in generate_rows():
+        # Rows too long for one line are wrapped between fields, with the continuation lined up inside the tuple
+        fields = [repr(field) for field in row]
+        line = "    (" + fields[0]
+        for field in fields[1:]:
+            if len(line) + len(field) + len("),") + 2 > MAX_LINE_LENGTH:
+                file.write(line + ",\n")
+                line = "     " + field
+            else:
+                line += ", " + field
+        file.write(line + "),\n")
+    file.write("]\n")
+
+
+if __name__ == "__main__":
+    # The index is generated before the file is opened, so a failure leaves the old index in place
+    index = io.StringIO()
+    write_index(index)
+    index_file = open(hearthbreaker.card_index.__file__, "w")
+    index_file.write(index.getvalue())
+    index_file.close()
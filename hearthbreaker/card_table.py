@@ -0,0 +1,176 @@
+"""
+A table of the printed details of every implemented card (its text, cost, attack, health, class, minion type, rarity,
+type and set), compiled from ``cards.csv`` so that it can be searched without importing or instantiating any cards.
+
+The table is stored by column, as one tuple per column in :mod:`hearthbreaker.card_data`, which is generated by
+running::
+
+    python -m hearthbreaker.card_table
+
+from the root of the repository whenever ``cards.csv`` changes.  The unit tests check that the data is up to date
+with ``cards.csv`` and that it agrees with the card implementations.
+
+Every combination of the indexed columns (see :data:`INDEXED`) has an index of its own, so a query such as "all two
+cost beasts" or "a random neutral minion" is a single dictionary lookup however many columns it uses::
+
+    table.select(mana=2, minion_type=MINION_TYPE.BEAST)
+    table.random_card(character_class=CHARACTER_CLASS.ALL, type=MINION)
+"""
+import csv
+import io
+import random
+
+import hearthbreaker.card_data
+from hearthbreaker.card_registry import MINION, SPELL, WEAPON
+from hearthbreaker.constants import CHARACTER_CLASS, CARD_RARITY, MINION_TYPE, CARD_SET
+
+
+#: The columns of the table, in the order they are listed in :mod:`hearthbreaker.card_data`
+COLUMNS = ["name", "text", "mana", "attack", "health", "character_class", "minion_type", "rarity", "type", "set"]
+
+#: The columns which can be searched with :meth:`CardTable.select`
+INDEXED = ["character_class", "mana", "type", "minion_type", "set"]
+
+_TYPES = {
+    "Minion": MINION,
+    "Spell": SPELL,
+    "Weapon": WEAPON,
+}
+
+
+class CardTable:
+    """
+    The printed details of a set of cards, kept by column and indexed on every combination of the :data:`INDEXED`
+    columns.
+
+    In this table, spells and secrets both have the type :const:`hearthbreaker.card_registry.SPELL`, as ``cards.csv``
+    does not tell them apart, and cards which are not minions, or which are minions without a type, have the minion
+    type :const:`hearthbreaker.constants.MINION_TYPE.NONE`.  Attack and health are None for spells.
+    """
+
+    def __init__(self, columns):
+        """
+        :param dict columns: Maps each of the :data:`COLUMNS` to a tuple of that column's value for each card
+        """
+        #: Maps each of the :data:`COLUMNS` to a tuple of that column's value for each card
+        self.columns = columns
+        names = columns["name"]
+        self._rows = dict((name, row) for row, name in enumerate(names))
+        # There is one index for each combination of the indexed columns, found by a bit mask of the columns it uses
+        # and keyed by their values, in the order of INDEXED
+        self._indexes = []
+        for mask in range(0, 1 << len(INDEXED)):
+            index = {}
+            keys = [()] * len(names)
+            if mask != 0:
+                keys = zip(*[columns[column] for bit, column in enumerate(INDEXED) if mask & (1 << bit)])
+            for name, key in zip(names, keys):
+                index.setdefault(key, []).append(name)
+            self._indexes.append(dict((key, tuple(rows)) for key, rows in index.items()))
+
+    def __contains__(self, card_name):
+        return card_name in self._rows
+
+    def __len__(self):
+        return len(self._rows)
+
+    def value(self, card_name, column):
+        """
+        :param string card_name: The name of a card in English
+        :param string column: One of the :data:`COLUMNS`
+        :return: The value of the column for the card
+        """
+        return self.columns[column][self._rows[card_name]]
+
+    def select(self, **criteria):
+        """
+        Finds the cards which have all of the given values, such as ``select(mana=2, minion_type=MINION_TYPE.BEAST)``.
+
+        :param criteria: The value to search for in each of the :data:`INDEXED` columns to be searched
+        :return: The names of the cards found, in alphabetical order
+        :rtype: tuple[str]
+        """
+        mask = 0
+        values = []
+        for bit, column in enumerate(INDEXED):
+            if column in criteria:
+                mask |= 1 << bit
+                values.append(criteria[column])
+        if len(values) != len(criteria):
+            raise KeyError("Only the columns {0} can be searched".format(", ".join(INDEXED)))
+        return self._indexes[mask].get(tuple(values), ())
+
+    def random_card(self, random_func=random.randint, **criteria):
+        """
+        Chooses one of the cards which have all of the given values at random.
+
+        :param function random_func: A function which takes a lower and upper bound, and returns a random number
+                                     between them, inclusive, such as :func:`random.randint`
+        :param criteria: The value to search for in each of the :data:`INDEXED` columns to be searched, as for
+                         :meth:`select`
+        :return: The name of the card chosen, or None if no cards have those values
+        :rtype: str
+        """
+        names = self.select(**criteria)
+        if len(names) == 0:
+            return None
+        return names[random_func(0, len(names) - 1)]
+
+
+#: The table of all of the cards listed in :mod:`hearthbreaker.card_data`
+table = CardTable(dict((column, getattr(hearthbreaker.card_data, column.upper())) for column in COLUMNS))
+
+
+def read_csv(file):
+    """
+    Reads the implemented cards from a file in the format of ``cards.csv``.
+
+    :param file: The open file
+    :return: A dictionary mapping each of the :data:`COLUMNS` to a tuple of its values, in the order of the file
+    """
+    def number(value):
+        if value == "":
+            return None
+        return int(value)
+
+    rows = []
+    for row in csv.DictReader(file):
+        if row["Implemented?"] != "yes":
+            continue
+        rows.append((row["Name"], row["Text"], int(row["Cost"]), number(row["Attack"]), number(row["Health"]),
+                     CHARACTER_CLASS.from_str(row["Class"]), MINION_TYPE.from_str(row["Race"]),
+                     CARD_RARITY.from_str(row["Rarity"]), _TYPES[row["Type"]], CARD_SET.from_str(row["Set"])))
+    return dict((column, tuple(values)) for column, values in zip(COLUMNS, zip(*rows)))
+
+
+def write_data(columns, file):
+    """
+    Writes a card data module holding the given columns to the given file.
+
+    :param dict columns: Maps each of the :data:`COLUMNS` to a tuple of its values, as returned by :func:`read_csv`
+    """
+    file.write('"""\n'
+               'The columns of the table of implemented cards used by :mod:`hearthbreaker.card_table`.\n\n'
+               'Generated from cards.csv by ``python -m hearthbreaker.card_table``.  Do not edit by hand.\n'
+               '"""\n')
+    for column in COLUMNS:
+        file.write("{0} = (\n".format(column.upper()))
+        line = "   "
+        for value in columns[column]:
+            item = " {0},".format(repr(value))
+            if len(line) + len(item) > 120:
+                file.write(line + "\n")
+                line = "   "
+            line += item
+        file.write(line + "\n)\n")
+
+
+if __name__ == "__main__":
+    # The data is written to memory first, so a failure leaves the old data in place
+    csv_file = open("cards.csv", "r")
+    data = io.StringIO()
+    write_data(read_csv(csv_file), data)
+    csv_file.close()
+    data_file = open(hearthbreaker.card_data.__file__, "w")
+    data_file.write(data.getvalue())
+    data_file.close()
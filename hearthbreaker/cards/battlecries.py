@@ -176,8 +176,7 @@ def put_friendly_minion_on_board_from_enemy_deck(minion):
         index += 1
     if len(index_list) > 0:
         chosen_index = player.game.random(0, len(index_list) - 1)
-        player.deck.used[index_list[chosen_index]] = True
-        player.deck.cards[index_list[chosen_index]].summon(player, player.game, len(player.minions))
+        player.deck.take(index_list[chosen_index]).summon(player, player.game, len(player.minions))
 
 
 def put_minion_on_board_from_hand(minion):
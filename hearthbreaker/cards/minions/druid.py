@@ -1,25 +1,29 @@
 import hearthbreaker.targeting
-from hearthbreaker.constants import CHARACTER_CLASS, CARD_RARITY, MINION_TYPE
+from hearthbreaker.constants import CHARACTER_CLASS, CARD_RARITY
 from hearthbreaker.game_objects import MinionCard, Minion, Card
 from hearthbreaker.cards.battlecries import silence, deal_two_damage
 
 
-class KeeperOfTheGrove(MinionCard):
+# The options of Keeper of the Grove, which only give the agent something to choose between
+class _Moonfire(Card):
     def __init__(self):
-        super().__init__("Keeper of the Grove", 4, CHARACTER_CLASS.DRUID, CARD_RARITY.RARE)
+        super().__init__("Moonfire", 0, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
 
-    def create_minion(self, player):
 
-        class Moonfire(Card):
-            def __init__(self):
-                super().__init__("Moonfire", 0, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
+class _Dispel(Card):
+    def __init__(self):
+        super().__init__("Dispel", 0, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
+
 
-        class Dispel(Card):
-            def __init__(self):
-                super().__init__("Dispel", 0, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
+class KeeperOfTheGrove(MinionCard):
+    choose_one = 2
+
+    def __init__(self):
+        super().__init__("Keeper of the Grove", 4, CHARACTER_CLASS.DRUID, CARD_RARITY.RARE)
 
-        moonfire = Moonfire()
-        dispell = Dispel()
+    def create_minion(self, player):
+        moonfire = _Moonfire()
+        dispell = _Dispel()
         option = player.agent.choose_option(moonfire, dispell)
         minion = Minion(2, 4)
         if option == moonfire:
@@ -39,42 +43,49 @@ class KeeperOfTheGrove(MinionCard):
         return minion
 
 
-class DruidOfTheClaw(MinionCard):
+# These are basically placeholders to give the agent something to
+# choose
+class _CatForm(Card):
     def __init__(self):
-        super().__init__("Druid of the Claw", 5, CHARACTER_CLASS.DRUID, CARD_RARITY.COMMON)
+        super().__init__("Cat Form", 0, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
 
-    def create_minion(self, player):
 
-        # These are basically placeholders to give the agent something to
-        # choose
-        class CatForm(Card):
-            def __init__(self):
-                super().__init__("Cat Form", 0, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
+class _BearForm(Card):
+    def __init__(self):
+        super().__init__("Bear Form", 0, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
 
-        class BearForm(Card):
-            def __init__(self):
-                super().__init__("Bear Form", 0, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
 
-        cat = CatForm()
-        bear = BearForm()
-        option = player.agent.choose_option(cat, bear)
-        if option is cat:
-            class CatDruid(MinionCard):
-                def __init__(self):
-                    super().__init__("Druid of the Claw", 5, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
+# The forms Druid of the Claw takes share its name, so they are kept out of the card index
+class _CatDruid(MinionCard):
+    def __init__(self):
+        super().__init__("Druid of the Claw", 5, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
 
-                def create_minion(self, p):
-                    return Minion(4, 4, charge=True)
+    def create_minion(self, p):
+        return Minion(4, 4, charge=True)
 
-            druid = CatDruid()
-        else:
-            class BearDruid(MinionCard):
-                def __init__(self):
-                    super().__init__("Druid of the Claw", 5, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
 
-                def create_minion(self, p):
-                    return Minion(4, 6, taunt=True)
-            druid = BearDruid()
+class _BearDruid(MinionCard):
+    def __init__(self):
+        super().__init__("Druid of the Claw", 5, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, p):
+        return Minion(4, 6, taunt=True)
+
+
+class DruidOfTheClaw(MinionCard):
+    choose_one = 2
+
+    def __init__(self):
+        super().__init__("Druid of the Claw", 5, CHARACTER_CLASS.DRUID, CARD_RARITY.COMMON)
+
+    def create_minion(self, player):
+        cat = _CatForm()
+        bear = _BearForm()
+        option = player.agent.choose_option(cat, bear)
+        if option is cat:
+            druid = _CatDruid()
+        else:
+            druid = _BearDruid()
 
         def set_card(m):
             m.card = druid
@@ -83,54 +94,61 @@ class DruidOfTheClaw(MinionCard):
         return minion
 
 
+# These are basically placeholders to give the agent something to
+# choose.  Note the lack of call to super().use()
+class _AncientSecrets(Card):
+    def __init__(self):
+        super().__init__("Ancient Secrets", 0, CHARACTER_CLASS.DRUID,
+                         CARD_RARITY.SPECIAL)
+
+    def use(self, player, game):
+        player.hero.heal(player.effective_heal_power(5), self)
+
+
+class _AncientTeachings(Card):
+    def __init__(self):
+        super().__init__("Ancient  Teachings", 0, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
+
+    def use(self, player, game):
+        player.draw()
+        player.draw()
+
+
 class AncientOfLore(MinionCard):
+    choose_one = 2
+
     def __init__(self):
         super().__init__("Ancient of Lore", 7, CHARACTER_CLASS.DRUID, CARD_RARITY.EPIC)
 
     def create_minion(self, player):
-        # These are basically placeholders to give the agent something to
-        # choose.  Note the lack of call to super().use()
-        class AncientSecrets(Card):
-            def __init__(self):
-                super().__init__("Ancient Secrets", 0, CHARACTER_CLASS.DRUID,
-                                 CARD_RARITY.SPECIAL)
-
-            def use(self, player, game):
-                player.hero.heal(player.effective_heal_power(5), self)
-
-        class AncientTeachings(Card):
-            def __init__(self):
-                super().__init__("Ancient  Teachings", 0, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
-
-            def use(self, player, game):
-                player.draw()
-                player.draw()
-
-        option = player.agent.choose_option(AncientSecrets(),
-                                            AncientTeachings())
+        option = player.agent.choose_option(_AncientSecrets(),
+                                            _AncientTeachings())
         option.use(player, player.game)
 
         return Minion(5, 5)
 
 
-class AncientOfWar(MinionCard):
+# These are basically placeholders to give the agent something to
+# choose
+class _Health(Card):
     def __init__(self):
-        super().__init__("Ancient of War", 7, CHARACTER_CLASS.DRUID, CARD_RARITY.EPIC)
+        super().__init__("+5 Health and Taunt", 0, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
+
+
+class _Attack(Card):
+    def __init__(self):
+        super().__init__("+5 Attack", 0, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
 
-    def create_minion(self, player):
 
-        # These are basically placeholders to give the agent something to
-        # choose
-        class Health(Card):
-            def __init__(self):
-                super().__init__("+5 Health and Taunt", 0, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
+class AncientOfWar(MinionCard):
+    choose_one = 2
 
-        class Attack(Card):
-            def __init__(self):
-                super().__init__("+5 Attack", 0, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
+    def __init__(self):
+        super().__init__("Ancient of War", 7, CHARACTER_CLASS.DRUID, CARD_RARITY.EPIC)
 
-        health = Health()
-        attack = Attack()
+    def create_minion(self, player):
+        health = _Health()
+        attack = _Attack()
         option = player.agent.choose_option(health, attack)
         minion = Minion(5, 5)
         if option is health:
@@ -151,54 +169,53 @@ class IronbarkProtector(MinionCard):
         return Minion(8, 8, taunt=True)
 
 
+# The options of Cenarius, each of which is invoked with Cenarius once it has been added to the board
+class _IncreaseStats(Card):
+    def __init__(self):
+        super().__init__("Give your other minions +2/+2 and taunt", 0,
+                         CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
+
+    def invoke(self, cenarius, index):
+        for minion in cenarius.player.minions:
+            if minion is not cenarius:
+                minion.change_attack(2)
+                minion.increase_health(2)
+                minion.taunt = True
+
+
+class _SummonTreants(Card):
+    def __init__(self):
+        super().__init__("Summon two 2/2 Treants with taunt", 0,
+                         CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
+
+    def invoke(self, cenarius, index):
+        ltreant = _Treant()
+        ltreant.summon(cenarius.player, cenarius.game, cenarius.index)
+        rtreant = _Treant()
+        rtreant.summon(cenarius.player, cenarius.game, cenarius.index + 1)
+
+
+# Several cards summon different treants, so none of them are in the card index
+class _Treant(MinionCard):
+    def __init__(self):
+        super().__init__("Treant", 1, CHARACTER_CLASS.DRUID,
+                         CARD_RARITY.COMMON)
+
+    def create_minion(self, p):
+        minion = Minion(2, 2)
+        minion.taunt = True
+        return minion
+
+
 class Cenarius(MinionCard):
+    choose_one = 2
+
     def __init__(self):
         super().__init__("Cenarius", 9, CHARACTER_CLASS.DRUID,
                          CARD_RARITY.LEGENDARY)
 
     def create_minion(self, player):
-
-        # These are basically placeholders to give the agent something to
-        # choose
-        class IncreaseStats(Card):
-            def __init__(self):
-                super().__init__("Give your other minions +2/+2 and taunt", 0,
-                                 CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
-
-            def use(self, player, game):
-                for minion in player.minions:
-                    if minion is not cenarius:
-                        minion.change_attack(2)
-                        minion.increase_health(2)
-                        minion.taunt = True
-
-            def invoke(self, minion, index):
-                self.use(minion.player, minion.game)
-
-        class SummonTreants(Card):
-            def __init__(self):
-                super().__init__("Summon two 2/2 Treants with taunt", 0,
-                                 CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
-
-            def use(self, player, game):
-                class Treant(MinionCard):
-                    def __init__(self):
-                        super().__init__("Treant", 1, CHARACTER_CLASS.DRUID,
-                                         CARD_RARITY.COMMON)
-
-                    def create_minion(self, p):
-                        minion = Minion(2, 2, MINION_TYPE.NONE)
-                        minion.taunt = True
-                        return minion
-                ltreant = Treant()
-                ltreant.summon(player, game, cenarius.index)
-                rtreant = Treant()
-                rtreant.summon(player, game, cenarius.index + 1)
-
-            def invoke(self, minion, index):
-                self.use(minion.player, minion.game)
-
-        option = player.agent.choose_option(IncreaseStats(), SummonTreants())
+        option = player.agent.choose_option(_IncreaseStats(), _SummonTreants())
         cenarius = Minion(5, 8)
         cenarius.bind_once("added_to_board", option.invoke)
         return cenarius
@@ -17,19 +17,20 @@ class TimberWolf(MinionCard):
         return Minion(1, 1, effects=[StatsAura(attack=1, minion_type=MINION_TYPE.BEAST)])
 
 
+class Hyena(MinionCard):
+    def __init__(self):
+        super().__init__("Hyena", 2, CHARACTER_CLASS.HUNTER, CARD_RARITY.SPECIAL, MINION_TYPE.BEAST)
+
+    def create_minion(self, player):
+        return Minion(2, 2)
+
+
 class SavannahHighmane(MinionCard):
     def __init__(self):
         super().__init__("Savannah Highmane", 6, CHARACTER_CLASS.HUNTER, CARD_RARITY.RARE, MINION_TYPE.BEAST)
 
     def create_minion(self, player):
         def summon_hyenas(m):
-            class Hyena(MinionCard):
-                def __init__(self):
-                    super().__init__("Hyena", 2, CHARACTER_CLASS.HUNTER, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, player):
-                    return Minion(2, 2, MINION_TYPE.BEAST)
-
             Hyena().summon(m.player, m.game, m.index)
             Hyena().summon(m.player, m.game, m.index)
 
@@ -4,7 +4,7 @@ from hearthbreaker.cards.battlecries import draw_card, silence, deal_one_damage,
     destroy_target, two_temp_attack, nightblade, ssc, deathwing, return_to_hand, opponent_draw_two, \
     put_friendly_minion_on_board_from_enemy_deck
 from hearthbreaker.effects import StatsAura, IncreaseBattlecryMinionCost, DoubleDeathrattle, GrowOnDeathrattleSummon
-from hearthbreaker.game_objects import Minion, MinionCard, SecretCard, Card
+from hearthbreaker.game_objects import Minion, MinionCard, SecretCard, Card, ManaCostFilter, card_type_filter
 from hearthbreaker.constants import CARD_RARITY, CHARACTER_CLASS, MINION_TYPE
 import hearthbreaker.targeting
 import copy
@@ -217,12 +217,12 @@ class LeperGnome(MinionCard):
     def create_minion(self, player):
         def deal_enemy_hero_two_damage(minion):
             if minion.player is minion.player.game.current_player:
-                player.game.other_player.hero.damage(2, None)
-                player.game.other_player.hero.activate_delayed()
+                minion.game.other_player.hero.damage(2, None)
+                minion.game.other_player.hero.activate_delayed()
 
             else:
-                player.game.current_player.hero.damage(2, None)
-                player.game.current_player.hero.activate_delayed()
+                minion.game.current_player.hero.damage(2, None)
+                minion.game.current_player.hero.activate_delayed()
 
         return Minion(2, 1, deathrattle=deal_enemy_hero_two_damage)
 
@@ -584,9 +584,9 @@ class Abomination(MinionCard):
 
     def create_minion(self, player):
         def deal_two_to_all(minion):
-            for target in hearthbreaker.targeting.find_battlecry_target(player.game, lambda x: True):
+            for target in hearthbreaker.targeting.find_battlecry_target(minion.game, lambda x: True):
                 target.damage(2, self)
-            player.game.check_delayed()
+            minion.game.check_delayed()
 
         return Minion(4, 4, deathrattle=deal_two_to_all, taunt=True)
 
@@ -607,16 +607,10 @@ class VentureCoMercenary(MinionCard):
 
     def create_minion(self, player):
         def apply_effect(m, p):
-            class Filter:
-                def __init__(self):
-                    self.amount = -3
-                    self.filter = lambda c: isinstance(c, MinionCard)
-                    self.min = 0
-
-            filter = Filter()
-            minion.bind_once("silenced", lambda: player.mana_filters.remove(filter))
-            player.mana_filters.append(filter)
-            minion.bind("copied", apply_effect)
+            filter = ManaCostFilter(-3, 0, card_type_filter("minion"))
+            m.bind_once("silenced", lambda: p.remove_mana_filter(filter))
+            p.add_mana_filter(filter)
+            m.bind("copied", apply_effect)
         minion = Minion(7, 6)
         apply_effect(minion, player)
         return minion
@@ -644,19 +638,20 @@ class AmaniBerserker(MinionCard):
         return minion
 
 
+class Squire(MinionCard):
+    def __init__(self):
+        super().__init__("Squire", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        return Minion(2, 2)
+
+
 class SilverHandKnight(MinionCard):
     def __init__(self):
         super().__init__("Silver Hand Knight", 5, CHARACTER_CLASS.ALL, CARD_RARITY.COMMON)
 
     def create_minion(self, player):
         def summon_squire(m):
-            class Squire(MinionCard):
-                def __init__(self):
-                    super().__init__("Squire", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, player):
-                    return Minion(2, 2)
-
             Squire().summon(player, player.game, m.index + 1)
 
         return Minion(4, 4, battlecry=summon_squire)
@@ -855,32 +850,36 @@ class SpitefulSmith(MinionCard):
         super().__init__("Spiteful Smith", 5, CHARACTER_CLASS.ALL, CARD_RARITY.COMMON)
 
     def create_minion(self, player):
-        def increase_weapon_attack():
-            if player.hero.weapon:
-                player.hero.weapon.base_attack += 2
-                if player.game.current_player is player:
-                    player.hero.change_temp_attack(2)
-
-        def decrease_weapon_attack():
-            if player.hero.weapon:
-                player.hero.weapon.base_attack -= 2
-                if player.game.current_player is player:
-                    player.hero.change_temp_attack(-2)
-
-        def weapon_equipped():
-            if minion.enraged:
-                increase_weapon_attack()
+        def apply_effect(m, p):
+            def increase_weapon_attack():
+                if p.hero.weapon:
+                    p.hero.weapon.base_attack += 2
+                    if p.game.current_player is p:
+                        p.hero.change_temp_attack(2)
+
+            def decrease_weapon_attack():
+                if p.hero.weapon:
+                    p.hero.weapon.base_attack -= 2
+                    if p.game.current_player is p:
+                        p.hero.change_temp_attack(-2)
+
+            def weapon_equipped():
+                if m.enraged:
+                    increase_weapon_attack()
 
-        def silenced():
-            minion.unbind("enraged", increase_weapon_attack)
-            minion.unbind("unenraged", decrease_weapon_attack)
-            player.hero.unbind("weapon_equipped", weapon_equipped)
+            def silenced():
+                m.unbind("enraged", increase_weapon_attack)
+                m.unbind("unenraged", decrease_weapon_attack)
+                p.hero.unbind("weapon_equipped", weapon_equipped)
+
+            m.bind("enraged", increase_weapon_attack)
+            m.bind("unenraged", decrease_weapon_attack)
+            p.hero.bind("weapon_equipped", weapon_equipped)
+            m.bind("silenced", silenced)
+            m.bind("copied", apply_effect)
 
         minion = Minion(4, 6)
-        minion.bind("enraged", increase_weapon_attack)
-        minion.bind("unenraged", decrease_weapon_attack)
-        player.hero.bind("weapon_equipped", weapon_equipped)
-        minion.bind("silenced", silenced)
+        apply_effect(minion, player)
         return minion
 
 
@@ -924,55 +923,59 @@ class RaidLeader(MinionCard):
         return minion
 
 
+class MechanicalDragonling(MinionCard):
+    def __init__(self):
+        super().__init__("Mechanical Dragonling", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        return Minion(2, 1)
+    # Apparently not a dragon
+
+
 class DragonlingMechanic(MinionCard):
     def __init__(self):
         super().__init__("Dragonling Mechanic", 4, CHARACTER_CLASS.ALL, CARD_RARITY.COMMON)
 
     def create_minion(self, player):
         def summon_dragonling(m):
-            class MechanicalDragonling(MinionCard):
-                def __init__(self):
-                    super().__init__("Mechanical Dragonling", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, player):
-                    return Minion(2, 1)
-                # Apparently not a dragon
             MechanicalDragonling().summon(player, player.game, m.index)
 
         return Minion(2, 4, battlecry=summon_dragonling)
 
 
+class MurlocScout(MinionCard):
+    def __init__(self):
+        super().__init__("Murloc Scout", 0, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.MURLOC)
+
+    def create_minion(self, player):
+        return Minion(1, 1)
+
+
 class MurlocTidehunter(MinionCard):
     def __init__(self):
         super().__init__("Murloc Tidehunter", 2, CHARACTER_CLASS.ALL, CARD_RARITY.COMMON, MINION_TYPE.MURLOC)
 
     def create_minion(self, player):
         def summon_murlocscout(m):
-            class MurlocScout(MinionCard):
-                def __init__(self):
-                    super().__init__("Murloc Scout", 0, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.MURLOC)
-
-                def create_minion(self, player):
-                    return Minion(1, 1)
-
             MurlocScout().summon(player, player.game, m.index)
 
         return Minion(2, 1, battlecry=summon_murlocscout)
 
 
+class Boar(MinionCard):
+    def __init__(self):
+        super().__init__("Boar", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.BEAST)
+
+    def create_minion(self, player):
+        return Minion(1, 1)
+
+
 class RazorfenHunter(MinionCard):
     def __init__(self):
         super().__init__("Razorfen Hunter", 3, CHARACTER_CLASS.ALL, CARD_RARITY.COMMON)
 
     def create_minion(self, player):
         def summon_boar(m):
-            class Boar(MinionCard):
-                def __init__(self):
-                    super().__init__("Boar", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.BEAST)
-
-                def create_minion(self, player):
-                    return Minion(1, 1)
-
             Boar().summon(player, player.game, m.index)
 
         return Minion(2, 3, battlecry=summon_boar)
@@ -983,44 +986,43 @@ class KnifeJuggler(MinionCard):
         super().__init__("Knife Juggler", 2, CHARACTER_CLASS.ALL, CARD_RARITY.RARE)
 
     def create_minion(self, player):
-        def throw_knife(m):
-            if m is minion:
-                return
-            if m.player is player.game.current_player:
-                enemy_player = player.game.other_player
-            else:
-                enemy_player = player.game.current_player
-            targets = copy.copy(enemy_player.minions)
-            targets.append(enemy_player.hero)
-            target = targets[player.game.random(0, len(targets) - 1)]
-            target.damage(1, minion)
-
-        def copy_minion(new_minon, new_player):
-            new_player.bind("after_minion_added", throw_knife)
-            new_minon.bind_once("silenced", lambda: player.unbind("after_minion_added", throw_knife))
-            new_minon.bind("copied", copy_minion)
+        def apply_effect(minion, p):
+            def throw_knife(m):
+                if m is minion:
+                    return
+                if m.player is p.game.current_player:
+                    enemy_player = p.game.other_player
+                else:
+                    enemy_player = p.game.current_player
+                targets = copy.copy(enemy_player.minions)
+                targets.append(enemy_player.hero)
+                target = targets[p.game.random(0, len(targets) - 1)]
+                target.damage(1, minion)
+
+            p.bind("after_minion_added", throw_knife)
+            minion.bind_once("silenced", lambda: p.unbind("after_minion_added", throw_knife))
+            minion.bind("copied", apply_effect)
 
         minion = Minion(3, 2)
-        player.bind("after_minion_added", throw_knife)
-        minion.bind_once("silenced", lambda: player.unbind("after_minion_added", throw_knife))
-        minion.bind("copied", copy_minion)
+        apply_effect(minion, player)
         return minion
 
 
+class BaineBloodhoof(MinionCard):
+    def __init__(self):
+        super().__init__("Baine Bloodhoof", 4, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        return Minion(4, 5)
+
+
 class CairneBloodhoof(MinionCard):
     def __init__(self):
         super().__init__("Cairne Bloodhoof", 6, CHARACTER_CLASS.ALL, CARD_RARITY.LEGENDARY)
 
     def create_minion(self, player):
         def summon_baine(m):
-            class BaineBloodhoof(MinionCard):
-                def __init__(self):
-                    super().__init__("Baine Bloodhoof", 4, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, player):
-                    return Minion(4, 5)
-
-            BaineBloodhoof().summon(player, player.game, m.index)
+            BaineBloodhoof().summon(m.player, m.game, m.index)
 
         return Minion(4, 5, deathrattle=summon_baine)
 
@@ -1031,33 +1033,36 @@ class HarvestGolem(MinionCard):
 
     def create_minion(self, player):
         def summon_damaged_golem(minion):
-            class DamagedGolem(MinionCard):
-                def __init__(self):
-                    super().__init__("Damaged Golem", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, player):
-                    return Minion(2, 1)
-
             DamagedGolem().summon(minion.player, minion.game, minion.index)
 
         return Minion(2, 3, deathrattle=summon_damaged_golem)
 
 
+class DamagedGolem(MinionCard):
+    def __init__(self):
+        super().__init__("Damaged Golem", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        return Minion(2, 1)
+
+
+class FinkleEinhorn(MinionCard):
+    def __init__(self):
+        super().__init__("Finkle Einhorn", 2, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        return Minion(3, 3)
+
+
 class TheBeast(MinionCard):
     def __init__(self):
         super().__init__("The Beast", 6, CHARACTER_CLASS.ALL, CARD_RARITY.LEGENDARY, MINION_TYPE.BEAST)
 
     def create_minion(self, player):
         def summon_finkle(minion):
-            class FinkleEinhorn(MinionCard):
-                def __init__(self):
-                    super().__init__("Finkle Einhorn", 2, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, player):
-                    return Minion(3, 3)
             finkle_owner = []
-            finkle_owner.append(player.game.current_player)
-            finkle_owner.append(player.game.other_player)
+            finkle_owner.append(minion.game.current_player)
+            finkle_owner.append(minion.game.other_player)
             finkle_owner.remove(minion.player)
             owner = finkle_owner.pop()
             FinkleEinhorn().summon(owner, minion.game, len(owner.minions))
@@ -1074,7 +1079,7 @@ class SylvanasWindrunner(MinionCard):
 
             targets = copy.copy(m.player.opponent.minions)
             if len(targets) > 0:
-                target = targets[player.game.random(0, len(targets) - 1)]
+                target = targets[m.game.random(0, len(targets) - 1)]
                 new_minion = target.copy(m.player)
                 target.remove_from_board()
                 new_minion.add_to_board(len(m.player.minions))
@@ -1159,21 +1164,22 @@ class Gruul(MinionCard):
         return minion
 
 
+class Gnoll(MinionCard):
+    def __init__(self):
+        super().__init__("Gnoll", 2, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        minion = Minion(2, 2)
+        minion.taunt = True
+        return minion
+
+
 class Hogger(MinionCard):
     def __init__(self):
         super().__init__("Hogger", 6, CHARACTER_CLASS.ALL, CARD_RARITY.LEGENDARY)
 
     def create_minion(self, player):
         def summon_gnoll():
-            class Gnoll(MinionCard):
-                def __init__(self):
-                    super().__init__("Gnoll", 2, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, player):
-                    minion = Minion(2, 2)
-                    minion.taunt = True
-                    return minion
-
             Gnoll().summon(player, player.game, minion.index + 1)
         minion = Minion(4, 4)
         player.bind("turn_ended", summon_gnoll)
@@ -1181,19 +1187,20 @@ class Hogger(MinionCard):
         return minion
 
 
+class Imp(MinionCard):
+    def __init__(self):
+        super().__init__("Imp", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.DEMON)
+
+    def create_minion(self, player):
+        return Minion(1, 1)
+
+
 class ImpMaster(MinionCard):
     def __init__(self):
         super().__init__("Imp Master", 3, CHARACTER_CLASS.ALL, CARD_RARITY.RARE)
 
     def create_minion(self, player):
         def summon_imp():
-            class Imp(MinionCard):
-                def __init__(self):
-                    super().__init__("Imp", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.DEMON)
-
-                def create_minion(self, player):
-                    return Minion(1, 1)
-
             minion.damage(1, None)
             player.game.check_delayed()
             Imp().summon(player, player.game, minion.index + 1)
@@ -1428,18 +1435,12 @@ class ManaWraith(MinionCard):
         super().__init__("Mana Wraith", 2, CHARACTER_CLASS.ALL, CARD_RARITY.RARE)
 
     def create_minion(self, player):
-        class Filter:
-            def __init__(self):
-                self.amount = -1
-                self.filter = lambda c: isinstance(c, MinionCard)
-                self.min = 0
-
-        filter = Filter()
+        filter = ManaCostFilter(-1, 0, card_type_filter("minion"))
         minion = Minion(2, 2)
-        minion.bind_once("silenced", lambda: player.game.current_player.mana_filters.remove(filter))
-        player.game.current_player.mana_filters.append(filter)
-        minion.bind_once("silenced", lambda: player.game.other_player.mana_filters.remove(filter))
-        player.game.other_player.mana_filters.append(filter)
+        minion.bind_once("silenced", lambda: player.game.current_player.remove_mana_filter(filter))
+        player.game.current_player.add_mana_filter(filter)
+        minion.bind_once("silenced", lambda: player.game.other_player.remove_mana_filter(filter))
+        player.game.other_player.add_mana_filter(filter)
         return minion
 
 
@@ -1476,18 +1477,20 @@ class MurlocTidecaller(MinionCard):
         return minion
 
 
+class Whelp(MinionCard):
+    def __init__(self):
+        super().__init__("Whelp", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.DRAGON)
+
+    def create_minion(self, player):
+        return Minion(1, 1)
+
+
 class Onyxia(MinionCard):
     def __init__(self):
         super().__init__("Onyxia", 9, CHARACTER_CLASS.ALL, CARD_RARITY.LEGENDARY, MINION_TYPE.DRAGON)
 
     def create_minion(self, player):
         def summon_whelps(m):
-            class Whelp(MinionCard):
-                def __init__(self):
-                    super().__init__("Whelp", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.DRAGON)
-
-                def create_minion(self, player):
-                    return Minion(1, 1)
             whelp = Whelp()
             for i in range(len(player.minions), 7):
                 whelp.summon(player, player.game, i)
@@ -1522,16 +1525,23 @@ class YoungPriestess(MinionCard):
         super().__init__("Young Priestess", 1, CHARACTER_CLASS.ALL, CARD_RARITY.RARE)
 
     def create_minion(self, player):
-        def buff_ally_health():
-            targets = copy.copy(player.game.current_player.minions)
-            targets.remove(minion)
-            if len(targets) > 0:
-                target = targets[player.game.random(0, len(targets) - 1)]
-                target.increase_health(1)
+        def apply_effect(m, p):
+            def buff_ally_health():
+                # A priestess taken by the other player is removed from the board without being silenced
+                if m.removed:
+                    p.unbind("turn_ended", buff_ally_health)
+                    return
+                targets = [minion for minion in p.minions if minion is not m]
+                if len(targets) > 0:
+                    target = targets[p.game.random(0, len(targets) - 1)]
+                    target.increase_health(1)
+
+            p.bind("turn_ended", buff_ally_health)
+            m.bind_once("silenced", lambda: p.unbind("turn_ended", buff_ally_health))
+            m.bind("copied", apply_effect)
 
         minion = Minion(2, 1)
-        player.bind("turn_ended", buff_ally_health)
-        minion.bind_once("silenced", lambda: player.unbind("turn_ended", buff_ally_health))
+        apply_effect(minion, player)
         return minion
 
 
@@ -1581,18 +1591,20 @@ class Secretkeeper(MinionCard):
         return minion
 
 
+class VioletApprentice(MinionCard):
+    def __init__(self):
+        super().__init__("Violet Apprentice", 0, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        return Minion(1, 1)
+
+
 class VioletTeacher(MinionCard):
     def __init__(self):
         super().__init__("Violet Teacher", 4, CHARACTER_CLASS.ALL, CARD_RARITY.RARE)
 
     def create_minion(self, player):
         def summon_apprentice(card):
-            class VioletApprentice(MinionCard):
-                def __init__(self):
-                    super().__init__("Violet Apprentice", 0, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, player):
-                    return Minion(1, 1)
             apprentice = VioletApprentice()
             apprentice.summon(minion.player, minion.player.game, minion.index + 1)
 
@@ -1616,18 +1628,20 @@ class GadgetzanAuctioneer(MinionCard):
         return minion
 
 
+class FlameOfAzzinoth(MinionCard):
+    def __init__(self):
+        super().__init__("Flame of Azzinoth", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        return Minion(2, 1)
+
+
 class IllidanStormrage(MinionCard):
     def __init__(self):
         super().__init__("Illidan Stormrage", 6, CHARACTER_CLASS.ALL, CARD_RARITY.LEGENDARY, MINION_TYPE.DEMON)
 
     def create_minion(self, player):
         def summon_flame(card):
-            class FlameOfAzzinoth(MinionCard):
-                def __init__(self):
-                    super().__init__("Flame of Azzinoth", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, player):
-                    return Minion(2, 1)
             if card is not self:
                 flame = FlameOfAzzinoth()
                 flame.summon(minion.player, minion.player.game, minion.index + 1)
@@ -1769,21 +1783,23 @@ class HarrisonJones(MinionCard):
         return Minion(5, 4, battlecry=destroy_enemy_weapon)
 
 
+class Bananas(Card):
+    def __init__(self):
+        super().__init__("Bananas", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL,
+                         hearthbreaker.targeting.find_minion_spell_target)
+
+    def use(self, player, game):
+        super().use(player, game)
+        self.target.change_attack(1)
+        self.target.increase_health(1)
+
+
 class KingMukla(MinionCard):
     def __init__(self):
         super().__init__("King Mukla", 3, CHARACTER_CLASS.ALL, CARD_RARITY.LEGENDARY, MINION_TYPE.BEAST)
 
     def create_minion(self, player):
         def give_bananas(m):
-            class Bananas(Card):
-                def __init__(self):
-                    super().__init__("Bananas", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL,
-                                     hearthbreaker.targeting.find_minion_spell_target)
-
-                def use(self, player, game):
-                    super().use(player, game)
-                    self.target.change_attack(1)
-                    self.target.increase_health(1)
             player.game.other_player.hand.append(Bananas())
             player.game.other_player.hand.append(Bananas())
 
@@ -1796,12 +1812,6 @@ class LeeroyJenkins(MinionCard):
 
     def create_minion(self, player):
         def summon_whelps(m):
-            class Whelp(MinionCard):
-                def __init__(self):
-                    super().__init__("Whelp", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.DRAGON)
-
-                def create_minion(self, player):
-                    return Minion(1, 1)
             whelp = Whelp()
             whelp.summon(player.game.other_player, player.game, len(player.game.other_player.minions))
             whelp.summon(player.game.other_player, player.game, len(player.game.other_player.minions))
@@ -1881,34 +1891,35 @@ class CaptainsParrot(MinionCard):
                     minions.append(i)
             if len(minions) > 0:
                 index = minions.pop(player.game.random(0, len(minions) - 1))
-                m.player.deck.used[index] = True
-                m.player.deck.left -= 1
-                m.player.hand.append(m.player.deck.cards[index])
-                self.trigger("card_drawn", m.player.deck.cards[index])
+                pirate = m.player.deck.take(index)
+                m.player.hand.append(pirate)
+                self.trigger("card_drawn", pirate)
 
         return Minion(1, 1, battlecry=draw_pirate)
 
 
-class TinkmasterOverspark(MinionCard):
+class Squirrel(MinionCard):
     def __init__(self):
-        super().__init__("Tinkmaster Overspark", 3, CHARACTER_CLASS.ALL, CARD_RARITY.LEGENDARY)
+        super().__init__("Squirrel", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.BEAST)
 
     def create_minion(self, player):
-        def transform_random(m):
-            class Squirrel(MinionCard):
-                def __init__(self):
-                    super().__init__("Squirrel", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.BEAST)
+        return Minion(1, 1)
+
 
-                def create_minion(self, player):
-                    return Minion(1, 1)
+class Devilsaur(MinionCard):
+    def __init__(self):
+        super().__init__("Devilsaur", 5, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.BEAST)
+
+    def create_minion(self, player):
+        return Minion(5, 5)
 
-            class Devilsaur(MinionCard):
-                def __init__(self):
-                    super().__init__("Devilsaur", 5, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.BEAST)
 
-                def create_minion(self, player):
-                    return Minion(5, 5)
+class TinkmasterOverspark(MinionCard):
+    def __init__(self):
+        super().__init__("Tinkmaster Overspark", 3, CHARACTER_CLASS.ALL, CARD_RARITY.LEGENDARY)
 
+    def create_minion(self, player):
+        def transform_random(m):
             squirrel = Squirrel()
             devilsaur = Devilsaur()
             targets = copy.copy(player.game.other_player.minions)
@@ -1951,52 +1962,56 @@ class AlarmoBot(MinionCard):
         return minion
 
 
-class EliteTaurenChieftain(MinionCard):
+class Murloc(MinionCard):
     def __init__(self):
-        super().__init__("Elite Tauren Chieftain", 5, CHARACTER_CLASS.ALL, CARD_RARITY.LEGENDARY)
+        super().__init__("Murloc", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.MURLOC)
 
-    def create_minion(self, player):
-        def both_may_rock(m):
-            class IAmMurloc(Card):
-                def __init__(self):
-                    super().__init__("I Am Murloc", 4, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+    def create_minion(self, p):
+        return Minion(1, 1)
+
+
+class IAmMurloc(Card):
+    def __init__(self):
+        super().__init__("I Am Murloc", 4, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
 
-                def use(self, player, game):
-                    super().use(player, game)
+    def use(self, player, game):
+        super().use(player, game)
 
-                    class Murloc(MinionCard):
-                        def __init__(self):
-                            super().__init__("Murloc", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.MURLOC)
+        for i in range(0, player.game.random(3, 5)):
+            Murloc().summon(player, player.game, len(player.minions))
 
-                        def create_minion(self, p):
-                            return Minion(1, 1)
 
-                    for i in range(0, player.game.random(3, 5)):
-                        Murloc().summon(player, player.game, len(player.minions))
+class PowerOfTheHorde(Card):
+    def __init__(self):
+        super().__init__("Power of the Horde", 4, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def use(self, player, game):
+        super().use(player, game)
 
-            class PowerOfTheHorde(Card):
-                def __init__(self):
-                    super().__init__("Power of the Horde", 4, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+        horde_list = [FrostwolfGrunt(), TaurenWarrior(), ThrallmarFarseer(),
+                      SilvermoonGuardian(), SenjinShieldmasta(), CairneBloodhoof()]
+        horde_summon = horde_list[player.game.random(0, 5)]
+        horde_summon.summon(player, player.game, len(player.minions))
 
-                def use(self, player, game):
-                    super().use(player, game)
 
-                    horde_list = [FrostwolfGrunt(), TaurenWarrior(), ThrallmarFarseer(),
-                                  SilvermoonGuardian(), SenjinShieldmasta(), CairneBloodhoof()]
-                    horde_summon = horde_list[player.game.random(0, 5)]
-                    horde_summon.summon(player, player.game, len(player.minions))
+class RoguesDoIt(Card):
+    def __init__(self):
+        super().__init__("Rogues Do It...", 4, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL,
+                         hearthbreaker.targeting.find_spell_target)
 
-            class RoguesDoIt(Card):
-                def __init__(self):
-                    super().__init__("Rogues Do It...", 4, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL,
-                                     hearthbreaker.targeting.find_spell_target)
+    def use(self, player, game):
+        super().use(player, game)
 
-                def use(self, player, game):
-                    super().use(player, game)
+        self.target.damage(player.effective_spell_damage(4), self)
+        player.draw()
 
-                    self.target.damage(player.effective_spell_damage(4), self)
-                    player.draw()
 
+class EliteTaurenChieftain(MinionCard):
+    def __init__(self):
+        super().__init__("Elite Tauren Chieftain", 5, CHARACTER_CLASS.ALL, CARD_RARITY.LEGENDARY)
+
+    def create_minion(self, player):
+        def both_may_rock(m):
             etc_card_list = [IAmMurloc(), PowerOfTheHorde(), RoguesDoIt()]
             for p in player.game.players:
                 if len(p.hand) < 10:
@@ -2013,19 +2028,13 @@ class MillhouseManastorm(MinionCard):
 
     def create_minion(self, player):
         def free_spells(m):
-            class Filter:
-                def __init__(self):
-                    self.amount = 10
-                    self.filter = lambda c: c.is_spell()
-                    self.min = 0
-
-            free = Filter()
+            free = ManaCostFilter(10, 0, card_type_filter("spell"))
 
             def start_free_spells():
-                player.game.other_player.mana_filters.append(free)
+                player.game.other_player.add_mana_filter(free)
 
             def end_free_spells():
-                player.game.other_player.mana_filters.remove(free)
+                player.game.other_player.remove_mana_filter(free)
 
             player.game.other_player.bind_once("turn_started", start_free_spells)
             player.game.other_player.bind_once("turn_ended", end_free_spells)
@@ -2038,19 +2047,13 @@ class PintSizedSummoner(MinionCard):
         super().__init__("Pint-Sized Summoner", 2, CHARACTER_CLASS.ALL, CARD_RARITY.RARE)
 
     def create_minion(self, player):
-        class Filter:
-            def __init__(self):
-                self.amount = 1
-                self.filter = lambda c: isinstance(c, MinionCard)
-                self.min = 0
-
-        lesser = Filter()
+        lesser = ManaCostFilter(1, 0, card_type_filter("minion"))
 
         def start_discounted_minion():
-            player.mana_filters.append(lesser)
+            player.add_mana_filter(lesser)
 
         def end_discounted_minion(m):
-            player.mana_filters.remove(lesser)
+            player.remove_mana_filter(lesser)
 
         def subbind():
             player.bind_once("minion_played", end_discounted_minion)
@@ -2096,73 +2099,79 @@ class OldMurkEye(MinionCard):
         return minion
 
 
+class Dream(Card):
+    def __init__(self):
+        super().__init__("Dream", 0, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL,
+                         hearthbreaker.targeting.find_minion_spell_target)
+
+    def use(self, player, game):
+        super().use(player, game)
+        self.target.bounce()
+
+
+class YseraAwakens(Card):
+    def __init__(self):
+        super().__init__("Ysera Awakens", 2, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def use(self, player, game):
+        super().use(player, game)
+        targets = copy.copy(player.game.other_player.minions)
+        targets.extend(player.game.current_player.minions)
+        targets.append(player.game.other_player.hero)
+        targets.append(player.game.current_player.hero)
+        for minion in targets:
+            if isinstance(minion, Minion) and minion.card.name == "Ysera":
+                targets.remove(minion)
+        for minion in targets:
+            minion.damage(player.effective_spell_damage(5), self)
+
+
+class Nightmare(Card):
+    def __init__(self):
+        super().__init__("Nightmare", 0, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL,
+                         hearthbreaker.targeting.find_minion_spell_target)
+
+    def use(self, player, game):
+        super().use(player, game)
+        self.target.change_attack(5)
+        self.target.increase_health(5)
+
+        def death():
+            self.target.die(None)
+            game.check_delayed()
+
+        player.bind("turn_started", death)
+        self.target.bind_once("silenced", lambda: player.unbind("turn_started", death))
+
+
+class PlayfulSister(MinionCard):
+    def __init__(self):
+        super().__init__("Playful Sister", 3, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        def silence():
+            minion.spell_targettable = lambda: True
+
+        minion = Minion(3, 5)
+        minion.spell_targettable = lambda: False
+        minion.bind("silenced", silence)
+        return minion
+
+
+class EmeraldDrake(MinionCard):
+    def __init__(self):
+        super().__init__("Emerald Drake", 4, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.DRAGON)
+
+    def create_minion(self, player):
+        return Minion(7, 6)
+
+
 class Ysera(MinionCard):
     def __init__(self):
         super().__init__("Ysera", 9, CHARACTER_CLASS.ALL, CARD_RARITY.LEGENDARY, MINION_TYPE.DRAGON)
 
     def create_minion(self, player):
         def dream_card():
-            class Dream(Card):
-                def __init__(self):
-                    super().__init__("Dream", 0, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL,
-                                     hearthbreaker.targeting.find_minion_spell_target)
-
-                def use(self, player, game):
-                    super().use(player, game)
-                    self.target.bounce()
-
-            class YseraAwakens(Card):
-                def __init__(self):
-                    super().__init__("Ysera Awakens", 2, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
-
-                def use(self, player, game):
-                    super().use(player, game)
-                    targets = copy.copy(player.game.other_player.minions)
-                    targets.extend(player.game.current_player.minions)
-                    targets.append(player.game.other_player.hero)
-                    targets.append(player.game.current_player.hero)
-                    for minion in targets:
-                        if isinstance(minion, Minion) and minion.card.name == "Ysera":
-                            targets.remove(minion)
-                    for minion in targets:
-                        minion.damage(player.effective_spell_damage(5), self)
-
-            class Nightmare(Card):
-                def __init__(self):
-                    super().__init__("Nightmare", 0, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL,
-                                     hearthbreaker.targeting.find_minion_spell_target)
-
-                def use(self, player, game):
-                    super().use(player, game)
-                    self.target.change_attack(5)
-                    self.target.increase_health(5)
-
-                    def death():
-                        self.target.die(None)
-                        game.check_delayed()
-
-                    player.bind("turn_started", death)
-                    self.target.bind_once("silenced", lambda: player.unbind("turn_started", death))
-
-            class PlayfulSister(MinionCard):
-                def __init__(self):
-                    super().__init__("Playful Sister", 3, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, player):
-                    def silence():
-                        minion.spell_targettable = lambda: True
-
-                    minion = Minion(3, 5)
-                    minion.spell_targettable = lambda: False
-                    minion.bind("silenced", silence)
-                    return minion
-
-            class EmeraldDrake(MinionCard):
-                def __init__(self):
-                    super().__init__("Emerald Drake", 4, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.DRAGON)
-
-                def create_minion(self, player):
-                    return Minion(7, 6)
             dream_card_list = [EmeraldDrake(), PlayfulSister(), Nightmare(), YseraAwakens(), Dream()]
             if len(player.hand) < 10:
                 player.hand.append(dream_card_list[player.game.random(0, 4)])
@@ -2174,86 +2183,92 @@ class Ysera(MinionCard):
         return minion
 
 
+class Emboldener3000(MinionCard):
+    def __init__(self):
+        super().__init__("Emboldener 3000", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        def random_buff():
+            targets = copy.copy(player.game.other_player.minions)
+            targets.extend(player.game.current_player.minions)
+            target = targets[player.game.random(0, len(targets) - 1)]
+            target.change_attack(1)
+            target.increase_health(1)
+        minion = Minion(0, 4)
+        player.bind("turn_ended", random_buff)
+        minion.bind_once("silenced", lambda: player.unbind("turn_ended", random_buff))
+        return minion
+
+
+class HomingChicken(MinionCard):
+    def __init__(self):
+        super().__init__("Homing Chicken", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        def death_draw():
+            minion.die(None)
+            for i in range(0, 3):
+                player.draw()
+        minion = Minion(0, 1)
+        player.bind_once("turn_started", death_draw)
+        minion.bind_once("silenced", lambda: player.unbind("turn_started", death_draw))
+        return minion
+
+
+class Chicken(MinionCard):
+    def __init__(self):
+        super().__init__("Chicken", 0, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL,
+                         MINION_TYPE.BEAST)
+
+    def create_minion(self, p):
+        return Minion(1, 1)
+
+
+class Poultryizer(MinionCard):
+    def __init__(self):
+        super().__init__("Poultryizer", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        def poultrymorph():
+            targets = copy.copy(player.game.other_player.minions)
+            targets.extend(player.game.current_player.minions)
+            target = targets[player.game.random(0, len(targets) - 1)]
+
+            chicken = Chicken()
+            minion = chicken.create_minion(None)
+            minion.card = chicken
+            target.replace(minion)
+        minion = Minion(0, 3)
+        player.bind("turn_started", poultrymorph)
+        minion.bind_once("silenced", lambda: player.unbind("turn_started", poultrymorph))
+        return minion
+
+
+class RepairBot(MinionCard):
+    def __init__(self):
+        super().__init__("Repair Bot", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        def repair():
+            targets = []
+            for m in hearthbreaker.targeting.find_spell_target(
+                    player.game, lambda x: x.health != x.calculate_max_health()):
+                targets.append(m)
+            if len(targets) > 0:
+                repairee = targets[player.game.random(0, len(targets) - 1)]
+                repairee.heal(player.effective_heal_power(6), self)
+        minion = Minion(0, 3)
+        player.bind("turn_ended", repair)
+        minion.bind_once("silenced", lambda: player.unbind("turn_ended", repair))
+        return minion
+
+
 class GelbinMekkatorque(MinionCard):
     def __init__(self):
         super().__init__("Gelbin Mekkatorque", 6, CHARACTER_CLASS.ALL, CARD_RARITY.LEGENDARY)
 
     def create_minion(self, player):
         def awesome_invention(m):
-            class Emboldener3000(MinionCard):
-                def __init__(self):
-                    super().__init__("Emboldener 3000", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, player):
-                    def random_buff():
-                        targets = copy.copy(player.game.other_player.minions)
-                        targets.extend(player.game.current_player.minions)
-                        target = targets[player.game.random(0, len(targets) - 1)]
-                        target.change_attack(1)
-                        target.increase_health(1)
-                    minion = Minion(0, 4)
-                    player.bind("turn_ended", random_buff)
-                    minion.bind_once("silenced", lambda: player.unbind("turn_ended", random_buff))
-                    return minion
-
-            class HomingChicken(MinionCard):
-                def __init__(self):
-                    super().__init__("Homing Chicken", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, player):
-                    def death_draw():
-                        minion.die(None)
-                        for i in range(0, 3):
-                            player.draw()
-                    minion = Minion(0, 1)
-                    player.bind_once("turn_started", death_draw)
-                    minion.bind_once("silenced", lambda: player.unbind("turn_started", death_draw))
-                    return minion
-
-            class Poultryizer(MinionCard):
-                def __init__(self):
-                    super().__init__("Poultryizer", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, player):
-                    def poultrymorph():
-                        targets = copy.copy(player.game.other_player.minions)
-                        targets.extend(player.game.current_player.minions)
-                        target = targets[player.game.random(0, len(targets) - 1)]
-
-                        class Chicken(MinionCard):
-                            def __init__(self):
-                                super().__init__("Chicken", 0, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL,
-                                                 MINION_TYPE.BEAST)
-
-                            def create_minion(self, p):
-                                return Minion(1, 1)
-
-                        chicken = Chicken()
-                        minion = chicken.create_minion(None)
-                        minion.card = chicken
-                        target.replace(minion)
-                    minion = Minion(0, 3)
-                    player.bind("turn_started", poultrymorph)
-                    minion.bind_once("silenced", lambda: player.unbind("turn_started", poultrymorph))
-                    return minion
-
-            class RepairBot(MinionCard):
-                def __init__(self):
-                    super().__init__("Repair Bot", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, player):
-                    def repair():
-                        targets = []
-                        for m in hearthbreaker.targeting.find_spell_target(
-                                player.game, lambda x: x.health != x.calculate_max_health()):
-                            targets.append(m)
-                        if len(targets) > 0:
-                            repairee = targets[player.game.random(0, len(targets) - 1)]
-                            repairee.heal(player.effective_heal_power(6), self)
-                    minion = Minion(0, 3)
-                    player.bind("turn_ended", repair)
-                    minion.bind_once("silenced", lambda: player.unbind("turn_ended", repair))
-                    return minion
             invention_list = [Emboldener3000(), HomingChicken(), Poultryizer(), RepairBot()]
             invention = invention_list[player.game.random(0, 3)]
             invention.summon(player, player.game, m.index + 1)
@@ -2315,18 +2330,19 @@ class NerubianEgg(MinionCard):
 
     def create_minion(self, player):
         def summon_nerubian(m):
-            class Nerubian(MinionCard):
-                def __init__(self):
-                    super().__init__("Nerubian", 3, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, p):
-                    return Minion(4, 4)
-
             Nerubian().summon(m.player, m.player.game, m.index)
 
         return Minion(0, 2, deathrattle=summon_nerubian)
 
 
+class Nerubian(MinionCard):
+    def __init__(self):
+        super().__init__("Nerubian", 3, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        return Minion(4, 4)
+
+
 class Maexxna(MinionCard):
     def __init__(self):
         super().__init__("Maexxna", 6, CHARACTER_CLASS.ALL, CARD_RARITY.LEGENDARY, MINION_TYPE.BEAST)
@@ -2348,19 +2364,20 @@ class Maexxna(MinionCard):
         return minion
 
 
+class SpectralSpider(MinionCard):
+    def __init__(self):
+        super().__init__("Spectral Spider", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        return Minion(1, 1)
+
+
 class HauntedCreeper(MinionCard):
     def __init__(self):
         super().__init__("Haunted Creeper", 2, CHARACTER_CLASS.ALL, CARD_RARITY.COMMON, MINION_TYPE.BEAST)
 
     def create_minion(self, player):
         def summon_spiders(minion):
-            class SpectralSpider(MinionCard):
-                def __init__(self):
-                    super().__init__("Spectral Spider", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, player):
-                    return Minion(1, 1)
-
             SpectralSpider().summon(minion.player, minion.game, minion.index)
             SpectralSpider().summon(minion.player, minion.game, minion.index)
 
@@ -2418,19 +2435,20 @@ class StoneskinGargoyle(MinionCard):
         return minion
 
 
+class Slime(MinionCard):
+    def __init__(self):
+        super().__init__("Slime", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, p):
+        return Minion(1, 2, taunt=True)
+
+
 class SludgeBelcher(MinionCard):
     def __init__(self):
         super().__init__("Sludge Belcher", 5, CHARACTER_CLASS.ALL, CARD_RARITY.COMMON)
 
     def create_minion(self, player):
         def summon_slime(minion):
-            class Slime(MinionCard):
-                def __init__(self):
-                    super().__init__("Slime", 1, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, p):
-                    return Minion(1, 2, taunt=True)
-
             Slime().summon(minion.player, minion.game, minion.index)
 
         return Minion(3, 5, taunt=True, deathrattle=summon_slime)
@@ -2545,9 +2563,8 @@ class MadScientist(MinionCard):
                     secret_indices.append(index)
             if len(secret_indices) > 0:
                 secret_index = secret_indices[minion.game.random(0, len(secret_indices) - 1)]
-                secret = minion.player.deck.cards[secret_index]
+                secret = minion.player.deck.take(secret_index)
                 minion.player.secrets.append(secret)
-                minion.player.deck.used[secret_index] = True
                 if minion.player is minion.game.other_player:
                     secret.player = minion.player
                     secret.activate(minion.player)
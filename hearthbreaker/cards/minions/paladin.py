@@ -31,21 +31,30 @@ class GuardianOfKings(MinionCard):
         return minion
 
 
+class Ashbringer(WeaponCard):
+    def __init__(self):
+        super().__init__("Ashbringer", 5, CHARACTER_CLASS.PALADIN, CARD_RARITY.LEGENDARY)
+
+    def create_weapon(self, player):
+        weapon = Weapon(5, 3)
+        return weapon
+
+
 class TirionFordring(MinionCard):
     def __init__(self):
         super().__init__("Tirion Fordring", 8, CHARACTER_CLASS.PALADIN, CARD_RARITY.LEGENDARY)
 
     def create_minion(self, player):
-        class Ashbringer(WeaponCard):
-            def __init__(self):
-                super().__init__("Ashbringer", 5, CHARACTER_CLASS.PALADIN, CARD_RARITY.LEGENDARY)
-
-            def create_weapon(self, player):
-                weapon = Weapon(5, 3)
-                return weapon
-
         def equip_ashbringer(minion):
             ashbringer = Ashbringer().create_weapon(minion.player)
             ashbringer.equip(minion.player)
 
         return Minion(6, 6, divine_shield=True, taunt=True, deathrattle=equip_ashbringer)
+
+
+class SilverHandRecruit(MinionCard):
+    def __init__(self):
+        super().__init__("Silver Hand Recruit", 1, CHARACTER_CLASS.PALADIN, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        return Minion(1, 1)
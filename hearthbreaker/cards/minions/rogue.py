@@ -6,19 +6,20 @@ from hearthbreaker.game_objects import MinionCard, Minion
 from hearthbreaker.cards.battlecries import give_stealth
 
 
+class DefiasBandit(MinionCard):
+    def __init__(self):
+        super().__init__("Defias Bandit", 1, CHARACTER_CLASS.ROGUE, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        return Minion(2, 1)
+
+
 class DefiasRingleader(MinionCard):
     def __init__(self):
         super().__init__("Defias Ringleader", 2, CHARACTER_CLASS.ROGUE, CARD_RARITY.COMMON)
 
     def create_minion(self, player):
         def combo(m):
-            class DefiasBandit(MinionCard):
-                def __init__(self):
-                    super().__init__("Defias Bandit", 1, CHARACTER_CLASS.ROGUE, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, player):
-                    return Minion(2, 1)
-
             if m.player.cards_played > 0:
                 bandit_card = DefiasBandit()
                 bandit_card.summon(m.player, m.game, m.index + 1)
@@ -83,3 +83,45 @@ class Windspeaker(MinionCard):
 
     def create_minion(self, player):
         return Minion(3, 3, battlecry=give_windfury)
+
+
+class HealingTotem(MinionCard):
+    def __init__(self):
+        super().__init__("Healing Totem", 1, CHARACTER_CLASS.SHAMAN, CARD_RARITY.SPECIAL, MINION_TYPE.TOTEM)
+
+    def create_minion(self, player):
+        def heal_friendly_minions():
+            for m in player.minions:
+                m.heal(player.effective_heal_power(1), self)
+
+        def silence():
+            player.unbind("turn_ended", heal_friendly_minions)
+
+        minion = Minion(0, 2)
+        player.bind("turn_ended", heal_friendly_minions)
+        minion.bind_once("silenced", silence)
+        return minion
+
+
+class SearingTotem(MinionCard):
+    def __init__(self):
+        super().__init__("Searing Totem", 1, CHARACTER_CLASS.SHAMAN, CARD_RARITY.SPECIAL, MINION_TYPE.TOTEM)
+
+    def create_minion(self, player):
+        return Minion(1, 1)
+
+
+class StoneclawTotem(MinionCard):
+    def __init__(self):
+        super().__init__("Stoneclaw Totem", 1, CHARACTER_CLASS.SHAMAN, CARD_RARITY.SPECIAL, MINION_TYPE.TOTEM)
+
+    def create_minion(self, player):
+        return Minion(0, 2, taunt=True)
+
+
+class WrathOfAirTotem(MinionCard):
+    def __init__(self):
+        super().__init__("Wrath of Air Totem", 1, CHARACTER_CLASS.SHAMAN, CARD_RARITY.SPECIAL, MINION_TYPE.TOTEM)
+
+    def create_minion(self, player):
+        return Minion(0, 2, spell_damage=1)
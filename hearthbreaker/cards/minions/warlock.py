@@ -1,5 +1,6 @@
 from hearthbreaker.constants import CHARACTER_CLASS, CARD_RARITY, MINION_TYPE
-from hearthbreaker.game_objects import MinionCard, Minion, WeaponCard, Weapon
+from hearthbreaker.game_objects import MinionCard, Minion, WeaponCard, Weapon, ManaCostFilter, \
+    card_type_filter
 from hearthbreaker.cards.battlecries import deal_one_damage_all_characters, \
     destroy_own_crystal, discard_one, discard_two, flame_imp, pit_lord, put_minion_on_board_from_hand
 import copy
@@ -67,16 +68,10 @@ class SummoningPortal(MinionCard):
         super().__init__("Summoning Portal", 4, CHARACTER_CLASS.WARLOCK, CARD_RARITY.COMMON)
 
     def create_minion(self, player):
-        class Filter:
-            def __init__(self):
-                self.amount = 2
-                self.filter = lambda c: isinstance(c, MinionCard)
-                self.min = 1
-
-        mana_filter = Filter()
+        mana_filter = ManaCostFilter(2, 1, card_type_filter("minion"))
         minion = Minion(0, 4)
-        minion.bind_once("silenced", lambda: player.mana_filters.remove(mana_filter))
-        player.mana_filters.append(mana_filter)
+        minion.bind_once("silenced", lambda: player.remove_mana_filter(mana_filter))
+        player.add_mana_filter(mana_filter)
         return minion
 
 
@@ -99,19 +94,20 @@ class BloodImp(MinionCard):
         return minion
 
 
+class BloodFury(WeaponCard):
+    def __init__(self):
+        super().__init__("Blood Fury", 3, CHARACTER_CLASS.LORD_JARAXXUS, CARD_RARITY.SPECIAL)
+
+    def create_weapon(self, player):
+        return Weapon(3, 8)
+
+
 class LordJaraxxus(MinionCard):
     def __init__(self):
         super().__init__("Lord Jaraxxus", 9, CHARACTER_CLASS.WARLOCK, CARD_RARITY.LEGENDARY, MINION_TYPE.DEMON)
 
     def create_minion(self, player):
         def summon_jaraxxus(minion):
-            class BloodFury(WeaponCard):
-                def __init__(self):
-                    super().__init__("Blood Fury", 3, CHARACTER_CLASS.LORD_JARAXXUS, CARD_RARITY.SPECIAL)
-
-                def create_weapon(self, player):
-                    return Weapon(3, 8)
-
             minion.remove_from_board()
             player.trigger("minion_played", minion)
             player.hero.health = minion.health
@@ -159,3 +155,11 @@ class Voidcaller(MinionCard):
 
     def create_minion(self, player):
         return Minion(3, 4, deathrattle=put_minion_on_board_from_hand)
+
+
+class Infernal(MinionCard):
+    def __init__(self):
+        super().__init__("Infernal", 6, CHARACTER_CLASS.LORD_JARAXXUS, CARD_RARITY.SPECIAL, MINION_TYPE.DEMON)
+
+    def create_minion(self, player):
+        return Minion(6, 6)
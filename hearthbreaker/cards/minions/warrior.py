@@ -3,18 +3,19 @@ from hearthbreaker.constants import CHARACTER_CLASS, CARD_RARITY
 from hearthbreaker.game_objects import MinionCard, Minion, WeaponCard, Weapon
 
 
+class BattleAxe(WeaponCard):
+    def __init__(self):
+        super().__init__("Battle Axe", 1, CHARACTER_CLASS.WARRIOR, CARD_RARITY.SPECIAL)
+
+    def create_weapon(self, player):
+        return Weapon(2, 2)
+
+
 class ArathiWeaponsmith(MinionCard):
     def __init__(self):
         super().__init__("Arathi Weaponsmith", 4, CHARACTER_CLASS.WARRIOR, CARD_RARITY.COMMON)
 
     def create_minion(self, player):
-        class BattleAxe(WeaponCard):
-            def __init__(self):
-                super().__init__("Battle Axe", 1, CHARACTER_CLASS.WARRIOR, CARD_RARITY.SPECIAL)
-
-            def create_weapon(self, player):
-                return Weapon(2, 2)
-
         def equip_battle_axe(minion):
             battle_axe = BattleAxe().create_weapon(player)
             battle_axe.equip(player)
@@ -76,43 +76,49 @@ class MarkOfTheWild(Card):
         self.target.taunt = True
 
 
-class PowerOfTheWild(Card):
+class _LeaderOfThePack(Card):
     def __init__(self):
-        super().__init__("Power of the Wild", 2, CHARACTER_CLASS.DRUID,
+        super().__init__("Leader of the Pack", 0,
+                         CHARACTER_CLASS.DRUID,
                          CARD_RARITY.COMMON)
 
     def use(self, player, game):
-        super().use(player, game)
+        for minion in player.minions:
+            minion.change_attack(1)
+            minion.increase_health(1)
+
+
+class _SummonPanther(Card):
+    def __init__(self):
+        super().__init__("Summon a Panther", 0, CHARACTER_CLASS.DRUID,
+                         CARD_RARITY.SPECIAL)
 
-        class LeaderOfThePack(Card):
-            def __init__(self):
-                super().__init__("Leader of the Pack", 0,
-                                 CHARACTER_CLASS.DRUID,
-                                 CARD_RARITY.COMMON)
+    def use(self, player, game):
+        panther = Panther()
+        panther.summon(player, game, len(player.minions))
 
-            def use(self, player, game):
-                for minion in player.minions:
-                    minion.change_attack(1)
-                    minion.increase_health(1)
 
-        class SummonPanther(Card):
-            def __init__(self):
-                super().__init__("Summon a Panther", 0, CHARACTER_CLASS.DRUID,
-                                 CARD_RARITY.SPECIAL)
+# Special card that only appears in tandem with Power of the Wild
+class Panther(MinionCard):
+    def __init__(self):
+        super().__init__("Panther", 2, CHARACTER_CLASS.DRUID,
+                         CARD_RARITY.SPECIAL, MINION_TYPE.BEAST)
 
-            def use(self, player, game):
-                class Panther(MinionCard):
-                    def __init__(self):
-                        super().__init__("Panther", 2, CHARACTER_CLASS.DRUID,
-                                         CARD_RARITY.SPECIAL)
+    def create_minion(self, _):
+        return Minion(3, 2)
 
-                    def create_minion(self, _):
-                        return Minion(3, 2, MINION_TYPE.BEAST)
 
-                panther = Panther()
-                panther.summon(player, game, len(player.minions))
+class PowerOfTheWild(Card):
+    choose_one = 2
 
-        option = player.agent.choose_option(LeaderOfThePack(), SummonPanther())
+    def __init__(self):
+        super().__init__("Power of the Wild", 2, CHARACTER_CLASS.DRUID,
+                         CARD_RARITY.COMMON)
+
+    def use(self, player, game):
+        super().use(player, game)
+
+        option = player.agent.choose_option(_LeaderOfThePack(), _SummonPanther())
         option.use(player, game)
 
 
@@ -140,36 +146,41 @@ class ExcessMana(Card):
         player.draw()
 
 
-class Wrath(Card):
-    def __init__(self):
-        super().__init__("Wrath", 2, CHARACTER_CLASS.DRUID, CARD_RARITY.COMMON,
+# The options of Wrath, which damage the minion Wrath targeted
+class _WrathOne(Card):
+    def __init__(self, wrath):
+        super().__init__("Wrath 1 Damage", 2, CHARACTER_CLASS.DRUID,
+                         CARD_RARITY.SPECIAL,
                          hearthbreaker.targeting.find_minion_spell_target)
+        self.wrath = wrath
 
     def use(self, player, game):
-        class WrathOne(Card):
-            def __init__(self):
-                super().__init__("Wrath 1 Damage", 2, CHARACTER_CLASS.DRUID,
-                                 CARD_RARITY.SPECIAL,
-                                 hearthbreaker.targeting.find_minion_spell_target)
+        self.wrath.target.damage(player.effective_spell_damage(1), self.wrath)
+        player.draw()
 
-            def use(self, player, game):
-                target.damage(player.effective_spell_damage(1), wrath)
-                player.draw()
 
-        class WrathThree(Card):
-            def __init__(self):
-                super().__init__("Wrath 3 Damage", 2, CHARACTER_CLASS.DRUID,
-                                 CARD_RARITY.SPECIAL,
-                                 hearthbreaker.targeting.find_minion_spell_target)
+class _WrathThree(Card):
+    def __init__(self, wrath):
+        super().__init__("Wrath 3 Damage", 2, CHARACTER_CLASS.DRUID,
+                         CARD_RARITY.SPECIAL,
+                         hearthbreaker.targeting.find_minion_spell_target)
+        self.wrath = wrath
 
-            def use(self, player, game):
-                target.damage(player.effective_spell_damage(3), wrath)
+    def use(self, player, game):
+        self.wrath.target.damage(player.effective_spell_damage(3), self.wrath)
+
+
+class Wrath(Card):
+    choose_one = 2
 
+    def __init__(self):
+        super().__init__("Wrath", 2, CHARACTER_CLASS.DRUID, CARD_RARITY.COMMON,
+                         hearthbreaker.targeting.find_minion_spell_target)
+
+    def use(self, player, game):
         super().use(player, game)
-        option = game.current_player.agent.choose_option(WrathOne(),
-                                                         WrathThree())
-        target = self.target
-        wrath = self
+        option = game.current_player.agent.choose_option(_WrathOne(self),
+                                                         _WrathThree(self))
         option.use(player, game)
 
 
@@ -184,38 +195,44 @@ class HealingTouch(Card):
         self.target.heal(player.effective_heal_power(8), self)
 
 
+# The options of Mark of Nature, which buff the minion Mark of Nature targeted
+class _MarkOfNatureAttack(Card):
+    def __init__(self, mark):
+        super().__init__("Mark of Nature +4 Attack", 0,
+                         CHARACTER_CLASS.DRUID,
+                         CARD_RARITY.SPECIAL,
+                         hearthbreaker.targeting.find_minion_spell_target)
+        self.mark = mark
+
+    def use(self, player, game):
+        self.mark.target.change_attack(4)
+
+
+class _MarkOfNatureHealth(Card):
+    def __init__(self, mark):
+        super().__init__("Mark of Nature +4 Health", 0,
+                         CHARACTER_CLASS.DRUID,
+                         CARD_RARITY.SPECIAL,
+                         hearthbreaker.targeting.find_minion_spell_target)
+        self.mark = mark
+
+    def use(self, player, game):
+        self.mark.target.increase_health(4)
+        self.mark.target.taunt = True
+
+
 class MarkOfNature(Card):
+    choose_one = 2
+
     def __init__(self):
         super().__init__("Mark of Nature", 3, CHARACTER_CLASS.DRUID,
                          CARD_RARITY.COMMON,
                          hearthbreaker.targeting.find_minion_spell_target)
 
     def use(self, player, game):
-        class MarkOfNatureAttack(Card):
-            def __init__(self):
-                super().__init__("Mark of Nature +4 Attack", 0,
-                                 CHARACTER_CLASS.DRUID,
-                                 CARD_RARITY.SPECIAL,
-                                 hearthbreaker.targeting.find_minion_spell_target)
-
-            def use(self, player, game):
-                target.change_attack(4)
-
-        class MarkOfNatureHealth(Card):
-            def __init__(self):
-                super().__init__("Mark of Nature +4 Health", 0,
-                                 CHARACTER_CLASS.DRUID,
-                                 CARD_RARITY.SPECIAL,
-                                 hearthbreaker.targeting.find_minion_spell_target)
-
-            def use(self, player, game):
-                target.increase_health(4)
-                target.taunt = True
-
         super().use(player, game)
-        target = self.target
-        option = game.current_player.agent.choose_option(MarkOfNatureAttack(),
-                                                         MarkOfNatureHealth())
+        option = game.current_player.agent.choose_option(_MarkOfNatureAttack(self),
+                                                         _MarkOfNatureHealth(self))
         option.use(player, game)
 
 
@@ -244,6 +261,15 @@ class Bite(Card):
         player.hero.increase_armor(4)
 
 
+# Several cards summon different treants, so none of them are in the card index
+class _SoulOfTheForestTreant(MinionCard):
+    def __init__(self):
+        super().__init__("Treant", 1, CHARACTER_CLASS.DRUID, CARD_RARITY.COMMON)
+
+    def create_minion(self, _):
+        return Minion(2, 2)
+
+
 class SoulOfTheForest(Card):
     def __init__(self):
         super().__init__("Soul of the Forest", 4, CHARACTER_CLASS.DRUID,
@@ -252,16 +278,10 @@ class SoulOfTheForest(Card):
     def use(self, player, game):
         super().use(player, game)
 
-        class Treant(MinionCard):
-            def __init__(self):
-                super().__init__("Treant", 1, CHARACTER_CLASS.DRUID, CARD_RARITY.COMMON)
-
-            def create_minion(self, _):
-                return Minion(2, 2)
         # Can stack as many deathrattles as we want, so no need to check if this has already been given
         # See http://hearthstone.gamepedia.com/Soul_of_the_Forest
         for minion in player.minions:
-            minion.add_effect(SummonOnDeath(Treant))
+            minion.add_effect(SummonOnDeath(_SoulOfTheForestTreant))
 
 
 class Swipe(Card):
@@ -282,44 +302,71 @@ class Swipe(Card):
                                           self)
 
 
+class _Gain2(Card):
+
+    def __init__(self):
+        super().__init__("Gain 2 mana crystals", 0,
+                         CHARACTER_CLASS.DRUID,
+                         CARD_RARITY.SPECIAL)
+
+    def use(self, player, game):
+        if player.max_mana < 8:
+            player.max_mana += 2
+            player.mana += 2
+        else:
+            player.max_mana = 10
+            player.mana += 2
+
+
+class _Draw3(Card):
+
+    def __init__(self):
+        super().__init__("Draw three cards", 0, CHARACTER_CLASS.DRUID,
+                         CARD_RARITY.SPECIAL)
+
+    def use(self, player, game):
+        player.draw()
+        player.draw()
+        player.draw()
+
+
 class Nourish(Card):
+    choose_one = 2
+
     def __init__(self):
         super().__init__("Nourish", 5, CHARACTER_CLASS.DRUID, CARD_RARITY.RARE)
 
     def use(self, player, game):
         super().use(player, game)
 
-        class Gain2(Card):
+        option = player.agent.choose_option(_Gain2(), _Draw3())
+        option.use(player, game)
 
-            def __init__(self):
-                super().__init__("Gain 2 mana crystals", 0,
-                                 CHARACTER_CLASS.DRUID,
-                                 CARD_RARITY.SPECIAL)
 
-            def use(self, player, game):
-                if player.max_mana < 8:
-                    player.max_mana += 2
-                    player.mana += 2
-                else:
-                    player.max_mana = 10
-                    player.mana += 2
+class _DamageAll(Card):
+    def __init__(self):
+        super().__init__("Do two damage to all enemy minions", 0,
+                         CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
 
-        class Draw3(Card):
+    def use(self, player, game):
+        for minion in copy.copy(game.other_player.minions):
+            minion.damage(player.effective_spell_damage(2), self)
 
-            def __init__(self):
-                super().__init__("Draw three cards", 0, CHARACTER_CLASS.DRUID,
-                                 CARD_RARITY.SPECIAL)
 
-            def use(self, player, game):
-                player.draw()
-                player.draw()
-                player.draw()
+class _DamageOne(Card):
+    def __init__(self):
+        super().__init__("Do five damage to an enemy minion", 0,
+                         CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
 
-        option = player.agent.choose_option(Gain2(), Draw3())
-        option.use(player, game)
+    def use(self, player, game):
+        targets = hearthbreaker.targeting.find_minion_spell_target(game, lambda t: t.spell_targetable())
+        target = player.agent.choose_target(targets)
+        target.damage(player.effective_spell_damage(5), self)
 
 
 class Starfall(Card):
+    choose_one = 2
+
     def __init__(self):
         super().__init__("Starfall", 5, CHARACTER_CLASS.DRUID,
                          CARD_RARITY.RARE)
@@ -330,27 +377,16 @@ class Starfall(Card):
     def use(self, player, game):
         super().use(player, game)
 
-        class DamageAll(Card):
-            def __init__(self):
-                super().__init__("Do two damage to all enemy minions", 0,
-                                 CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
-
-            def use(self, player, game):
-                for minion in copy.copy(game.other_player.minions):
-                    minion.damage(player.effective_spell_damage(2), self)
+        option = player.agent.choose_option(_DamageAll(), _DamageOne())
+        option.use(player, game)
 
-        class DamageOne(Card):
-            def __init__(self):
-                super().__init__("Do five damage to an enemy minion", 0,
-                                 CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
 
-            def use(self, player, game):
-                targets = hearthbreaker.targeting.find_minion_spell_target(game, lambda t: t.spell_targetable())
-                target = player.agent.choose_target(targets)
-                target.damage(player.effective_spell_damage(5), self)
+class _ForceOfNatureTreant(MinionCard):
+    def __init__(self):
+        super().__init__("Treant", 1, CHARACTER_CLASS.DRUID, CARD_RARITY.COMMON)
 
-        option = player.agent.choose_option(DamageAll(), DamageOne())
-        option.use(player, game)
+    def create_minion(self, player):
+        return Minion(2, 2, charge=True, effects=[KillMinion("turn_ended")])
 
 
 class ForceOfNature(Card):
@@ -361,15 +397,8 @@ class ForceOfNature(Card):
     def use(self, player, game):
         super().use(player, game)
 
-        class Treant(MinionCard):
-            def __init__(self):
-                super().__init__("Treant", 1, CHARACTER_CLASS.DRUID, CARD_RARITY.COMMON)
-
-            def create_minion(self, player):
-                return Minion(2, 2, charge=True, effects=[KillMinion("turn_ended")])
-
         for i in [0, 1, 2]:
-            treant_card = Treant()
+            treant_card = _ForceOfNatureTreant()
             treant_card.summon(player, game, len(player.minions))
 
 
@@ -384,6 +413,14 @@ class Starfire(Card):
         player.draw()
 
 
+class _PoisonSeedsTreant(MinionCard):
+    def __init__(self):
+        super().__init__("Treant", 2, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        return Minion(2, 2)
+
+
 class PoisionSeeds(Card):
     def __init__(self):
         super().__init__("Poison Seeds", 4, CHARACTER_CLASS.DRUID, CARD_RARITY.COMMON)
@@ -391,13 +428,6 @@ class PoisionSeeds(Card):
     def use(self, player, game):
         super().use(player, game)
 
-        class Treant(MinionCard):
-            def __init__(self):
-                super().__init__("Treant", 2, CHARACTER_CLASS.DRUID, CARD_RARITY.SPECIAL)
-
-            def create_minion(self, player):
-                return Minion(2, 2)
-
         targets = hearthbreaker.targeting.find_minion_spell_target(game, lambda m: True)
         for target in targets:
             target.die(None)
@@ -405,4 +435,4 @@ class PoisionSeeds(Card):
         game.check_delayed()
 
         for target in targets:
-            Treant().summon(target.player, target.game, len(target.player.minions))
+            _PoisonSeedsTreant().summon(target.player, target.game, len(target.player.minions))
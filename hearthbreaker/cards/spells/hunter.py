@@ -2,7 +2,7 @@ import copy
 from hearthbreaker.effects import Immune
 import hearthbreaker.targeting
 from hearthbreaker.constants import CHARACTER_CLASS, CARD_RARITY, MINION_TYPE
-from hearthbreaker.game_objects import Card, SecretCard, Minion, MinionCard
+from hearthbreaker.game_objects import Card, SecretCard, Minion, MinionCard, ManaCostFilter
 
 
 class HuntersMark(Card):
@@ -104,14 +104,9 @@ class FreezingTrap(SecretCard):
 
     def _reveal(self, attacker):
         if isinstance(attacker, Minion) and not attacker.removed:
-            class Filter:
-                def __init__(self):
-                    self.amount = -2
-                    self.filter = lambda c: c is card
-                    self.min = 0
             card = attacker.card
             attacker.bounce()
-            attacker.player.mana_filters.append(Filter())
+            attacker.player.add_mana_filter(ManaCostFilter(-2, 0, lambda c: c is card))
 
 
 class Misdirection(SecretCard):
@@ -218,14 +213,25 @@ class KillCommand(Card):
 
     def use(self, player, game):
         super().use(player, game)
-        beasts = hearthbreaker.targeting.find_friendly_minion_battlecry_target(
-            player.game, lambda x: x.card.minion_type is MINION_TYPE.BEAST)
-        if beasts is None:
+        beasts = hearthbreaker.targeting.count_targets(player.game,
+                                                       hearthbreaker.targeting.find_friendly_minion_spell_target,
+                                                       lambda x: x.card.minion_type is MINION_TYPE.BEAST)
+        if beasts == 0:
             self.target.damage(player.effective_spell_damage(3), self)
         else:
             self.target.damage(player.effective_spell_damage(5), self)
 
 
+class Hound(MinionCard):
+    def __init__(self):
+        super().__init__("Hound", 1, CHARACTER_CLASS.HUNTER, CARD_RARITY.SPECIAL, MINION_TYPE.BEAST)
+
+    def create_minion(self, player):
+        minion = Minion(1, 1)
+        minion.charge = True
+        return minion
+
+
 class UnleashTheHounds(Card):
     def __init__(self):
         super().__init__("Unleash the Hounds", 3, CHARACTER_CLASS.HUNTER, CARD_RARITY.COMMON)
@@ -233,61 +239,64 @@ class UnleashTheHounds(Card):
     def use(self, player, game):
         super().use(player, game)
 
-        class Hound(MinionCard):
-            def __init__(self):
-                super().__init__("Hound", 1, CHARACTER_CLASS.HUNTER, CARD_RARITY.SPECIAL)
-
-            def create_minion(self, player):
-                minion = Minion(1, 1, MINION_TYPE.BEAST)
-                minion.charge = True
-                return minion
         for target in hearthbreaker.targeting.find_enemy_minion_spell_target(player.game, lambda x: True):
             hound = Hound()
             hound.summon(player, game, len(player.minions))
 
 
-class AnimalCompanion(Card):
+class Huffer(MinionCard):
     def __init__(self):
-        super().__init__("Animal Companion", 3, CHARACTER_CLASS.HUNTER, CARD_RARITY.COMMON)
+        super().__init__("Huffer", 3, CHARACTER_CLASS.HUNTER, CARD_RARITY.SPECIAL, MINION_TYPE.BEAST)
 
-    def use(self, player, game):
-        super().use(player, game)
+    def create_minion(self, player):
+        minion = Minion(4, 2)
+        minion.charge = True
+        return minion
+
+
+class Misha(MinionCard):
+    def __init__(self):
+        super().__init__("Misha", 3, CHARACTER_CLASS.HUNTER, CARD_RARITY.SPECIAL, MINION_TYPE.BEAST)
 
-        class Huffer(MinionCard):
-            def __init__(self):
-                super().__init__("Huffer", 3, CHARACTER_CLASS.HUNTER, CARD_RARITY.SPECIAL)
+    def create_minion(self, player):
+        minion = Minion(4, 4)
+        minion.taunt = True
+        return minion
 
-            def create_minion(self, player):
-                minion = Minion(4, 2, MINION_TYPE.BEAST)
-                minion.charge = True
-                return minion
 
-        class Misha(MinionCard):
-            def __init__(self):
-                super().__init__("Misha", 3, CHARACTER_CLASS.HUNTER, CARD_RARITY.SPECIAL)
+class Leokk(MinionCard):
+    def __init__(self):
+        super().__init__("Leokk", 3, CHARACTER_CLASS.HUNTER, CARD_RARITY.SPECIAL, MINION_TYPE.BEAST)
+
+    def create_minion(self, player):
+        def add_effect(m, index):
+            m.add_aura(1, 0, [player], lambda mini: mini is not minion)
 
-            def create_minion(self, player):
-                minion = Minion(4, 4, MINION_TYPE.BEAST)
-                minion.taunt = True
-                return minion
+        minion = Minion(2, 4)
+        minion.bind("added_to_board", add_effect)
+        return minion
 
-        class Leokk(MinionCard):
-            def __init__(self):
-                super().__init__("Leokk", 3, CHARACTER_CLASS.HUNTER, CARD_RARITY.SPECIAL)
 
-            def create_minion(self, player):
-                def add_effect(m, index):
-                    m.add_aura(1, 0, [player], lambda mini: mini is not minion)
+class AnimalCompanion(Card):
+    def __init__(self):
+        super().__init__("Animal Companion", 3, CHARACTER_CLASS.HUNTER, CARD_RARITY.COMMON)
 
-                minion = Minion(2, 4, MINION_TYPE.BEAST)
-                minion.bind("added_to_board", add_effect)
-                return minion
+    def use(self, player, game):
+        super().use(player, game)
 
         beast_list = [Huffer(), Misha(), Leokk()]
         card = beast_list[player.game.random(0, 2)]
         card.summon(player, player.game, len(player.minions))
 
 
+class Snake(MinionCard):
+    def __init__(self):
+        super().__init__("Snake", 1, CHARACTER_CLASS.HUNTER, CARD_RARITY.SPECIAL, MINION_TYPE.BEAST)
+
+    def create_minion(self, player):
+        return Minion(1, 1)
+
+
 class SnakeTrap(SecretCard):
     def __init__(self):
         super().__init__("Snake Trap", 2, CHARACTER_CLASS.HUNTER, CARD_RARITY.EPIC)
@@ -300,12 +309,6 @@ class SnakeTrap(SecretCard):
 
     def _reveal(self, attacker, target):
         if isinstance(target, Minion):
-            class Snake(MinionCard):
-                def __init__(self):
-                    super().__init__("Snake", 1, CHARACTER_CLASS.HUNTER, CARD_RARITY.SPECIAL, MINION_TYPE.BEAST)
-
-                def create_minion(self, player):
-                    return Minion(1, 1)
             snake = Snake()
             player = target.player.game.other_player
             for i in range(0, 3):
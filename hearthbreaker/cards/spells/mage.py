@@ -30,6 +30,17 @@ class IceLance(Card):
             self.target.freeze()
 
 
+# The minions Mirror Image summons share its name, so they are kept out of the card index
+class _MirrorImageMinion(MinionCard):
+    def __init__(self):
+        super().__init__("Mirror Image", 0, CHARACTER_CLASS.MAGE, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, p):
+        minion = Minion(0, 2)
+        minion.taunt = True
+        return minion
+
+
 class MirrorImage(Card):
     def __init__(self):
         super().__init__("Mirror Image", 1, CHARACTER_CLASS.MAGE, CARD_RARITY.COMMON)
@@ -37,17 +48,8 @@ class MirrorImage(Card):
     def use(self, player, game):
         super().use(player, game)
 
-        class MirrorImageMinion(MinionCard):
-            def __init__(self):
-                super().__init__("Mirror Image", 0, CHARACTER_CLASS.MAGE, CARD_RARITY.SPECIAL)
-
-            def create_minion(self, p):
-                minion = Minion(0, 2)
-                minion.taunt = True
-                return minion
-
         for i in range(0, 2):
-            mirror_image = MirrorImageMinion()
+            mirror_image = _MirrorImageMinion()
             mirror_image.summon(player, game, len(player.minions))
 
 
@@ -146,6 +148,15 @@ class MirrorEntity(SecretCard):
         self.player = None
 
 
+# As with Mirror Image, the minion Spellbender summons shares its name
+class _SpellbenderMinion(MinionCard):
+    def __init__(self):
+        super().__init__("Spellbender", 0, CHARACTER_CLASS.MAGE, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, p):
+        return Minion(1, 3)
+
+
 class Spellbender(SecretCard):
     def __init__(self):
         super().__init__("Spellbender", 3, CHARACTER_CLASS.MAGE,
@@ -154,17 +165,10 @@ class Spellbender(SecretCard):
 
     def _reveal(self, card):
         if len(self.player.minions) < 7 and card.targetable:
-            class SpellbenderMinion(MinionCard):
-                def __init__(self):
-                    super().__init__("Spellbender", 0, CHARACTER_CLASS.MAGE, CARD_RARITY.SPECIAL)
-
-                def create_minion(self, p):
-                    return Minion(1, 3)
-
             def choose_bender(targets):
                 target = old_target(targets)
                 if isinstance(target, Minion):
-                    spell_bender = SpellbenderMinion()
+                    spell_bender = _SpellbenderMinion()
                     # Seems according to http://us.battle.net/hearthstone/en/forum/topic/10070927066, spellbender
                     # will not activate if there are too many minions
                     spell_bender.summon(self.player, self.player.game, len(self.player.minions))
@@ -266,6 +270,14 @@ class Fireball(Card):
         self.target.damage(player.effective_spell_damage(6), self)
 
 
+class Sheep(MinionCard):
+    def __init__(self):
+        super().__init__("Sheep", 0, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.BEAST)
+
+    def create_minion(self, p):
+        return Minion(1, 1)
+
+
 class Polymorph(Card):
     def __init__(self):
         super().__init__("Polymorph", 4, CHARACTER_CLASS.MAGE, CARD_RARITY.FREE,
@@ -274,13 +286,6 @@ class Polymorph(Card):
     def use(self, player, game):
         super().use(player, game)
 
-        class Sheep(MinionCard):
-            def __init__(self):
-                super().__init__("Sheep", 0, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.BEAST)
-
-            def create_minion(self, p):
-                return Minion(1, 1)
-
         sheep = Sheep()
         minion = sheep.create_minion(None)
         minion.card = sheep
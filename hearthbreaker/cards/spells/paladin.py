@@ -198,6 +198,15 @@ class EyeForAnEye(SecretCard):
         player.hero.unbind("hero_damaged", self._reveal)
 
 
+class Defender(MinionCard):
+    def __init__(self):
+        super().__init__("Defender", 1, CHARACTER_CLASS.PALADIN,
+                         CARD_RARITY.SPECIAL)
+
+    def create_minion(self, p):
+        return Minion(2, 1)
+
+
 class NobleSacrifice(SecretCard):
     def __init__(self):
         super().__init__("Noble Sacrifice", 1, CHARACTER_CLASS.PALADIN,
@@ -206,16 +215,8 @@ class NobleSacrifice(SecretCard):
     def _reveal(self, attacker):
         player = attacker.game.other_player
         if len(player.minions) < 7 and not attacker.removed:
-            class DefenderMinion(MinionCard):
-                def __init__(self):
-                    super().__init__("Defender", 1, CHARACTER_CLASS.PALADIN,
-                                     CARD_RARITY.SPECIAL)
-
-                def create_minion(self, p):
-                    return Minion(2, 1)
-
             def choose_defender(targets):
-                defender = DefenderMinion()
+                defender = Defender()
                 defender.summon(player, player.game, len(player.minions))
                 old_target(targets)  # Called to allow the player to choose a target, although it will be ignored
                 player.game.current_player.agent.choose_target = old_target
@@ -247,6 +248,7 @@ class Redemption(SecretCard):
         resurrection.player = player
         resurrection.game = player.game
         player.minions.append(resurrection)
+        player.auras_changed()
         player.game.trigger("minion_added", resurrection)
         super().reveal()
 
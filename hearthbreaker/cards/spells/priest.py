@@ -142,6 +142,16 @@ class MindVision(Card):
         player.hand.append(card)
 
 
+class ShadowOfNothing(MinionCard):
+    def __init__(self):
+        super().__init__("Shadow of Nothing", 0,
+                         CHARACTER_CLASS.PRIEST, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, p):
+        minion = Minion(0, 1)
+        return minion
+
+
 class Mindgames(Card):
     def __init__(self):
         super().__init__("Mindgames", 4, CHARACTER_CLASS.PRIEST,
@@ -150,15 +160,6 @@ class Mindgames(Card):
     def use(self, player, game):
         super().use(player, game)
 
-        class ShadowOfNothing(MinionCard):
-            def __init__(self):
-                super().__init__("Shadow of Nothing", 0,
-                                 CHARACTER_CLASS.PRIEST, CARD_RARITY.SPECIAL)
-
-            def create_minion(self, p):
-                minion = Minion(0, 1)
-                return minion
-
         minions = []
 
         for index in range(0, 30):
@@ -1,7 +1,7 @@
 import copy
 import hearthbreaker.targeting
 from hearthbreaker.constants import CHARACTER_CLASS, CARD_RARITY
-from hearthbreaker.game_objects import Card
+from hearthbreaker.game_objects import Card, ManaCostFilter, card_type_filter
 
 
 class Assassinate(Card):
@@ -171,28 +171,22 @@ class Preparation(Card):
         super().__init__("Preparation", 0, CHARACTER_CLASS.ROGUE, CARD_RARITY.EPIC)
 
     def use(self, player, game):
-        class Filter:
-            def __init__(self):
-                self.amount = 3
-                self.filter = lambda c: c.is_spell()
-                self.min = 0
-
         def card_used(card):
             if card is not self and card.is_spell():
                 player.unbind("card_used", card_used)
                 player.unbind("turn_ended", turn_ended)
-                player.mana_filters.remove(mana_filter)
+                player.remove_mana_filter(mana_filter)
 
         def turn_ended():
             player.unbind("card_used", card_used)
-            player.mana_filters.remove(mana_filter)
+            player.remove_mana_filter(mana_filter)
 
         super().use(player, game)
 
-        mana_filter = Filter()
+        mana_filter = ManaCostFilter(3, 0, card_type_filter("spell"))
         player.bind("card_used", card_used)
         player.bind_once("turn_ended", turn_ended)
-        player.mana_filters.append(mana_filter)
+        player.add_mana_filter(mana_filter)
 
 
 class Sap(Card):
@@ -212,23 +206,18 @@ class Shadowstep(Card):
                          hearthbreaker.targeting.find_friendly_minion_spell_target)
 
     def use(self, player, game):
-        class Filter:
-            def __init__(self, card):
-                self.amount = 2
-                self.filter = lambda c: c is card
-                self.min = 0
-
         def card_used(card):
             if card is self.target.card:
                 player.unbind("card_used", card_used)
-                player.mana_filters.remove(mana_filter)
+                player.remove_mana_filter(mana_filter)
 
         super().use(player, game)
 
         self.target.bounce()
-        mana_filter = Filter(self.target.card)
+        card = self.target.card
+        mana_filter = ManaCostFilter(2, 0, lambda c: c is card)
         player.bind("card_used", card_used)
-        player.mana_filters.append(mana_filter)
+        player.add_mana_filter(mana_filter)
 
 
 class Shiv(Card):
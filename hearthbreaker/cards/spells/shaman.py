@@ -1,7 +1,7 @@
 import copy
 import hearthbreaker.targeting
 from hearthbreaker.constants import CHARACTER_CLASS, CARD_RARITY, MINION_TYPE
-from hearthbreaker.game_objects import Card, Minion, MinionCard
+from hearthbreaker.game_objects import Card, Minion, MinionCard, ManaCostFilter
 
 
 class AncestralHealing(Card):
@@ -67,15 +67,9 @@ class FarSight(Card):
         super().__init__("Far Sight", 3, CHARACTER_CLASS.SHAMAN, CARD_RARITY.EPIC)
 
     def use(self, player, game):
-        class Filter:
-            def __init__(self, card):
-                self.amount = 3
-                self.filter = lambda c: c is card
-                self.min = 0
-
         def reduce_cost(card):
             nonlocal filter
-            filter = Filter(card)
+            filter = ManaCostFilter(3, 0, lambda c: c is card)
             player.unbind("card_drawn", reduce_cost)
 
         super().use(player, game)
@@ -84,7 +78,17 @@ class FarSight(Card):
         player.bind("card_drawn", reduce_cost)
         player.draw()
         if filter is not None:
-            player.mana_filters.append(filter)
+            player.add_mana_filter(filter)
+
+
+class SpiritWolf(MinionCard):
+    def __init__(self):
+        super().__init__("Spirit Wolf", 2, CHARACTER_CLASS.SHAMAN, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, p):
+        minion = Minion(2, 3)
+        minion.taunt = True
+        return minion
 
 
 class FeralSpirit(Card):
@@ -94,15 +98,6 @@ class FeralSpirit(Card):
     def use(self, player, game):
         super().use(player, game)
 
-        class SpiritWolf(MinionCard):
-            def __init__(self):
-                super().__init__("Spirit Wolf", 2, CHARACTER_CLASS.SHAMAN, CARD_RARITY.SPECIAL)
-
-            def create_minion(self, p):
-                minion = Minion(2, 3)
-                minion.taunt = True
-                return minion
-
         for i in range(0, 2):
             spirit_wolf = SpiritWolf()
             spirit_wolf.summon(player, game, len(player.minions))
@@ -136,6 +131,14 @@ class FrostShock(Card):
         self.target.freeze()
 
 
+class Frog(MinionCard):
+    def __init__(self):
+        super().__init__("Frog", 0, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.BEAST)
+
+    def create_minion(self, p):
+        return Minion(0, 1, taunt=True)
+
+
 class Hex(Card):
     def __init__(self):
         super().__init__("Hex", 3, CHARACTER_CLASS.SHAMAN, CARD_RARITY.FREE,
@@ -144,13 +147,6 @@ class Hex(Card):
     def use(self, player, game):
         super().use(player, game)
 
-        class Frog(MinionCard):
-            def __init__(self):
-                super().__init__("Frog", 0, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL, MINION_TYPE.BEAST)
-
-            def create_minion(self, p):
-                return Minion(0, 1, taunt=True)
-
         frog = Frog()
         minion = frog.create_minion(None)
         minion.card = frog
@@ -122,6 +122,14 @@ class SiphonSoul(Card):
         player.hero.heal(player.effective_heal_power(3), self)
 
 
+class WorthlessImp(MinionCard):
+    def __init__(self):
+        super().__init__("Worthless Imp", 1, CHARACTER_CLASS.WARLOCK, CARD_RARITY.SPECIAL, MINION_TYPE.DEMON)
+
+    def create_minion(self, p):
+        return Minion(1, 1)
+
+
 class SenseDemons(Card):
     def __init__(self):
         super().__init__("Sense Demons", 3, CHARACTER_CLASS.WARLOCK, CARD_RARITY.COMMON)
@@ -129,13 +137,6 @@ class SenseDemons(Card):
     def use(self, player, game):
         super().use(player, game)
 
-        class WorthlessImp(MinionCard):
-            def __init__(self):
-                super().__init__("Worthless Imp", 1, CHARACTER_CLASS.WARLOCK, CARD_RARITY.SPECIAL, MINION_TYPE.DEMON)
-
-            def create_minion(self, p):
-                return Minion(1, 1)
-
         minions = []
         for i in range(0, 30):
             if (not game.current_player.deck.used[i] and isinstance(game.current_player.deck.cards[i], MinionCard) and
@@ -145,13 +146,12 @@ class SenseDemons(Card):
         for i in range(0, 2):
             if len(minions) > 0:
                 index = minions.pop(game.random(0, len(minions) - 1))
-                player.deck.used[index] = True
-                player.deck.left -= 1
+                demon = player.deck.take(index)
                 if len(player.hand) < 10:
-                    player.hand.append(player.deck.cards[index])
-                    self.trigger("card_drawn", player.deck.cards[index])
+                    player.hand.append(demon)
+                    self.trigger("card_drawn", demon)
                 else:
-                    player.trigger("card_destroyed", player.deck.cards[index])
+                    player.trigger("card_destroyed", demon)
             else:
                 if len(player.hand) < 10:
                     player.hand.append(WorthlessImp())
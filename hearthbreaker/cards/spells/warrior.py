@@ -178,6 +178,14 @@ class Slam(Card):
             self.target.damage(player.effective_spell_damage(2), self)
 
 
+class HeavyAxe(WeaponCard):
+    def __init__(self):
+        super().__init__("Heavy Axe", 1, CHARACTER_CLASS.WARRIOR, CARD_RARITY.SPECIAL)
+
+    def create_weapon(self, player):
+        return Weapon(1, 3)
+
+
 class Upgrade(Card):
     def __init__(self):
         super().__init__("Upgrade!", 1, CHARACTER_CLASS.WARRIOR, CARD_RARITY.RARE)
@@ -188,12 +196,6 @@ class Upgrade(Card):
             player.hero.weapon.durability += 1
             player.hero.weapon.base_attack += 1
         else:
-            class HeavyAxe(WeaponCard):
-                def __init__(self):
-                    super().__init__("Heavy Axe", 1, CHARACTER_CLASS.WARRIOR, CARD_RARITY.SPECIAL)
-
-                def create_weapon(self, player):
-                    return Weapon(1, 3)
             heavy_axe = HeavyAxe().create_weapon(player)
             heavy_axe.equip(player)
 
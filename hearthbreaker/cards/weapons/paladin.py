@@ -38,13 +38,17 @@ class TruesilverChampion(WeaponCard):
         super().__init__("Truesilver Champion", 4, CHARACTER_CLASS.PALADIN, CARD_RARITY.COMMON)
 
     def create_weapon(self, player):
-        def heal(attacker):
-            player.hero.heal(player.effective_heal_power(2), self)
+        def add_effect(w, p):
+            def heal(attacker):
+                p.hero.heal(p.effective_heal_power(2), self)
 
-        def on_destroy():
-            player.hero.unbind("attack", heal)
+            def on_destroy():
+                p.hero.unbind("attack", heal)
+
+            p.hero.bind("attack", heal)
+            w.bind_once("destroyed", on_destroy)
+            w.bind("copied", add_effect)
 
         weapon = Weapon(4, 2)
-        player.hero.bind("attack", heal)
-        weapon.bind_once("destroyed", on_destroy)
+        add_effect(weapon, player)
         return weapon
@@ -27,3 +27,11 @@ class PerditionsBlade(WeaponCard):
 
         weapon = Weapon(2, 2, battlecry=deal_damage)
         return weapon
+
+
+class WickedKnife(WeaponCard):
+    def __init__(self):
+        super().__init__("Wicked Knife", 1, CHARACTER_CLASS.ROGUE, CARD_RARITY.SPECIAL)
+
+    def create_weapon(self, player):
+        return Weapon(1, 2)
@@ -25,9 +25,15 @@ class Gorehowl(WeaponCard):
         super().__init__("Gorehowl", 7, CHARACTER_CLASS.WARRIOR, CARD_RARITY.EPIC)
 
     def create_weapon(self, player):
-        def maybe_increase_durability(target):
-            if isinstance(target, Minion):
-                weapon.durability += 1
+        def add_effect(w, p):
+            def maybe_increase_durability(target):
+                if isinstance(target, Minion):
+                    w.durability += 1
+
+            p.hero.bind("attack", maybe_increase_durability)
+            w.bind_once("destroyed", lambda: p.hero.unbind("attack", maybe_increase_durability))
+            w.bind("copied", add_effect)
+
         weapon = Weapon(7, 1)
-        player.hero.bind("attack", maybe_increase_durability)
+        add_effect(weapon, player)
         return weapon
@@ -87,3 +87,23 @@ class MINION_TYPE:
     def to_str(minion_number):
         types = dict(zip(MINION_TYPE.__types.values(), MINION_TYPE.__types.keys()))
         return types[minion_number].capitalize()
+
+
+class CARD_SET:
+    BASIC = 1
+    EXPERT = 2
+    REWARD = 3
+    PROMOTION = 4
+    NAXXRAMAS = 5
+
+    __sets = {
+        "BASIC": BASIC,
+        "EXPERT": EXPERT,
+        "REWARD": REWARD,
+        "PROMOTION": PROMOTION,
+        "CURSE OF NAXXRAMAS": NAXXRAMAS,
+    }
+
+    @staticmethod
+    def from_str(set_name):
+        return CARD_SET.__sets[set_name.upper()]
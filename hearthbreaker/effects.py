@@ -1,5 +1,5 @@
 from hearthbreaker.constants import MINION_TYPE
-from hearthbreaker.game_objects import Effect, MinionCard, SecretCard, Minion
+from hearthbreaker.game_objects import Effect, MinionCard, Minion, ManaCostFilter, card_type_filter
 
 
 class KillMinion(Effect):
@@ -185,6 +185,10 @@ class ChargeAura(Effect):
         self.minion_type = minion_type
 
     def apply(self):
+        # The lists are made afresh for each minion this aura is applied to, rather than shared with the aura it was
+        # copied from, which would otherwise keep every minion it had ever been copied from
+        self.affected_minions = []
+        self.charged_minions = []
         if self.players == "friendly" or self.players == "both":
             for charge_minion in self.target.player.minions:
                 self.give_charge_if_beast(charge_minion)
@@ -274,11 +278,12 @@ class StatsAura(Effect):
             players = [self.target.player.opponent]
         else:
             players = [self.target.player, self.target.player.opponent]
+        # This effect is copied with its minion, so the aura it adds isn't
         if self.minion_type == MINION_TYPE.ALL:
-            self.target.add_aura(self.attack, self.health, players)
+            self.target.add_aura(self.attack, self.health, players, keep_on_copy=False)
         else:
             self.target.add_aura(self.attack, self.health, players,
-                                 lambda minion: minion.card.minion_type == self.minion_type)
+                                 lambda minion: minion.card.minion_type == self.minion_type, keep_on_copy=False)
 
     def unapply(self):
         pass
@@ -290,6 +295,10 @@ class StatsAura(Effect):
             self.attack, self.health, self.players, MINION_TYPE.to_str(self.minion_type))
 
 
+def _has_battlecry(card):
+    return isinstance(card, MinionCard) and card.has_battlecry()
+
+
 class IncreaseBattlecryMinionCost(Effect):
 
     def __init__(self, amount):
@@ -298,23 +307,13 @@ class IncreaseBattlecryMinionCost(Effect):
         self.mana_filter = None
 
     def apply(self):
-        amount = self.amount
-        target = self.target
-
-        class Filter:
-            def __init__(self):
-                self.amount = -amount
-                self.filter = lambda c: isinstance(c, MinionCard) and \
-                    c.create_minion(target.player).battlecry is not None
-                self.min = 0
-
-        self.mana_filter = Filter()
-        self.target.game.current_player.mana_filters.append(self.mana_filter)
-        self.target.game.other_player.mana_filters.append(self.mana_filter)
+        self.mana_filter = ManaCostFilter(-self.amount, 0, _has_battlecry)
+        self.target.game.current_player.add_mana_filter(self.mana_filter)
+        self.target.game.other_player.add_mana_filter(self.mana_filter)
 
     def unapply(self):
-        self.target.game.current_player.mana_filters.remove(self.mana_filter)
-        self.target.game.other_player.mana_filters.remove(self.mana_filter)
+        self.target.game.current_player.remove_mana_filter(self.mana_filter)
+        self.target.game.other_player.remove_mana_filter(self.mana_filter)
 
     def __str__(self):
         return "IncreaseMinionCost(battlecry, {0})".format(self.amount)
@@ -407,32 +406,17 @@ class ManaFilter(Effect):
         self.player = player
 
     def apply(self):
-        if self.filter_type == "minion":
-            my_filter = lambda c: isinstance(c, MinionCard)
-        elif self.filter_type == "spell":
-            my_filter = lambda c: c.is_spell()
-        elif self.filter_type == "secret":
-            my_filter = lambda c: isinstance(c, SecretCard)
-        else:
-            my_filter = lambda c: True
-
-        class Filter:
-            def __init__(self, amount, minimum, filter):
-                self.amount = amount
-                self.min = minimum
-                self.filter = filter
-
-        self.filter_object = Filter(self.amount, self.minimum, my_filter)
+        self.filter_object = ManaCostFilter(self.amount, self.minimum, card_type_filter(self.filter_type))
         if self.player == "friendly" or self.player == "both":
-            self.target.player.mana_filters.append(self.filter_object)
+            self.target.player.add_mana_filter(self.filter_object)
         if self.player == "enemy" or self.player == "both":
-            self.target.player.opponent.mana_filters.append(self.filter_object)
+            self.target.player.opponent.add_mana_filter(self.filter_object)
 
     def unapply(self):
         if self.player == "friendly" or self.player == "both":
-            self.target.player.mana_filters.remove(self.filter_object)
+            self.target.player.remove_mana_filter(self.filter_object)
         if self.player == "enemy" or self.player == "both":
-            self.target.player.opponent.mana_filters.remove(self.filter_object)
+            self.target.player.opponent.remove_mana_filter(self.filter_object)
 
     def __str__(self):
         return "ManaFilter({0}, {1}, {2}, {3})".format(self.amount, self.minimum, self.filter_type, self.player)
@@ -473,6 +457,7 @@ class AddCardOnSpell(Effect):
     def add_card(self, spell_card):
         if len(self.target.player.hand) < 10:
             self.target.player.hand.append(self.card())
+            self.target.player.game.epoch += 1
 
     def __str__(self):
         return "AddOnSpell({0})".format(self.card().name)
@@ -1,40 +1,63 @@
 import copy
+import heapq
+import operator
 import random
 import abc
 
+import hearthbreaker.actions
+import hearthbreaker.card_registry
 import hearthbreaker.powers
 import hearthbreaker.targeting
 import hearthbreaker.constants
-
-card_table = {}
+import hearthbreaker.zobrist
 
 
 def card_lookup(card_name):
     """
     Given a the name of a card as a string, return an object corresponding to that card
 
+    The card's class is found in :data:`hearthbreaker.card_registry.registry`, so no other cards are instantiated
+    to find it.  Cards which have been implemented but not yet added to :mod:`hearthbreaker.card_index` are found by
+    searching the subclasses of :class:`Card`.
+
     :param str card_name: A string representing the name of the card in English
     :return: An instance of a subclass of Card corresponding to the given card name or None if no Card
              by that name exists.
     :rtype: hearthbreaker.game_objects.Card
     """
+    if card_name in hearthbreaker.card_registry.registry:
+        return hearthbreaker.card_registry.registry.card_class(card_name)()
+    return _unindexed_card_lookup(card_name)()
+
+
+#: The cards found by searching the subclasses of :class:`Card`, by name.  Names which weren't found are kept as None,
+#: so that looking up the same missing card again doesn't search every card again.
+_unindexed_cards = {}
+
 
+#: Whether the minions created by cards which aren't in the card index have a battlecry, by card class
+_unindexed_battlecries = {}
+
+
+def _unindexed_card_lookup(card_name):
     def card_lookup_rec(card_type):
         subclasses = card_type.__subclasses__()
-        if len(subclasses) is 0:
+        if len(subclasses) == 0 and hearthbreaker.card_registry._indexable(card_type):
             c = card_type()
-            card_table[c.name] = card_type
+            _unindexed_cards[c.name] = card_type
         for sub_type in subclasses:
             card_lookup_rec(sub_type)
 
-    if len(card_table) == 0:
+    if card_name not in _unindexed_cards:
         for card_class in Card.__subclasses__():
             card_lookup_rec(card_class)
+        if card_name not in _unindexed_cards:
+            _unindexed_cards[card_name] = None
 
-    card = card_table[card_name]
-    if card is not None:
-        return card()
-    return None
+    card_type = _unindexed_cards[card_name]
+    if card_type is None:
+        raise KeyError(card_name)
+    return card_type
 
 
 class GameException(Exception):
@@ -46,6 +69,45 @@ class GameException(Exception):
         super().__init__(message)
 
 
+class _Handler:
+    """
+    A function bound to an event of a :class:`Bindable`
+    """
+    __slots__ = ["function", "remove", "active"]
+
+    def __init__(self, function, remove):
+        self.function = function
+        #: True if the function should be unbound after it is called
+        self.remove = remove
+        #: True while the function is being called, so that it isn't called again recursively
+        self.active = False
+
+
+class _NoEvents(dict):
+    """
+    The events of a :class:`Bindable` which hasn't had any functions bound to it.  There is only one, which is shared,
+    and can't be changed, so objects which are never bound to don't need a dictionary of their own.
+    """
+    __slots__ = []
+
+    def _read_only(self, *args):
+        raise TypeError("The shared empty events can't be changed")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return "_NO_EVENTS"
+
+
+_NO_EVENTS = _NoEvents()
+
+
 class Bindable:
     """
     A class which inherits from Bindable has an event structure added to it.
@@ -98,12 +160,21 @@ class Bindable:
 
     Any class which subclasses this class must be sure to call :meth:`__init__`
     """
+    __slots__ = ["events"]
 
     def __init__(self):
         """
         Set up a new :class:`Bindable`.  Must be called by any subclasses.
         """
-        self.events = {}
+        #: Maps the name of each event to the handlers bound to it.  This is an empty mapping shared by every object
+        #: until a function is first bound, so it must only be changed through :meth:`bind` and :meth:`unbind`.
+        self.events = _NO_EVENTS
+
+    def _own_events(self):
+        # Gives this object a dictionary of events of its own, if it is still using the shared empty one
+        if self.events is _NO_EVENTS:
+            self.events = {}
+        return self.events
 
     def bind(self, event, function):
         """
@@ -114,17 +185,8 @@ class Bindable:
                                   ensure its signature matches the parameters called from :meth:`trigger`
         :see: :class:`Bindable`
         """
-
-        class Handler:
-            def __init__(self):
-                self.function = function
-                self.remove = False
-                self.active = False
-
-        if event not in self.events:
-            self.events[event] = []
-
-        self.events[event].append(Handler())
+        events = self._own_events()
+        events[event] = events.get(event, ()) + (_Handler(function, False),)
 
     def bind_once(self, event, function):
         """
@@ -136,17 +198,8 @@ class Bindable:
                                   ensure its signature matches the parameters called from :meth:`trigger`
         :see: :class:`Bindable`
         """
-
-        class Handler:
-            def __init__(self):
-                self.function = function
-                self.remove = True
-                self.active = False
-
-        if event not in self.events:
-            self.events[event] = []
-
-        self.events[event].append(Handler())
+        events = self._own_events()
+        events[event] = events.get(event, ()) + (_Handler(function, True),)
 
     def trigger(self, event, *args):
         """
@@ -154,21 +207,49 @@ class Bindable:
 
         The parameters passed to this function as `args` will be passed along to the bound functions.
 
+        The handlers for an event are kept in a tuple which is replaced, never modified, whenever a function is bound
+        or unbound.  The tuple being dispatched is therefore a snapshot of the handlers when the event was triggered:
+        functions bound during dispatch are not called until the next trigger.  Functions unbound during dispatch are
+        not called either, which is checked against the current handlers only if they have been replaced since the
+        dispatch began.
+
         :param string event: The name of the event to trigger
         :param list args: The arguments to pass to the bound function
         :see: :class:`Bindable`
         """
-        if event in self.events:
-            for handler in copy.copy(self.events[event]):
-                if not handler.active and handler in self.events[event]:
-                    handler.active = True
-                    handler.function(*args)
-                    handler.active = False
-                    if handler.remove:
-                        self.events[event].remove(handler)
-                        # tidy up the events dict so we don't have entries for events with no handlers
-                        if len(self.events[event]) is 0:
-                            del (self.events[event])
+        events = self.events
+        if event not in events:
+            return
+        handlers = events[event]
+        live_handlers = handlers
+        live_set = None
+        called = False
+        for handler in handlers:
+            if handler.active:
+                continue
+            # Only a handler called earlier in this dispatch could have unbound this one
+            if called:
+                current = events.get(event, ())
+                if current is not handlers:
+                    if current is not live_handlers:
+                        live_handlers = current
+                        live_set = set(current)
+                    if handler not in live_set:
+                        continue
+            called = True
+            handler.active = True
+            handler.function(*args)
+            handler.active = False
+            if handler.remove:
+                self._remove_handler(event, handler)
+
+    def _remove_handler(self, event, handler):
+        remaining = tuple(h for h in self.events.get(event, ()) if h is not handler)
+        if len(remaining) == 0:
+            # tidy up the events dict so we don't have entries for events with no handlers
+            self.events.pop(event, None)
+        else:
+            self.events[event] = remaining
 
     def unbind(self, event, function):
         """
@@ -180,9 +261,11 @@ class Bindable:
         :param function function: The function to unbind.
         """
         if event in self.events:
-            self.events[event] = [handler for handler in self.events[event] if not handler.function == function]
-            if len(self.events[event]) is 0:
+            remaining = tuple(handler for handler in self.events[event] if not handler.function == function)
+            if len(remaining) == 0:
                 del (self.events[event])
+            else:
+                self.events[event] = remaining
 
 
 class Effect (metaclass=abc.ABCMeta):
@@ -211,7 +294,14 @@ class Character(Bindable, metaclass=abc.ABCMeta):
     A Character in Hearthstone is something that can attack, i.e. a :class:`Hero` or :class:`Minion`.
 
      This common superclass handles all of the status effects and calculations involved in attacking or being attacked.
+
+     Characters keep their attributes in slots rather than a dictionary, as a game may be copied many times over.
+     Cards which need to give a character an attribute of their own can still do so, as characters also have a
+     dictionary, which isn't created until it is first used.
     """
+    __slots__ = ["health", "base_health", "base_attack", "active", "dead", "windfury", "used_windfury", "frozen",
+                 "frozen_this_turn", "temp_attack", "player", "immune", "delayed", "stealth", "enraged", "removed",
+                 "effects", "born", "__dict__"]
 
     def __init__(self, attack_power, health, stealth=False, windfury=False):
         """
@@ -248,19 +338,27 @@ class Character(Bindable, metaclass=abc.ABCMeta):
         self.player = None
         #: Whether or not this character is immune to damage (but not other effects)
         self.immune = False
-        #: The list of delayed events
-        self.delayed = []
+        #: The delayed events, as tuples of the event name and its arguments.  An empty tuple until an event is delayed.
+        self.delayed = ()
         #: If this character has stealth
         self.stealth = stealth
         #: If this character is enraged
         self.enraged = False
         #: If this character has been removed from the board
         self.removed = False
-        #: A list of effects that have been applied to this character
-        self.effects = []
+        #: A list of effects that have been applied to this character.  An empty tuple until an effect is applied.
+        self.effects = ()
         #: An integer describing when this character was created.  The lower, the earlier it was created
         self.born = -1
 
+    def _changed(self):
+        """
+        Records that this :class:`Character` has changed by advancing the game's :attr:`Game.epoch`.  Characters
+        which have not been given a player yet are not part of any game, so there is nothing to record.
+        """
+        if self.player is not None:
+            self.player.game.epoch += 1
+
     def attack(self):
         """
         Causes this :class:`Character` to attack.
@@ -279,25 +377,15 @@ class Character(Bindable, metaclass=abc.ABCMeta):
         if not self.can_attack():
             raise GameException("That minion cannot attack")
 
-        found_taunt = False
-        targets = []
-        for enemy in self.player.game.other_player.minions:
-            if enemy.taunt and enemy.can_be_attacked():
-                found_taunt = True
-            if enemy.can_be_attacked():
-                targets.append(enemy)
-
-        if found_taunt:
-            targets = [target for target in targets if target.taunt]
-        else:
-            targets.append(self.player.game.other_player.hero)
-
+        self._changed()
+        targets = self.attack_targets()
         self.player.trigger("pre_attack", self)
         target = self.choose_target(targets)
         self.player.trigger("attack", self, target)
         self.trigger("attack", target)
         target.trigger("attacked", self)
         if self.removed or self.dead:  # removed won't be set yet if the Character died during this attack
+            self._changed()
             return
         my_attack = self.calculate_attack()  # In case the damage causes my attack to grow
         self.damage(target.calculate_attack(), target)
@@ -309,6 +397,28 @@ class Character(Bindable, metaclass=abc.ABCMeta):
         else:
             self.active = False
         self.stealth = False
+        self._changed()
+
+    def attack_targets(self):
+        """
+        Finds the characters this :class:`Character` could attack.  If any of the enemy minions which can be attacked
+        have taunt, then only they can be attacked.
+
+        :rtype: list[Character]
+        """
+        found_taunt = False
+        targets = []
+        for enemy in self.player.game.other_player.minions:
+            if enemy.taunt and enemy.can_be_attacked():
+                found_taunt = True
+            if enemy.can_be_attacked():
+                targets.append(enemy)
+
+        if found_taunt:
+            targets = [target for target in targets if target.taunt]
+        else:
+            targets.append(self.player.game.other_player.hero)
+        return targets
 
     def choose_target(self, targets):
         """
@@ -345,8 +455,10 @@ class Character(Bindable, metaclass=abc.ABCMeta):
         :param list args: The arguments to pass to the handler when it is called.
         :see: :class:`Bindable`
         """
-        self.delayed.append({'event': event, 'args': args})
-        self.player.game.delayed_minions.add(self)
+        if len(self.delayed) == 0:
+            self.delayed = []
+        self.delayed.append((event, args))
+        self.player.game.delay(self)
 
     def activate_delayed(self):
         """
@@ -354,10 +466,10 @@ class Character(Bindable, metaclass=abc.ABCMeta):
 
         :see: :meth:`delayed_trigger`
         """
-        for delayed in self.delayed:
-            self.trigger(delayed['event'], *delayed['args'])
+        for event, args in self.delayed:
+            self.trigger(event, *args)
 
-        self.delayed = []
+        self.delayed = ()
 
     def damage(self, amount, attacker):
         """
@@ -391,7 +503,11 @@ class Character(Bindable, metaclass=abc.ABCMeta):
                 # The response of a secret to damage must happen immediately
                 self.trigger("hero_damaged", amount, attacker)
             self.health -= amount
+            self._changed()
             if issubclass(type(attacker), Character):
+                if type(attacker) is Minion:
+                    # A minion loses stealth when it deals damage
+                    attacker.stealth = False
                 attacker.trigger("did_damage", amount, self)
             self.trigger("health_changed")
             if not self.enraged and self.health != self.calculate_max_health():
@@ -415,6 +531,7 @@ class Character(Bindable, metaclass=abc.ABCMeta):
 
         self.trigger("attack_changed", amount)
         self.base_attack += amount
+        self._changed()
         apply_silence(self)
 
     def change_temp_attack(self, amount):
@@ -426,6 +543,7 @@ class Character(Bindable, metaclass=abc.ABCMeta):
         """
         self.trigger("attack_changed", amount)
         self.temp_attack += amount
+        self._changed()
 
     def increase_health(self, amount):
         """
@@ -444,6 +562,7 @@ class Character(Bindable, metaclass=abc.ABCMeta):
         self.trigger("health_increased", amount)
         self.base_health += amount
         self.health += amount
+        self._changed()
         self.trigger("health_changed")
         apply_silence(self)
 
@@ -469,6 +588,7 @@ class Character(Bindable, metaclass=abc.ABCMeta):
         self.base_health -= amount
         if self.health > self.calculate_max_health():
             self.health = self.calculate_max_health()
+        self._changed()
 
         if self.enraged and self.health == self.calculate_max_health():
             self.enraged = False
@@ -484,6 +604,7 @@ class Character(Bindable, metaclass=abc.ABCMeta):
         """
         self.frozen_this_turn = True
         self.frozen = True
+        self._changed()
 
     def heal(self, amount, source):
         """
@@ -502,6 +623,7 @@ class Character(Bindable, metaclass=abc.ABCMeta):
             self.health += amount
             if self.health > self.calculate_max_health():
                 self.health = self.calculate_max_health()
+            self._changed()
             if self.enraged and self.health == self.calculate_max_health():
                 self.enraged = False
                 self.trigger("unenraged")
@@ -546,13 +668,48 @@ class Character(Bindable, metaclass=abc.ABCMeta):
         self.player.effect_count[type(effect)] += 1
         effect.set_target(self)
         effect.apply()
+        if len(self.effects) == 0:
+            self.effects = []
         self.effects.append(effect)
+        self._changed()
 
 
 def _is_spell_targetable(target):
     return target.spell_targetable()
 
 
+class CardDefinition:
+    """
+    The parts of a card which are the same for every copy of it: its name, cost, class, rarity, targeting, overload
+    and minion type.  Each card class has one definition, which is created with the first instance of the class and
+    shared by all of them, so creating and copying cards only has to set up what changes while the card is played.
+
+    A definition must not be changed once it has been created.
+    """
+    __slots__ = ["name", "mana", "character_class", "rarity", "targetable", "get_targets", "filter_func", "overload",
+                 "minion_type"]
+
+    def __init__(self, name, mana, character_class, rarity, target_func, filter_func, overload, minion_type):
+        #: The name of the card in English
+        self.name = name
+        #: The base amount of mana the card costs
+        self.mana = mana
+        #: A member of :class:`hearthbreaker.constants.CHARACTER_CLASS`
+        self.character_class = character_class
+        #: A member of :class:`hearthbreaker.constants.CARD_RARITY`
+        self.rarity = rarity
+        #: True if the card needs a target
+        self.targetable = target_func is not None
+        #: The function finding the card's targets, or None if it has none
+        self.get_targets = target_func
+        #: The function choosing which of the targets found by :attr:`get_targets` can be targeted
+        self.filter_func = filter_func
+        #: The amount of overload on the card
+        self.overload = overload
+        #: A member of :class:`hearthbreaker.constants.MINION_TYPE` if the card is a :class:`MinionCard`, or None
+        self.minion_type = minion_type
+
+
 class Card(Bindable):
     """
     Represents a card in Heathstone.  Every card is implemented as a subclass, either directly or through
@@ -564,8 +721,13 @@ class Card(Bindable):
     cause its effect, but not update the game state.
     """
 
+    __slots__ = ["definition", "cancel", "targets", "target"]
+
+    #: The number of options the player chooses between when playing a "Choose One" card, or 0 for other cards
+    choose_one = 0
+
     def __init__(self, name, mana, character_class, rarity, target_func=None,
-                 filter_func=_is_spell_targetable, overload=0):
+                 filter_func=_is_spell_targetable, overload=0, minion_type=None):
         """
             Creates a new :class:`Card`.
 
@@ -581,8 +743,8 @@ class Card(Bindable):
                                         :const:`hearthbreaker.constants.CHARACTER_CLASS.ALL` if neutral
             :param int rarity: A constant from :class:`hearthbreaker.constants.CARD_RARITY` denoting the rarity of the
                                card.
-            :param function target_func: A function which takes a game, and returns a list of targets.  If None, then
-                                         the card is assumed not to require a target.  If `target_func` returns
+            :param function target_func: A function which takes a game, and returns a sequence of targets.  If None,
+                                         then the card is assumed not to require a target.  If `target_func` returns
                                          an empty list, then the card cannot be played.  If it returns None, then the
                                          card is played, but with no target (i.e. a battlecry which has no valid target
                                          will not stop the minion from being played).
@@ -592,20 +754,82 @@ class Card(Bindable):
                                          for :class:`hearthbreaker.cards.spells.priest.ShadowMadness` might be a
                                          function which returns true if the target's attack is less than 3.
             :param int overload: The amount of overload on the card
+            :param int minion_type: The type of minion a :class:`MinionCard` summons.  Set by :class:`MinionCard`.
+
+            These are only read the first time the card's class is instantiated, to create its
+            :class:`CardDefinition`, so they must be the same for every instance of a class.
         """
         super().__init__()
-        self.name = name
-        self.mana = mana
-        self.character_class = character_class
-        self.rarity = rarity
+        # The definition is looked up on this class alone, as subclasses of a card are different cards
+        definition = type(self).__dict__.get("_definition")
+        if definition is None:
+            definition = CardDefinition(name, mana, character_class, rarity, target_func, filter_func, overload,
+                                        minion_type)
+            type(self)._definition = definition
+        #: The :class:`CardDefinition` shared by every instance of this card
+        self.definition = definition
+        #: If True, the card is not used when it is played
         self.cancel = False
-        self.targetable = target_func is not None
-        if self.targetable:
-            self.targets = []
-            self.target = None
-            self.get_targets = target_func
-            self.filter_func = filter_func
-        self.overload = overload
+        #: The characters this card could target, as found the last time :meth:`can_use` was called
+        self.targets = [] if definition.targetable else None
+        #: The character chosen for this card to target when it was used
+        self.target = None
+
+    @property
+    def name(self):
+        """
+        The name of the card in English
+        """
+        return self.definition.name
+
+    @property
+    def mana(self):
+        """
+        The base amount of mana the card costs, before any mana filters.  See :meth:`mana_cost`.
+        """
+        return self.definition.mana
+
+    @property
+    def character_class(self):
+        """
+        A member of :class:`hearthbreaker.constants.CHARACTER_CLASS`
+        """
+        return self.definition.character_class
+
+    @property
+    def rarity(self):
+        """
+        A member of :class:`hearthbreaker.constants.CARD_RARITY`
+        """
+        return self.definition.rarity
+
+    @property
+    def targetable(self):
+        """
+        True if the card needs a target
+        """
+        return self.definition.targetable
+
+    @property
+    def get_targets(self):
+        """
+        The function finding the card's targets, or None if it has none
+        """
+        return self.definition.get_targets
+
+    @property
+    def filter_func(self):
+        """
+        The function choosing which targets can be targeted
+        """
+        return self.definition.filter_func
+
+    @property
+    def overload(self):
+        """
+        The amount of overload on the card
+        """
+        return self.definition.overload
 
     def can_use(self, player, game):
         """
@@ -638,6 +862,16 @@ class Card(Bindable):
         :return: representing the actual mana cost of this card.
         :rtype: int
         """
+        costs = player._mana_costs
+        if self in costs:
+            mana_cost_cache.hits += 1
+            return costs[self]
+        mana_cost_cache.misses += 1
+        cost = self._filter_mana_cost(player)
+        costs[self] = cost
+        return cost
+
+    def _filter_mana_cost(self, player):
         calc_mana = self.mana
         for mana_filter in player.mana_filters:
             if mana_filter.filter(self):
@@ -693,6 +927,8 @@ class MinionCard(Card, metaclass=abc.ABCMeta):
     :see: :class:`Card`
     :see: :meth:`create_minion`
     """
+    __slots__ = []
+
     def __init__(self, name, mana, character_class, rarity, minion_type=hearthbreaker.constants.MINION_TYPE.NONE,
                  targeting_func=None, filter_func=lambda target: not target.stealth, overload=0):
         """
@@ -712,8 +948,30 @@ class MinionCard(Card, metaclass=abc.ABCMeta):
         :param function filter_func: Used to filter targets returned from the targeting function for appropriateness.
                                      Typically used for ensuring that stealthed minions aren't targeted
         """
-        super().__init__(name, mana, character_class, rarity, targeting_func, filter_func, overload)
-        self.minion_type = minion_type
+        super().__init__(name, mana, character_class, rarity, targeting_func, filter_func, overload, minion_type)
+
+    @property
+    def minion_type(self):
+        """
+        The type of the minion this card summons, a member of :class:`hearthbreaker.constants.MINION_TYPE`
+        """
+        return self.definition.minion_type
+
+    def has_battlecry(self):
+        """
+        Checks if the minion this card creates has a battlecry.  This is read from the card index, so no minion is
+        created.  Cards which aren't in the index, such as private tokens, have their minion created once with
+        :func:`hearthbreaker.card_registry.find_battlecry` instead.
+
+        :rtype: bool
+        """
+        card_type = type(self)
+        info = hearthbreaker.card_registry.registry.by_name.get(self.name)
+        if info is not None and info.class_name == card_type.__name__ and info.module == card_type.__module__:
+            return info.battlecry
+        if card_type not in _unindexed_battlecries:
+            _unindexed_battlecries[card_type] = hearthbreaker.card_registry.find_battlecry(self)
+        return _unindexed_battlecries[card_type]
 
     def can_use(self, player, game):
         """
@@ -825,6 +1083,8 @@ class MinionCard(Card, metaclass=abc.ABCMeta):
 
 
 class SecretCard(Card, metaclass=abc.ABCMeta):
+    __slots__ = ["player"]
+
     def __init__(self, name, mana, character_class, rarity):
         super().__init__(name, mana, character_class, rarity, None)
         self.player = None
@@ -854,7 +1114,57 @@ class SecretCard(Card, metaclass=abc.ABCMeta):
         pass
 
 
+class CacheStatistics:
+    """
+    Counts how often a cache was able to answer a query, and how often it had to be recalculated
+    """
+    __slots__ = ["hits", "misses"]
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def reset(self):
+        self.hits = 0
+        self.misses = 0
+
+    def __str__(self):  # pragma: no cover
+        return "{0} hits, {1} misses".format(self.hits, self.misses)
+
+
+#: The effectiveness of the cached aura bonuses used by :meth:`Minion.calculate_attack` and
+#: :meth:`Minion.calculate_max_health`
+aura_cache = CacheStatistics()
+
+#: The effectiveness of the cached card costs used by :meth:`Card.mana_cost`
+mana_cost_cache = CacheStatistics()
+
+#: The effectiveness of the results cached by :meth:`Game.memoize`
+memo_cache = CacheStatistics()
+
+#: How often :meth:`Game.check_delayed` finds no delayed events and returns at once (counted as hits), and how often
+#: it has events to activate (counted as misses)
+delayed_checks = CacheStatistics()
+
+
+class Aura:
+    """
+    An increase to the attack and health of the minions which match a filter, kept in :attr:`Player.auras`
+    """
+    __slots__ = ["attack", "health", "filter"]
+
+    def __init__(self, attack, health, filter_func):
+        self.attack = attack
+        self.health = health
+        #: A function which takes a minion and returns True if it is affected by this aura
+        self.filter = filter_func
+
+
 class Minion(Character):
+    __slots__ = ["taunt", "game", "card", "index", "charge", "_aura_player", "_aura_version", "_aura_attack",
+                 "_aura_health", "spell_damage", "divine_shield", "can_be_targeted_by_spells", "battlecry",
+                 "deathrattle", "base_deathrattle", "exhausted", "_effects_to_add", "_auras_to_add"]
+
     def __init__(self, attack, health, battlecry=None,
                  deathrattle=None, taunt=False, charge=False, spell_damage=0, divine_shield=False, stealth=False,
                  windfury=False, spell_targetable=True, effects=None):
@@ -864,6 +1174,11 @@ class Minion(Character):
         self.card = None
         self.index = -1
         self.charge = charge
+        # The bonuses from auras, which are valid while the player and their aura version are unchanged
+        self._aura_player = None
+        self._aura_version = -1
+        self._aura_attack = 0
+        self._aura_health = 0
         self.spell_damage = spell_damage
         self.divine_shield = divine_shield
         self.can_be_targeted_by_spells = spell_targetable
@@ -875,11 +1190,10 @@ class Minion(Character):
         if effects:
             self._effects_to_add = effects
         else:
-            self._effects_to_add = []
-        self.bind("did_damage", self.__on_did_damage)
-
-    def __on_did_damage(self, amount, target):
-        self.stealth = False
+            self._effects_to_add = ()
+        # The auras this minion was copied with, as tuples of their attack, health, whether each player they affect is
+        # friendly and their filter, which are added once the copy is on the board
+        self._auras_to_add = ()
 
     def add_to_board(self, index):
         self.game.minion_counter += 1
@@ -891,10 +1205,12 @@ class Minion(Character):
             minion.index = count
             count += 1
         self.index = index
+        self.player.auras_changed()
         self.active = True
         self.health += self.calculate_max_health() - self.base_health
         for effect in self._effects_to_add:
             self.add_effect(effect)
+        self._add_copied_auras()
         self.trigger("added_to_board", self, index)
 
     def calculate_attack(self):
@@ -902,22 +1218,33 @@ class Minion(Character):
         Calculates the amount of attack this :class:`Minion` has, including the base attack, any temporary attack
         bonuses for this turn and any aura effects
         """
-        aura_attack = 0
-        for aura in self.player.auras:
-            if aura.filter(self):
-                aura_attack += aura.attack
-        return super().calculate_attack() + aura_attack
+        self._update_auras()
+        return self.base_attack + self.temp_attack + self._aura_attack
 
     def calculate_max_health(self):
         """
         Calculates the maximum amount of health this :class:`Character` has, including the base health, and any aura
         effects
         """
+        self._update_auras()
+        return self.base_health + self._aura_health
+
+    def _update_auras(self):
+        player = self.player
+        if self._aura_player is player and self._aura_version == player._aura_version:
+            aura_cache.hits += 1
+            return
+        aura_cache.misses += 1
+        aura_attack = 0
         aura_health = 0
-        for aura in self.player.auras:
+        for aura in player.auras:
             if aura.filter(self):
+                aura_attack += aura.attack
                 aura_health += aura.health
-        return self.base_health + aura_health
+        self._aura_player = player
+        self._aura_version = player._aura_version
+        self._aura_attack = aura_attack
+        self._aura_health = aura_health
 
     def remove_from_board(self):
         for minion in self.player.minions:
@@ -940,8 +1267,10 @@ class Minion(Character):
         self.game.minion_counter += 1
         new_minion.born = self.game.minion_counter
         self.player.minions[self.index] = new_minion
+        self.player.auras_changed()
         for effect in new_minion._effects_to_add:
             new_minion.add_effect(effect)
+        new_minion._add_copied_auras()
         new_minion.health += new_minion.calculate_max_health() - new_minion.base_health
 
     def attack(self):
@@ -960,7 +1289,7 @@ class Minion(Character):
         for effect in reversed(self.effects):
             self.player.effect_count[type(effect)] -= 1
             effect.unapply()
-        self.effects = []
+        self.effects = ()
         self.taunt = False
         self.stealth = False
         self.charge = False
@@ -970,6 +1299,7 @@ class Minion(Character):
         self.battlecry = None
         self.deathrattle = None
         self.can_be_targeted_by_spells = True
+        self._changed()
         self.trigger("silenced")
         if "copied" in self.events:
             del self.events["copied"]
@@ -977,6 +1307,7 @@ class Minion(Character):
     def damage(self, amount, attacker):
         if self.divine_shield:
             self.divine_shield = False
+            self._changed()
         else:
             super().damage(amount, attacker)
 
@@ -994,7 +1325,7 @@ class Minion(Character):
                 self.silence()
                 if deathrattle is not None:
                     deathrattle(self)
-                self.player.graveyard.add(self.card.name)
+                self.player.graveyard |= {self.card.name}
             self.bind_once("died", delayed_death)
             super().die(by)
 
@@ -1013,7 +1344,7 @@ class Minion(Character):
     def __str__(self):  # pragma: no cover
         return "({0}) ({1}) {2} at index {3}".format(self.calculate_attack(), self.health, self.card.name, self.index)
 
-    def add_aura(self, attack, health, affected_players, filter_func=lambda m: True):
+    def add_aura(self, attack, health, affected_players, filter_func=lambda m: True, keep_on_copy=True):
         """
         Adds an aura effect to some minions on the board minions.  This aura can increase the attack or health of
         the minions, or both.  The effect can be limited to only certain minions with the use of a filter
@@ -1028,18 +1359,15 @@ class Minion(Character):
         :param function filter_func: A function that selects which minions to apply this effect to. Takes
                                      one paramter: the minion to test and returns true if the minion should be
                                      affected, and false otherwise.
+        :param boolean keep_on_copy: If False, the aura isn't added to copies of this minion, as when it is added by an
+                                     :class:`Effect`, which is copied itself
         """
 
         complete_filter_func = lambda m: m is not self and filter_func(m)
-
-        class Aura:
-            def __init__(self):
-                self.attack = attack
-                self.health = health
-                self.filter = complete_filter_func
-        aura = Aura()
+        aura = Aura(attack, health, complete_filter_func)
         for player in affected_players:
             player.auras.append(aura)
+            player.auras_changed()
             if health > 0:
                 for minion in filter(complete_filter_func, player.minions):
                     minion.health += health
@@ -1048,13 +1376,28 @@ class Minion(Character):
         def silenced():
             for player in affected_players:
                 player.auras.remove(aura)
+                player.auras_changed()
                 if health > 0:
                     for filtered_minion in filter(complete_filter_func, player.minions):
                         if filtered_minion.health > filtered_minion.calculate_max_health():
                             filtered_minion.health = filtered_minion.calculate_max_health()
                             filtered_minion.trigger("health_changed")
 
+        def copied(new_minion, new_owner):
+            # The players affected are recorded as friendly or not, as the copy's opponent may not have been copied yet
+            friendly = tuple(player is self.player for player in affected_players)
+            new_minion._auras_to_add += ((attack, health, friendly, filter_func),)
+
         self.bind_once("silenced", silenced)
+        if keep_on_copy:
+            self.bind("copied", copied)
+
+    def _add_copied_auras(self):
+        # Adds the auras this minion was copied with, once its player and their opponent are in place
+        for attack, health, friendly, filter_func in self._auras_to_add:
+            players = [self.player if is_friendly else self.player.opponent for is_friendly in friendly]
+            self.add_aura(attack, health, players, filter_func)
+        self._auras_to_add = ()
 
     def add_adjacency_aura(self, attack, health, player):
         """
@@ -1068,14 +1411,9 @@ class Minion(Character):
         :param hearthbreaker.game_objects.Player player: The player who the adjacent minions belong to.
         """
         me = self
-
-        class Aura:
-            def __init__(self):
-                self.attack = attack
-                self.health = health
-                self.filter = lambda mini: mini.index is me.index - 1 or mini.index is me.index + 1
-        aura = Aura()
+        aura = Aura(attack, health, lambda mini: mini.index is me.index - 1 or mini.index is me.index + 1)
         player.auras.append(aura)
+        player.auras_changed()
         if health > 0:
             for minion in filter(aura.filter, player.minions):
                 minion.health += health
@@ -1083,6 +1421,7 @@ class Minion(Character):
 
         def silenced():
             player.auras.remove(aura)
+            player.auras_changed()
             if health > 0:
                 for filtered_minion in filter(aura.filter, player.minions):
                     if filtered_minion.health > filtered_minion.calculate_max_health():
@@ -1098,8 +1437,6 @@ class Minion(Character):
     def copy(self, new_owner, new_game=None):
         new_minion = Minion(self.base_attack, self.base_health, self.battlecry, self.base_deathrattle)
         new_minion.health = self.health
-        new_minion.events = dict()
-        new_minion.bind("did_damage", self.__on_did_damage)
         new_minion.stealth = self.stealth
         new_minion.taunt = self.taunt
         new_minion.divine_shield = self.divine_shield
@@ -1111,6 +1448,7 @@ class Minion(Character):
         new_minion.index = self.index
         new_minion.active = self.active
         new_minion.exhausted = self.exhausted
+        new_minion.enraged = self.enraged
         new_minion.born = self.born
         card_type = type(self.card)
         new_minion.card = card_type()
@@ -1119,8 +1457,7 @@ class Minion(Character):
             new_minion.game = new_game
         else:
             new_minion.game = new_owner.game
-        new_minion.effects = []
-        new_minion._effects_to_add = [copy.copy(effect) for effect in self.effects]
+        new_minion._effects_to_add = tuple(copy.copy(effect) for effect in self.effects)
         self.trigger("copied", new_minion, new_owner)
         return new_minion
 
@@ -1129,6 +1466,7 @@ class Minion(Character):
             self.silence()
             self.remove_from_board()
             self.player.hand.append(self.card)
+            self.game.epoch += 1
         else:
             self.die(None)
             self.game.check_delayed()
@@ -1138,6 +1476,7 @@ class WeaponCard(Card, metaclass=abc.ABCMeta):
     """
     Represents a :class:`Card` for creating a :class:`Weapon`
     """
+    __slots__ = []
 
     def __init__(self, name, mana, character_class, rarity, target_func=None, filter_func=lambda t: not t.stealth,
                  overload=0):
@@ -1206,6 +1545,7 @@ class Weapon(Bindable):
     Represents a Hearthstone weapon.  All weapons have attack power and durability.  The logic for handling the
     attacks is handled by :class:`Hero`, but it can be modified through the use of events.
     """
+    __slots__ = ["base_attack", "durability", "battlecry", "player", "card", "game", "__dict__"]
 
     def __init__(self, attack_power, durability, battlecry=None):
         """
@@ -1225,16 +1565,23 @@ class Weapon(Bindable):
         self.player = None
         #: The :class:`WeaponCard` that created this weapon
         self.card = None
+        #: The :class:`Game` this weapon is in
+        self.game = None
 
-    def copy(self, new_owner):
+    def copy(self, new_owner, new_game=None):
         new_weapon = copy.copy(self)
-        new_weapon.events = copy.copy(self.events)
+        # The handlers bound to this weapon belong to this game, so they rebind themselves to the copy on "copied"
+        new_weapon.events = _NO_EVENTS
         new_weapon.player = new_owner
+        if new_game is not None:
+            new_weapon.game = new_game
         self.trigger("copied", new_weapon, new_owner)
+        return new_weapon
 
     def destroy(self):
         self.trigger("destroyed")
         self.player.hero.weapon = None
+        self.player.game.epoch += 1
         if self.player.game.current_player is self.player:
             self.player.hero.change_temp_attack(-self.base_attack)
         self.player.hero.windfury = False
@@ -1244,6 +1591,7 @@ class Weapon(Bindable):
         if self.player.hero.weapon is not None:
             self.player.hero.weapon.destroy()
         self.player.hero.weapon = self
+        self.player.game.epoch += 1
         if self.player.game.current_player is self.player:
             self.player.hero.change_temp_attack(self.base_attack)
         self.player.hero.trigger("weapon_equipped")
@@ -1253,45 +1601,154 @@ class Deck:
     def __init__(self, cards, character_class):
         if len(cards) != 30:
             raise GameException("Deck must have exactly 30 cards in it")
+        #: The cards in this deck, including those which have been drawn
         self.cards = cards
         self.character_class = character_class
-        self.used = [False] * 30
-        self.left = 30
+        #: Whether each card in :attr:`cards` has been drawn
+        self.used = [False] * len(cards)
+        #: The number of cards which have not been drawn
+        self.left = len(cards)
+        # A Fenwick tree counting the cards which haven't been drawn, so that the nth of them can be found, and a
+        # card drawn or put back, in logarithmic time.  Entry i (from 1) counts the undrawn cards among the i & -i
+        # cards of cards ending at index i - 1.
+        self._counts = [0] * (len(cards) + 1)
+        for index in range(1, len(cards) + 1):
+            self._counts[index] += 1
+            parent = index + (index & -index)
+            if parent <= len(cards):
+                self._counts[parent] += self._counts[index]
+        # The largest power of two no greater than the number of cards, where a search of the tree starts
+        self._top = 1 << (len(cards).bit_length() - 1) if len(cards) > 0 else 0
+        # Maps each card to its index in cards.  Where a card appears more than once, the first index is used.
+        self._positions = {}
+        for index in range(len(cards) - 1, -1, -1):
+            self._positions[cards[index]] = index
+        #: The :mod:`Zobrist hash <hearthbreaker.zobrist>` of the cards which haven't been drawn, which is updated as
+        #: cards are drawn, taken and put back
+        self.state_hash = self.calculate_state_hash()
+        # True if the cards which haven't been drawn are shared with another deck
+        self._shared = False
+        # True if cards and _positions are not shared with another deck, and so can be modified
+        self._owns_cards = True
 
     def copy(self):
-        return copy.deepcopy(self)
+        """
+        Copies this deck.  The copy shares its list of cards with this deck, so copying is cheap.  Cards are only
+        created for the copy as they are drawn from it with :meth:`take`.
+
+        :rtype: Deck
+        """
+        copied_deck = copy.copy(self)
+        copied_deck.used = list(self.used)
+        copied_deck._counts = list(self._counts)
+        copied_deck._shared = True
+        copied_deck._owns_cards = False
+        self._owns_cards = False
+        return copied_deck
 
     def can_draw(self):
         return self.left > 0
 
+    def calculate_state_hash(self):
+        """
+        Calculates the hash of the cards which haven't been drawn from scratch.  It should always equal
+        :attr:`state_hash`.
+
+        :rtype: int
+        """
+        state_hash = 0
+        for index in range(0, len(self.cards)):
+            if not self.used[index]:
+                state_hash ^= hearthbreaker.zobrist.key(("deck", index, self.cards[index].name))
+        return state_hash
+
     def draw(self, random_func):
+        """
+        Draws a random card from the deck.  The number chosen by `random_func` selects a card by its position among
+        the cards which haven't been drawn, in the order they appear in :attr:`cards`.
+
+        :param function random_func: A function which takes a lower and upper bound, and returns a random number
+                                     between them, inclusive, such as :func:`random.randint`
+        :rtype: Card
+        """
         if not self.can_draw():
             raise GameException("Cannot draw more than 30 cards")
 
-        index = random_func(0, self.left - 1)
-        count = 0
-        i = 0
-        while count <= index:
-            if not self.used[i]:
-                count += 1
-            i += 1
-
-        self.used[i - 1] = True
+        # Finds the index of the card with the chosen number of undrawn cards before it, by descending the tree
+        remaining = random_func(0, self.left - 1)
+        index = 0
+        step = self._top
+        counts = self._counts
+        while step > 0:
+            if index + step < len(counts) and counts[index + step] <= remaining:
+                index += step
+                remaining -= counts[index]
+            step >>= 1
+        return self._remove(index)
+
+    def take(self, index):
+        """
+        Removes a particular card from the deck.  Cards which haven't been drawn may be shared with other copies of
+        this deck, so they should only be examined in :attr:`cards`, and removed from the deck with this method.
+
+        :param int index: The index in :attr:`cards` of a card which hasn't been drawn
+        :return: The card, which belongs to this deck alone
+        :rtype: Card
+        """
+        if self.used[index]:
+            raise GameException("Tried to take a card that has already been drawn")
+        return self._remove(index)
+
+    def _count(self, index, change):
+        # Changes the count of undrawn cards at an index in cards
+        counts = self._counts
+        index += 1
+        while index < len(counts):
+            counts[index] += change
+            index += index & -index
+
+    def _remove(self, index):
+        self._count(index, -1)
+        self.used[index] = True
         self.left -= 1
-        return self.cards[i - 1]
+        card = self.cards[index]
+        self.state_hash ^= hearthbreaker.zobrist.key(("deck", index, card.name))
+        if self._shared:
+            if not self._owns_cards:
+                self.cards = list(self.cards)
+                self._positions = dict(self._positions)
+                self._owns_cards = True
+            if self._positions.get(card) == index:
+                del self._positions[card]
+            card = type(card)()
+            self.cards[index] = card
+            self._positions[card] = index
+        return card
 
     def put_back(self, card):
-        for index in range(0, 30):
-            if self.cards[index] == card:
-                if self.used[index] is False:
-                    raise GameException("Tried to put back a card that hadn't been used yet")
-                self.used[index] = False
-                self.left += 1
-                return
-        raise GameException("Tried to put back a card that didn't come from this deck")
+        if card not in self._positions:
+            raise GameException("Tried to put back a card that didn't come from this deck")
+        self.restore(self._positions[card])
+
+    def restore(self, index):
+        """
+        Returns a card which has been drawn to the deck, the opposite of :meth:`take`.  The card is the one in
+        :attr:`cards`, so can be returned even if the card drawn has since been replaced by a copy of it.
+
+        :param int index: The index in :attr:`cards` of a card which has been drawn
+        """
+        if self.used[index] is False:
+            raise GameException("Tried to put back a card that hadn't been used yet")
+        card = self.cards[index]
+        self.used[index] = False
+        self.left += 1
+        self._count(index, 1)
+        self.state_hash ^= hearthbreaker.zobrist.key(("deck", index, card.name))
 
 
 class Hero(Character):
+    __slots__ = ["armor", "weapon", "character_class", "power"]
+
     def __init__(self, character_class, player):
         super().__init__(0, 30)
 
@@ -1303,12 +1760,16 @@ class Hero(Character):
 
     def copy(self, new_owner, new_game):
         new_hero = copy.copy(self)
-        new_hero.events = copy.copy(self.events)
-        if self.weapon:
-            new_hero.weapon = self.weapon.copy(new_owner, new_game)
+        # As with players, functions bound to the hero act on this game, so they are not kept by the copy.  The
+        # weapons, minions and secrets which bound them bind them again to the copy.
+        new_hero.events = _NO_EVENTS
         new_hero.player = new_owner
         new_hero.power = copy.copy(self.power)
         new_hero.power.hero = new_hero
+        # The weapon binds its functions to its owner's hero when it is copied, so the new hero must be in place first
+        new_owner.hero = new_hero
+        if self.weapon:
+            new_hero.weapon = self.weapon.copy(new_owner, new_game)
         return new_hero
 
     def attack(self):
@@ -1328,19 +1789,94 @@ class Hero(Character):
     def increase_armor(self, amount):
         self.trigger("armor_increased", amount)
         self.armor += amount
+        self._changed()
 
     def die(self, by):
         super().die(by)
         self.player.game.game_over()
 
+    def power_targets(self):
+        """
+        Finds the characters a hero power which needs a target could be used on
+
+        :rtype: tuple[Character]
+        """
+        return hearthbreaker.targeting.find_spell_target(self.player.game, _is_spell_targetable)
+
     def find_power_target(self):
-        targets = hearthbreaker.targeting.find_spell_target(self.player.game, lambda t: t.spell_targetable())
+        targets = self.power_targets()
         target = self.choose_target(targets)
         self.trigger("found_power_target", target)
         return target
 
 
+def _any_card(card):
+    return True
+
+
+def _minion_card(card):
+    return isinstance(card, MinionCard)
+
+
+def _spell_card(card):
+    return card.is_spell()
+
+
+def _secret_card(card):
+    return isinstance(card, SecretCard)
+
+
+def card_type_filter(filter_type):
+    """
+    Finds the function which selects cards of a given type.
+
+    :param string filter_type: One of "minion", "spell", "secret" or "card".  Any other value selects all cards.
+    :return: A function which takes a card and returns True if it is of the given type
+    """
+    if filter_type == "minion":
+        return _minion_card
+    elif filter_type == "spell":
+        return _spell_card
+    elif filter_type == "secret":
+        return _secret_card
+    else:
+        return _any_card
+
+
+class ManaCostFilter:
+    """
+    A change to the mana cost of the cards which match a filter, kept in :attr:`Player.mana_filters`
+    """
+    __slots__ = ["amount", "min", "filter"]
+
+    def __init__(self, amount, minimum, filter_func):
+        #: The amount to reduce the cost of matching cards by (negative to increase it)
+        self.amount = amount
+        #: The least this filter can reduce a card's cost to
+        self.min = minimum
+        #: A function which takes a card and returns True if its cost is changed by this filter
+        self.filter = filter_func
+
+
+class CardFilter:
+    """
+    A record of a call to :meth:`Player.add_card_filter`, so that it can be repeated when the player is copied
+    """
+    __slots__ = ["amount", "filter", "until", "only_first"]
+
+    def __init__(self, amount, card_filter, until, only_first):
+        self.amount = amount
+        self.filter = card_filter
+        self.until = until
+        self.only_first = only_first
+
+
 class Player(Bindable):
+    __slots__ = ["hero", "name", "mana", "max_mana", "deck", "spell_damage", "minions", "graveyard", "random", "hand",
+                 "auras", "_aura_version", "fatigue", "agent", "game", "card_filters", "secrets", "spell_multiplier",
+                 "heal_multiplier", "heal_does_damage", "mana_filters", "_mana_costs", "overload", "effect_count",
+                 "opponent", "cards_played", "_hash_part", "_shared_cards", "__dict__"]
+
     def __init__(self, name, deck, agent, game, random_func=random.randint):
         super().__init__()
         self.hero = Hero(deck.character_class, self)
@@ -1350,10 +1886,14 @@ class Player(Bindable):
         self.deck = deck
         self.spell_damage = 0
         self.minions = []
-        self.graveyard = set()
+        #: The names of the minions this player has had die.  The set is replaced rather than modified, so that it
+        #: can be shared with copies of this player
+        self.graveyard = frozenset()
         self.random = random_func
         self.hand = []
         self.auras = []
+        # Increased whenever auras or minions are added or removed, so minions know to recalculate their aura bonuses
+        self._aura_version = 0
         self.fatigue = 0
         self.agent = agent
         self.game = game
@@ -1363,39 +1903,80 @@ class Player(Bindable):
         self.heal_multiplier = 1
         self.heal_does_damage = False
         self.mana_filters = []
+        # Maps cards to their cost after mana filters.  Emptied whenever mana filters are added or removed.
+        self._mana_costs = {}
         self.overload = 0
         self.effect_count = dict()
         self.opponent = None
         self.cards_played = 0
+        # This player's part of the state hash, without their hero's character and minions, or their deck, as a tuple of
+        # the index of the player, the attributes the part was found from and the part itself.  See
+        # :meth:`Game.state_hash`.
+        self._hash_part = None
+        # The cards in this player's hand which are shared with the player this player was copied from.  Such a card
+        # is replaced by one of this player's own before it is played.
+        self._shared_cards = frozenset()
 
     def __str__(self):  # pragma: no cover
         return "Player: " + self.name
 
     def copy(self, new_game):
         copied_player = copy.copy(self)
-        copied_player.events = dict()
+        copied_player.events = _NO_EVENTS
+        copied_player.game = new_game
         copied_player.auras = []
         copied_player.mana_filters = []
+        copied_player._mana_costs = {}
         copied_player.card_filters = []
         for card_filter in self.card_filters:
             copied_player.add_card_filter(card_filter.amount, card_filter.filter, card_filter.until,
                                           card_filter.only_first)
         copied_player.hero = self.hero.copy(copied_player, new_game)
         copied_player.deck = self.deck.copy()
-        copied_player.graveyard = copy.copy(self.graveyard)
         copied_player.minions = [minion.copy(copied_player, new_game) for minion in self.minions]
-        copied_player.hand = [type(card)() for card in self.hand]
-        copied_player.game = new_game
+        # The cards in hand are shared until the copy plays them, when Game.play_card replaces them.  The original
+        # keeps its cards, which mana filters may refer to.  Secrets are in play, and belong to their player and are
+        # bound to them when activated, so each copy needs its own.
+        copied_player.hand = list(self.hand)
+        copied_player._shared_cards = frozenset(self.hand)
         copied_player.secrets = [type(secret)() for secret in self.secrets]
+        for secret in copied_player.secrets:
+            secret.player = copied_player
         copied_player.effect_count = dict()
-        for minion in copied_player.minions:
-            for effect in minion._effects_to_add:
-                minion.add_effect(effect)
         return copied_player
 
+    def add_mana_filter(self, mana_filter):
+        """
+        Adds a filter which changes the cost of this player's cards.
+
+        :param ManaCostFilter mana_filter: The filter to add
+        """
+        self.mana_filters.append(mana_filter)
+        self._mana_costs = {}
+        self.game.epoch += 1
+
+    def remove_mana_filter(self, mana_filter):
+        """
+        Removes a filter added with :meth:`add_mana_filter`
+
+        :param ManaCostFilter mana_filter: The filter to remove
+        """
+        self.mana_filters.remove(mana_filter)
+        self._mana_costs = {}
+        self.game.epoch += 1
+
+    def auras_changed(self):
+        """
+        Records that this player's auras or minions have changed, so the bonuses minions get from auras must be
+        recalculated.  Must be called after changing :attr:`auras` or :attr:`minions` directly.
+        """
+        self._aura_version += 1
+        self.game.epoch += 1
+
     def draw(self):
         if self.can_draw():
             card = self.deck.draw(self.random)
+            self.game.epoch += 1
             self.trigger("card_drawn", card)
             if len(self.hand) < 10:
                 self.hand.append(card)
@@ -1422,6 +2003,7 @@ class Player(Bindable):
     def put_back(self, card):
         self.hand.remove(card)
         self.deck.put_back(card)
+        self.game.epoch += 1
         self.trigger("card_put_back", card)
 
     def discard(self):
@@ -1429,6 +2011,7 @@ class Player(Bindable):
             targets = self.hand
             target = targets[self.random(0, len(targets) - 1)]
             self.hand.remove(target)
+            self.game.epoch += 1
             self.trigger("card_discarded", target)
 
     def add_card_filter(self, amount, card_filter="card", until="turn_started", only_first=False):
@@ -1447,36 +2030,15 @@ class Player(Bindable):
         :param boolean only_first: True if this card filter should be removed the first time a player plays a card which
                                    matches the filter
         """
-        class CardEffect:
-            def __init__(self):
-                self.amount = amount
-                self.filter = card_filter
-                self.until = until
-                self.only_first = only_first
-
-        if card_filter == "minion":
-            my_filter = lambda c: isinstance(c, MinionCard)
-        elif card_filter == "spell":
-            my_filter = lambda c: c.is_spell()
-        elif card_filter == "secret":
-            my_filter = lambda c: isinstance(c, SecretCard)
-        else:
-            my_filter = lambda c: True
-
-        class Filter:
-            def __init__(self):
-                self.amount = amount
-                self.min = 0
-                self.filter = my_filter
-
-        card_effect = CardEffect()
-        mana_filter = Filter()
+        my_filter = card_type_filter(card_filter)
+        card_effect = CardFilter(amount, card_filter, until, only_first)
+        mana_filter = ManaCostFilter(amount, 0, my_filter)
         self.card_filters.append(card_effect)
-        self.mana_filters.append(mana_filter)
+        self.add_mana_filter(mana_filter)
 
         def remove():
             self.card_filters.remove(card_effect)
-            self.mana_filters.remove(mana_filter)
+            self.remove_mana_filter(mana_filter)
             if only_first:
                 self.unbind("card_played", card_played)
 
@@ -1493,10 +2055,294 @@ class Player(Bindable):
         return self.agent.choose_target(targets)
 
 
+# The attributes of each character, and each minion, which are part of the state hash
+_character_attributes = operator.attrgetter("health", "base_health", "base_attack", "temp_attack", "active", "dead",
+                                            "windfury", "used_windfury", "frozen", "frozen_this_turn", "immune",
+                                            "stealth")
+_minion_attributes = operator.attrgetter("card", "taunt", "charge", "divine_shield", "spell_damage", "exhausted",
+                                         "can_be_targeted_by_spells", "battlecry", "deathrattle")
+
+
+def _hero_state(hero):
+    # Everything a hero's part of the state hash is found from, which can be compared to tell if the part has changed
+    return _character_attributes(hero), tuple(hero.effects), hero.character_class
+
+
+def _minion_state(minion):
+    return _character_attributes(minion), tuple(minion.effects), _minion_attributes(minion)
+
+
+def _character_hash(feature, attributes, effects):
+    # The effects are included by name, as they are part of the character's state but don't have any of their own.
+    # Whether the character is enraged follows from its health, so it is left out.
+    names = tuple(type(effect).__name__ for effect in effects)
+    return hearthbreaker.zobrist.mix((hearthbreaker.zobrist.key(feature + names),) + attributes)
+
+
+def _hero_hash(player_index, state):
+    attributes, effects, character_class = state
+    return _character_hash(("hero", player_index, character_class), attributes, effects)
+
+
+_player_attributes = operator.attrgetter("mana", "max_mana", "overload", "fatigue", "spell_damage", "spell_multiplier",
+                                         "heal_multiplier", "heal_does_damage", "cards_played", "graveyard")
+
+
+def _player_state(player):
+    weapon = player.hero.weapon
+    if weapon is not None:
+        weapon = (weapon.card, weapon.base_attack, weapon.durability)
+    return (_player_attributes(player), player.hero.armor, player.hero.power.used, weapon, tuple(player.hand),
+            tuple(player.secrets))
+
+
+def _player_hash(player_index, state):
+    zobrist = hearthbreaker.zobrist
+    attributes, armor, power_used, weapon, hand, secrets = state
+    state_hash = zobrist.mix((zobrist.key(("player", player_index)),) + attributes[:-1])
+    state_hash ^= zobrist.mix((zobrist.key(("hero", player_index)), armor, power_used))
+    if weapon is not None:
+        card, base_attack, durability = weapon
+        name = card.name if card is not None else None
+        state_hash ^= zobrist.mix((zobrist.key(("weapon", player_index, name)), base_attack, durability))
+    for position in range(0, len(hand)):
+        state_hash ^= zobrist.key(("hand", player_index, position, hand[position].name))
+    for position in range(0, len(secrets)):
+        state_hash ^= zobrist.key(("secret", player_index, position, secrets[position].name))
+    for name in attributes[-1]:
+        state_hash ^= zobrist.key(("graveyard", player_index, name))
+    return state_hash
+
+
+def _minion_hash(player_index, position, state):
+    attributes, effects, (card, taunt, charge, divine_shield, spell_damage, exhausted, can_be_targeted_by_spells,
+                          battlecry, deathrattle) = state
+    name = card.name if card is not None else None
+    return _character_hash(("minion", player_index, position, name), attributes, effects) ^ \
+        hearthbreaker.zobrist.mix((hearthbreaker.zobrist.key(("minion", player_index, position)), taunt, charge,
+                                   divine_shield, spell_damage, exhausted, can_be_targeted_by_spells,
+                                   battlecry is not None, deathrattle is not None))
+
+
+class _SlotFunctions(dict):
+    """
+    Maps each class to the names of the slots of it and its base classes, a function returning their values, a
+    function setting them, the names of the attributes holding containers which aren't slots, and whether its objects
+    have a dictionary.  The attributes named by `containers` hold lists, dictionaries or sets which are changed in
+    place, so they are copied as they are got and again as they are set, and the values saved are never changed.
+    """
+
+    def __init__(self, containers=()):
+        super().__init__()
+        self.containers = containers
+
+    def __missing__(self, cls):
+        containers = self.containers
+        names = []
+        for base in cls.__mro__:
+            for name in base.__dict__.get("__slots__", ()):
+                if name not in ("__dict__", "__weakref__") and name not in names:
+                    names.append(name)
+        # As with collections.namedtuple, the functions are written out for each class.  This makes saving and restoring
+        # a checkpoint several times faster than getting and setting each slot by name.  The containers are copied as
+        # _copy_container would, but without calling it, as there are many of them.
+        copied = [index for index in range(0, len(names)) if names[index] in containers]
+        copy_value = "value{0} if value{0} is _NO_EVENTS or type(value{0}) is tuple else type(value{0})(value{0})"
+        got = [copy_value.format(index) if index in copied else "obj." + names[index] for index in range(0, len(names))]
+        targets = ["value{0}".format(index) if index in copied else "obj." + names[index]
+                   for index in range(0, len(names))]
+        get = ["value{0} = obj.{1}".format(index, names[index]) for index in copied]
+        get.append("return ({0})".format("".join(value + ", " for value in got)))
+        put = ["({0}) = values".format("".join(target + ", " for target in targets))] if names else ["pass"]
+        put.extend("obj.{0} = {1}".format(names[index], copy_value.format(index)) for index in copied)
+        source = "def get(obj):\n    {0}\n\ndef put(obj, values):\n    {1}\n".format(
+            "\n    ".join(get), "\n    ".join(put))
+        namespace = {"_NO_EVENTS": _NO_EVENTS}
+        exec(source, namespace)
+        others = tuple(name for name in containers if name not in names)
+        has_dict = any("__slots__" not in base.__dict__ or "__dict__" in base.__slots__ for base in cls.__mro__[:-1])
+        self[cls] = (names, namespace["get"], namespace["put"], others, has_dict)
+        return self[cls]
+
+
+# The slot functions of each kind of object saved by a checkpoint
+_GAME_SLOTS = _SlotFunctions(("events", "_delayed", "_character_hashes"))
+_PLAYER_SLOTS = _SlotFunctions(("events", "minions", "hand", "secrets", "auras", "mana_filters", "card_filters",
+                                "effect_count"))
+_HERO_SLOTS = _SlotFunctions(("events", "effects", "delayed"))
+_MINION_SLOTS = _SlotFunctions(("events", "effects", "delayed", "_effects_to_add"))
+_CARD_SLOTS = _SlotFunctions(("events",))
+_DECK_SLOTS = _SlotFunctions(("used", "_counts"))
+_PLAIN_SLOTS = _SlotFunctions()
+
+
+def _set_slots(obj, names, values):
+    # Sets the slots of an object which didn't all have values when it was saved, so can't be set all at once
+    for name, value in zip(names, values):
+        if value is not _UNSET:
+            setattr(obj, name, value)
+        elif hasattr(obj, name):
+            delattr(obj, name)
+
+
+# Stands for a slot which hasn't been given a value
+_UNSET = object()
+
+
+def _random_generators(game):
+    # The generators whose methods the game and its players use as random functions, each listed once
+    generators = []
+    for random_func in [game.random] + [player.random for player in game.players]:
+        generator = getattr(random_func, "__self__", None)
+        if isinstance(generator, random.Random) and all(generator is not other for other in generators):
+            generators.append(generator)
+    return generators
+
+
+def _copy_container(value):
+    # The shared empty events, and the empty tuples characters have until they are given delayed events or effects,
+    # can't be changed, so are kept rather than copied
+    if value is _NO_EVENTS or type(value) is tuple:
+        return value
+    return type(value)(value)
+
+
+class Checkpoint:
+    """
+    The state of a game at some point, which it can be returned to with :meth:`Game.rollback`.  Created by
+    :meth:`Game.checkpoint`.
+
+    Rather than creating a new game, as :meth:`Game.copy` does, a checkpoint records the attributes of each object
+    in the game, and rolling back puts them back on the same objects.  Characters, cards and players therefore keep
+    their identity, and the event handlers bound by cards, which refer to those objects, remain valid.
+
+    The state of the random number generators used by the game and its players is recorded too, so that playing on
+    from a rollback makes the same random choices as playing on from the checkpoint did.  Only generators whose methods
+    are used as random functions (such as the default ``random.randint``) can be recorded.
+    """
+    __slots__ = ["game", "saved", "decks", "agents", "random_states"]
+
+    def __init__(self, game):
+        #: The :class:`Game` this checkpoint belongs to
+        self.game = game
+        # Tuples of an object, the function which sets its slots (or None if some of them had no value), the values of
+        # its slots, a copy of its dictionary (or None if it has none), and the names and copies of attributes holding
+        # lists, dictionaries or sets which are changed in place, and so must be copied
+        self.saved = []
+        # Tuples of a deck and which of its cards hadn't been drawn
+        self.decks = []
+        self._save(game, _GAME_SLOTS)
+        for player in game.players:
+            self._save(player, _PLAYER_SLOTS)
+            self._save_character(player.hero, _HERO_SLOTS)
+            self._save(player.hero.power, _PLAIN_SLOTS)
+            if player.hero.weapon is not None:
+                self._save(player.hero.weapon, _CARD_SLOTS)
+            for minion in player.minions:
+                self._save_character(minion, _MINION_SLOTS)
+                if minion.card is not None:
+                    self._save(minion.card, _CARD_SLOTS)
+            for card in player.hand:
+                self._save(card, _CARD_SLOTS)
+            for secret in player.secrets:
+                self._save(secret, _CARD_SLOTS)
+            # A deck's cards are only changed once it owns them (see Deck._remove), so rather than being copied they
+            # are shared with the checkpoint
+            player.deck._owns_cards = False
+            self._save(player.deck, _DECK_SLOTS)
+            self.decks.append((player.deck, [not used for used in player.deck.used]))
+        # Tuples of an agent and a copy of its attributes.  Cards such as Misdirection replace an agent's methods until
+        # they have been used, so they are put back too.
+        self.agents = [(player.agent, dict(player.agent.__dict__)) for player in game.players
+                       if hasattr(player.agent, "__dict__")]
+        # Tuples of a random number generator and its state
+        self.random_states = [(generator, generator.getstate()) for generator in _random_generators(game)]
+
+    def _save(self, obj, slot_functions):
+        names, get, put, others, has_dict = slot_functions[type(obj)]
+        try:
+            values = get(obj)
+        except AttributeError:
+            values = tuple(getattr(obj, name, _UNSET) for name in names)
+            put = None
+            others = slot_functions.containers
+        copies = [(name, _copy_container(getattr(obj, name))) for name in others] if others else ()
+        attributes = dict(obj.__dict__) if has_dict else None
+        self.saved.append((obj, put, values, attributes, copies))
+
+    def _save_character(self, character, slot_functions):
+        self._save(character, slot_functions)
+        for effect in character.effects:
+            self._save(effect, _PLAIN_SLOTS)
+
+    def restore(self):
+        """
+        Puts every object in the game back the way it was when this checkpoint was made.  The checkpoint can be
+        restored any number of times.  Use :meth:`Game.rollback` rather than calling this directly.
+        """
+        # Cards drawn since the checkpoint may have been changed while in the player's hand, so are replaced
+        drawn = [[index for index in range(0, len(undrawn)) if undrawn[index] and deck.used[index]]
+                 for deck, undrawn in self.decks]
+        for obj, put, values, attributes, copies in self.saved:
+            if put is not None:
+                put(obj, values)
+            else:
+                _set_slots(obj, _PLAIN_SLOTS[type(obj)][0], values)
+            if attributes is not None:
+                obj.__dict__.clear()
+                obj.__dict__.update(attributes)
+            # The copies are copied again, so that the checkpoint is unchanged when the game changes
+            for name, value in copies:
+                setattr(obj, name, _copy_container(value))
+        for (deck, undrawn), indices in zip(self.decks, drawn):
+            if len(indices) > 0:
+                deck.cards = list(deck.cards)
+                deck._positions = dict(deck._positions)
+                deck._owns_cards = True
+            for index in indices:
+                card = deck.cards[index]
+                if deck._positions.get(card) == index:
+                    del deck._positions[card]
+                card = type(card)()
+                deck.cards[index] = card
+                deck._positions[card] = index
+        for player in self.game.players:
+            player._mana_costs = {}
+            player.auras_changed()
+        for agent, attributes in self.agents:
+            agent.__dict__.clear()
+            agent.__dict__.update(attributes)
+        for generator, state in self.random_states:
+            generator.setstate(state)
+
+
 class Game(Bindable):
+    #: If True, :meth:`state_hash` checks the hash it returns against one calculated entirely from scratch, and raises
+    #: a :class:`GameException` if they differ.  This is slow, and meant for debugging.
+    check_state_hash = False
+
     def __init__(self, decks, agents, random_func=random.randint):
         super().__init__()
-        self.delayed_minions = set()
+        #: Increased by every method which changes the state of the game, so that anything derived from the game's
+        #: state can tell when it is out of date.  It only ever increases, and copies of a game start from the
+        #: epoch of the game they were copied from.
+        #:
+        #: Cards and effects may change attributes directly, but only while a card is played, a character attacks, a
+        #: hero power is used or a turn starts or ends, and each of these increases the epoch when it begins and
+        #: again when it finishes.
+        self.epoch = 0
+        # The results stored by :meth:`memoize`, which are only valid while :attr:`epoch` is _memo_epoch
+        self._memo = {}
+        self._memo_epoch = 0
+        # A heap of the characters with delayed events, as tuples of when the character was born, the order it was
+        # added in (so that characters born at the same time are taken in the order they were added) and the character
+        self._delayed = []
+        self._delayed_order = 0
+        # The part of the state hash for each hero and minion, as a tuple of the index of its player, its position
+        # (-1 for a hero), the attributes the part was found from and the part itself, and the exclusive or of all of
+        # the parts.  See :meth:`state_hash`.
+        self._character_hashes = {}
+        self._characters_hash = 0
         self.random = random_func
         first_player = random_func(0, 1)
         if first_player is 0:
@@ -1510,6 +2356,9 @@ class Game(Bindable):
         self.current_player.opponent = self.other_player
         self.other_player.opponent = self.current_player
         self.game_ended = False
+        #: True once the current player has ended their turn with :class:`~hearthbreaker.actions.EndTurn`, until the
+        #: next turn starts.  No actions are legal in the meantime.
+        self.turn_over = False
         self.minion_counter = 0
         for i in range(0, 3):
             self.players[0].draw()
@@ -1517,11 +2366,30 @@ class Game(Bindable):
         for i in range(0, 4):
             self.players[1].draw()
 
+    def delay(self, character):
+        """
+        Records that a character has delayed events, which will be activated by the next call to
+        :meth:`check_delayed`.  Called by :meth:`Character.delayed_trigger`.
+
+        :param Character character: The character with delayed events
+        """
+        self._delayed_order += 1
+        heapq.heappush(self._delayed, (character.born, self._delayed_order, character))
+
     def check_delayed(self):
-        sorted_minions = sorted(self.delayed_minions, key=lambda m: m.born)
-        self.delayed_minions = set()
-        for minion in sorted_minions:
-            minion.activate_delayed()
+        """
+        Activates the delayed events of every character, in the order the characters were born.  Events delayed
+        while this happens are left for the next call.
+        """
+        if not self._delayed:
+            delayed_checks.hits += 1
+            return
+        delayed_checks.misses += 1
+        delayed = self._delayed
+        self._delayed = []
+        while delayed:
+            # A character may have been added more than once, in which case its events are activated the first time
+            heapq.heappop(delayed)[2].activate_delayed()
 
     def pre_game(self):
         card_keep_index = self.players[0].agent.do_card_check(self.players[0].hand)
@@ -1547,6 +2415,7 @@ class Game(Bindable):
             self.players[1].put_back(card)
 
         self.players[1].hand.append(TheCoin())
+        self.epoch += 1
 
     def start(self):
         self.pre_game()
@@ -1560,6 +2429,8 @@ class Game(Bindable):
         self._end_turn()
 
     def _start_turn(self):
+        self.epoch += 1
+        self.turn_over = False
         if self.current_player == self.players[0]:
             self.current_player = self.players[1]
             self.other_player = self.players[0]
@@ -1582,11 +2453,14 @@ class Game(Bindable):
         self.current_player.hero.power.used = False
         self.current_player.hero.active = True
         self.current_player.draw()
+        self.epoch += 1
 
     def game_over(self):
         self.game_ended = True
+        self.epoch += 1
 
     def _end_turn(self):
+        self.epoch += 1
         self.current_player.trigger("turn_ended")
         self.current_player.hero.temp_attack = 0
         self.other_player.hero.temp_attack = 0
@@ -1615,9 +2489,48 @@ class Game(Bindable):
             secret.deactivate(self.other_player)
 
         self.check_delayed()
+        self.epoch += 1
+
+    def checkpoint(self):
+        """
+        Records the state of this game, so that it can be returned to with :meth:`rollback`.  This is much faster
+        than :meth:`copy`, and is meant for searches which try an action and then undo it, such as trying each order
+        of attacks in a turn.
+
+        A checkpoint is a snapshot rather than a record of changes.  Making it takes time and memory in proportion to
+        the number of minions, cards in hand and effects in the game, and rolling back to it takes about the same
+        time however few or many changes have been made since.  Everything an agent can reach through the game is
+        recorded, as are the attributes of the agents themselves and the state of the game's random number generator,
+        but state kept by cards in their own event handlers (rather than on a minion, player or effect) is not.
+
+        :rtype: Checkpoint
+        """
+        return Checkpoint(self)
+
+    def rollback(self, checkpoint):
+        """
+        Returns this game to the state it was in when a checkpoint was made.  Minions, cards and other objects which
+        were in the game then are the same objects afterwards, while anything created since is discarded.  The
+        :attr:`epoch` still increases, so results memoized since the checkpoint are not reused.
+
+        :param Checkpoint checkpoint: A checkpoint made by :meth:`checkpoint` on this game
+        """
+        if checkpoint.game is not self:
+            raise GameException("That checkpoint belongs to another game")
+        epoch = self.epoch
+        checkpoint.restore()
+        self.epoch = epoch + 1
+        self._memo = {}
 
     def copy(self):
         copied_game = copy.copy(self)
+        copied_game.events = _NO_EVENTS
+        copied_game._memo = {}
+        # The copied characters are new objects, so their parts of the hash are found again
+        copied_game._character_hashes = {}
+        copied_game._characters_hash = 0
+        # The copied minions have no delayed events, and sharing the heap would fill this game's with the copy's
+        copied_game._delayed = []
         copied_game.players = [player.copy(copied_game) for player in self.players]
         if self.current_player is self.players[0]:
             copied_game.current_player = copied_game.players[0]
@@ -1629,6 +2542,18 @@ class Game(Bindable):
         copied_game.current_player.opponent = copied_game.other_player
         copied_game.other_player.opponent = copied_game.current_player
 
+        # Effects and auras are only applied once both players have been copied, as some of them change both players.
+        # The copied minions' health already includes any bonus from them, so is put back afterwards.
+        healths = [[minion.health for minion in player.minions] for player in copied_game.players]
+        for player in copied_game.players:
+            for minion in player.minions:
+                for effect in minion._effects_to_add:
+                    minion.add_effect(effect)
+                minion._add_copied_auras()
+        for player, player_healths in zip(copied_game.players, healths):
+            for minion, health in zip(player.minions, player_healths):
+                minion.health = health
+
         for secret in copied_game.other_player.secrets:
             secret.activate(copied_game.other_player)
         return copied_game
@@ -1636,8 +2561,16 @@ class Game(Bindable):
     def play_card(self, card):
         if self.game_ended:
             raise GameException("The game has ended")
+        if card in self.current_player._shared_cards and card in self.current_player.hand:
+            # Playing a card (and checking if it can be played) changes it, so a card shared with the game this game
+            # was copied from is replaced by a card of its own.  A copy starts without mana filters, and the filters
+            # added since only match cards which have come into the hand since, so none of them match the card.
+            index = self.current_player.hand.index(card)
+            card = type(card)()
+            self.current_player.hand[index] = card
         if not card.can_use(self.current_player, self):
             raise GameException("That card cannot be used")
+        self.epoch += 1
         self.current_player.trigger("card_played", card)
         self.current_player.mana -= card.mana_cost(self.current_player)
         if card.overload != 0:
@@ -1652,7 +2585,155 @@ class Game(Bindable):
             self.current_player.trigger("card_used", card)
             self.current_player.cards_played += 1
             self.check_delayed()
+        self.epoch += 1
 
     def remove_minion(self, minion, player):
         player.minions.remove(minion)
+        player.auras_changed()
         self.trigger("minion_removed", minion, player)
+
+    def state_hash(self):
+        """
+        Finds a 64 bit :mod:`Zobrist hash <hearthbreaker.zobrist>` of the state of this game.  Games in the same state
+        have the same hash, and games in different states almost certainly do not, so the hash can be used to find
+        repeated states, such as in a transposition table, or to check that a replayed game has not diverged.
+
+        The hash covers the current player, and for each player their mana, hero, weapon, minions, hand, deck,
+        secrets and graveyard, including the effects on each character.  It does not cover the event handlers bound by
+        cards, which are determined by the cards themselves.
+
+        The hash is made of parts, each of which is cached along with the attributes it was found from:
+
+        * Each hero and minion has its own part.  Every call walks the heroes and minions on the board and compares
+          each one's attributes with those its part was found from, and only mixes the part again if they differ or
+          the character has moved to another position.  Minions which have left the board have their parts taken out
+          of the hash, and minions which have joined it have theirs added.
+        * Each player's mana, weapon, hand, secrets and graveyard make up another part, checked in the same way.
+        * The hash of each deck is the only part which is updated as the game changes, as cards are drawn, taken and
+          put back, so it is never walked.
+
+        A call therefore still takes time in proportion to the size of the board, and saves only the cost of mixing
+        the parts which haven't changed.  The characters are walked because cards change their attributes directly,
+        without the game being told of it, so there is nothing which could keep their parts up to date.  A deck, on
+        the other hand, is left out of date if its cards are changed other than by :meth:`Deck.draw`,
+        :meth:`Deck.take` and :meth:`Deck.put_back`.  Setting :attr:`check_state_hash` will find any such changes.
+
+        :rtype: int
+        """
+        zobrist = hearthbreaker.zobrist
+        state_hash = zobrist.key(("current", self.players.index(self.current_player), self.game_ended))
+        state_hash ^= self._update_character_hashes()
+        for index in range(0, 2):
+            player = self.players[index]
+            state = _player_state(player)
+            part = player._hash_part
+            if part is None or part[0] != index or part[1] != state:
+                part = (index, state, _player_hash(index, state))
+                player._hash_part = part
+            state_hash ^= part[2] ^ zobrist.for_player(player.deck.state_hash, index)
+        if self.check_state_hash:
+            expected = self.calculate_state_hash(True)
+            if state_hash != expected:
+                raise GameException("State hash {0:016x} should be {1:016x}".format(state_hash, expected))
+        return state_hash
+
+    def calculate_state_hash(self, recalculate_decks=False):
+        """
+        Calculates the hash returned by :meth:`state_hash` from scratch, without using the parts of it kept by this
+        game.
+
+        :param boolean recalculate_decks: If True, then the hash of each deck is also calculated from scratch rather
+                                          than using :attr:`Deck.state_hash`
+        :rtype: int
+        """
+        zobrist = hearthbreaker.zobrist
+        state_hash = zobrist.key(("current", self.players.index(self.current_player), self.game_ended))
+        for index in range(0, 2):
+            player = self.players[index]
+            state_hash ^= _player_hash(index, _player_state(player))
+            state_hash ^= _hero_hash(index, _hero_state(player.hero))
+            for position in range(0, len(player.minions)):
+                state_hash ^= _minion_hash(index, position, _minion_state(player.minions[position]))
+            if recalculate_decks:
+                state_hash ^= zobrist.for_player(player.deck.calculate_state_hash(), index)
+            else:
+                state_hash ^= zobrist.for_player(player.deck.state_hash, index)
+        return state_hash
+
+    def _update_character_hashes(self):
+        # Replaces the parts of the hash of the characters which have changed or moved, and takes out the parts of
+        # those which have left the game
+        hashes = self._character_hashes
+        total = self._characters_hash
+        for index in range(0, 2):
+            player = self.players[index]
+            hero = player.hero
+            state = _hero_state(hero)
+            part = hashes.get(hero)
+            if part is None or part[0] != index or part[2] != state:
+                if part is not None:
+                    total ^= part[3]
+                part = (index, -1, state, _hero_hash(index, state))
+                hashes[hero] = part
+                total ^= part[3]
+            position = 0
+            for minion in player.minions:
+                state = _minion_state(minion)
+                part = hashes.get(minion)
+                if part is None or part[0] != index or part[1] != position or part[2] != state:
+                    if part is not None:
+                        total ^= part[3]
+                    part = (index, position, state, _minion_hash(index, position, state))
+                    hashes[minion] = part
+                    total ^= part[3]
+                position += 1
+        if len(hashes) != 2 + len(self.players[0].minions) + len(self.players[1].minions):
+            characters = set(self.players[0].minions + self.players[1].minions)
+            characters.add(self.players[0].hero)
+            characters.add(self.players[1].hero)
+            for character in [character for character in hashes if character not in characters]:
+                total ^= hashes.pop(character)[3]
+        self._characters_hash = total
+        return total
+
+    def legal_actions(self):
+        """
+        Lists every action the current player can take: each card they can play, with each of its targets, places on
+        the board and options, each attack they can make, their hero power with each of its targets, and ending their
+        turn.  Any action can be taken by calling its ``perform`` method with this game.
+
+        The actions are kept until :attr:`epoch` changes, so they are only found again once the game has changed.
+
+        :return: A tuple of :class:`~hearthbreaker.actions.PlayCard`, :class:`~hearthbreaker.actions.Attack`,
+                 :class:`~hearthbreaker.actions.UsePower` and :class:`~hearthbreaker.actions.EndTurn`
+        :rtype: tuple
+        """
+        return self.memoize("legal_actions", hearthbreaker.actions.find_legal_actions, self)
+
+    def memoize(self, key, function, *args):
+        """
+        Returns the result of calling a function, which is only called again once the game has changed.  Results are
+        kept until :attr:`epoch` changes, so the function must depend only on the state of this game and its
+        arguments.
+
+        For example, the minions an agent may attack could be cached with::
+
+            targets = game.memoize("attack_targets", find_targets, game)
+
+        :param key: Identifies the result, together with ``args``.  Must be hashable and distinct from the keys
+                    used by any other module.
+        :param function function: The function to call
+        :param list args: The arguments to call the function with.  Must be hashable.
+        :return: The result of ``function(*args)``, as of the current epoch
+        """
+        if self._memo_epoch != self.epoch:
+            self._memo = {}
+            self._memo_epoch = self.epoch
+        memo_key = (key, function) + args
+        if memo_key in self._memo:
+            memo_cache.hits += 1
+            return self._memo[memo_key]
+        memo_cache.misses += 1
+        result = function(*args)
+        self._memo[memo_key] = result
+        return result
@@ -24,6 +24,10 @@ def powers(character_class):
 
 
 class Power:
+    #: True if the power is used on a target, which is found with :meth:`Hero.find_power_target
+    #: <hearthbreaker.game_objects.Hero.find_power_target>`
+    targeted = False
+
     def __init__(self, hero):
         self.hero = hero
         self.used = False
@@ -36,6 +40,7 @@ class Power:
             self.hero.player.trigger("used_power")
             self.hero.player.mana -= 2
             self.used = True
+            self.hero.player.game.epoch += 1
 
 
 class DruidPower(Power):
@@ -58,6 +63,8 @@ class HunterPower(Power):
 
 
 class MagePower(Power):
+    targeted = True
+
     def __init__(self, hero):
         super().__init__(hero)
 
@@ -69,6 +76,8 @@ class MagePower(Power):
 
 
 class PriestPower(Power):
+    targeted = True
+
     def __init__(self, hero):
         super().__init__(hero)
 
@@ -86,6 +95,8 @@ class PriestPower(Power):
 
 # Special power the priest can obtain via the card Shadowform
 class MindSpike(Power):
+    targeted = True
+
     def __init__(self, hero):
         super().__init__(hero)
 
@@ -100,6 +111,8 @@ class MindSpike(Power):
 
 # Special power the priest can obtain via the card Shadowform
 class MindShatter(Power):
+    targeted = True
+
     def __init__(self, hero):
         super().__init__(hero)
 
@@ -117,17 +130,9 @@ class PaladinPower(Power):
         super().__init__(hero)
 
     def use(self):
-        class SilverHandRecruit(hearthbreaker.game_objects.MinionCard):
-            def __init__(self):
-                super().__init__("Silver Hand Recruit", 1, hearthbreaker.constants.CHARACTER_CLASS.PALADIN,
-                                 hearthbreaker.constants.CARD_RARITY.SPECIAL)
-
-            def create_minion(self, player):
-                return hearthbreaker.game_objects.Minion(1, 1)
-
         super().use()
 
-        recruit_card = SilverHandRecruit()
+        recruit_card = hearthbreaker.game_objects.card_lookup("Silver Hand Recruit")
         recruit_card.summon(self.hero.player, self.hero.player.game, len(self.hero.player.minions))
 
 
@@ -136,18 +141,9 @@ class RoguePower(Power):
         super().__init__(hero)
 
     def use(self):
-        class WickedKnife(hearthbreaker.game_objects.WeaponCard):
-            def __init__(self):
-                super().__init__("Wicked Knife", 1, hearthbreaker.constants.CHARACTER_CLASS.ROGUE,
-                                 hearthbreaker.constants.CARD_RARITY.SPECIAL)
-
-            def create_weapon(self, player):
-                weapon = hearthbreaker.game_objects.Weapon(1, 2)
-                return weapon
-
         super().use()
 
-        knife = WickedKnife().create_weapon(self.hero.player)
+        knife = hearthbreaker.game_objects.card_lookup("Wicked Knife").create_weapon(self.hero.player)
         knife.equip(self.hero.player)
 
 
@@ -182,61 +178,20 @@ class ShamanPower(Power):
         return super().can_use()
 
     def use(self):
-        class HealingTotem(hearthbreaker.game_objects.MinionCard):
-            def __init__(self):
-                super().__init__("Healing Totem", 1, hearthbreaker.constants.CHARACTER_CLASS.SHAMAN,
-                                 hearthbreaker.constants.CARD_RARITY.SPECIAL, hearthbreaker.constants.MINION_TYPE.TOTEM)
-
-            def create_minion(self, player):
-                def heal_friendly_minions():
-                    for m in player.minions:
-                        m.heal(player.effective_heal_power(1), self)
-
-                def silence():
-                    player.unbind("turn_ended", heal_friendly_minions)
-
-                minion = hearthbreaker.game_objects.Minion(0, 2)
-                player.bind("turn_ended", heal_friendly_minions)
-                minion.bind_once("silenced", silence)
-                return minion
-
-        class SearingTotem(hearthbreaker.game_objects.MinionCard):
-            def __init__(self):
-                super().__init__("Searing Totem", 1, hearthbreaker.constants.CHARACTER_CLASS.SHAMAN,
-                                 hearthbreaker.constants.CARD_RARITY.SPECIAL, hearthbreaker.constants.MINION_TYPE.TOTEM)
-
-            def create_minion(self, player):
-                return hearthbreaker.game_objects.Minion(1, 1)
-
-        class StoneclawTotem(hearthbreaker.game_objects.MinionCard):
-            def __init__(self):
-                super().__init__("Stoneclaw Totem", 1, hearthbreaker.constants.CHARACTER_CLASS.SHAMAN,
-                                 hearthbreaker.constants.CARD_RARITY.SPECIAL, hearthbreaker.constants.MINION_TYPE.TOTEM)
-
-            def create_minion(self, player):
-                return hearthbreaker.game_objects.Minion(0, 2, taunt=True)
-
-        class WrathOfAirTotem(hearthbreaker.game_objects.MinionCard):
-            def __init__(self):
-                super().__init__("Wrath of Air Totem", 1, hearthbreaker.constants.CHARACTER_CLASS.SHAMAN,
-                                 hearthbreaker.constants.CARD_RARITY.SPECIAL, hearthbreaker.constants.MINION_TYPE.TOTEM)
-
-            def create_minion(self, player):
-                return hearthbreaker.game_objects.Minion(0, 2, spell_damage=1)
-
         super().use()
 
         totems = []
         if not self.healing_totem:
-            totems.append(HealingTotem())
+            totems.append("Healing Totem")
         if not self.searing_totem:
-            totems.append(SearingTotem())
+            totems.append("Searing Totem")
         if not self.stoneclaw_totem:
-            totems.append(StoneclawTotem())
+            totems.append("Stoneclaw Totem")
         if not self.wrath_of_air_totem:
-            totems.append(WrathOfAirTotem())
+            totems.append("Wrath of Air Totem")
 
-        random_totem = totems[self.hero.player.game.random(0, len(totems) - 1)]
+        totem_name = totems[self.hero.player.game.random(0, len(totems) - 1)]
+        random_totem = hearthbreaker.game_objects.card_lookup(totem_name)
         random_totem.summon(self.hero.player, self.hero.player.game, len(self.hero.player.minions))
 
 
@@ -255,17 +210,9 @@ class JaraxxusPower(Power):
         super().__init__(hero)
 
     def use(self):
-        class Infernal(hearthbreaker.game_objects.MinionCard):
-            def __init__(self):
-                super().__init__("Infernal", 6, hearthbreaker.constants.CHARACTER_CLASS.LORD_JARAXXUS,
-                                 hearthbreaker.constants.CARD_RARITY.SPECIAL)
-
-            def create_minion(self, player):
-                return hearthbreaker.game_objects.Minion(6, 6, hearthbreaker.constants.MINION_TYPE.DEMON)
-
         super().use()
 
-        infernal_card = Infernal()
+        infernal_card = hearthbreaker.game_objects.card_lookup("Infernal")
         infernal_card.summon(self.hero.player, self.hero.player.game, len(self.hero.player.minions))
 
 
@@ -0,0 +1,529 @@
+"""
+Profilers which find where the time spent simulating games goes.
+
+:class:`EventProfiler` counts and times the events triggered through :meth:`Bindable.trigger
+<hearthbreaker.game_objects.Bindable.trigger>`.  :class:`CardProfiler` attributes time and events to the cards
+responsible for them.  Both do so by replacing methods while the profiler is running, and putting the originals back
+when it stops, so that games played without a profiler run exactly the code they would otherwise.
+
+Example::
+
+    from hearthbreaker.profiling import EventProfiler
+
+    with EventProfiler() as profiler:
+        game.start()
+    print(profiler.table())
+
+The profile of a whole batch of games is taken by :func:`run_batch <hearthbreaker.batch.run_batch>` with
+``profile_events=True`` or ``profile_cards=True``, or by ``run_games.py --profile-events`` or ``--profile-cards``.
+"""
+import json
+import time
+
+import hearthbreaker.cards
+import hearthbreaker.game_objects
+from hearthbreaker.game_objects import Bindable, Minion, MinionCard, WeaponCard, GameException
+
+
+#: The events listed in ``events.md``, by the class which triggers them.  The unit tests check that this is up to
+#: date with ``events.md``.
+EVENTS = [
+    ("Player", ["card_drawn", "card_put_back", "card_destroyed", "card_discarded", "card_played", "card_used",
+                "spell_cast", "minion_placed", "minion_played", "minion_summoned", "after_minion_added",
+                "minion_died", "turn_started", "turn_ended", "attacking", "secret_revealed", "overloaded", "attack"]),
+    ("Game", ["kept_cards", "minion_removed", "minion_healed", "minion_damaged"]),
+    ("SavedGame (Game)", ["action_replayed"]),
+    ("Character", ["attack", "attack_completed", "attacked", "damaged", "healed", "damaged_by_spell", "hero_damaged",
+                   "physically_damaged", "damaged_by_minion", "damaged_by_player", "did_damage", "died",
+                   "attack_changed", "health_increased", "health_decreased", "health_changed", "enraged",
+                   "unenraged"]),
+    ("Minion (Character)", ["added_to_board", "silenced", "copied"]),
+    ("Hero (Character)", ["armor_increased", "used_power", "found_power_target", "fatigue_damage"]),
+    ("Weapon", ["destroyed"]),
+]
+
+
+def _event_names():
+    names = []
+    for section, events in EVENTS:
+        for event in events:
+            if event not in names:
+                names.append(event)
+    return names
+
+
+class EventStatistics:
+    """
+    The counts and times recorded for one event by an :class:`EventProfiler`
+    """
+    __slots__ = ["triggers", "handlers", "total_time", "self_time", "max_handlers", "depth"]
+
+    def __init__(self):
+        #: The number of times the event was triggered, whether or not any functions were bound to it
+        self.triggers = 0
+        #: The number of functions bound to the event when it was triggered, over every trigger
+        self.handlers = 0
+        #: The time spent dispatching the event, in seconds, including any events triggered by its handlers.  Time
+        #: spent in an event triggered while it was already being dispatched is only counted once.
+        self.total_time = 0.0
+        #: The time spent dispatching the event, in seconds, not including any events triggered by its handlers
+        self.self_time = 0.0
+        #: The most functions bound to the event when it was triggered
+        self.max_handlers = 0
+        #: The number of dispatches of the event in progress
+        self.depth = 0
+
+    def add(self, other):
+        """
+        Adds the counts and times of another :class:`EventStatistics` to these
+
+        :param EventStatistics other: The statistics to add
+        """
+        self.triggers += other.triggers
+        self.handlers += other.handlers
+        self.total_time += other.total_time
+        self.self_time += other.self_time
+        self.max_handlers = max(self.max_handlers, other.max_handlers)
+
+    def to_dict(self):
+        return {"triggers": self.triggers, "handlers": self.handlers, "total_time": self.total_time,
+                "self_time": self.self_time, "max_handlers": self.max_handlers}
+
+
+class _Profiler:
+    # The parts common to the profilers: starting and stopping, and combining and writing out the statistics, which
+    # are kept in a dictionary mapping the name of each event or card to an object with add() and to_dict() methods
+
+    # The statistics kept for each event or card
+    _statistics_type = None
+    # The profiler of each type which is running, if any
+    _running = None
+
+    def __init__(self, timer=time.perf_counter):
+        """
+        :param function timer: The function which returns the time, in seconds
+        """
+        self.statistics = {}
+        self.timer = timer
+        # The original trigger, and the one which replaces it while the profiler is running
+        self._trigger = None
+        self._profiled_trigger = None
+
+    def start(self):
+        """
+        Starts profiling
+        """
+        if type(self)._running is not None:
+            raise GameException("A {0} is already running".format(type(self).__name__))
+        type(self)._running = self
+        self._trigger = Bindable.trigger
+        self._start()
+
+    def stop(self):
+        """
+        Stops profiling, putting back the original methods.  Profilers which are running at the same time must be
+        stopped in the reverse order to that they were started in.
+        """
+        if type(self)._running is not self:
+            raise GameException("This {0} isn't running".format(type(self).__name__))
+        if Bindable.trigger is not self._profiled_trigger:
+            raise GameException("Profilers must be stopped in the reverse order to that they were started in")
+        self._stop()
+        Bindable.trigger = self._trigger
+        self._trigger = None
+        self._profiled_trigger = None
+        type(self)._running = None
+
+    def _start(self):
+        pass
+
+    def _stop(self):
+        pass
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _get_statistics(self, name):
+        statistics = self.statistics.get(name)
+        if statistics is None:
+            statistics = self.statistics[name] = self._statistics_type()
+        return statistics
+
+    def add(self, other):
+        """
+        Adds the statistics recorded by another profiler of the same type to this one's
+
+        :param other: The profiler to add
+        """
+        for name, statistics in other.statistics.items():
+            self._get_statistics(name).add(statistics)
+
+    def _names(self):
+        return sorted(self.statistics)
+
+    def to_dict(self):
+        """
+        :return: A dictionary mapping the name of each event or card to a dictionary of its statistics, with the same
+                 names as the attributes of :class:`EventStatistics` or :class:`CardStatistics`
+        """
+        empty = self._statistics_type()
+        return dict((name, self.statistics.get(name, empty).to_dict()) for name in self._names())
+
+    def write_json(self, file):
+        """
+        Writes the profile as JSON, in the form returned by :meth:`to_dict`
+
+        :param file: The file to write to, either as a path or as a file open for writing
+        """
+        if 'write' not in dir(file):
+            file = open(file, "w")
+            json.dump(self.to_dict(), file, indent=2, sort_keys=True)
+            file.close()
+        else:
+            json.dump(self.to_dict(), file, indent=2, sort_keys=True)
+
+    def _table(self, heading, rows, columns):
+        # columns is a list of (heading, key, scale) for each statistic, where the times are in seconds and
+        # are scaled to milliseconds
+        width = max([len(name) for name, values in rows] + [24])
+        lines = [" ".join(["{0:<{1}}".format(heading, width)] + ["{0:>12}".format(column[0]) for column in columns])]
+        for name, values in rows:
+            cells = ["{0:<{1}}".format(name, width)]
+            for heading, key, scale in columns:
+                if scale is None:
+                    cells.append("{0:>12}".format(values[key]))
+                else:
+                    cells.append("{0:>12.2f}".format(values[key] * scale))
+            lines.append(" ".join(cells))
+        return "\n".join(lines)
+
+
+class EventProfiler(_Profiler):
+    """
+    Records, for each event, how many times it was triggered, how many functions it was dispatched to, how long the
+    dispatch took and how many functions were bound to it at most.  Only one event profiler can run at a time.
+
+    The profile covers every event listed in ``events.md`` (see :data:`EVENTS`), whether or not it was triggered,
+    followed by any others which were.  Profiles taken in different processes, such as by the workers of a batch, can
+    be combined with :meth:`add`.
+    """
+
+    _statistics_type = EventStatistics
+    _running = None
+
+    def __init__(self, timer=time.perf_counter):
+        """
+        :param function timer: The function which returns the time, in seconds
+        """
+        super().__init__(timer)
+        #: Maps the name of each event triggered to its :class:`EventStatistics`
+        self.statistics = {}
+
+    def _start(self):
+        original = self._trigger
+        get_statistics = self._get_statistics
+        timer = self.timer
+        # The time spent in events triggered by the handlers of each dispatch in progress, innermost last
+        nested = [0.0]
+
+        def trigger(bindable, event, *args):
+            event_statistics = get_statistics(event)
+            handler_count = len(bindable.events.get(event, ()))
+            event_statistics.triggers += 1
+            event_statistics.handlers += handler_count
+            if handler_count > event_statistics.max_handlers:
+                event_statistics.max_handlers = handler_count
+            event_statistics.depth += 1
+            nested.append(0.0)
+            start = timer()
+            try:
+                original(bindable, event, *args)
+            finally:
+                elapsed = timer() - start
+                event_statistics.depth -= 1
+                if event_statistics.depth == 0:
+                    event_statistics.total_time += elapsed
+                event_statistics.self_time += elapsed - nested.pop()
+                nested[-1] += elapsed
+
+        trigger.__doc__ = original.__doc__
+        self._profiled_trigger = trigger
+        Bindable.trigger = trigger
+
+    def events(self):
+        """
+        :return: The names of the events in the profile: those in :data:`EVENTS`, followed by any others which were
+                 triggered, in alphabetical order
+        :rtype: list[str]
+        """
+        names = _event_names()
+        return names + sorted(event for event in self.statistics if event not in names)
+
+    def _names(self):
+        return self.events()
+
+    def table(self, sort="self_time", all_events=False):
+        """
+        Formats the profile as a text table.
+
+        :param string sort: The statistic to sort the events by, largest first
+        :param boolean all_events: If True, events which were never triggered are included
+        :rtype: str
+        """
+        rows = [(event, values) for event, values in self.to_dict().items()
+                if all_events or values["triggers"] > 0]
+        rows.sort(key=lambda row: (-row[1][sort], row[0]))
+        return self._table("event", rows, [("triggers", "triggers", None), ("handlers", "handlers", None),
+                                           ("max", "max_handlers", None), ("total (ms)", "total_time", 1000),
+                                           ("self (ms)", "self_time", 1000)])
+
+
+class CardStatistics:
+    """
+    The counts and times attributed to one card by a :class:`CardProfiler`
+    """
+    __slots__ = ["uses", "battlecries", "deathrattles", "handler_calls", "triggers", "total_time", "self_time",
+                 "depth"]
+
+    def __init__(self):
+        #: The number of times the card was used by :meth:`Card.use <hearthbreaker.game_objects.Card.use>`
+        self.uses = 0
+        #: The number of times the battlecry of a minion or weapon created by the card was called
+        self.battlecries = 0
+        #: The number of times the deathrattle of a minion created by the card was called
+        self.deathrattles = 0
+        #: The number of times a function the card bound to an event was called
+        self.handler_calls = 0
+        #: The number of events triggered while the card was responsible
+        self.triggers = 0
+        #: The time the card was responsible for, in seconds, including time spent in other cards it caused to act
+        self.total_time = 0.0
+        #: The time the card was responsible for, in seconds, not including time spent in other cards
+        self.self_time = 0.0
+        #: The number of calls attributed to the card in progress
+        self.depth = 0
+
+    def add(self, other):
+        """
+        Adds the counts and times of another :class:`CardStatistics` to these
+
+        :param CardStatistics other: The statistics to add
+        """
+        self.uses += other.uses
+        self.battlecries += other.battlecries
+        self.deathrattles += other.deathrattles
+        self.handler_calls += other.handler_calls
+        self.triggers += other.triggers
+        self.total_time += other.total_time
+        self.self_time += other.self_time
+
+    def to_dict(self):
+        return {"uses": self.uses, "battlecries": self.battlecries, "deathrattles": self.deathrattles,
+                "handler_calls": self.handler_calls, "triggers": self.triggers, "total_time": self.total_time,
+                "self_time": self.self_time}
+
+
+class _Attributed:
+    # Wraps a function belonging to a card, so that the profiler which created it attributes calls to the card.  A
+    # wrapper equals the function it wraps, so that Bindable.unbind finds the function it was bound as.
+    __slots__ = ["function", "name", "count", "profiler"]
+
+    def __init__(self, function, name, count, profiler):
+        self.function = function
+        self.name = name
+        self.count = count
+        self.profiler = profiler
+
+    def __call__(self, *args):
+        return self.profiler._call(self.name, self.count, self.function, args)
+
+    def __eq__(self, other):
+        if isinstance(other, _Attributed):
+            other = other.function
+        return self.function == other
+
+    def __hash__(self):
+        return hash(self.function)
+
+
+def _card_classes():
+    # Every card class, which are all defined once the cards have been imported, apart from those defined in functions
+    classes = []
+    pending = [hearthbreaker.game_objects.Card]
+    while len(pending) > 0:
+        card_class = pending.pop()
+        classes.append(card_class)
+        pending.extend(card_class.__subclasses__())
+    return classes
+
+
+class CardProfiler(_Profiler):
+    """
+    Attributes wall time and events to the card responsible for them.  A card is responsible for:
+
+     * its :meth:`Card.use <hearthbreaker.game_objects.Card.use>` and the :meth:`create_minion
+       <hearthbreaker.game_objects.MinionCard.create_minion>` or :meth:`create_weapon
+       <hearthbreaker.game_objects.WeaponCard.create_weapon>` which creates its minion or weapon
+     * the battlecry and deathrattle of that minion or weapon
+     * every function bound to an event while it is responsible, such as those bound by ``create_minion``, and
+       those bound by those functions in turn
+
+    Time spent while a card is responsible is counted towards its :attr:`CardStatistics.total_time`, and towards its
+    :attr:`CardStatistics.self_time` unless another card becomes responsible, as when a minion played by one card
+    triggers another's handler.  Only one card profiler can run at a time.
+
+    Only cards whose classes exist when the profiler starts are profiled, so cards defined inside functions, such as
+    the tokens created by some minions, count towards the card which created them.  Profiles taken in different
+    processes, such as by the workers of a batch, can be combined with :meth:`add`.
+    """
+
+    _statistics_type = CardStatistics
+    _running = None
+
+    def __init__(self, timer=time.perf_counter):
+        """
+        :param function timer: The function which returns the time, in seconds
+        """
+        super().__init__(timer)
+        #: Maps the name of each card which was responsible for anything to its :class:`CardStatistics`
+        self.statistics = {}
+        # The names of the cards responsible for the calls in progress, innermost last
+        self._responsible = []
+        # The time spent in calls of other cards by each call in progress, innermost last
+        self._nested = [0.0]
+        # The methods replaced while the profiler is running, as (class, name, original method)
+        self._replaced = []
+
+    def _call(self, name, count, function, args):
+        # Calls a function the named card is responsible for, counting the call in the given statistic, if any
+        if CardProfiler._running is not self:
+            return function(*args)
+        card_statistics = self._get_statistics(name)
+        if count is not None:
+            setattr(card_statistics, count, getattr(card_statistics, count) + 1)
+        card_statistics.depth += 1
+        self._responsible.append(name)
+        self._nested.append(0.0)
+        start = self.timer()
+        try:
+            return function(*args)
+        finally:
+            elapsed = self.timer() - start
+            self._responsible.pop()
+            card_statistics.depth -= 1
+            if card_statistics.depth == 0:
+                card_statistics.total_time += elapsed
+            card_statistics.self_time += elapsed - self._nested.pop()
+            self._nested[-1] += elapsed
+
+    def _attribute(self, function, count):
+        # Wraps a function bound or created while a card is responsible, so that the card is responsible for its calls
+        if function is None or isinstance(function, _Attributed) or len(self._responsible) == 0:
+            return function
+        return _Attributed(function, self._responsible[-1], count, self)
+
+    def _replace(self, owner, name, method):
+        self._replaced.append((owner, name, owner.__dict__[name]))
+        setattr(owner, name, method)
+
+    def _start(self):
+        profiler = self
+        original_trigger = self._trigger
+        responsible = self._responsible
+        get_statistics = self._get_statistics
+
+        def trigger(bindable, event, *args):
+            if len(responsible) > 0:
+                get_statistics(responsible[-1]).triggers += 1
+            original_trigger(bindable, event, *args)
+
+        def replace_bind(name):
+            original = Bindable.__dict__[name]
+
+            def bind(bindable, event, function):
+                original(bindable, event, profiler._attribute(function, "handler_calls"))
+            bind.__doc__ = original.__doc__
+            self._replace(Bindable, name, bind)
+
+        # The cards whose use() is in progress, innermost last, so that calls to super().use() are not counted again
+        using = []
+
+        def replace_use(card_class):
+            original = card_class.__dict__["use"]
+
+            def use(card, player, game):
+                if len(using) > 0 and using[-1] is card:
+                    return original(card, player, game)
+                using.append(card)
+                try:
+                    return profiler._call(card.name, "uses", original, (card, player, game))
+                finally:
+                    using.pop()
+            use.__doc__ = original.__doc__
+            self._replace(card_class, "use", use)
+
+        def replace_create(card_class, name):
+            original = card_class.__dict__[name]
+            if getattr(original, "__isabstractmethod__", False):
+                return
+
+            def create(card, player):
+                created = profiler._call(card.name, None, original, (card, player))
+                responsible.append(card.name)
+                created.battlecry = profiler._attribute(created.battlecry, "battlecries")
+                if isinstance(created, Minion):
+                    created.deathrattle = profiler._attribute(created.deathrattle, "deathrattles")
+                    created.base_deathrattle = profiler._attribute(created.base_deathrattle, "deathrattles")
+                responsible.pop()
+                return created
+            create.__doc__ = original.__doc__
+            self._replace(card_class, name, create)
+
+        trigger.__doc__ = original_trigger.__doc__
+        self._profiled_trigger = trigger
+        Bindable.trigger = trigger
+        replace_bind("bind")
+        replace_bind("bind_once")
+        for card_class in _card_classes():
+            if "use" in card_class.__dict__:
+                replace_use(card_class)
+            if "create_minion" in card_class.__dict__ and issubclass(card_class, MinionCard):
+                replace_create(card_class, "create_minion")
+            if "create_weapon" in card_class.__dict__ and issubclass(card_class, WeaponCard):
+                replace_create(card_class, "create_weapon")
+
+    def _stop(self):
+        for owner, name, method in reversed(self._replaced):
+            setattr(owner, name, method)
+        self._replaced = []
+
+    def hottest(self, count=None, sort="self_time"):
+        """
+        Finds the cards which were responsible for the most time, or the most of another statistic.
+
+        :param int count: The number of cards to return.  If None, every card in the profile is returned
+        :param string sort: The statistic to sort the cards by, largest first
+        :return: A list of tuples of the name of each card and a dictionary of its statistics, as in :meth:`to_dict`
+        """
+        rows = sorted(self.to_dict().items(), key=lambda row: (-row[1][sort], row[0]))
+        if count is not None:
+            rows = rows[0:count]
+        return rows
+
+    def table(self, count=None, sort="self_time"):
+        """
+        Formats the :meth:`hottest` cards as a text table.
+
+        :param int count: The number of cards to include.  If None, every card in the profile is included
+        :param string sort: The statistic to sort the cards by, largest first
+        :rtype: str
+        """
+        return self._table("card", self.hottest(count, sort),
+                           [("uses", "uses", None), ("battlecries", "battlecries", None),
+                            ("deathrattles", "deathrattles", None), ("handlers", "handler_calls", None),
+                            ("triggers", "triggers", None), ("total (ms)", "total_time", 1000),
+                            ("self (ms)", "self_time", 1000)])
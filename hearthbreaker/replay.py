@@ -1,11 +1,14 @@
+import base64
 from random import randint
 import re
 
 import hearthbreaker
+import hearthbreaker.binary_replay
 import hearthbreaker.constants
 import hearthbreaker.game_objects
 import hearthbreaker.cards
 import hearthbreaker.game_objects
+import hearthbreaker.snapshot
 
 
 class ReplayException(Exception):
@@ -23,7 +26,7 @@ class ProxyCharacter:
             else:
                 self.character_ref = "p2"
         elif type(character_ref) is hearthbreaker.game_objects.Minion:
-            if character_ref.player == game.players[0].hero:
+            if character_ref.player is game.players[0]:
                 self.character_ref = "p1:" + str(character_ref.index)
             else:
                 self.character_ref = "p2:" + str(character_ref.index)
@@ -68,7 +71,7 @@ class ProxyCard:
         self.targetable = False
 
     def set_option(self, option):
-        self.card_ref = ":" + str(option)
+        self.card_ref = "{0}:{1}".format(self.card_ref, option)
 
     def resolve(self, game):
         ref = self.card_ref.split(':')
@@ -190,20 +193,65 @@ class ConcedeAction(ReplayAction):
         game.current_player.hero.activate_delayed()
 
 
+class GameSnapshot:
+    """
+    The state of a game at the start of a turn, embedded in a replay so that :meth:`SavedGame.seek` can start from it.
+    Made by :meth:`SavedGame.snapshot`.
+    """
+    __slots__ = ["turn", "state_hash", "data"]
+
+    def __init__(self, turn, state_hash, data):
+        #: The number of turns played before the snapshot was taken
+        self.turn = turn
+        #: The :meth:`state hash <hearthbreaker.game_objects.Game.state_hash>` of the game when the snapshot was taken
+        self.state_hash = state_hash
+        #: The state of the game, saved by :func:`hearthbreaker.snapshot.save`
+        self.data = data
+
+    def to_output_string(self):
+        return "snapshot({0},{1},{2})".format(self.turn, self.state_hash, base64.b64encode(self.data).decode("ascii"))
+
+
 class Replay:
-    def __init__(self):
+    def __init__(self, writer=None):
+        """
+        :param hearthbreaker.binary_replay.BinaryReplayWriter writer: A writer to stream the replay to as it is
+                                                                       recorded, or None to keep it in memory
+        """
+        self.writer = writer
         self.actions = []
         self.random_numbers = []
         self.last_card = None
         self.card_class = None
         self.last_target = None
         self.last_index = None
+        # The target the agent chose for the attack being made, and whether it is still to be chosen
+        self.attack_target = None
+        self.choosing_attack_target = False
         self.game = None
         self.decks = []
         self.keeps = []
+        #: The snapshots of the game embedded in the replay, as :class:`GameSnapshot`, in the order of their turns
+        self.snapshots = []
 
     def save_decks(self, deck1, deck2):
         self.decks = [deck1, deck2]
+        if self.writer is not None:
+            self.writer.write_header(self.decks)
+
+    def flush(self):
+        """
+        Writes the random numbers, kept cards and actions recorded so far to the replay's writer, and forgets them.
+        Called at the end of each turn when the replay has a writer.
+        """
+        self.writer.write_random(self.random_numbers)
+        for keep in self.keeps:
+            self.writer.write_keep(keep)
+        for action in self.actions:
+            self.writer.write_action(action)
+        self.random_numbers = []
+        self.keeps = []
+        self.actions = []
 
     def record_random(self, result):
         self.random_numbers.append(result)
@@ -211,27 +259,24 @@ class Replay:
     def record_turn_end(self):
         self._save_played_card()
         self.actions.append(TurnEndAction())
+        if self.writer is not None:
+            self.flush()
 
     def _save_played_card(self):
         if self.last_card is not None:
             if issubclass(self.card_class, hearthbreaker.game_objects.MinionCard):
                 if self.last_card.targetable:
                     self.actions.append(MinionAction(self.last_card, self.last_index, self.last_target, self.game))
-                    self.last_card = None
-                    self.last_index = None
-                    self.last_target = None
                 else:
                     self.actions.append(MinionAction(self.last_card, self.last_index, game=self.game))
-                    self.last_card = None
-                    self.last_index = None
             else:
                 if self.last_card.targetable:
                     self.actions.append(SpellAction(self.last_card, self.last_target, self.game))
-                    self.last_card = None
-                    self.last_target = None
                 else:
                     self.actions.append(SpellAction(self.last_card, game=self.game))
-                    self.last_card = None
+            self.last_card = None
+            self.last_index = None
+            self.last_target = None
 
     def record_card_played(self, card):
         self._save_played_card()
@@ -239,11 +284,33 @@ class Replay:
         self.last_card.targetable = card.targetable
         self.card_class = type(card)
 
+    def record_card_used(self, card):
+        self._save_played_card()
+
+    def record_target(self, target):
+        if self.choosing_attack_target:
+            self.attack_target = target
+            self.choosing_attack_target = False
+            return
+        # The first target chosen while a card is used is the card's target.  Where it is on the board is found
+        # straight away, as using the card may move it.
+        if self.last_card is not None and self.last_target is None:
+            self.last_target = ProxyCharacter(target, self.game).character_ref
+
     def record_option_chosen(self, option):
         self.last_card.set_option(option)
 
+    def record_pre_attack(self, attacker):
+        self.choosing_attack_target = True
+
     def record_attack(self, attacker, target):
+        # The target the agent chose is recorded rather than the one attacked, which a secret such as Misdirection may
+        # have chosen instead.  The secret makes the same choice again when the replay is played.
         self._save_played_card()
+        if self.attack_target is not None:
+            target = self.attack_target
+        self.attack_target = None
+        self.choosing_attack_target = False
         self.actions.append(AttackAction(attacker, target, target.player.game))
 
     def record_power(self):
@@ -259,6 +326,8 @@ class Replay:
             if card_index[index]:
                 k_arr.append(index)
         self.keeps.append(k_arr)
+        if self.writer is not None:
+            self.flush()
 
     def write_replay(self, file):
 
@@ -273,6 +342,7 @@ class Replay:
                         break
                 if matched:
                     return cards[0:pattern_length]
+            return cards
 
         if 'write' not in dir(file):
             writer = open(file, 'w')
@@ -298,8 +368,19 @@ class Replay:
             writer.write(",".join([str(k) for k in keep]))
             writer.write(")\n")
 
+        snapshots = iter(self.snapshots)
+        snapshot = next(snapshots, None)
+        turn = 0
         for action in self.actions:
+            while snapshot is not None and snapshot.turn <= turn:
+                writer.write(snapshot.to_output_string() + "\n")
+                snapshot = next(snapshots, None)
             writer.write(action.to_output_string() + "\n")
+            if type(action) is TurnEndAction:
+                turn += 1
+        while snapshot is not None:
+            writer.write(snapshot.to_output_string() + "\n")
+            snapshot = next(snapshots, None)
 
     def parse_replay(self, replayfile):
 
@@ -357,46 +438,63 @@ class Replay:
 
             elif action == 'concede':
                 self.actions.append(ConcedeAction())
+            elif action == 'snapshot':
+                self.snapshots.append(GameSnapshot(int(args[0]), int(args[1]), base64.b64decode(args[2])))
         replayfile.close()
         if len(self.keeps) is 0:
             self.keeps = [[0, 1, 2], [0, 1, 2, 3]]
 
 
-class RecordingGame(hearthbreaker.game_objects.Game):
-    def __init__(self, decks, agents):
-        game = self
+class _RecordingAgent:
+    """
+    Passes the decisions of an agent on to a :class:`RecordingGame`'s replay
+    """
+    __slots__ = ['agent', '_game', '__dict__']
 
-        class RecordingAgent:
-            __slots__ = ['agent']
+    def __init__(self, proxied_agent, game):
+        object.__setattr__(self, "agent", proxied_agent)
+        # Not called game, so that the proxied agent's game is still found through __getattr__
+        object.__setattr__(self, "_game", game)
 
-            def __init__(self, proxied_agent):
-                object.__setattr__(self, "agent", proxied_agent)
+    def choose_index(self, card, player):
+        index = self.agent.choose_index(card, player)
+        self._game.replay.last_index = index
+        return index
 
-            def choose_index(self, card, player):
-                index = self.agent.choose_index(card, player)
-                game.replay.last_index = index
-                return index
+    def choose_target(self, targets):
+        target = self.agent.choose_target(targets)
+        self._game.replay.record_target(target)
+        return target
 
-            def choose_target(self, targets):
-                target = self.agent.choose_target(targets)
-                game.replay.last_target = target
-                return target
+    def choose_option(self, *options):
+        option = self.agent.choose_option(options)
 
-            def choose_option(self, *options):
-                option = self.agent.choose_option(options)
+        self._game.replay.record_option_chosen(options.index(option))
+        return option
 
-                game.replay.record_option_chosen(options.index(option))
-                return option
+    def __getattr__(self, item):
+        return self.agent.__getattribute__(item)
 
-            def __getattr__(self, item):
-                return self.agent.__getattribute__(item)
+    def __setattr__(self, key, value):
+        # Cards such as Misdirection replace the methods which choose, and call the method they replaced.  Replacing
+        # the proxied agent's method instead would have it call this agent, and so itself.
+        if key in ("choose_index", "choose_target", "choose_option"):
+            object.__setattr__(self, key, value)
+        else:
+            setattr(self.__getattribute__("agent"), key, value)
 
-            def __setattr__(self, key, value):
-                setattr(self.__getattribute__("agent"), key, value)
 
-        self.replay = hearthbreaker.replay.Replay()
+class RecordingGame(hearthbreaker.game_objects.Game):
+    def __init__(self, decks, agents, writer=None):
+        """
+        :param list[hearthbreaker.game_objects.Deck] decks: The decks of the two players
+        :param list agents: The agents of the two players
+        :param hearthbreaker.binary_replay.BinaryReplayWriter writer: A writer to stream the replay to a turn at a
+                                                                       time, rather than keeping it in :attr:`replay`
+        """
+        self.replay = hearthbreaker.replay.Replay(writer)
         self.replay.game = self
-        agents = [RecordingAgent(agents[0]), RecordingAgent(agents[1])]
+        agents = [_RecordingAgent(agents[0], self), _RecordingAgent(agents[1], self)]
 
         super().__init__(decks, agents, self._find_random)
 
@@ -409,6 +507,8 @@ class RecordingGame(hearthbreaker.game_objects.Game):
             player.bind("used_power", self.replay.record_power)
             player.hero.bind("found_power_target", self.replay.record_power_target)
             player.bind("card_played", self.replay.record_card_played)
+            player.bind("card_used", self.replay.record_card_used)
+            player.bind("pre_attack", self.replay.record_pre_attack)
             player.bind("attack", self.replay.record_attack)
 
     def _find_random(self, lower_bound, upper_bound):
@@ -417,64 +517,231 @@ class RecordingGame(hearthbreaker.game_objects.Game):
         return result
 
 
-class SavedGame(hearthbreaker.game_objects.Game):
-    def __init__(self, replay_file):
-
-        replay = Replay()
-        replay.parse_replay(replay_file)
-
-        action_index = 0
-        random_index = 0
-        game_ref = self
-        k_index = 0
-
-        def replay_random(start, end):
-            nonlocal random_index
-            random_index += 1
-            return replay.random_numbers[random_index - 1]
-
-        def null_random(start, end):
-            return 0
+class _ReplayAgent:
+    """
+    Makes the decisions recorded in a :class:`SavedGame`'s replay
+    """
 
-        class ReplayAgent:
-
-            def __init__(self):
-                self.next_target = None
-                self.next_index = -1
-                self.next_option = None
-
-            def do_card_check(self, cards):
-                nonlocal k_index
-                keep_arr = [False] * len(cards)
-                for index in replay.keeps[k_index]:
-                    keep_arr[int(index)] = True
-                k_index += 1
-                return keep_arr
+    def __init__(self, game, keeps):
+        self.game = game
+        self.keeps = keeps
+        self.next_target = None
+        self.next_index = -1
+        self.next_option = None
+
+    def do_card_check(self, cards):
+        keep = next(self.keeps, None)
+        if keep is None:
+            return [True] * len(cards)
+        keep_arr = [False] * len(cards)
+        for index in keep:
+            keep_arr[int(index)] = True
+        return keep_arr
+
+    def do_turn(self, player):
+        # Heroes can still use their powers and characters can still attack after a hero has died, so the recorded
+        # actions are played until the end of the turn rather than until a hero dies
+        while True:
+            action = self.game._next_action()
+            if action is None or type(action) is hearthbreaker.replay.TurnEndAction:
+                break
+            action.play(self.game)
+            self.game.trigger("action_replayed", action)
+
+    def set_game(self, game):
+        pass
 
-            def do_turn(self, player):
-                nonlocal action_index
-                while action_index < len(replay.actions) and not player.hero.dead and type(
-                        replay.actions[action_index]) is not hearthbreaker.replay.TurnEndAction:
-                    replay.actions[action_index].play(game_ref)
-                    action_index += 1
+    def choose_target(self, targets):
+        return self.next_target
 
-                action_index += 1
+    def choose_index(self, card, player):
+        return self.next_index
 
-            def set_game(self, game):
-                pass
+    def choose_option(self, *options):
+        return options[self.next_option]
 
-            def choose_target(self, targets):
-                return self.next_target
 
-            def choose_index(self, card, player):
-                return self.next_index
+# The attributes of a SavedGame which belong to the replay being read, rather than to the game played from it, or
+# which are only kept to save finding them again, so are left out of snapshots of the game
+_REPLAY_ATTRIBUTES = frozenset(["_action_source", "_random_source", "_snapshot_source", "_keeps", "_actions",
+                                "_random_numbers", "_checkpoints", "_snapshots", "_snapshots_ended",
+                                "checkpoint_interval", "_memo", "_character_hashes", "_characters_hash"])
 
-            def choose_option(self, *options):
-                return options[self.next_option]
 
-        if len(replay.random_numbers) is 0:
-            random_func = null_random
+class SavedGame(hearthbreaker.game_objects.Game):
+    def __init__(self, replay_file, checkpoint_interval=None):
+        """
+        :param replay_file: The replay to play, in either the text or the binary format, as a path or an open file.
+                            A binary replay is read as it is played.
+        :param int checkpoint_interval: If given, a checkpoint is made every this many turns as the replay is played,
+                                        so that :meth:`seek` can return to an earlier turn by playing only the turns
+                                        since the checkpoint before it.  A checkpoint is always made at the start of
+                                        the game.
+        """
+
+        if hearthbreaker.binary_replay.is_binary(replay_file):
+            reader = hearthbreaker.binary_replay.BinaryReplayReader(replay_file)
+            decks = reader.decks
+            self._action_source = reader.actions()
+            self._random_source = reader.random_numbers()
+            self._snapshot_source = reader.snapshots()
+            keeps = reader.keeps()
         else:
-            random_func = replay_random
-
-        super().__init__(replay.decks, [ReplayAgent(), ReplayAgent()], random_func)
+            replay = Replay()
+            replay.parse_replay(replay_file)
+            decks = replay.decks
+            self._action_source = iter(replay.actions)
+            self._random_source = iter(replay.random_numbers)
+            self._snapshot_source = iter(replay.snapshots)
+            keeps = iter(replay.keeps)
+        self._keeps = keeps
+
+        #: The number of turns played so far
+        self.turn = 0
+        self.checkpoint_interval = checkpoint_interval
+        # The actions and random numbers read so far, and the position of the next of each to be used.  As these are
+        # attributes of the game, rolling back to a checkpoint returns the positions to where they were.
+        self._actions = []
+        self._action_index = 0
+        self._random_numbers = []
+        self._random_index = 0
+        # Maps the turns checkpoints were made at to the checkpoints
+        self._checkpoints = {}
+        # Maps the turns of the snapshots read from the replay so far to the snapshots, and whether they have all been
+        # read
+        self._snapshots = {}
+        self._snapshots_ended = False
+        self._started = False
+
+        super().__init__(decks, [_ReplayAgent(self, keeps), _ReplayAgent(self, keeps)], self._replay_random)
+
+    def _next_action(self):
+        while len(self._actions) <= self._action_index:
+            action = next(self._action_source, None)
+            if action is None:
+                return None
+            self._actions.append(action)
+        self._action_index += 1
+        return self._actions[self._action_index - 1]
+
+    def _replay_random(self, start, end):
+        while len(self._random_numbers) <= self._random_index:
+            number = next(self._random_source, None)
+            if number is None:
+                # A replay without random numbers uses 0 every time
+                return 0
+            self._random_numbers.append(number)
+        self._random_index += 1
+        return self._random_numbers[self._random_index - 1]
+
+    def pre_game(self):
+        super().pre_game()
+        self._started = True
+
+    def _snapshot_references(self):
+        return {"game": self, "keeps": self._keeps}
+
+    def snapshot(self):
+        """
+        Takes a snapshot of the game as it is now, to be embedded in a replay (see :func:`take_snapshots`).
+
+        :rtype: GameSnapshot
+        """
+        state = {name: value for name, value in self.__dict__.items() if name not in _REPLAY_ATTRIBUTES}
+        state["events"] = self.events
+        return GameSnapshot(self.turn, self.state_hash(),
+                            hearthbreaker.snapshot.save(state, self._snapshot_references()))
+
+    def _read_snapshots(self, turn):
+        # Reads the snapshots in the replay at least as far as the given turn
+        while not self._snapshots_ended and all(snapshot_turn <= turn for snapshot_turn in self._snapshots):
+            snapshot = next(self._snapshot_source, None)
+            if snapshot is None:
+                self._snapshots_ended = True
+            else:
+                self._snapshots[snapshot.turn] = snapshot
+
+    def _restore_snapshot(self, snapshot):
+        # Puts the game in the state saved in a snapshot, returning False and leaving the game as it was if the
+        # snapshot can't be loaded, or if it doesn't give the state it was taken in
+        try:
+            state = hearthbreaker.snapshot.load(snapshot.data, self._snapshot_references())
+        except hearthbreaker.snapshot.SnapshotException:
+            return False
+        events = self.events
+        attributes = dict(self.__dict__)
+        epoch = self.epoch
+        self.events = state.pop("events")
+        self.__dict__.update(state)
+        self.epoch = epoch + 1
+        self._memo = {}
+        self._character_hashes = {}
+        self._characters_hash = 0
+        if self.calculate_state_hash(True) != snapshot.state_hash:
+            self.events = events
+            self.__dict__.clear()
+            self.__dict__.update(attributes)
+            return False
+        return True
+
+    def play_single_turn(self):
+        due = self.turn == 0 or (self.checkpoint_interval is not None and self.turn % self.checkpoint_interval == 0)
+        if due and self.turn not in self._checkpoints:
+            self._checkpoints[self.turn] = self.checkpoint()
+        super().play_single_turn()
+        self.turn += 1
+
+    def seek(self, turn):
+        """
+        Plays the replay up to the start of a turn, playing as few of the turns before it as it can:
+
+        * If the game has already been played past the turn, it is first rolled back to the latest checkpoint made
+          before it (see :meth:`Game.rollback <hearthbreaker.game_objects.Game.rollback>`).
+        * If the replay has :class:`snapshots <GameSnapshot>` embedded in it, the game is then put in the state of the
+          latest snapshot before the turn, if that is later than where the game is.
+
+        Only the turns after that are played.  Checkpoints are kept in memory, and made as turns are played, so
+        without snapshots the first seek in a newly loaded replay plays every turn up to the turn sought.
+
+        A snapshot is only used if the game it gives has the state hash the snapshot was taken with.  Snapshots taken
+        by another version of hearthbreaker may not, in which case the turns are played instead.
+
+        :param int turn: The number of turns to have been played, where 0 is the start of the game, once the players
+                         have chosen which cards to keep.  If the game ends first, it is played to the end.
+        """
+        if not self._started:
+            self.pre_game()
+            self.current_player = self.players[1]
+        if turn < self.turn:
+            start = max(checkpoint_turn for checkpoint_turn in self._checkpoints if checkpoint_turn <= turn)
+            self.rollback(self._checkpoints[start])
+            # Later checkpoints refer to objects which will be replaced as the game is played again
+            for checkpoint_turn in list(self._checkpoints):
+                if checkpoint_turn > start:
+                    del self._checkpoints[checkpoint_turn]
+        self._read_snapshots(turn)
+        for snapshot_turn in sorted(self._snapshots, reverse=True):
+            if self.turn < snapshot_turn <= turn and self._restore_snapshot(self._snapshots[snapshot_turn]):
+                break
+        while self.turn < turn and not self.game_ended:
+            self.play_single_turn()
+
+
+def take_snapshots(replay_file, interval):
+    """
+    Plays a replay, taking a snapshot of the game at the start of every so many turns.  Embedded in the replay, as
+    :attr:`Replay.snapshots`, the snapshots let :meth:`SavedGame.seek` start from the latest snapshot before the turn
+    it seeks, rather than from the start of the game.
+
+    :param replay_file: The replay, in either format, as a path or an open file
+    :param int interval: How many turns to play between snapshots
+    :rtype: list[GameSnapshot]
+    """
+    game = SavedGame(replay_file)
+    game.seek(0)
+    snapshots = []
+    while not game.game_ended:
+        if game.turn > 0 and game.turn % interval == 0:
+            snapshots.append(game.snapshot())
+        game.play_single_turn()
+    return snapshots
@@ -0,0 +1,276 @@
+"""
+Checks that replays still play out the way they did when their goldens were made, spread over a pool of worker
+processes.
+
+A golden is a file next to its replay, named by adding ``.golden`` to the replay's name, which holds the fingerprint
+of the game's state (its :meth:`state hash <hearthbreaker.game_objects.Game.state_hash>`) after each action of the
+replay and at the end of each turn.  Each line is one turn: the fingerprints after each of the turn's actions, followed
+by the fingerprint at the end of the turn, as hexadecimal numbers separated by spaces.
+
+A replay is checked by playing it with :class:`SavedGame <hearthbreaker.replay.SavedGame>` and comparing its
+fingerprints with the golden's, turn by turn.  A replay which diverges is reported with the first action after which
+the fingerprints differ.  Each replay is checked by one worker, and the results are returned as each replay finishes,
+so checking many replays takes time in proportion to the number of replays over the number of processes.
+
+Example::
+
+    from hearthbreaker.replay_check import check_replays, DIVERGED
+
+    for result in check_replays("tests/replays", processes=32):
+        if result.status == DIVERGED:
+            print(result)
+
+or from the root of the repository::
+
+    python check_replays.py tests/replays
+"""
+import multiprocessing
+import os
+import time
+
+import hearthbreaker.binary_replay
+import hearthbreaker.replay
+
+
+PASSED = "passed"
+DIVERGED = "diverged"
+FAILED = "failed"
+NO_GOLDEN = "no golden"
+UPDATED = "updated"
+
+#: The extensions of the files treated as replays by :func:`find_replays`
+REPLAY_EXTENSIONS = (".rep", ".hbr")
+
+#: Added to the name of a replay to give the name of its golden
+GOLDEN_SUFFIX = ".golden"
+
+
+def _format_fingerprint(fingerprint):
+    if fingerprint is None:
+        return "nothing"
+    return "{0:016x}".format(fingerprint)
+
+
+class ReplayCheck:
+    """
+    The result of checking a single replay against its golden
+    """
+
+    def __init__(self, path, status):
+        #: The path of the replay
+        self.path = path
+        #: One of :const:`PASSED`, :const:`DIVERGED`, :const:`FAILED` (the replay could not be played),
+        #: :const:`NO_GOLDEN` or :const:`UPDATED` (the golden was written, rather than checked)
+        self.status = status
+        #: The number of turns played
+        self.turns = 0
+        #: The turn in which the replay diverged or failed, counting from 0
+        self.turn = None
+        #: The index in the replay of the first action after which the fingerprints differ, or which failed, counting
+        #: every action including the end of each turn
+        self.action = None
+        #: The action, as written in the text format
+        self.action_text = None
+        #: The fingerprint the golden has after the action, or None if it has none
+        self.expected = None
+        #: The fingerprint the game had after the action, or None if the game had ended
+        self.actual = None
+        #: The error the replay failed with
+        self.error = None
+        #: The time taken to check the replay, in seconds
+        self.elapsed = 0.0
+
+    def __str__(self):
+        if self.status == DIVERGED:
+            return "{0}: diverged in turn {1} at action {2} {3} (expected {4}, found {5})".format(
+                self.path, self.turn, self.action, self.action_text, _format_fingerprint(self.expected),
+                _format_fingerprint(self.actual))
+        if self.status == FAILED:
+            return "{0}: failed in turn {1} at action {2} {3}: {4}".format(self.path, self.turn, self.action,
+                                                                           self.action_text, self.error)
+        return "{0}: {1} ({2} turns)".format(self.path, self.status, self.turns)
+
+
+def find_replays(directory):
+    """
+    Finds every replay in a directory tree.
+
+    :param string directory: The root of the tree
+    :return: The paths of the replays, in sorted order
+    :rtype: list[str]
+    """
+    paths = []
+    for root, directories, files in os.walk(directory):
+        for name in files:
+            if name.endswith(REPLAY_EXTENSIONS):
+                paths.append(os.path.join(root, name))
+    return sorted(paths)
+
+
+def fingerprint_replay(replay_file, turns=None):
+    """
+    Plays a replay, finding the fingerprint of the game's state after each action and at the end of each turn.
+
+    :param string replay_file: The path of the replay, in either format
+    :param list turns: A list to add the fingerprints of each turn to as the turn is played.  If the replay fails, it
+                       holds the fingerprints found so far, and the last turn in it has no fingerprint for its end.
+    :return: A list with one list for each turn, of the fingerprints after each of the turn's actions followed by
+             the fingerprint at the end of the turn
+    """
+    if turns is None:
+        turns = []
+    game = hearthbreaker.replay.SavedGame(replay_file)
+    game.bind("action_replayed", lambda action: turns[-1].append(game.state_hash()))
+    game.seek(0)
+    while not game.game_ended:
+        turns.append([])
+        game.play_single_turn()
+        turns[-1].append(game.state_hash())
+    return turns
+
+
+def read_golden(golden_file):
+    """
+    :param string golden_file: The path of the golden
+    :return: The fingerprints of each turn, as returned by :func:`fingerprint_replay`
+    """
+    file = open(golden_file, "r")
+    turns = [[int(fingerprint, 16) for fingerprint in line.split()] for line in file if line.strip() != ""]
+    file.close()
+    return turns
+
+
+def write_golden(turns, golden_file):
+    """
+    :param list turns: The fingerprints of each turn, as returned by :func:`fingerprint_replay`
+    :param string golden_file: The path to write the golden to
+    """
+    file = open(golden_file, "w")
+    for fingerprints in turns:
+        file.write(" ".join(_format_fingerprint(fingerprint) for fingerprint in fingerprints))
+        file.write("\n")
+    file.close()
+
+
+def _replay_actions(replay_file):
+    if hearthbreaker.binary_replay.is_binary(replay_file):
+        return hearthbreaker.binary_replay.BinaryReplayReader(replay_file).read_replay().actions
+    replay = hearthbreaker.replay.Replay()
+    replay.parse_replay(replay_file)
+    return replay.actions
+
+
+def _find_action(result, turn, index):
+    # Finds the action at the given index in the given turn, where the end of the turn comes after its other actions.
+    # The actions before the turn are those of the earlier turns, each of which ends with the end of the turn.
+    actions = _replay_actions(result.path)
+    position = 0
+    for turn_index in range(0, turn):
+        while position < len(actions) and not isinstance(actions[position], hearthbreaker.replay.TurnEndAction):
+            position += 1
+        position += 1
+    position += index
+    result.turn = turn
+    result.action = position
+    if position < len(actions):
+        result.action_text = actions[position].to_output_string()
+    else:
+        result.action_text = "(past the end of the replay)"
+
+
+def check_replay(replay_file, update=False):
+    """
+    Checks a replay against its golden.
+
+    :param string replay_file: The path of the replay, in either format
+    :param boolean update: If True, the golden is written from the replay rather than checked
+    :rtype: ReplayCheck
+    """
+    start_time = time.time()
+    golden_file = replay_file + GOLDEN_SUFFIX
+    if not update and not os.path.exists(golden_file):
+        return ReplayCheck(replay_file, NO_GOLDEN)
+
+    turns = []
+    error = None
+    try:
+        fingerprint_replay(replay_file, turns)
+    except Exception as e:
+        error = e
+
+    if update:
+        result = ReplayCheck(replay_file, UPDATED)
+        if error is None:
+            write_golden(turns, golden_file)
+    else:
+        result = ReplayCheck(replay_file, PASSED)
+        golden = read_golden(golden_file)
+        # A replay which failed is only checked up to the turn it failed in
+        last_turn = len(turns) if error is not None else max(len(turns), len(golden))
+        for turn in range(0, last_turn):
+            actual = turns[turn] if turn < len(turns) else []
+            expected = golden[turn] if turn < len(golden) else []
+            # and that turn only as far as it got
+            if error is not None and turn == len(turns) - 1:
+                expected = expected[0:len(actual)]
+            if actual == expected:
+                continue
+            index = 0
+            while index < len(actual) and index < len(expected) and actual[index] == expected[index]:
+                index += 1
+            result.status = DIVERGED
+            result.expected = expected[index] if index < len(expected) else None
+            result.actual = actual[index] if index < len(actual) else None
+            # The fingerprint at each index of the replayed turn follows the action at that index in the turn,
+            # ending with the turn's end() action
+            _find_action(result, turn, min(index, max(len(actual) - 1, 0)))
+            break
+
+    if error is not None and result.status != DIVERGED:
+        result.status = FAILED
+        result.error = "{0}: {1}".format(type(error).__name__, error)
+        if len(turns) == 0:
+            result.turn = 0
+        else:
+            # The action which failed is the one after those with fingerprints
+            _find_action(result, len(turns) - 1, len(turns[-1]))
+    result.turns = len(turns)
+    result.elapsed = time.time() - start_time
+    return result
+
+
+def _check_update(replay_file):
+    return check_replay(replay_file, True)
+
+
+def check_replays(replays, processes=None, update=False):
+    """
+    Checks many replays against their goldens, spread over a pool of processes.  The results are generated as each
+    replay finishes, so they are not in the order of the replays.
+
+    :param replays: The path of a directory, all of whose replays are checked (see :func:`find_replays`), or a list
+                    of the paths of replays
+    :param int processes: The number of worker processes.  Defaults to the number of CPUs.  If 1, the replays are
+                          checked in this process
+    :param boolean update: If True, the goldens are written from the replays rather than checked
+    :return: A generator of a :class:`ReplayCheck` for each replay
+    """
+    if isinstance(replays, str):
+        replays = find_replays(replays)
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    check = _check_update if update else check_replay
+
+    if processes == 1:
+        for replay_file in replays:
+            yield check(replay_file)
+        return
+
+    pool = multiprocessing.Pool(processes)
+    try:
+        # Replays are handed out one at a time, so that a long replay doesn't hold up others queued behind it
+        for result in pool.imap_unordered(check, replays):
+            yield result
+    finally:
+        pool.close()
+        pool.join()
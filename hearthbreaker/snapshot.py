@@ -0,0 +1,168 @@
+"""
+Saves the state of a game as bytes and loads it again, so that snapshots of a game can be embedded in a replay (see
+:meth:`SavedGame.seek <hearthbreaker.replay.SavedGame.seek>`).
+
+The state of a game isn't only data.  Cards bind functions defined inside their methods to events, and those functions
+keep state in their closures, which the standard :mod:`pickle` can't save.  :func:`save` extends it:
+
+ * A function which can't be found by its name is saved as the module it was defined in, its qualified name, the line
+   it starts on and which of the functions with that name and line it is, along with its closure.  Its code is found
+   in the module again when the snapshot is loaded.
+ * The cells of a closure are saved as objects of their own, and filled once the function has been loaded.  Functions
+   which share a cell still share it, and a function whose closure refers to the function itself can be saved.
+ * Bound methods are saved as their function and the object they are bound to.
+
+Since functions are found by where they are in the source, a snapshot can only be loaded by the version of
+hearthbreaker which saved it.  Anything else raises a :class:`SnapshotException`, or loads a game in a different
+state, which can be caught by comparing :meth:`state hashes <hearthbreaker.game_objects.Game.state_hash>`.
+
+Objects outside the game, such as the game itself or the file a replay is read from, are given names.  Each is saved as
+its name alone, and the object given for the same name takes its place when the snapshot is loaded.
+"""
+import importlib
+import io
+import pickle
+import sys
+import types
+import zlib
+
+
+class SnapshotException(Exception):
+    def __init__(self, message):
+        super().__init__(message)
+
+
+# Maps the names of modules to dictionaries, which map the qualified name and first line of each function defined in
+# the module to the code of each such function
+_module_code = {}
+
+
+def _code_key(code):
+    # Before Python 3.11, code only has the function's own name, which is less often unique within a line
+    return getattr(code, "co_qualname", code.co_name), code.co_firstlineno
+
+
+def _find_code(module):
+    if module.__name__ not in _module_code:
+        found = {}
+
+        def add_code(code):
+            found.setdefault(_code_key(code), []).append(code)
+            for const in code.co_consts:
+                if isinstance(const, types.CodeType):
+                    add_code(const)
+
+        add_code(module.__loader__.get_code(module.__name__))
+        _module_code[module.__name__] = found
+    return _module_code[module.__name__]
+
+
+class _Empty:
+    # Stands for a cell which hasn't been given a value
+    def __reduce__(self):
+        return "_EMPTY"
+
+
+_EMPTY = _Empty()
+
+
+def _load_function(module_name, key, index, closure):
+    module = importlib.import_module(module_name)
+    code = _find_code(module)[key][index]
+    return types.FunctionType(code, vars(module), code.co_name, None, closure)
+
+
+def _fill_function(function, state):
+    contents, defaults, keyword_defaults, attributes = state
+    for cell, value in zip(function.__closure__ or (), contents):
+        if value is not _EMPTY:
+            cell.cell_contents = value
+    function.__defaults__ = defaults
+    function.__kwdefaults__ = keyword_defaults
+    function.__dict__.update(attributes)
+
+
+def _load_cell():
+    return types.CellType()
+
+
+def _load_method(function, obj):
+    return types.MethodType(function, obj)
+
+
+def _cell_contents(cell):
+    try:
+        return cell.cell_contents
+    except ValueError:
+        return _EMPTY
+
+
+class _Pickler(pickle.Pickler):
+    def __init__(self, file, external):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.names = {id(obj): name for name, obj in external.items()}
+
+    def persistent_id(self, obj):
+        return self.names.get(id(obj))
+
+    def reducer_override(self, obj):
+        if type(obj) is types.FunctionType:
+            module = sys.modules.get(obj.__module__)
+            found = module
+            for name in obj.__qualname__.split("."):
+                found = getattr(found, name, None)
+            if found is obj:
+                # Pickle saves functions it can find by name itself
+                return NotImplemented
+            if getattr(module, "__loader__", None) is None:
+                raise pickle.PicklingError("Can't find the module of {0}".format(obj.__qualname__))
+            key = _code_key(obj.__code__)
+            index = _find_code(module)[key].index(obj.__code__)
+            closure = obj.__closure__
+            contents = tuple(_cell_contents(cell) for cell in closure or ())
+            return (_load_function, (obj.__module__, key, index, closure),
+                    (contents, obj.__defaults__, obj.__kwdefaults__, dict(obj.__dict__)), None, None, _fill_function)
+        if type(obj) is types.CellType:
+            return _load_cell, ()
+        if type(obj) is types.MethodType:
+            return _load_method, (obj.__func__, obj.__self__)
+        return NotImplemented
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file, external):
+        super().__init__(file)
+        self.external = external
+
+    def persistent_load(self, name):
+        return self.external[name]
+
+
+def save(obj, external):
+    """
+    Saves an object, and everything it refers to, as bytes.
+
+    :param obj: The object to save
+    :param dict external: Maps names to objects which are saved as the name alone
+    :rtype: bytes
+    """
+    output = io.BytesIO()
+    try:
+        _Pickler(output, external).dump(obj)
+    except (pickle.PicklingError, TypeError, ValueError) as error:
+        raise SnapshotException("Could not save the snapshot: {0}".format(error))
+    return zlib.compress(output.getvalue())
+
+
+def load(data, external):
+    """
+    Loads an object saved by :func:`save`.
+
+    :param bytes data: The saved object
+    :param dict external: Maps the names given to :func:`save` to the objects to use in their place
+    :return: A new copy of the object
+    """
+    try:
+        return _Unpickler(io.BytesIO(zlib.decompress(data)), external).load()
+    except Exception as error:
+        raise SnapshotException("Could not load the snapshot: {0}".format(error))
@@ -1,97 +1,161 @@
-import copy
+"""
+Functions for finding the characters a card, battlecry or hero power could target.
+
+Each ``find_*`` function takes a game and a filter function, and returns a tuple of the characters in one part of the
+board (such as the enemy minions) for which the filter function returns True.  The tuple is kept until the game
+changes (see :meth:`Game.memoize <hearthbreaker.game_objects.Game.memoize>`), so asking for the same targets again,
+as agents do each time they check which cards they can play, returns the same tuple rather than building a new one.
+Filter functions are told apart by their code and the values they capture rather than by identity, so a lambda
+created afresh for each call finds the tuple built for the last one.
+
+:func:`count_targets` counts the targets one of these functions would find without building anything, for when only
+the number of targets, or whether there are any, is needed.
+"""
+
+# The parts of the board each function finds targets in, in the order they are listed, as pairs of the attribute of
+# the game holding the player, and which of the player's characters are included
+_ALL = (("other_player", "minions"), ("current_player", "minions"), ("other_player", "hero"),
+        ("current_player", "hero"))
+_ENEMY = (("other_player", "minions"), ("other_player", "hero"))
+_FRIENDLY = (("current_player", "minions"), ("current_player", "hero"))
+_MINIONS = (("other_player", "minions"), ("current_player", "minions"))
+_ENEMY_MINIONS = (("other_player", "minions"),)
+_FRIENDLY_MINIONS = (("current_player", "minions"),)
+_HEROES = (("current_player", "hero"), ("other_player", "hero"))
+
+
+def _find_targets(game, filter_function, parts, none_if_empty):
+    targets = []
+    for player_name, part in parts:
+        player = getattr(game, player_name)
+        if part == "minions":
+            targets.extend(filter(filter_function, player.minions))
+        elif filter_function(player.hero):
+            targets.append(player.hero)
+    if none_if_empty and len(targets) == 0:
+        return None
+    return tuple(targets)
 
 
-def find_spell_target(game, filter_function):
-    targets = copy.copy(game.other_player.minions)
-    targets.extend(game.current_player.minions)
-    targets.append(game.other_player.hero)
-    targets.append(game.current_player.hero)
+class _Filter:
+    """
+    Wraps a filter function so that it is memoized on what it does rather than on which function object it is.  Two
+    functions created by the same ``def`` or ``lambda`` with the same defaults and the same captured values always
+    filter the same way.  Other callables, such as bound methods, are compared as they are.
+    """
+    __slots__ = ["function", "key", "hash"]
 
-    targets = [target for target in targets if filter_function(target)]
-    return targets
+    def __init__(self, function):
+        self.function = function
+        code = getattr(function, "__code__", None)
+        if code is None:
+            self.key = function
+        elif function.__closure__ is None:
+            self.key = (code, function.__defaults__)
+        else:
+            self.key = (code, function.__defaults__, tuple(cell.cell_contents for cell in function.__closure__))
+        self.hash = hash(self.key)
 
+    def __hash__(self):
+        return self.hash
 
-def find_battlecry_target(game, filter_function):
-    targets = copy.copy(game.other_player.minions)
-    targets.extend(game.current_player.minions)
-    targets.append(game.other_player.hero)
-    targets.append(game.current_player.hero)
+    def __eq__(self, other):
+        return self.key == other.key
 
-    targets = [target for target in targets if filter_function(target)]
-    return targets
 
+def _find_filtered(game, filter_key, parts, none_if_empty):
+    return _find_targets(game, filter_key.function, parts, none_if_empty)
 
-def find_enemy_spell_target(game, filter_function):
-    targets = copy.copy(game.other_player.minions)
-    targets.append(game.other_player.hero)
 
-    targets = [target for target in targets if filter_function(target)]
-    return targets
+def _find(game, filter_function, parts, none_if_empty=False):
+    try:
+        filter_key = _Filter(filter_function)
+    except (TypeError, ValueError):
+        # The filter captures something unhashable, or a variable with no value yet, so isn't memoized
+        return _find_targets(game, filter_function, parts, none_if_empty)
+    return game.memoize("targets", _find_filtered, game, filter_key, parts, none_if_empty)
 
 
-def find_friendly_spell_target(game, filter_function):
-    targets = copy.copy(game.current_player.minions)
-    targets.append(game.current_player.hero)
+def find_spell_target(game, filter_function):
+    return _find(game, filter_function, _ALL)
 
-    targets = [target for target in targets if filter_function(target)]
-    return targets
 
+def find_battlecry_target(game, filter_function):
+    return _find(game, filter_function, _ALL)
 
-def find_minion_spell_target(game, filter_function):
-    targets = copy.copy(game.other_player.minions)
-    targets.extend(game.current_player.minions)
 
-    targets = [target for target in targets if filter_function(target)]
-    return targets
+def find_enemy_spell_target(game, filter_function):
+    return _find(game, filter_function, _ENEMY)
 
 
-def find_minion_battlecry_target(game, filter_function):
-    targets = copy.copy(game.other_player.minions)
-    targets.extend(game.current_player.minions)
+def find_friendly_spell_target(game, filter_function):
+    return _find(game, filter_function, _FRIENDLY)
 
-    targets = [target for target in targets if filter_function(target)]
-    if len(targets) is 0:
-        return None
 
-    return targets
+def find_minion_spell_target(game, filter_function):
+    return _find(game, filter_function, _MINIONS)
 
 
-def find_enemy_minion_spell_target(game, filter_function):
-    targets = copy.copy(game.other_player.minions)
+def find_minion_battlecry_target(game, filter_function):
+    return _find(game, filter_function, _MINIONS, True)
 
-    targets = [target for target in targets if filter_function(target)]
-    return targets
 
+def find_enemy_minion_spell_target(game, filter_function):
+    return _find(game, filter_function, _ENEMY_MINIONS)
 
-def find_friendly_minion_spell_target(game, filter_function):
-    targets = copy.copy(game.current_player.minions)
 
-    targets = [target for target in targets if filter_function(target)]
-    return targets
+def find_friendly_minion_spell_target(game, filter_function):
+    return _find(game, filter_function, _FRIENDLY_MINIONS)
 
 
 def find_enemy_minion_battlecry_target(game, filter_function):
-    targets = copy.copy(game.other_player.minions)
-
-    targets = [target for target in targets if filter_function(target)]
-    if len(targets) is 0:
-        return None
-    return targets
+    return _find(game, filter_function, _ENEMY_MINIONS, True)
 
 
 def find_friendly_minion_battlecry_target(game, filter_function):
-    targets = copy.copy(game.current_player.minions)
-
-    targets = [target for target in targets if filter_function(target)]
-    if len(targets) is 0:
-        return None
-    return targets
+    return _find(game, filter_function, _FRIENDLY_MINIONS, True)
 
 
 def find_hero_target(game, filter_function):
-    targets = []
-    targets.append(game.current_player.hero)
-    targets.append(game.other_player.hero)
-
-    targets = [target for target in targets if filter_function(target)]
-    return targets
+    return _find(game, filter_function, _HEROES)
+
+
+_parts = {
+    find_spell_target: _ALL,
+    find_battlecry_target: _ALL,
+    find_enemy_spell_target: _ENEMY,
+    find_friendly_spell_target: _FRIENDLY,
+    find_minion_spell_target: _MINIONS,
+    find_minion_battlecry_target: _MINIONS,
+    find_enemy_minion_spell_target: _ENEMY_MINIONS,
+    find_friendly_minion_spell_target: _FRIENDLY_MINIONS,
+    find_enemy_minion_battlecry_target: _ENEMY_MINIONS,
+    find_friendly_minion_battlecry_target: _FRIENDLY_MINIONS,
+    find_hero_target: _HEROES,
+}
+
+
+def count_targets(game, target_func, filter_function):
+    """
+    Counts the targets a function would find, without building a list of them.
+
+    :param hearthbreaker.game_objects.Game game: The game to count targets in
+    :param function target_func: One of the ``find_*`` functions in this module.  Any other function is called, and
+                                 the targets it returns are counted.
+    :param function filter_function: The filter function to pass to ``target_func``
+    :return: The number of targets.  A battlecry function which would return None counts as having no targets.
+    :rtype: int
+    """
+    if target_func not in _parts:
+        targets = target_func(game, filter_function)
+        return 0 if targets is None else len(targets)
+    count = 0
+    for player_name, part in _parts[target_func]:
+        player = getattr(game, player_name)
+        if part == "minions":
+            for minion in player.minions:
+                if filter_function(minion):
+                    count += 1
+        elif filter_function(player.hero):
+            count += 1
+    return count
@@ -0,0 +1,69 @@
+"""
+Zobrist hashing of game states, as used by :meth:`hearthbreaker.game_objects.Game.state_hash`.
+
+Each feature of a game, such as a card being in a particular position in a player's hand, is given a random 64 bit
+key, and the hash of a game is the exclusive or of the keys of all of its features.  Adding or removing a feature
+changes the hash by the exclusive or of a single key, so a part of the hash can be replaced without recomputing the
+rest.
+
+Keys are derived from the features themselves rather than drawn from a random number generator, and numbers are
+mixed with SplitMix64 rather than Python's hash, so that the same state has the same hash in every process, on any
+interpreter, and hashes can be compared between runs and machines.
+"""
+import hashlib
+
+#: The hashes are kept to this many bits
+MASK = (1 << 64) - 1
+
+# Multiplying by an odd number is a bijection on 64 bit integers, so these keep the hash of two identical decks (or
+# other parts) belonging to different players from cancelling each other out
+_PLAYER_MULTIPLIERS = [0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F]
+
+_keys = {}
+
+
+def key(feature):
+    """
+    Finds the key for a feature of a game.
+
+    :param tuple feature: A tuple of strings, numbers, booleans and None, describing the feature
+    :return: A 64 bit integer, which is the same for equal features in any process
+    :rtype: int
+    """
+    if feature not in _keys:
+        digest = hashlib.md5(repr(feature).encode("utf-8")).digest()
+        _keys[feature] = int.from_bytes(digest[0:8], "little")
+    return _keys[feature]
+
+
+def _split_mix(value):
+    # One step of SplitMix64, which spreads each bit of its input across all 64 bits of its output
+    value = (value + 0x9E3779B97F4A7C15) & MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK
+    return value ^ (value >> 31)
+
+
+def mix(values):
+    """
+    Hashes a tuple of integers and booleans, such as the attack and health of a minion, into 64 bits.  The hash only
+    depends on the values, so it is the same on every interpreter and platform, unlike Python's own hash of a tuple.
+
+    :param tuple values: The values to hash, which may be negative
+    :rtype: int
+    """
+    result = _split_mix(len(values))
+    for value in values:
+        result = _split_mix(result ^ (int(value) & MASK))
+    return result
+
+
+def for_player(value, player_index):
+    """
+    Distinguishes a hash of part of a game belonging to one player from the same part belonging to the other.
+
+    :param int value: A 64 bit hash
+    :param int player_index: 0 or 1
+    :rtype: int
+    """
+    return (value * _PLAYER_MULTIPLIERS[player_index]) & MASK
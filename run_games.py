@@ -1,43 +1,46 @@
-import re
-from hearthbreaker.agents.basic_agents import RandomAgent
-from hearthbreaker.constants import CHARACTER_CLASS
-from hearthbreaker.game_objects import Game, card_lookup, Deck
-from hearthbreaker.cards import *
-import timeit
+import argparse
+
+from hearthbreaker.batch import load_deck, find_agent, run_batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play a batch of games between two decks")
+    parser.add_argument("deck1", nargs="?", default="example.hsdeck",
+                        help="the first deck.  Results are reported from its point of view")
+    parser.add_argument("deck2", nargs="?", default="example.hsdeck", help="the second deck")
+    parser.add_argument("-n", "--games", type=int, default=1000, help="the number of games to play")
+    parser.add_argument("-p", "--processes", type=int, default=None,
+                        help="the number of worker processes (default: one per CPU)")
+    parser.add_argument("-s", "--seed", type=int, default=None, help="the seed for the batch")
+    parser.add_argument("--agent1", default="RandomAgent", help="the agent playing the first deck")
+    parser.add_argument("--agent2", default="RandomAgent", help="the agent playing the second deck")
+    parser.add_argument("--profile-events", action="store_true",
+                        help="profile the events triggered in the games, and print a table of the results")
+    parser.add_argument("--profile-json", default=None,
+                        help="profile the events triggered in the games, and write the results to this file as JSON")
+    parser.add_argument("--profile-cards", type=int, default=None, metavar="COUNT",
+                        help="attribute the time spent in the games to the cards responsible, and print a table of "
+                             "the COUNT hottest cards")
+    parser.add_argument("--profile-cards-json", default=None,
+                        help="attribute the time spent in the games to the cards responsible, and write the results "
+                             "to this file as JSON")
+    args = parser.parse_args()
+    profile_events = args.profile_events or args.profile_json is not None
+    profile_cards = args.profile_cards is not None or args.profile_cards_json is not None
+
+    result = run_batch(load_deck(args.deck1), load_deck(args.deck2), find_agent(args.agent1),
+                       find_agent(args.agent2), args.games, args.processes, args.seed,
+                       profile_events=profile_events, profile_cards=profile_cards)
+    print(result)
+    if args.profile_events:
+        print(result.event_profile.table())
+    if args.profile_json is not None:
+        result.event_profile.write_json(args.profile_json)
+    if args.profile_cards is not None:
+        print(result.card_profile.table(args.profile_cards))
+    if args.profile_cards_json is not None:
+        result.card_profile.write_json(args.profile_cards_json)
 
 
-def load_deck(filename):
-    deck_file = open(filename, "r")
-    contents = deck_file.read()
-    items = re.split('\n', contents)
-    cards = []
-    character_class = CHARACTER_CLASS.MAGE
-    for line in items[0:]:
-        line = line.strip(" \n\t\r")
-        parts = line.split(" ", 1)
-        count = int(parts[0])
-        for i in range(0, count):
-            card = card_lookup(parts[1])
-            if card.character_class != CHARACTER_CLASS.ALL:
-                character_class = card.character_class
-            cards.append(card)
-
-    deck_file.close()
-
-    return Deck(cards, character_class)
-
-
-def do_stuff():
-    def play_game():
-        new_game = game.copy()
-        new_game.start()
-
-    deck1 = load_deck("example.hsdeck")
-    deck2 = load_deck("example.hsdeck")
-    game = Game([deck1, deck2], [RandomAgent(), RandomAgent()])
-    game.start()
-
-    print(timeit.timeit(play_game, 'gc.enable()', number=1000))
-
 if __name__ == "__main__":
-    do_stuff()
+    main()
@@ -1,13 +1,19 @@
 import random
+import time
 import unittest
-from hearthbreaker.agents.basic_agents import RandomAgent
+from benchmarks.mcts_strength import play_match
+from hearthbreaker.agents.basic_agents import RandomAgent, RandomActionAgent, DoNothingBot
+from hearthbreaker.agents.mcts import MCTSAgent, determinize
 from hearthbreaker.cards import GoldshireFootman, MurlocRaider, BloodfenRaptor, FrostwolfGrunt, RiverCrocolisk, \
     IronfurGrizzly, MagmaRager, SilverbackPatriarch, ChillwindYeti, SenjinShieldmasta, BootyBayBodyguard, \
     FenCreeper, BoulderfistOgre, WarGolem, Shieldbearer, FlameImp, YoungPriestess, DarkIronDwarf, DireWolfAlpha, \
     VoidWalker, HarvestGolem, KnifeJuggler, ShatteredSunCleric, ArgentSquire, Doomguard, Soulfire, DefenderOfArgus, \
-    AbusiveSergeant, NerubianEgg, KeeperOfTheGrove
+    AbusiveSergeant, NerubianEgg, KeeperOfTheGrove, Wrath, DruidOfTheClaw, Starfall, Moonfire, StonetuskBoar, \
+    Misdirection, FreezingTrap, ExplosiveTrap
+from hearthbreaker.batch import load_deck
 from hearthbreaker.constants import CHARACTER_CLASS
-from hearthbreaker.game_objects import Deck, Game
+from hearthbreaker.game_objects import Deck, Game, SecretCard
+from tests.testing_utils import generate_game_for
 
 
 class TestAgents(unittest.TestCase):
@@ -115,3 +121,111 @@ class TestAgents(unittest.TestCase):
         self.assertEqual(0, game.other_player.hero.health)
 
         self.assertTrue(game.game_ended)
+
+    def test_RandomActionAgent(self):
+        for seed in range(0, 10):
+            random.seed(seed)
+            deck1 = Deck([Wrath(), DruidOfTheClaw(), Starfall(), Moonfire(), GoldshireFootman(), MurlocRaider()] * 5,
+                         CHARACTER_CLASS.DRUID)
+            deck2 = Deck([Shieldbearer(), FlameImp(), DireWolfAlpha(), KnifeJuggler(), Soulfire(), NerubianEgg()] * 5,
+                         CHARACTER_CLASS.MAGE)
+            game = Game([deck1, deck2], [RandomActionAgent(), RandomActionAgent()])
+            game.start()
+
+            self.assertTrue(game.game_ended)
+            self.assertEqual((), game.legal_actions())
+
+    def test_MCTSAgent(self):
+        deck1 = Deck([Wrath(), DruidOfTheClaw(), Starfall(), Moonfire(), GoldshireFootman(), MurlocRaider()] * 5,
+                     CHARACTER_CLASS.DRUID)
+        deck2 = Deck([Shieldbearer(), FlameImp(), DireWolfAlpha(), KnifeJuggler(), Soulfire(), NerubianEgg()] * 5,
+                     CHARACTER_CLASS.WARLOCK)
+        agent = MCTSAgent(iterations=20, rollout_turns=2, seed=1857)
+        game = Game([deck1, deck2], [agent, RandomAgent()])
+        game.start()
+        self.assertTrue(game.game_ended)
+
+    def test_MCTSAgent_beats_RandomAgent(self):
+        # A short match, so the test stays quick; python -m benchmarks.mcts_strength plays a longer one
+        wins, losses, draws = play_match(load_deck("zoo.hsdeck"), 6, 20, seed=0)
+        self.assertGreater(wins, 2 * losses)
+
+    def test_determinize(self):
+        deck1 = Deck([StonetuskBoar()] * 30, CHARACTER_CLASS.MAGE)
+        deck2 = Deck([Misdirection(), FreezingTrap(), ExplosiveTrap()] * 2 + [BloodfenRaptor()] * 24,
+                     CHARACTER_CLASS.HUNTER)
+        game = Game([deck1, deck2], [DoNothingBot(), DoNothingBot()])
+        game.pre_game()
+        game.current_player = game.players[0]
+        game.other_player = game.players[1]
+        opponent = game.players[1]
+        secret = opponent.deck.take(0)
+        secret.player = opponent
+        opponent.secrets.append(secret)
+        hand = [card.name for card in opponent.hand]
+        self.assertIn("The Coin", hand)
+
+        secrets = set()
+        hand_cards = set()
+        for seed in range(0, 50):
+            copied_game = game.copy()
+            determinize(copied_game, 0, random.Random(seed))
+            copied_opponent = copied_game.players[1]
+            self.assertEqual(len(hand), len(copied_opponent.hand))
+            self.assertEqual(hand.index("The Coin"), [card.name for card in copied_opponent.hand].index("The Coin"))
+            self.assertEqual(1, len(copied_opponent.secrets))
+            self.assertIsInstance(copied_opponent.secrets[0], SecretCard)
+            self.assertEqual(opponent.deck.left, copied_opponent.deck.left)
+            self.assertEqual(copied_opponent.deck.calculate_state_hash(), copied_opponent.deck.state_hash)
+            secrets.add(copied_opponent.secrets[0].name)
+            hand_cards.update(card.name for card in copied_opponent.hand)
+            # The agent's own cards are known to it
+            self.assertEqual([card.name for card in game.players[0].hand],
+                             [card.name for card in copied_game.players[0].hand])
+
+        self.assertEqual({"Misdirection", "Freezing Trap", "Explosive Trap"}, secrets)
+        self.assertIn("Misdirection", hand_cards)
+        # The game copied is left as it was
+        self.assertEqual(hand, [card.name for card in opponent.hand])
+        self.assertEqual([secret], opponent.secrets)
+        self.assertEqual(opponent.deck.calculate_state_hash(), opponent.deck.state_hash)
+
+    def test_MCTSAgent_lethal(self):
+        # Two boars can attack the enemy hero, which has two health left.  Both attacks must be found, and the tree
+        # kept from the first is added to for the second.
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingBot, DoNothingBot)
+        game.play_single_turn()
+        game.play_single_turn()
+        player = game.players[0]
+        for index in range(0, 2):
+            StonetuskBoar().summon(player, game, index)
+        player.agent = MCTSAgent(iterations=30, seed=1857)
+        game.players[1].hero.health = 2
+        game._start_turn()
+        player.agent.do_turn(player)
+
+        self.assertTrue(game.game_ended)
+        self.assertTrue(game.players[1].hero.dead)
+        self.assertGreater(player.agent.last_iterations, 30)
+
+    def test_MCTSAgent_time_limit(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingBot, DoNothingBot)
+        # How many iterations fit in the time depends on the machine, so only the search itself is checked
+        agent = MCTSAgent(time_limit=0.05, seed=1857)
+        game.players[0].agent = agent
+        game.play_single_turn()
+        game.play_single_turn()
+        start = time.time()
+        game.play_single_turn()
+        self.assertGreater(agent.last_iterations, 0)
+        self.assertLess(time.time() - start, 5)
+
+    def test_MCTSAgent_processes(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingBot, DoNothingBot)
+        agent = MCTSAgent(iterations=10, processes=2, seed=1857)
+        game.players[0].agent = agent
+        game.play_single_turn()
+        game.play_single_turn()
+        game.play_single_turn()
+        self.assertGreater(len(game.players[0].minions), 0)
+        self.assertEqual(20, agent.last_iterations)
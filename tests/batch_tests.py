@@ -0,0 +1,88 @@
+import ast
+import gc
+import os
+import unittest
+
+import hearthbreaker
+from hearthbreaker.agents.basic_agents import RandomAgent, PredictableBot
+from hearthbreaker.batch import load_deck, find_agent, run_batch, play_game, WIN, LOSS, DRAW
+from hearthbreaker.constants import CHARACTER_CLASS
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        self.zoo = load_deck("zoo.hsdeck")
+        self.example = load_deck("example.hsdeck")
+
+    def test_load_deck(self):
+        self.assertEqual(30, len(self.zoo.cards))
+        self.assertEqual(CHARACTER_CLASS.WARLOCK, self.zoo.character_class)
+        self.assertEqual(CHARACTER_CLASS.MAGE, self.example.character_class)
+        self.assertEqual("Shieldbearer", self.zoo.cards[0].name)
+
+    def test_find_agent(self):
+        self.assertIs(RandomAgent, find_agent("RandomAgent"))
+        self.assertRaises(Exception, find_agent, "NoSuchAgent")
+
+    def test_play_game(self):
+        specs = [([card.name for card in self.zoo.cards], self.zoo.character_class),
+                 ([card.name for card in self.example.cards], self.example.character_class)]
+        outcome, turns = play_game(specs, [RandomAgent, RandomAgent], 1857)
+        self.assertIn(outcome, [WIN, LOSS, DRAW])
+        self.assertGreater(turns, 0)
+        self.assertEqual((outcome, turns), play_game(specs, [RandomAgent, RandomAgent], 1857))
+
+    def test_run_batch(self):
+        result = run_batch(self.zoo, self.example, RandomAgent, PredictableBot, games=12, processes=1, seed=1857)
+        self.assertEqual(12, result.games)
+        self.assertEqual(12, result.wins + result.losses + result.draws)
+        self.assertGreater(result.games_per_second, 0)
+        self.assertGreater(result.mean_length, 0)
+
+    def test_batch_independent_of_processes(self):
+        serial = run_batch(self.zoo, self.example, games=8, processes=1, seed=42)
+        parallel = run_batch(self.zoo, self.example, games=8, processes=2, seed=42, chunk_size=3)
+        self.assertEqual(serial.lengths, parallel.lengths)
+        self.assertEqual((serial.wins, serial.losses, serial.draws),
+                         (parallel.wins, parallel.losses, parallel.draws))
+
+    def test_no_classes_created(self):
+        def count_classes():
+            return sum(1 for obj in gc.get_objects() if isinstance(obj, type))
+
+        def play_games(seeds):
+            names = [card.name for card in self.zoo.cards]
+            opponent = ([card.name for card in self.example.cards], self.example.character_class)
+            for seed in seeds:
+                for character_class in range(CHARACTER_CLASS.MAGE, CHARACTER_CLASS.WARLOCK + 1):
+                    play_game([(names, character_class), opponent], [RandomAgent, RandomAgent], seed)
+
+        play_games([0])
+        gc.collect()
+        gc.disable()
+        try:
+            before = count_classes()
+            play_games([1, 2])
+            self.assertEqual(before, count_classes())
+        finally:
+            gc.enable()
+
+    def test_no_classes_in_functions(self):
+        # The games above only play some of the cards, so every card is checked by looking for classes which would be
+        # created again each time the function defining them is called
+        package = os.path.dirname(hearthbreaker.__file__)
+        nested = []
+
+        def find_nested(node, path, in_function):
+            for child in ast.iter_child_nodes(node):
+                if isinstance(child, ast.ClassDef) and in_function:
+                    nested.append("{0}:{1} {2}".format(path, child.lineno, child.name))
+                find_nested(child, path, in_function or isinstance(child, (ast.FunctionDef, ast.Lambda)))
+
+        for directory, directories, files in os.walk(package):
+            for file_name in files:
+                if file_name.endswith(".py"):
+                    path = os.path.join(directory, file_name)
+                    with open(path) as source:
+                        find_nested(ast.parse(source.read()), os.path.relpath(path, package), False)
+        self.assertEqual([], nested)
@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+
+from benchmarks.suite import run_suite, save_results, load_results, compare_results, slower_probability, median, \
+    BENCHMARKS, REGRESSED, IMPROVED, UNCHANGED
+
+
+def results(benchmarks):
+    return {"version": 1, "benchmarks": dict((name, {"number": 1, "samples": samples})
+                                             for name, samples in benchmarks.items())}
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_median(self):
+        self.assertEqual(2, median([3, 1, 2]))
+        self.assertEqual(2.5, median([4, 1, 2, 3]))
+
+    def test_slower_probability(self):
+        baseline = [1.0, 1.1, 0.9, 1.05, 0.95, 1.0, 1.02, 0.98]
+        self.assertLess(slower_probability(baseline, [sample * 1.5 for sample in baseline]), 0.01)
+        self.assertGreater(slower_probability(baseline, [sample * 0.5 for sample in baseline]), 0.99)
+        self.assertAlmostEqual(0.5, slower_probability(baseline, baseline), 1)
+
+    def test_compare(self):
+        baseline = [1.0, 1.1, 0.9, 1.05, 0.95, 1.0, 1.02, 0.98, 1.01, 0.99]
+        comparisons = compare_results(results({"slower": baseline, "faster": baseline, "same": baseline,
+                                               "removed": baseline}),
+                                      results({"slower": [sample * 1.5 for sample in baseline],
+                                               "faster": [sample * 0.5 for sample in baseline],
+                                               "same": list(reversed(baseline))}))
+        verdicts = dict((name, verdict) for name, before, after, p, verdict in comparisons)
+        self.assertEqual({"slower": REGRESSED, "faster": IMPROVED, "same": UNCHANGED}, verdicts)
+        # A significant change smaller than the threshold isn't reported
+        comparisons = compare_results(results({"slightly_slower": baseline}),
+                                      results({"slightly_slower": [sample + 0.01 for sample in baseline]}))
+        self.assertEqual(UNCHANGED, comparisons[0][4])
+
+    def test_run(self):
+        self.assertEqual(len(BENCHMARKS), len(set(name for name, setup, args, number in BENCHMARKS)))
+        run = run_suite(2, ["trigger.", "play_card.Fireball"])
+        self.assertEqual(["play_card.Fireball", "trigger.1", "trigger.8"], sorted(run["benchmarks"]))
+        for name, benchmark in run["benchmarks"].items():
+            self.assertEqual(2, len(benchmark["samples"]))
+
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            save_results(run, path)
+            self.assertEqual(run, load_results(path))
+        finally:
+            os.remove(path)
@@ -0,0 +1,100 @@
+import io
+import unittest
+
+import hearthbreaker.card_index
+import hearthbreaker.game_objects
+from hearthbreaker.card_registry import registry, generate_rows, write_index, CardRegistry, MINION, SPELL, SECRET, \
+    WEAPON, MAX_LINE_LENGTH
+from hearthbreaker.cards import Wisp, Fireball, Snipe, FieryWarAxe, ShatteredSunCleric
+from hearthbreaker.cards.spells.mage import _MirrorImageMinion
+from hearthbreaker.constants import CHARACTER_CLASS, CARD_RARITY, MINION_TYPE
+from hearthbreaker.game_objects import card_lookup, TheCoin, MinionCard, Minion
+
+
+# Shares its name with a card in the index, but not its battlecry.  Private, so it isn't indexed itself.
+class _WispWithBattlecry(MinionCard):
+    def __init__(self):
+        super().__init__("Wisp", 0, CHARACTER_CLASS.ALL, CARD_RARITY.SPECIAL)
+
+    def create_minion(self, player):
+        return Minion(1, 1, battlecry=lambda minion: None)
+
+
+class TestCardRegistry(unittest.TestCase):
+    def test_index_up_to_date(self):
+        self.assertEqual(generate_rows(), hearthbreaker.card_index.CARDS,
+                         "The card index is out of date.  Run python -m hearthbreaker.card_registry")
+
+    def test_index_line_length(self):
+        index = io.StringIO()
+        write_index(index)
+        for line in index.getvalue().splitlines():
+            self.assertLessEqual(len(line), MAX_LINE_LENGTH, line)
+        namespace = {}
+        exec(index.getvalue(), namespace)
+        self.assertEqual(generate_rows(), namespace["CARDS"])
+
+    def test_lookup(self):
+        self.assertIs(Wisp, registry.card_class("Wisp"))
+        self.assertIs(TheCoin, registry.card_class("The Coin"))
+        self.assertIsInstance(card_lookup("Fireball"), Fireball)
+        self.assertNotIn("Not a card", registry)
+        self.assertRaises(KeyError, card_lookup, "Not a card")
+
+    def test_unindexed_lookup(self):
+        self.assertRaises(KeyError, card_lookup, "Another missing card")
+        # The miss is remembered, so looking the card up again doesn't search every card again
+        self.assertIn("Another missing card", hearthbreaker.game_objects._unindexed_cards)
+        self.assertIsNone(hearthbreaker.game_objects._unindexed_cards["Another missing card"])
+        self.assertRaises(KeyError, card_lookup, "Another missing card")
+
+    def test_info(self):
+        info = registry.info("Snipe")
+        self.assertEqual(2, info.mana)
+        self.assertEqual(CHARACTER_CLASS.HUNTER, info.character_class)
+        self.assertEqual(CARD_RARITY.COMMON, info.rarity)
+        self.assertIsNone(info.minion_type)
+        self.assertEqual(SECRET, info.type)
+        self.assertIs(Snipe, info.card_class)
+
+        self.assertEqual(WEAPON, registry.info("Fiery War Axe").type)
+        self.assertIs(FieryWarAxe, registry.info("Fiery War Axe").card_class)
+        self.assertEqual(SPELL, registry.info("Fireball").type)
+        self.assertEqual(MINION, registry.info("Wisp").type)
+
+    def test_battlecry(self):
+        self.assertTrue(registry.info("Shattered Sun Cleric").battlecry)
+        self.assertFalse(registry.info("Wisp").battlecry)
+        self.assertFalse(registry.info("Fireball").battlecry)
+        self.assertTrue(ShatteredSunCleric().has_battlecry())
+        self.assertFalse(Wisp().has_battlecry())
+
+        # Cards which aren't in the index have their minion examined instead, even if they share a name with one that is
+        self.assertTrue(_WispWithBattlecry().has_battlecry())
+        self.assertFalse(_MirrorImageMinion().has_battlecry())
+
+    def test_indexes(self):
+        zero_cost = [info.name for info in registry.by_cost[0]]
+        self.assertIn("Wisp", zero_cost)
+        self.assertIn("The Coin", zero_cost)
+        self.assertNotIn("Fireball", zero_cost)
+
+        for info in registry.by_class[CHARACTER_CLASS.MAGE]:
+            self.assertEqual(CHARACTER_CLASS.MAGE, info.character_class)
+        self.assertIn(registry.info("Fireball"), registry.by_class[CHARACTER_CLASS.MAGE])
+
+        for info in registry.by_rarity[CARD_RARITY.LEGENDARY]:
+            self.assertEqual(CARD_RARITY.LEGENDARY, info.rarity)
+
+        murlocs = [info.name for info in registry.by_minion_type[MINION_TYPE.MURLOC]]
+        self.assertIn("Murloc Raider", murlocs)
+        self.assertNotIn("Wisp", murlocs)
+
+    def test_no_instantiation(self):
+        rows = [("Test Card", "hearthbreaker.no_such_module", "TestCard", 3, CHARACTER_CLASS.ALL, CARD_RARITY.COMMON,
+                 MINION_TYPE.BEAST, MINION)]
+        test_registry = CardRegistry(rows)
+        self.assertEqual(1, len(test_registry))
+        self.assertEqual(3, test_registry.info("Test Card").mana)
+        self.assertEqual("Test Card", test_registry.by_minion_type[MINION_TYPE.BEAST][0].name)
+        self.assertRaises(ImportError, lambda: test_registry.card_class("Test Card"))
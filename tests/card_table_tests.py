@@ -0,0 +1,84 @@
+import unittest
+
+import hearthbreaker.card_data
+from hearthbreaker.agents.basic_agents import DoNothingBot
+from hearthbreaker.card_registry import registry, MINION, SPELL, SECRET, WEAPON
+from hearthbreaker.card_table import table, read_csv, CardTable, COLUMNS
+from hearthbreaker.cards import StonetuskBoar
+from hearthbreaker.constants import CHARACTER_CLASS, CARD_RARITY, MINION_TYPE, CARD_SET
+from hearthbreaker.game_objects import card_lookup
+from tests.testing_utils import generate_game_for
+
+
+class TestCardTable(unittest.TestCase):
+    def test_data_up_to_date(self):
+        csv_file = open("cards.csv", "r")
+        columns = read_csv(csv_file)
+        csv_file.close()
+        for column in COLUMNS:
+            self.assertEqual(columns[column], table.columns[column],
+                             "The card data is out of date.  Run python -m hearthbreaker.card_table")
+
+    def test_matches_implementations(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingBot, DoNothingBot)
+        for name in table.columns["name"]:
+            info = registry.info(name)
+            self.assertEqual(info.mana, table.value(name, "mana"), name)
+            self.assertEqual(info.character_class, table.value(name, "character_class"), name)
+            self.assertEqual(info.rarity, table.value(name, "rarity"), name)
+            self.assertEqual(SPELL if info.type == SECRET else info.type, table.value(name, "type"), name)
+            if info.type == MINION:
+                self.assertEqual(info.minion_type, table.value(name, "minion_type"), name)
+                minion = card_lookup(name).create_minion(game.current_player)
+                minion.player = game.current_player
+                minion.silence()
+                self.assertEqual(table.value(name, "attack"), minion.calculate_attack(), name)
+                self.assertEqual(table.value(name, "health"), minion.health, name)
+            elif info.type == WEAPON:
+                weapon = card_lookup(name).create_weapon(game.current_player)
+                self.assertEqual(table.value(name, "attack"), weapon.base_attack, name)
+                self.assertEqual(table.value(name, "health"), weapon.durability, name)
+            else:
+                self.assertEqual(MINION_TYPE.NONE, table.value(name, "minion_type"), name)
+                self.assertIsNone(table.value(name, "attack"), name)
+
+    def test_select(self):
+        beasts = table.select(mana=2, minion_type=MINION_TYPE.BEAST)
+        self.assertIn("Bloodfen Raptor", beasts)
+        self.assertIn("River Crocolisk", beasts)
+        self.assertNotIn("Murloc Tidehunter", beasts)
+        for name in beasts:
+            self.assertEqual(2, table.value(name, "mana"))
+            self.assertEqual(MINION_TYPE.BEAST, table.value(name, "minion_type"))
+        self.assertEqual(list(beasts), sorted(beasts))
+
+        self.assertEqual(len(table), len(table.select()))
+        self.assertIn("Fireball", table.select(character_class=CHARACTER_CLASS.MAGE, type=SPELL, set=CARD_SET.BASIC))
+        self.assertIn("Haunted Creeper", table.select(set=CARD_SET.NAXXRAMAS))
+        self.assertEqual((), table.select(mana=30))
+        self.assertRaises(KeyError, table.select, rarity=CARD_RARITY.COMMON)
+
+    def test_random_card(self):
+        neutral_minions = table.select(character_class=CHARACTER_CLASS.ALL, type=MINION)
+        self.assertEqual(neutral_minions[0], table.random_card(lambda lower, upper: lower,
+                                                               character_class=CHARACTER_CLASS.ALL, type=MINION))
+        self.assertEqual(neutral_minions[-1], table.random_card(lambda lower, upper: upper,
+                                                                character_class=CHARACTER_CLASS.ALL, type=MINION))
+        for i in range(0, 20):
+            name = table.random_card(character_class=CHARACTER_CLASS.ALL, type=MINION)
+            self.assertEqual(CHARACTER_CLASS.ALL, table.value(name, "character_class"))
+            self.assertEqual(MINION, table.value(name, "type"))
+        self.assertIsNone(table.random_card(mana=30))
+
+    def test_columns(self):
+        self.assertIs(hearthbreaker.card_data.NAME, table.columns["name"])
+        columns = {"name": ("Test Card",), "text": ("",), "mana": (3,), "attack": (1,), "health": (2,),
+                   "character_class": (CHARACTER_CLASS.ALL,), "minion_type": (MINION_TYPE.BEAST,),
+                   "rarity": (CARD_RARITY.COMMON,), "type": (MINION,), "set": (CARD_SET.EXPERT,)}
+        test_table = CardTable(columns)
+        self.assertEqual(1, len(test_table))
+        self.assertIn("Test Card", test_table)
+        self.assertEqual(("Test Card",), test_table.select(mana=3, minion_type=MINION_TYPE.BEAST,
+                                                           character_class=CHARACTER_CLASS.ALL, type=MINION,
+                                                           set=CARD_SET.EXPERT))
+        self.assertEqual((), test_table.select(mana=3, minion_type=MINION_TYPE.MURLOC))
@@ -2453,6 +2453,8 @@ class TestCommon(unittest.TestCase):
         self.assertEqual(1, len(game.other_player.minions))
 
         self.assertEqual("Water Elemental", game.other_player.minions[0].card.name)
+        # The minion is taken out of the deck
+        self.assertEqual(23, game.other_player.deck.left)
 
         for turn in range(0, 2):
             game.play_single_turn()
@@ -2677,6 +2679,8 @@ class TestCommon(unittest.TestCase):
         game.play_single_turn()
 
         self.assertEqual(1, len(game.other_player.secrets))
+        # The secret is taken out of the deck
+        self.assertEqual(24, game.other_player.deck.left)
 
         game.play_single_turn()
         self.assertEqual(2, len(game.current_player.secrets))
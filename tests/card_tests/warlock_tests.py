@@ -7,6 +7,7 @@ from tests.agents.testing_agents import OneSpellTestingAgent, MinionPlayingAgent
 from hearthbreaker.constants import MINION_TYPE
 from tests.testing_utils import generate_game_for
 from hearthbreaker.cards import *
+from hearthbreaker.cards.minions.warlock import Infernal
 
 
 class TestWarlock(unittest.TestCase):
@@ -278,6 +279,8 @@ class TestWarlock(unittest.TestCase):
         self.assertEqual(7, len(game.players[0].hand))
         self.assertEqual('Doomguard', game.players[0].hand[5].name)
         self.assertEqual('Doomguard', game.players[0].hand[6].name)
+        # One card is drawn at the start of the turn, and the two Doomguards are taken out of the deck
+        self.assertEqual(22, game.players[0].deck.left)
 
         for turn in range(0, 4):
             game.play_single_turn()
@@ -446,6 +449,18 @@ class TestWarlock(unittest.TestCase):
         self.assertEqual(8, game.current_player.mana)
         self.assertEqual(24, game.other_player.hero.health)
 
+    def test_Infernal(self):
+        game = generate_game_for([Hellfire, Infernal], StonetuskBoar, MinionPlayingAgent, DoNothingBot)
+        for turn in range(0, 11):
+            game.play_single_turn()
+
+        # The infernal is played from hand like any other minion, and is a demon without a battlecry
+        self.assertEqual(1, len(game.current_player.minions))
+        self.assertEqual(6, game.current_player.minions[0].calculate_attack())
+        self.assertEqual(6, game.current_player.minions[0].calculate_max_health())
+        self.assertEqual(MINION_TYPE.DEMON, game.current_player.minions[0].card.minion_type)
+        self.assertIsNone(game.current_player.minions[0].battlecry)
+
     def test_Jaraxxus_with_secrets(self):
         class SecretTester(DoNothingBot):
             def __init__(self):
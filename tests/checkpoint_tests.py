@@ -0,0 +1,141 @@
+import random
+import unittest
+
+from hearthbreaker.agents.basic_agents import DoNothingBot, RandomAgent
+from hearthbreaker.batch import load_deck
+from hearthbreaker.cards import StonetuskBoar, ChillwindYeti, StormwindChampion, KnifeJuggler, Wisp, Lightspawn
+from hearthbreaker.constants import CHARACTER_CLASS
+from hearthbreaker.game_objects import Game, Deck, GameException, card_lookup
+from tests.agents.testing_agents import MinionPlayingAgent
+from tests.testing_utils import generate_game_for
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+
+    def test_rollback_attack(self):
+        game = generate_game_for(StonetuskBoar, Wisp, MinionPlayingAgent, DoNothingBot)
+        for turn in range(0, 4):
+            game.play_single_turn()
+        KnifeJuggler().summon(game.players[1], game, 0)
+        ChillwindYeti().summon(game.players[1], game, 1)
+        StormwindChampion().summon(game.players[0], game, 0)
+        game._start_turn()
+
+        player = game.current_player
+        juggler, yeti = game.other_player.minions
+        minions = [list(p.minions) for p in game.players]
+        hand = list(player.hand)
+        state_hash = game.calculate_state_hash(True)
+        epoch = game.epoch
+        checkpoint = game.checkpoint()
+
+        for attempt in range(0, 2):
+            for minion in list(player.minions):
+                if minion.can_attack():
+                    minion.attack()
+            game.play_card(player.hand[0])
+            self.assertTrue(juggler.dead)
+            self.assertEqual([yeti], game.other_player.minions)
+            self.assertEqual(3, yeti.health)
+            self.assertEqual(2, len(player.minions))
+
+            game.rollback(checkpoint)
+            self.assertEqual(minions, [p.minions for p in game.players])
+            self.assertEqual(hand, player.hand)
+            self.assertFalse(juggler.dead)
+            self.assertEqual(5, yeti.health)
+            self.assertEqual([2, 2], [minion.calculate_attack() for minion in player.minions[1:]])
+            self.assertEqual(state_hash, game.calculate_state_hash(True))
+            self.assertLess(epoch, game.epoch)
+
+        self.assertRaises(GameException, game.copy().rollback, checkpoint)
+
+    def test_rollback_instance_attributes(self):
+        # Lightspawn replaces the calculate_attack method of its minion, which is kept in the minion's dictionary
+        # rather than in a slot
+        game = generate_game_for(StonetuskBoar, Wisp, MinionPlayingAgent, DoNothingBot)
+        game.play_single_turn()
+        Lightspawn().summon(game.players[0], game, 0)
+        lightspawn = game.players[0].minions[0]
+        self.assertEqual(5, lightspawn.calculate_attack())
+
+        checkpoint = game.checkpoint()
+        lightspawn.silence()
+        self.assertEqual(0, lightspawn.calculate_attack())
+        game.rollback(checkpoint)
+        self.assertEqual(5, lightspawn.calculate_attack())
+        lightspawn.damage(2, None)
+        self.assertEqual(3, lightspawn.calculate_attack())
+
+    def test_rollback_turns(self):
+        def new_game():
+            random.seed(1857)
+            decks = [load_deck("zoo.hsdeck"), load_deck("example.hsdeck")]
+            decks = [Deck([card_lookup(card.name) for card in deck.cards], CHARACTER_CLASS.PRIEST) for deck in decks]
+            game = Game(decks, [RandomAgent(), RandomAgent()])
+            game.pre_game()
+            game.current_player = game.players[1]
+            for turn in range(0, 8):
+                game.play_single_turn()
+            return game
+
+        def finish(game):
+            while not game.game_ended:
+                game.play_single_turn()
+            return game.calculate_state_hash(True)
+
+        game = new_game()
+        checkpoint = game.checkpoint()
+        copied_game = game.copy()
+        copied_hash = copied_game.calculate_state_hash(True)
+        for turn in range(0, 4):
+            game.play_single_turn()
+
+        # A copy made after the checkpoint is unaffected by rolling back
+        later_copy = game.copy()
+        later_hash = later_copy.calculate_state_hash(True)
+        game.rollback(checkpoint)
+        self.assertEqual(later_hash, later_copy.calculate_state_hash(True))
+        self.assertEqual(copied_hash, copied_game.calculate_state_hash(True))
+
+        # Playing on from the checkpoint gives the same game as never having left it, as the random number generator
+        # is rolled back too
+        rolled_back_hash = finish(game)
+        self.assertEqual(finish(new_game()), rolled_back_hash)
+
+    def test_rollback_shared_deck(self):
+        game = generate_game_for(StonetuskBoar, ChillwindYeti, DoNothingBot, DoNothingBot)
+        cards = list(game.players[0].deck.cards)
+        game_hash = game.calculate_state_hash(True)
+        # The copy's deck shares its cards with the game's until a card is drawn from it, when it copies them.  The
+        # checkpoint shares them in turn, so they must be copied again as cards are drawn after it.
+        copied_game = game.copy()
+        copied_game.players[0].draw()
+        checkpoint = copied_game.checkpoint()
+        state_hash = copied_game.calculate_state_hash(True)
+        for attempt in range(0, 3):
+            for draw in range(0, 3):
+                copied_game.players[0].draw()
+            copied_game.rollback(checkpoint)
+            self.assertEqual(state_hash, copied_game.calculate_state_hash(True))
+        self.assertTrue(all(card is original for card, original in zip(game.players[0].deck.cards, cards)))
+        self.assertEqual(game_hash, game.calculate_state_hash(True))
+
+    def test_rollback_random(self):
+        generator = random.Random(1857)
+        decks = [Deck([card_lookup(card.name) for card in load_deck(name).cards], CHARACTER_CLASS.MAGE)
+                 for name in ["zoo.hsdeck", "example.hsdeck"]]
+        game = Game(decks, [RandomAgent(), RandomAgent()], generator.randint)
+        checkpoint = game.checkpoint()
+        rolls = [game.random(0, 1000) for roll in range(0, 10)]
+        game.players[0].draw()
+        game.rollback(checkpoint)
+        self.assertEqual(rolls, [game.random(0, 1000) for roll in range(0, 10)])
+
+        # A random function which isn't a generator's method can't be rolled back, but still works
+        game.random = game.players[0].random = game.players[1].random = lambda low, high: low
+        checkpoint = game.checkpoint()
+        game.rollback(checkpoint)
+        self.assertEqual(0, game.random(0, 1000))
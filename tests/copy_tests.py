@@ -1,6 +1,7 @@
 import random
 import unittest
 
+from hearthbreaker.actions import Attack
 from hearthbreaker.agents.basic_agents import DoNothingBot, PredictableBot
 from tests.agents.testing_agents import SpellTestingAgent, MinionPlayingAgent, PredictableAgentWithoutHeroPower
 from tests.testing_utils import generate_game_for
@@ -66,6 +67,173 @@ class TestGameCopying(unittest.TestCase):
         self.assertEqual(0, len(game.current_player.minions))
         self.assertEqual(0, len(game.other_player.minions))
 
+    def test_shared_deck_and_graveyard(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, MinionPlayingAgent, DoNothingBot)
+        game.play_single_turn()
+        game.play_single_turn()
+        game.players[0].minions[0].die(None)
+        game.check_delayed()
+        graveyard = game.players[0].graveyard
+
+        new_game = game.copy()
+        deck = game.players[0].deck
+        new_deck = new_game.players[0].deck
+        self.assertIs(deck.cards, new_deck.cards)
+        self.assertIs(graveyard, new_game.players[0].graveyard)
+        hand = list(game.players[0].hand)
+        self.assertEqual(hand, new_game.players[0].hand)
+
+        new_game.play_single_turn()
+        new_game.play_single_turn()
+        new_game.play_single_turn()
+        new_game.players[0].minions[0].die(None)
+        new_game.check_delayed()
+
+        # The copy has drawn cards of its own, and the original is unchanged
+        self.assertIsNot(deck.cards, new_deck.cards)
+        self.assertEqual(deck.left - 2, new_deck.left)
+        self.assertEqual(deck.used.count(True) + 2, new_deck.used.count(True))
+        for card in new_game.players[0].hand:
+            if card not in hand:
+                self.assertNotIn(card, deck.cards)
+        self.assertEqual(0, len(game.players[0].minions))
+        self.assertIs(graveyard, game.players[0].graveyard)
+        self.assertIsNot(graveyard, new_game.players[0].graveyard)
+
+        game.play_single_turn()
+        self.assertEqual(deck.left, new_deck.left + 1)
+
+    def test_shared_hand(self):
+        game = generate_game_for(Moonfire, Counterspell, DoNothingBot, SpellTestingAgent)
+        for turn in range(0, 6):
+            game.play_single_turn()
+        self.assertEqual(["Counterspell"], [secret.name for secret in game.players[1].secrets])
+        hand = list(game.players[0].hand)
+
+        # The copy's Counterspell cancels the first Moonfire played in the copy, but the card it cancels is the copy's
+        # own, so the same Moonfire isn't cancelled in the original
+        copied_game = game.copy()
+        self.assertEqual(hand, copied_game.players[0].hand)
+        copied_game.players[0].agent = SpellTestingAgent()
+        copied_game.play_single_turn()
+        self.assertEqual(24, copied_game.players[1].hero.health)
+        self.assertEqual(hand, game.players[0].hand)
+        for card in hand:
+            self.assertFalse(card.cancel)
+            self.assertIsNone(card.target)
+
+        game.players[0].agent = SpellTestingAgent()
+        game.play_single_turn()
+        self.assertEqual(24, game.players[1].hero.health)
+        self.assertEqual(0, len(game.players[1].secrets))
+
+    def test_shared_hand_keeps_cards(self):
+        # Copying the game doesn't change the cards in the original's hand, so a discount on one of them still applies
+        game = generate_game_for(FarSight, StonetuskBoar, DoNothingBot, DoNothingBot)
+        game.play_single_turn()
+        player = game.current_player
+        player.mana = 3
+        game.play_card(player.hand[0])
+        drawn = player.hand[-1]
+        self.assertEqual(0, drawn.mana_cost(player))
+
+        player.mana = 0
+        game.copy()
+        self.assertIs(drawn, player.hand[-1])
+        self.assertTrue(drawn.can_use(player, game))
+        game.play_card(drawn)
+        self.assertNotIn(drawn, player.hand)
+        self.assertEqual(0, player.mana)
+
+    def test_copy_is_independent(self):
+        # Deathrattles, triggers and weapons in the copy act on the copy alone
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingBot, DoNothingBot)
+        game.play_single_turn()
+        player = game.players[0]
+        for card in [KnifeJuggler(), Abomination(), LeperGnome(), VentureCoMercenary()]:
+            card.summon(player, game, len(player.minions))
+        FieryWarAxe().use(player, game)
+        state_hash = game.calculate_state_hash(True)
+        mana_filters = list(player.mana_filters)
+
+        copied_game = game.copy()
+        copied_player = copied_game.players[0]
+        self.assertEqual(3, copied_player.hero.weapon.base_attack)
+        self.assertIs(copied_game, copied_player.hero.weapon.game)
+        self.assertEqual(1, len(copied_player.mana_filters))
+        StonetuskBoar().summon(copied_player, copied_game, 0)
+        for minion in list(copied_player.minions):
+            minion.die(None)
+        copied_game.check_delayed()
+        self.assertEqual(0, len(copied_player.mana_filters))
+        self.assertEqual(22, copied_game.players[1].hero.health)
+
+        self.assertEqual(state_hash, game.calculate_state_hash(True))
+        self.assertEqual(mana_filters, player.mana_filters)
+        self.assertEqual(27, game.players[1].hero.health)
+        self.assertEqual(4, len(player.minions))
+
+    def test_hero_bound_handlers(self):
+        # Weapons and minions which bind functions to their player's hero bind them to the hero of a copy, so the copy
+        # plays on just as the original does
+        def play_on(play, check):
+            game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingBot, DoNothingBot)
+            game.play_single_turn()
+            game.play_single_turn()
+            game._start_turn()
+            ChillwindYeti().summon(game.other_player, game, 0)
+            play(game)
+            copied_game = game.copy()
+            for each_game in [game, copied_game]:
+                Attack(each_game.current_player.hero, each_game.other_player.minions[0]).perform(each_game)
+                check(each_game)
+            self.assertEqual(game.calculate_state_hash(True), copied_game.calculate_state_hash(True))
+
+        def truesilver(game):
+            game.current_player.hero.health = 20
+            TruesilverChampion().use(game.current_player, game)
+
+        def gorehowl(game):
+            Gorehowl().use(game.current_player, game)
+
+        def spiteful_smith(game):
+            SpitefulSmith().summon(game.current_player, game, 0)
+            game.current_player.minions[0].damage(1, None)
+            FieryWarAxe().use(game.current_player, game)
+
+        play_on(truesilver, lambda game: self.assertEqual(18, game.current_player.hero.health))
+        play_on(gorehowl, lambda game: self.assertEqual((1, 7), (game.current_player.hero.weapon.durability,
+                                                                 game.current_player.hero.weapon.base_attack)))
+        # The smith's bonus gives the axe enough attack to kill the yeti
+        play_on(spiteful_smith, lambda game: self.assertEqual((0, 26), (len(game.other_player.minions),
+                                                                        game.current_player.hero.health)))
+
+        # Healing the smith in the copy takes away the weapon's bonus
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingBot, DoNothingBot)
+        game.play_single_turn()
+        spiteful_smith(game)
+        copied_game = game.copy()
+        copied_game.current_player.minions[0].heal(1, None)
+        self.assertEqual(3, copied_game.current_player.hero.weapon.base_attack)
+        self.assertEqual(5, game.current_player.hero.weapon.base_attack)
+
+    def test_auras_copied(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, DoNothingBot, DoNothingBot)
+        game.play_single_turn()
+        for card in [RaidLeader(), Wisp(), StormwindChampion()]:
+            card.summon(game.players[0], game, len(game.players[0].minions))
+        for card in [MurlocWarleader(), MurlocRaider()]:
+            card.summon(game.players[1], game, len(game.players[1].minions))
+        stats = [[(minion.calculate_attack(), minion.health) for minion in player.minions] for player in game.players]
+
+        copied_game = game
+        for copy in range(0, 3):
+            copied_game = copied_game.copy()
+            self.assertEqual(stats, [[(minion.calculate_attack(), minion.health) for minion in player.minions]
+                                     for player in copied_game.players])
+        copied_game.players[0].minions[0].silence()
+        self.assertEqual(2, copied_game.players[0].minions[1].calculate_attack())
+
 
 class TestMinionCopying(unittest.TestCase):
     def setUp(self):
@@ -278,6 +446,24 @@ class TestMinionCopying(unittest.TestCase):
         self.assertTrue(game.current_player.minions[0].charge)
         self.assertTrue(game.current_player.minions[1].charge)
 
+    def test_TundraRhino_copied_repeatedly(self):
+        game = generate_game_for([RiverCrocolisk, TundraRhino], StonetuskBoar, MinionPlayingAgent, DoNothingBot)
+        for turn in range(0, 10):
+            game.play_single_turn()
+
+        for generation in range(0, 20):
+            game = game.copy()
+
+        rhino = game.players[0].minions[0]
+        self.assertEqual("Tundra Rhino", rhino.card.name)
+        self.assertEqual(1, len(rhino.effects))
+        # The aura only refers to the minions of its own game, rather than those of every game it was copied from
+        self.assertEqual([game.players[0].minions[1]], rhino.effects[0].affected_minions)
+        self.assertTrue(game.players[0].minions[1].charge)
+
+        rhino.silence()
+        self.assertFalse(game.players[0].minions[1].charge)
+
     def test_StarvingBuzzard(self):
         game = generate_game_for(StarvingBuzzard, [StonetuskBoar, FacelessManipulator, Maexxna, CoreHound],
                                  MinionPlayingAgent, create_enemy_copying_agent())
@@ -1,12 +1,45 @@
+import copy
 import random
 import unittest
 
-from hearthbreaker.agents.basic_agents import DoNothingBot, PredictableBot
+import hearthbreaker.card_registry
+import hearthbreaker.targeting
+from hearthbreaker.actions import PlayCard, Attack, UsePower, EndTurn
+from hearthbreaker.agents.basic_agents import DoNothingBot, PredictableBot, RandomActionAgent
+from hearthbreaker.batch import load_deck, play_game
 from tests.agents.testing_agents import SpellTestingAgent, MinionPlayingAgent
 from hearthbreaker.constants import CHARACTER_CLASS
 from tests.testing_utils import generate_game_for, mock
-from hearthbreaker.cards import StonetuskBoar, ArcaneIntellect, Naturalize, Abomination, NerubianEgg, SylvanasWindrunner
-from hearthbreaker.game_objects import Game, Deck, Bindable, card_lookup, SecretCard
+from hearthbreaker.cards import StonetuskBoar, ArcaneIntellect, Naturalize, Abomination, NerubianEgg, \
+    SylvanasWindrunner, StormwindChampion, DireWolfAlpha, Moonfire, Wrath
+from hearthbreaker.game_objects import Game, Deck, Bindable, card_lookup, SecretCard, GameException, aura_cache, \
+    mana_cost_cache, ManaCostFilter, card_type_filter, delayed_checks
+
+
+class _HashCheckingAgent(RandomActionAgent):
+    # Checks the hash kept by the game before each action, after undoing an action and in a copy of the game.  Run
+    # with Game.check_state_hash set, so any difference from a hash calculated from scratch raises an exception.
+    def do_turn(self, player):
+        game = player.game
+        while not game.game_ended:
+            state_hash = game.state_hash()
+            actions = game.legal_actions()
+            action = actions[random.randint(0, len(actions) - 1)]
+            if isinstance(action, EndTurn):
+                return
+            if random.randint(0, 3) == 0:
+                self.check_copy(game, state_hash)
+            checkpoint = game.checkpoint()
+            action.perform(game)
+            game.state_hash()
+            game.rollback(checkpoint)
+            if game.state_hash() != state_hash:
+                raise GameException("Rolling back didn't restore the state hash")
+            actions[actions.index(action)].perform(game)
+
+    def check_copy(self, game, state_hash):
+        if game.copy().state_hash() != state_hash:
+            raise GameException("The copy's state hash is different")
 
 
 class TestGame(unittest.TestCase):
@@ -150,6 +183,324 @@ class TestGame(unittest.TestCase):
 
         self.assertEqual(1, len(game.current_player.minions))
 
+    def test_aura_cache(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, MinionPlayingAgent, DoNothingBot)
+
+        for turn in range(0, 5):
+            game.play_single_turn()
+
+        boars = list(game.current_player.minions)
+        self.assertEqual(3, len(boars))
+        StormwindChampion().summon(game.current_player, game, 1)
+        self.assertEqual([2, 2, 2], [boar.calculate_attack() for boar in boars])
+
+        aura_cache.reset()
+        self.assertEqual([2, 2, 2], [boar.calculate_attack() for boar in boars])
+        self.assertEqual([2, 2, 2], [boar.calculate_max_health() for boar in boars])
+        self.assertEqual(6, aura_cache.hits)
+        self.assertEqual(0, aura_cache.misses)
+
+        # Summoning a minion changes the board, so the bonuses are recalculated
+        DireWolfAlpha().summon(game.current_player, game, 0)
+        aura_cache.reset()
+        self.assertEqual([3, 2, 2], [boar.calculate_attack() for boar in boars])
+        self.assertEqual([3, 2, 2], [boar.calculate_attack() for boar in boars])
+        self.assertEqual(3, aura_cache.misses)
+        self.assertEqual(3, aura_cache.hits)
+
+        game.current_player.minions[2].silence()
+        self.assertEqual([2, 1, 1], [boar.calculate_attack() for boar in boars])
+        self.assertEqual([1, 1, 1], [boar.calculate_max_health() for boar in boars])
+
+    def test_mana_cost_cache(self):
+        game = generate_game_for(StonetuskBoar, ArcaneIntellect, DoNothingBot, DoNothingBot)
+        player = game.players[0]
+        boar = player.hand[0]
+        intellect = game.players[1].hand[0]
+
+        mana_cost_cache.reset()
+        self.assertEqual(1, boar.mana_cost(player))
+        self.assertEqual(1, boar.mana_cost(player))
+        self.assertEqual(1, mana_cost_cache.misses)
+        self.assertEqual(1, mana_cost_cache.hits)
+
+        mana_filter = ManaCostFilter(1, 0, card_type_filter("minion"))
+        player.add_mana_filter(mana_filter)
+        self.assertEqual(0, boar.mana_cost(player))
+        self.assertEqual(3, intellect.mana_cost(game.players[1]))
+        player.remove_mana_filter(mana_filter)
+        self.assertEqual(1, boar.mana_cost(player))
+
+        player.add_card_filter(2, "spell", "turn_ended")
+        game.players[1].add_card_filter(2, "spell", "turn_ended")
+        self.assertEqual(1, boar.mana_cost(player))
+        self.assertEqual(1, intellect.mana_cost(game.players[1]))
+        game.players[1].trigger("turn_ended")
+        self.assertEqual(3, intellect.mana_cost(game.players[1]))
+
+    def test_epoch(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, MinionPlayingAgent, DoNothingBot)
+
+        def changes(function):
+            before = game.epoch
+            function()
+            return game.epoch - before
+
+        self.assertLess(0, changes(game.play_single_turn))
+        self.assertLess(0, changes(game.play_single_turn))
+        boar = game.players[0].minions[0]
+        hero = game.players[1].hero
+        self.assertLess(0, changes(lambda: boar.damage(0, None)))
+        self.assertLess(0, changes(lambda: hero.heal(1, None)))
+        self.assertLess(0, changes(lambda: boar.change_attack(1)))
+        self.assertLess(0, changes(lambda: boar.increase_health(1)))
+        self.assertLess(0, changes(boar.freeze))
+        self.assertLess(0, changes(boar.silence))
+        self.assertLess(0, changes(lambda: hero.increase_armor(1)))
+        self.assertLess(0, changes(game.players[1].draw))
+        self.assertLess(0, changes(game.players[1].discard))
+        self.assertLess(0, changes(lambda: StormwindChampion().summon(game.players[0], game, 0)))
+        self.assertLess(0, changes(lambda: game.players[0].minions[0].die(None)))
+        self.assertLess(0, changes(game.check_delayed))
+        mana_filter = ManaCostFilter(1, 0, card_type_filter("card"))
+        self.assertLess(0, changes(lambda: game.players[0].add_mana_filter(mana_filter)))
+        self.assertEqual(0, changes(lambda: boar.calculate_attack()))
+
+        # Copies carry on from the epoch of the game they were copied from
+        self.assertEqual(game.epoch, game.copy().epoch)
+
+    def test_memoize(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, MinionPlayingAgent, DoNothingBot)
+        calls = []
+
+        def minion_count(player):
+            calls.append(player)
+            return len(player.minions)
+
+        game.play_single_turn()
+        player = game.players[0]
+        self.assertEqual(1, game.memoize("minions", minion_count, player))
+        self.assertEqual(1, game.memoize("minions", minion_count, player))
+        self.assertEqual(0, game.memoize("minions", minion_count, game.players[1]))
+        self.assertEqual(2, len(calls))
+
+        copied_game = game.copy()
+        self.assertEqual(1, copied_game.memoize("minions", minion_count, copied_game.players[0]))
+        self.assertEqual(3, len(calls))
+
+        StonetuskBoar().summon(player, game, 0)
+        self.assertEqual(2, game.memoize("minions", minion_count, player))
+        self.assertEqual(2, game.memoize("minions", minion_count, player))
+        self.assertEqual(4, len(calls))
+        self.assertEqual(1, copied_game.memoize("minions", minion_count, copied_game.players[0]))
+        self.assertEqual(4, len(calls))
+
+    def test_check_delayed(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, MinionPlayingAgent, DoNothingBot)
+        game.play_single_turn()
+        game.play_single_turn()
+        game.play_single_turn()
+        first, second = game.players[0].minions[1], game.players[0].minions[0]
+        self.assertLess(first.born, second.born)
+
+        events = []
+        first.bind("test_event", lambda: events.append(first))
+        second.bind("test_event", lambda: events.append(second))
+        hits, misses = delayed_checks.hits, delayed_checks.misses
+        game.check_delayed()
+        self.assertEqual((hits + 1, misses), (delayed_checks.hits, delayed_checks.misses))
+
+        second.delayed_trigger("test_event")
+        first.delayed_trigger("test_event")
+        second.delayed_trigger("test_event")
+        self.assertEqual([], events)
+        game.check_delayed()
+        self.assertEqual([first, second, second], events)
+        self.assertEqual((hits + 1, misses + 1), (delayed_checks.hits, delayed_checks.misses))
+
+        game.check_delayed()
+        self.assertEqual(3, len(events))
+        self.assertEqual((hits + 2, misses + 1), (delayed_checks.hits, delayed_checks.misses))
+
+    def test_targeting(self):
+        game = generate_game_for(StonetuskBoar, StonetuskBoar, MinionPlayingAgent, MinionPlayingAgent)
+        game.play_single_turn()
+        game.play_single_turn()
+        enemy_boar = game.players[0].minions[0]
+        friendly_boar = game.players[1].minions[0]
+
+        def spell_targetable(character):
+            return character.spell_targetable()
+
+        targets = hearthbreaker.targeting.find_spell_target(game, spell_targetable)
+        self.assertEqual((enemy_boar, friendly_boar, game.players[0].hero, game.players[1].hero), targets)
+        self.assertIs(targets, hearthbreaker.targeting.find_spell_target(game, spell_targetable))
+        self.assertEqual(4, hearthbreaker.targeting.count_targets(game, hearthbreaker.targeting.find_spell_target,
+                                                                  spell_targetable))
+        self.assertEqual(0, hearthbreaker.targeting.count_targets(
+            game, hearthbreaker.targeting.find_enemy_minion_battlecry_target, lambda m: m.taunt))
+        self.assertIsNone(hearthbreaker.targeting.find_enemy_minion_battlecry_target(game, lambda m: m.taunt))
+
+        # Filters created afresh each time are memoized on their code and captured values, rather than filling the
+        # memo with a new entry each time
+        def attack_at_least(attack):
+            return lambda character: character.calculate_attack() >= attack
+
+        entries = len(game._memo)
+        targets = hearthbreaker.targeting.find_spell_target(game, attack_at_least(1))
+        self.assertEqual((enemy_boar, friendly_boar), targets)
+        self.assertIs(targets, hearthbreaker.targeting.find_spell_target(game, attack_at_least(1)))
+        self.assertEqual((), hearthbreaker.targeting.find_spell_target(game, attack_at_least(2)))
+        self.assertEqual(entries + 2, len(game._memo))
+        # A filter capturing something unhashable still works, but isn't memoized
+        allowed = [friendly_boar]
+        self.assertEqual((friendly_boar,), hearthbreaker.targeting.find_spell_target(game, lambda c: c in allowed))
+        self.assertEqual(entries + 2, len(game._memo))
+
+        enemy_boar.die(None)
+        game.check_delayed()
+        targets = hearthbreaker.targeting.find_spell_target(game, spell_targetable)
+        self.assertEqual((friendly_boar, game.players[0].hero, game.players[1].hero), targets)
+        self.assertEqual(3, hearthbreaker.targeting.count_targets(game, hearthbreaker.targeting.find_spell_target,
+                                                                  spell_targetable))
+
+    def test_legal_actions(self):
+        game = generate_game_for(StonetuskBoar, Moonfire, MinionPlayingAgent, DoNothingBot)
+        game.play_single_turn()
+        game.play_single_turn()
+        game._start_turn()
+
+        player = game.current_player
+        boar = player.minions[0]
+        actions = game.legal_actions()
+        self.assertIs(actions, game.legal_actions())
+        plays = [action for action in actions if isinstance(action, PlayCard)]
+        self.assertEqual([(card, None, index, None) for card in player.hand for index in [0, 1]],
+                         [(action.card, action.target, action.index, action.option) for action in plays])
+        attacks = [(action.attacker, action.target) for action in actions if isinstance(action, Attack)]
+        self.assertEqual([(boar, game.other_player.hero)], attacks)
+        powers = [action.target for action in actions if isinstance(action, UsePower)]
+        self.assertEqual([boar, game.other_player.hero, player.hero], powers)
+        self.assertIsInstance(actions[-1], EndTurn)
+
+        [action for action in actions if isinstance(action, Attack)][0].perform(game)
+        self.assertEqual(29, game.other_player.hero.health)
+        actions = game.legal_actions()
+        self.assertEqual(0, len([action for action in actions if isinstance(action, Attack)]))
+
+        [action for action in actions if isinstance(action, PlayCard) and action.index == 0][0].perform(game)
+        self.assertEqual(2, len(player.minions))
+        self.assertIs(boar, player.minions[1])
+        self.assertEqual(1, player.mana)
+        actions = game.legal_actions()
+        self.assertEqual([(player.minions[0], game.other_player.hero)],
+                         [(action.attacker, action.target) for action in actions if isinstance(action, Attack)])
+        self.assertEqual(0, len([action for action in actions if isinstance(action, UsePower)]))
+        self.assertEqual(len(player.hand) * 3, len([action for action in actions if isinstance(action, PlayCard)]))
+
+        # The player's own agent is put back after each action, even one which fails
+        agent = player.agent
+        player.mana = 0
+        self.assertRaises(GameException, PlayCard(player.hand[0], None, 0).perform, game)
+        self.assertIs(agent, player.agent)
+
+        end_turn = game.legal_actions()[-1]
+        self.assertIsInstance(end_turn, EndTurn)
+        end_turn.perform(game)
+        self.assertEqual((), game.legal_actions())
+        game._end_turn()
+        game._start_turn()
+        self.assertIsInstance(game.legal_actions()[-1], EndTurn)
+
+    def test_legal_actions_choose_one(self):
+        game = generate_game_for(Wrath, StonetuskBoar, DoNothingBot, MinionPlayingAgent)
+        for turn in range(0, 4):
+            game.play_single_turn()
+        game._start_turn()
+
+        boar = game.other_player.minions[0]
+        self.assertEqual(6, len(game.current_player.hand))
+        wraths = [action for action in game.legal_actions() if isinstance(action, PlayCard)]
+        # Each Wrath can target either boar, with either option
+        self.assertEqual(6 * 2 * 2, len(wraths))
+        self.assertEqual([(boar, 0), (boar, 1)], [(action.target, action.option) for action in wraths[0:2]])
+
+        # The first option draws a card
+        wraths[0].perform(game)
+        self.assertTrue(boar.dead)
+        self.assertEqual(6, len(game.current_player.hand))
+
+    def test_state_hash(self):
+        def play(turns):
+            random.seed(1857)
+            game = generate_game_for(StonetuskBoar, ArcaneIntellect, MinionPlayingAgent, SpellTestingAgent)
+            for turn in range(0, turns):
+                game.play_single_turn()
+            return game
+
+        game = play(6)
+        self.assertEqual(play(6).state_hash(), game.state_hash())
+        self.assertNotEqual(play(5).state_hash(), game.state_hash())
+        copied_game = game.copy()
+        self.assertEqual(game.state_hash(), copied_game.state_hash())
+
+        copied_game.players[0].minions[0].damage(1, None)
+        self.assertNotEqual(game.state_hash(), copied_game.state_hash())
+        self.assertEqual(game.calculate_state_hash(True), game.state_hash())
+        self.assertEqual(copied_game.calculate_state_hash(True), copied_game.state_hash())
+
+        # Characters are compared with the attributes their parts of the hash were found from, so changing them
+        # directly still updates the hash
+        game.players[0].minions[0].health = 5
+        self.assertEqual(game.calculate_state_hash(), game.state_hash())
+        game.players[0].minions[0].taunt = True
+        self.assertEqual(game.calculate_state_hash(), game.state_hash())
+
+        # Everything else kept alongside the hash is checked the same way, apart from the hash of each deck
+        game.players[0].mana = 7
+        game.players[0].hand.pop()
+        self.assertEqual(game.calculate_state_hash(), game.state_hash())
+        game.players[0].deck.cards[game.players[0].deck.used.index(False)] = Wrath()
+        self.assertNotEqual(game.calculate_state_hash(True), game.state_hash())
+        Game.check_state_hash = True
+        try:
+            self.assertRaises(GameException, game.state_hash)
+            game.players[0].deck.state_hash = game.players[0].deck.calculate_state_hash()
+            self.assertEqual(game.calculate_state_hash(True), game.state_hash())
+        finally:
+            Game.check_state_hash = False
+
+    def test_state_hash_kept_up_to_date(self):
+        decks = [load_deck("zoo.hsdeck"), load_deck("example.hsdeck")]
+        specs = [([card.name for card in deck.cards], deck.character_class) for deck in decks]
+        Game.check_state_hash = True
+        try:
+            for seed in range(0, 4):
+                play_game(specs, [_HashCheckingAgent, _HashCheckingAgent], seed)
+                play_game(list(reversed(specs)), [_HashCheckingAgent, _HashCheckingAgent], seed)
+        finally:
+            Game.check_state_hash = False
+
+    def test_card_definitions(self):
+        first = card_lookup("Bloodfen Raptor")
+        second = card_lookup("Bloodfen Raptor")
+        self.assertIsNot(first, second)
+        self.assertIs(first.definition, second.definition)
+        self.assertIsNot(first.definition, card_lookup("River Crocolisk").definition)
+
+        for name in ["Bloodfen Raptor", "Moonfire", "Fiery War Axe", "Lightning Bolt"]:
+            card = card_lookup(name)
+            info = hearthbreaker.card_registry.registry.info(name)
+            self.assertEqual((info.mana, info.character_class, info.rarity, info.minion_type),
+                             (card.mana, card.character_class, card.rarity, getattr(card, "minion_type", None)))
+        self.assertEqual(1, card_lookup("Lightning Bolt").overload)
+        self.assertTrue(card_lookup("Moonfire").targetable)
+        self.assertRaises(AttributeError, setattr, first, "mana", 3)
+
+        # Per-play state is still kept on each card
+        first.cancel = True
+        self.assertFalse(second.cancel)
+
 
 class TestBinding(unittest.TestCase):
     def test_bind(self):
@@ -174,3 +525,105 @@ class TestBinding(unittest.TestCase):
         binder.trigger("test")
         event.assert_called_once_with(1, 5, 6)
         self.assertEqual(event2.call_count, 2)
+
+    def test_bind_during_trigger(self):
+        event = mock.Mock()
+        binder = Bindable()
+        binder.bind("test", lambda: binder.bind("test", event))
+        binder.trigger("test")
+        self.assertEqual(0, event.call_count)
+        binder.trigger("test")
+        self.assertEqual(1, event.call_count)
+
+    def test_unbind_during_trigger(self):
+        event = mock.Mock()
+        event2 = mock.Mock()
+        binder = Bindable()
+        binder.bind("test", lambda: binder.unbind("test", event))
+        binder.bind("test", event)
+        binder.bind("test", event2)
+        binder.trigger("test")
+        self.assertEqual(0, event.call_count)
+        self.assertEqual(1, event2.call_count)
+        self.assertEqual(2, len(binder.events["test"]))
+
+    def test_recursive_trigger(self):
+        calls = []
+
+        def recurse():
+            calls.append(1)
+            binder.trigger("test")
+
+        binder = Bindable()
+        binder.bind("test", recurse)
+        binder.bind_once("test", lambda: calls.append(2))
+        binder.trigger("test")
+        self.assertEqual([1, 2], calls)
+        self.assertEqual(1, len(binder.events["test"]))
+
+    def test_shared_empty_events(self):
+        event = mock.Mock()
+        binder = Bindable()
+        other_binder = Bindable()
+        self.assertIs(binder.events, other_binder.events)
+        self.assertRaises(TypeError, binder.events.update, {"test": ()})
+        self.assertIs(binder.events, copy.deepcopy(binder.events))
+
+        binder.bind("test", event)
+        binder.trigger("test")
+        other_binder.trigger("test")
+        self.assertEqual(1, event.call_count)
+        self.assertEqual(0, len(other_binder.events))
+        binder.unbind("test", event)
+        self.assertEqual(0, len(binder.events))
+
+
+class TestDeck(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+
+    def test_draw_order(self):
+        # The number chosen selects among the cards not yet drawn, in the order they were put in the deck
+        cards = [card_lookup(name) for name in ["Wisp", "Stonetusk Boar", "Arcane Intellect"] * 10]
+        deck = Deck(cards, CHARACTER_CLASS.MAGE)
+        used = [False] * 30
+        for step in range(0, 60):
+            drawn = [index for index in range(0, 30) if used[index]]
+            if step % 3 == 2 and len(drawn) > 0:
+                index = drawn[random.randint(0, len(drawn) - 1)]
+                deck.put_back(cards[index])
+                used[index] = False
+            else:
+                undrawn = [index for index in range(0, 30) if not used[index]]
+                choice = random.randint(0, len(undrawn) - 1)
+                self.assertIs(cards[undrawn[choice]], deck.draw(lambda low, high: choice))
+                used[undrawn[choice]] = True
+            self.assertEqual(used, deck.used)
+            self.assertEqual(used.count(False), deck.left)
+            self.assertEqual(deck.calculate_state_hash(), deck.state_hash)
+
+        # Putting back every card returns the deck to its original state
+        for index in range(0, 30):
+            if deck.used[index]:
+                deck.put_back(cards[index])
+        self.assertEqual(Deck(cards, CHARACTER_CLASS.MAGE).state_hash, deck.state_hash)
+
+    def test_take_and_put_back(self):
+        cards = [card_lookup("Wisp") for i in range(0, 30)]
+        deck = Deck(cards, CHARACTER_CLASS.MAGE)
+        self.assertIs(cards[5], deck.take(5))
+        self.assertRaises(GameException, deck.take, 5)
+        self.assertIs(cards[6], deck.draw(lambda low, high: 5))
+        self.assertRaises(GameException, deck.put_back, cards[7])
+        self.assertRaises(GameException, deck.put_back, card_lookup("Wisp"))
+        deck.put_back(cards[5])
+        self.assertEqual(29, deck.left)
+        self.assertIs(cards[5], deck.draw(lambda low, high: 5))
+
+        copied_deck = deck.copy()
+        drawn = copied_deck.draw(lambda low, high: 0)
+        self.assertIsNot(cards[0], drawn)
+        self.assertEqual("Wisp", drawn.name)
+        copied_deck.put_back(drawn)
+        self.assertEqual(28, copied_deck.left)
+        self.assertIs(cards[0], deck.draw(lambda low, high: 0))
@@ -0,0 +1,208 @@
+import io
+import json
+import os
+import random
+import re
+import tempfile
+import unittest
+
+from hearthbreaker.agents.basic_agents import RandomAgent, DoNothingBot
+from hearthbreaker.batch import load_deck, run_batch
+from hearthbreaker.cards import StonetuskBoar, Wisp, KnifeJuggler, ShatteredSunCleric, HarvestGolem
+from hearthbreaker.game_objects import Bindable, GameException, MinionCard
+from hearthbreaker.profiling import EventProfiler, CardProfiler, EVENTS
+from tests.agents.testing_agents import MinionPlayingAgent
+from tests.testing_utils import generate_game_for
+
+
+class TestEventProfiler(unittest.TestCase):
+    def test_events_up_to_date(self):
+        events = []
+        section = None
+        events_file = open("events.md", "r")
+        for line in events_file:
+            if line.startswith("##"):
+                section = (line[2:].strip(), [])
+                events.append(section)
+            elif line.strip().startswith("*") and section is not None:
+                section[1].append(re.match(r"\s*\*\s*(\w+)", line).group(1))
+        events_file.close()
+        self.assertEqual(events, EVENTS)
+
+    def test_trigger_counts(self):
+        times = iter(range(0, 1000))
+        bindable = Bindable()
+        bindable.bind("outer", lambda: bindable.trigger("inner"))
+        bindable.bind("outer", lambda: None)
+        bindable.bind("inner", lambda: None)
+
+        with EventProfiler(lambda: next(times)) as profiler:
+            bindable.trigger("outer")
+            bindable.trigger("inner")
+            bindable.trigger("unbound")
+
+        self.assertEqual(2, profiler.statistics["inner"].triggers)
+        self.assertEqual(2, profiler.statistics["inner"].handlers)
+        self.assertEqual(1, profiler.statistics["outer"].triggers)
+        self.assertEqual(2, profiler.statistics["outer"].handlers)
+        self.assertEqual(2, profiler.statistics["outer"].max_handlers)
+        self.assertEqual(1, profiler.statistics["unbound"].triggers)
+        self.assertEqual(0, profiler.statistics["unbound"].handlers)
+        # The outer trigger reads the clock at 0 and 3, the inner one at 1 and 2
+        self.assertEqual(3, profiler.statistics["outer"].total_time)
+        self.assertEqual(2, profiler.statistics["outer"].self_time)
+        self.assertEqual(2, profiler.statistics["inner"].total_time)
+        self.assertEqual(2, profiler.statistics["inner"].self_time)
+
+    def test_recursive_event(self):
+        times = iter(range(0, 1000))
+        bindable = Bindable()
+        bindable.bind("event", lambda: bindable.trigger("event"))
+        with EventProfiler(lambda: next(times)) as profiler:
+            bindable.trigger("event")
+
+        self.assertEqual(2, profiler.statistics["event"].triggers)
+        # Only the outer trigger counts towards the total, all of which is spent in this event
+        self.assertEqual(3, profiler.statistics["event"].total_time)
+        self.assertEqual(3, profiler.statistics["event"].self_time)
+
+    def test_trigger_restored(self):
+        trigger = Bindable.trigger
+        profiler = EventProfiler()
+        profiler.start()
+        self.assertIsNot(trigger, Bindable.trigger)
+        self.assertRaises(GameException, EventProfiler().start)
+        profiler.stop()
+        self.assertIs(trigger, Bindable.trigger)
+        self.assertRaises(GameException, profiler.stop)
+
+        try:
+            with EventProfiler():
+                raise ValueError()
+        except ValueError:
+            pass
+        self.assertIs(trigger, Bindable.trigger)
+
+    def test_game(self):
+        game = generate_game_for(StonetuskBoar, Wisp, RandomAgent, RandomAgent)
+        with EventProfiler() as profiler:
+            game.play_single_turn()
+            game.play_single_turn()
+            game.play_single_turn()
+        self.assertEqual(3, profiler.statistics["turn_started"].triggers)
+        self.assertEqual(3, profiler.statistics["turn_ended"].triggers)
+        self.assertGreater(profiler.statistics["card_drawn"].triggers, 0)
+
+    def test_output(self):
+        bindable = Bindable()
+        bindable.bind("turn_started", lambda: None)
+        with EventProfiler() as profiler:
+            bindable.trigger("turn_started")
+            bindable.trigger("custom_event")
+
+        profile = profiler.to_dict()
+        for section, events in EVENTS:
+            for event in events:
+                self.assertIn(event, profile)
+        self.assertEqual(1, profile["turn_started"]["handlers"])
+        self.assertEqual(0, profile["card_drawn"]["triggers"])
+        self.assertEqual("custom_event", profiler.events()[-1])
+
+        output = io.StringIO()
+        profiler.write_json(output)
+        self.assertEqual(profile, json.loads(output.getvalue()))
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            profiler.write_json(path)
+            json_file = open(path, "r")
+            self.assertEqual(profile, json.load(json_file))
+            json_file.close()
+        finally:
+            os.remove(path)
+
+        lines = profiler.table().split("\n")
+        self.assertEqual(3, len(lines))
+        self.assertTrue(lines[0].startswith("event"))
+        self.assertEqual(len(profile) + 1, len(profiler.table(all_events=True).split("\n")))
+
+    def test_batch(self):
+        zoo = load_deck("zoo.hsdeck")
+        example = load_deck("example.hsdeck")
+        serial = run_batch(zoo, example, games=4, processes=1, seed=1857, profile_events=True)
+        parallel = run_batch(zoo, example, games=4, processes=2, seed=1857, chunk_size=1, profile_events=True)
+        self.assertIsNone(run_batch(zoo, example, games=1, processes=1, seed=1857).event_profile)
+        self.assertEqual(sum(serial.lengths), serial.event_profile.statistics["turn_started"].triggers)
+        for event, statistics in serial.event_profile.statistics.items():
+            self.assertEqual(statistics.triggers, parallel.event_profile.statistics[event].triggers)
+            self.assertEqual(statistics.handlers, parallel.event_profile.statistics[event].handlers)
+            self.assertEqual(statistics.max_handlers, parallel.event_profile.statistics[event].max_handlers)
+
+
+class TestCardProfiler(unittest.TestCase):
+    def setUp(self):
+        random.seed(1857)
+
+    def test_card_attribution(self):
+        game = generate_game_for([KnifeJuggler, ShatteredSunCleric, HarvestGolem], StonetuskBoar, MinionPlayingAgent,
+                                 DoNothingBot)
+        with CardProfiler() as profiler:
+            for turn in range(0, 12):
+                game.play_single_turn()
+            golem = [minion for minion in game.players[0].minions if minion.card.name == "Harvest Golem"][0]
+            golem.die(None)
+            game.check_delayed()
+
+        self.assertEqual(2, profiler.statistics["Knife Juggler"].uses)
+        self.assertGreater(profiler.statistics["Knife Juggler"].handler_calls, 0)
+        self.assertGreater(profiler.statistics["Knife Juggler"].triggers, 0)
+        self.assertEqual(2, profiler.statistics["Shattered Sun Cleric"].uses)
+        self.assertEqual(2, profiler.statistics["Shattered Sun Cleric"].battlecries)
+        self.assertEqual(1, profiler.statistics["Harvest Golem"].uses)
+        self.assertEqual(1, profiler.statistics["Harvest Golem"].deathrattles)
+        self.assertIn("Damaged Golem", profiler.statistics)
+        for statistics in profiler.statistics.values():
+            self.assertGreaterEqual(statistics.total_time, statistics.self_time)
+
+        hottest = profiler.hottest(2, "uses")
+        self.assertEqual(["Knife Juggler", "Shattered Sun Cleric"], [name for name, values in hottest])
+        self.assertEqual(len(profiler.statistics) + 1, len(profiler.table().split("\n")))
+
+    def test_unbind(self):
+        game = generate_game_for(KnifeJuggler, StonetuskBoar, MinionPlayingAgent, DoNothingBot)
+        with CardProfiler():
+            for turn in range(0, 3):
+                game.play_single_turn()
+            juggler = game.players[0].minions[0]
+            self.assertEqual(1, len(game.players[0].events["after_minion_added"]))
+            juggler.silence()
+        self.assertNotIn("after_minion_added", game.players[0].events)
+
+    def test_methods_restored(self):
+        methods = (Bindable.trigger, Bindable.bind, Bindable.bind_once, MinionCard.use, KnifeJuggler.create_minion)
+        event_profiler = EventProfiler()
+        card_profiler = CardProfiler()
+        event_profiler.start()
+        card_profiler.start()
+        self.assertNotEqual(methods, (Bindable.trigger, Bindable.bind, Bindable.bind_once, MinionCard.use,
+                                      KnifeJuggler.create_minion))
+        self.assertRaises(GameException, event_profiler.stop)
+        card_profiler.stop()
+        event_profiler.stop()
+        self.assertEqual(methods, (Bindable.trigger, Bindable.bind, Bindable.bind_once, MinionCard.use,
+                                   KnifeJuggler.create_minion))
+
+    def test_batch(self):
+        zoo = load_deck("zoo.hsdeck")
+        example = load_deck("example.hsdeck")
+        plain = run_batch(zoo, example, games=4, processes=1, seed=1857)
+        serial = run_batch(zoo, example, games=4, processes=1, seed=1857, profile_cards=True)
+        parallel = run_batch(zoo, example, games=4, processes=2, seed=1857, chunk_size=1, profile_events=True,
+                             profile_cards=True)
+        self.assertIsNone(plain.card_profile)
+        self.assertEqual(plain.lengths, serial.lengths)
+        self.assertEqual(plain.lengths, parallel.lengths)
+        self.assertGreater(len(serial.card_profile.statistics), 0)
+        for card, statistics in serial.card_profile.statistics.items():
+            self.assertEqual(statistics.uses, parallel.card_profile.statistics[card].uses)
+            self.assertEqual(statistics.triggers, parallel.card_profile.statistics[card].triggers)
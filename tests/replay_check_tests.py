@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from hearthbreaker.replay_check import check_replays, check_replay, find_replays, fingerprint_replay, read_golden, \
+    write_golden, PASSED, DIVERGED, FAILED, NO_GOLDEN, UPDATED
+
+
+class TestReplayCheck(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def copy_replay(self, name, golden=True):
+        path = os.path.join(self.directory, name)
+        shutil.copy(os.path.join("tests/replays", name), path)
+        if golden:
+            shutil.copy(os.path.join("tests/replays", name + ".golden"), path + ".golden")
+        return path
+
+    def test_goldens_up_to_date(self):
+        results = list(check_replays("tests/replays", processes=2))
+        self.assertEqual(9, len(results))
+        self.assertEqual(sorted(find_replays("tests/replays")), sorted(result.path for result in results))
+        for result in results:
+            self.assertEqual(PASSED, result.status, str(result))
+            self.assertGreater(result.turns, 0)
+
+    def test_find_replays(self):
+        replays = find_replays("tests/replays")
+        self.assertIn("tests/replays/example.rep", replays)
+        self.assertIn(os.path.join("tests/replays/card_tests", "Shadowform.rep"), replays)
+        self.assertEqual(sorted(replays), replays)
+
+    def test_divergence(self):
+        path = self.copy_replay("example.rep")
+        turns = read_golden(path + ".golden")
+        self.assertEqual(turns, fingerprint_replay(path))
+        # The second fingerprint of the fifth turn follows the attack
+        turns[4][1] ^= 1
+        write_golden(turns, path + ".golden")
+
+        result = check_replay(path)
+        self.assertEqual(DIVERGED, result.status)
+        self.assertEqual(4, result.turn)
+        self.assertEqual(7, result.action)
+        self.assertEqual("attack(p1:0,p2)", result.action_text)
+        self.assertEqual(turns[4][1], result.expected)
+        self.assertEqual(turns[4][1] ^ 1, result.actual)
+        self.assertIn("attack(p1:0,p2)", str(result))
+
+        # A golden which stops early is reported at the first action it has no fingerprint for
+        write_golden(turns[0:3], path + ".golden")
+        result = check_replay(path)
+        self.assertEqual(DIVERGED, result.status)
+        self.assertEqual(3, result.turn)
+        self.assertEqual(4, result.action)
+        self.assertIsNone(result.expected)
+
+    def test_failure(self):
+        path = self.copy_replay("example.rep")
+        replay_file = open(path, "r")
+        contents = replay_file.read()
+        replay_file.close()
+        replay_file = open(path, "w")
+        replay_file.write(contents.replace("attack(p1:0,p2)", "attack(p1:4,p2)"))
+        replay_file.close()
+
+        result = check_replay(path)
+        self.assertEqual(FAILED, result.status)
+        self.assertEqual(4, result.turn)
+        self.assertEqual(7, result.action)
+        self.assertEqual("attack(p1:4,p2)", result.action_text)
+        self.assertIn("IndexError", result.error)
+
+    def test_update(self):
+        self.copy_replay("example.rep", False)
+        self.copy_replay("stonetusk_power.rep", False)
+        self.assertEqual([NO_GOLDEN, NO_GOLDEN], [result.status for result in check_replays(self.directory, 1)])
+        self.assertEqual([UPDATED, UPDATED], [result.status for result in check_replays(self.directory, 2, True)])
+        self.assertEqual([PASSED, PASSED], [result.status for result in check_replays(self.directory, 1)])
+        self.assertEqual(read_golden("tests/replays/example.rep.golden"),
+                         read_golden(os.path.join(self.directory, "example.rep.golden")))
@@ -1,12 +1,15 @@
 import unittest
-from io import StringIO
+from io import StringIO, BytesIO
 from os import listdir
 import re
 import random
 
-from hearthbreaker.replay import Replay, RecordingGame, SavedGame
-from hearthbreaker.agents.basic_agents import PredictableBot
+from hearthbreaker.binary_replay import BinaryReplayWriter, BinaryReplayReader, is_binary
+from hearthbreaker.replay import Replay, RecordingGame, SavedGame, ReplayException, GameSnapshot, take_snapshots
+from hearthbreaker.agents.basic_agents import PredictableBot, RandomAgent
+from hearthbreaker.batch import load_deck
 from hearthbreaker.constants import CHARACTER_CLASS
+from hearthbreaker.game_objects import Deck
 from hearthbreaker.cards import *
 import hearthbreaker.game_objects
 
@@ -66,3 +69,178 @@ class TestReplay(unittest.TestCase):
         self.assertEqual(panther.health, 3)
         self.assertEqual(panther.calculate_attack(), 4)
         self.assertEqual(panther.index, 0)
+
+    def test_binary_conversion(self):
+        self.maxDiff = None
+        for rfile in filter(lambda file: re.compile(r'.*\.rep$').match(file), listdir("tests/replays")):
+            replay = Replay()
+            replay.parse_replay("tests/replays/" + rfile)
+            text = StringIO()
+            replay.write_replay(text)
+
+            binary = BytesIO()
+            BinaryReplayWriter(binary).write_replay(replay)
+            self.assertLess(len(binary.getvalue()), len(text.getvalue()))
+            binary.seek(0)
+            self.assertTrue(is_binary(binary))
+            converted = BinaryReplayReader(binary).read_replay()
+            output = StringIO()
+            converted.write_replay(output)
+            self.assertEqual(text.getvalue(), output.getvalue())
+
+            binary_game = SavedGame(BytesIO(binary.getvalue()))
+            binary_game.start()
+            text_game = SavedGame("tests/replays/" + rfile)
+            text_game.start()
+            self.assertEqual(text_game.calculate_state_hash(True), binary_game.calculate_state_hash(True))
+
+        self.assertFalse(is_binary("tests/replays/example.rep"))
+        self.assertRaises(ReplayException, BinaryReplayReader, BytesIO(b"deck(Mage,Wisp)"))
+
+    def test_recording_binary_game(self):
+        random.seed(9876)
+        deck1 = hearthbreaker.game_objects.Deck([StonetuskBoar()] * 30, CHARACTER_CLASS.MAGE)
+        deck2 = hearthbreaker.game_objects.Deck([Naturalize()] * 30, CHARACTER_CLASS.DRUID)
+        binary = BytesIO()
+        game = RecordingGame([deck1, deck2], [PredictableBot(), PredictableBot()], BinaryReplayWriter(binary))
+        game.start()
+        # The replay is written a turn at a time, rather than kept
+        self.assertEqual([], game.replay.actions)
+        self.assertEqual([], game.replay.random_numbers)
+
+        binary.seek(0)
+        output = StringIO()
+        BinaryReplayReader(binary).read_replay().write_replay(output)
+        f = open("tests/replays/stonetusk_innervate.rep", 'r')
+        self.assertEqual(f.read(), output.getvalue())
+        f.close()
+
+        binary.seek(0)
+        saved_game = SavedGame(binary)
+        saved_game.start()
+        self.assertEqual(game.calculate_state_hash(True), saved_game.calculate_state_hash(True))
+
+    def record_game(self, writer=None, seed=1857, decks=None):
+        # Plays a game between random agents, returning the recording and the hash of the state at the start of each
+        # turn
+        random.seed(seed)
+        if decks is None:
+            decks = [load_deck("zoo.hsdeck"), load_deck("example.hsdeck")]
+        game = RecordingGame(decks, [RandomAgent(), RandomAgent()], writer)
+        game.pre_game()
+        game.current_player = game.players[1]
+        hashes = []
+        while not game.game_ended:
+            hashes.append(game.calculate_state_hash(True))
+            game.play_single_turn()
+        return game, hashes
+
+    def test_recorded_game_replays(self):
+        # Several games are played, as only some of them have actions taken after a hero has died
+        for seed in range(0, 40):
+            game, hashes = self.record_game(seed=seed)
+            output = StringIO()
+            game.replay.write_replay(output)
+            saved_game = SavedGame(StringIO(output.getvalue()))
+            saved_game.seek(0)
+            for turn_hash in hashes:
+                self.assertEqual(turn_hash, saved_game.calculate_state_hash(True), seed)
+                saved_game.play_single_turn()
+            self.assertTrue(saved_game.game_ended)
+            self.assertEqual(game.calculate_state_hash(True), saved_game.calculate_state_hash(True), seed)
+
+    def test_seek(self):
+        binary = BytesIO()
+        game, hashes = self.record_game(BinaryReplayWriter(binary))
+        last_turn = len(hashes)
+
+        saved_game = SavedGame(BytesIO(binary.getvalue()), checkpoint_interval=4)
+        saved_game.seek(7)
+        self.assertEqual(7, saved_game.turn)
+        self.assertEqual(hashes[7], saved_game.calculate_state_hash(True))
+        saved_game.seek(100)
+        self.assertTrue(saved_game.game_ended)
+        self.assertEqual(last_turn, saved_game.turn)
+        for turn in [last_turn - 1, 9, 0, 5, 13, 4, last_turn - 2]:
+            saved_game.seek(turn)
+            self.assertEqual(turn, saved_game.turn)
+            self.assertEqual(hashes[turn], saved_game.calculate_state_hash(True))
+
+        # Without a checkpoint interval, an earlier turn is found by playing again from the start
+        saved_game = SavedGame(BytesIO(binary.getvalue()))
+        saved_game.start()
+        saved_game.seek(6)
+        self.assertEqual(hashes[6], saved_game.calculate_state_hash(True))
+
+    def test_seek_snapshots(self):
+        class CountingGame(SavedGame):
+            def play_single_turn(self):
+                self.turns_played += 1
+                super().play_single_turn()
+
+        misdirection_decks = [Deck([Misdirection(), StonetuskBoar(), BloodfenRaptor(), Wolfrider()] * 5 +
+                                   [ArcaneShot()] * 10, CHARACTER_CLASS.HUNTER),
+                              Deck([NobleSacrifice(), StonetuskBoar(), BloodfenRaptor(), ChillwindYeti()] * 5 +
+                                   [Wolfrider()] * 10, CHARACTER_CLASS.PALADIN)]
+        for game, hashes in [self.record_game(), self.record_game(seed=0, decks=misdirection_decks)]:
+            text = StringIO()
+            game.replay.write_replay(text)
+            replay = Replay()
+            replay.parse_replay(StringIO(text.getvalue()))
+            replay.snapshots = take_snapshots(StringIO(text.getvalue()), 4)
+            self.assertEqual(list(range(4, len(hashes), 4)), [snapshot.turn for snapshot in replay.snapshots])
+            text = StringIO()
+            replay.write_replay(text)
+            binary = BytesIO()
+            BinaryReplayWriter(binary).write_replay(replay)
+            binary.seek(0)
+            output = StringIO()
+            BinaryReplayReader(binary).read_replay().write_replay(output)
+            self.assertEqual(text.getvalue(), output.getvalue())
+
+            for replay_file in [lambda: StringIO(text.getvalue()), lambda: BytesIO(binary.getvalue())]:
+                for turn in range(0, len(hashes)):
+                    saved_game = CountingGame(replay_file())
+                    saved_game.turns_played = 0
+                    saved_game.seek(turn)
+                    self.assertEqual(hashes[turn], saved_game.calculate_state_hash(True), turn)
+                    # Only the turns since the latest snapshot are played
+                    self.assertEqual(turn % 4 if turn >= 4 else turn, saved_game.turns_played)
+                saved_game.seek(100)
+                self.assertEqual(game.calculate_state_hash(True), saved_game.calculate_state_hash(True))
+
+            # A snapshot which can't be loaded, or which doesn't give the state it was taken in, is passed over
+            replay.snapshots = [GameSnapshot(4, replay.snapshots[0].state_hash, b"Not a snapshot"),
+                                GameSnapshot(8, replay.snapshots[1].state_hash ^ 1, replay.snapshots[1].data)]
+            text = StringIO()
+            replay.write_replay(text)
+            saved_game = CountingGame(StringIO(text.getvalue()))
+            saved_game.turns_played = 0
+            saved_game.seek(9)
+            self.assertEqual(hashes[9], saved_game.calculate_state_hash(True))
+            self.assertEqual(9, saved_game.turns_played)
+
+    def test_seek_misdirection(self):
+        # Misdirection and Noble Sacrifice replace the agent's choose_target until the next target is chosen, which is
+        # undone when the game is rolled back
+        decks = [Deck([Misdirection(), Misdirection(), StonetuskBoar(), BloodfenRaptor(), ArcaneShot(),
+                       Wolfrider()] * 5, CHARACTER_CLASS.HUNTER),
+                 Deck([NobleSacrifice(), NobleSacrifice(), StonetuskBoar(), BloodfenRaptor(), Wolfrider(),
+                       ChillwindYeti()] * 5, CHARACTER_CLASS.PALADIN)]
+        game, hashes = self.record_game(seed=0, decks=decks)
+        output = StringIO()
+        game.replay.write_replay(output)
+        last_turn = len(hashes)
+
+        saved_game = SavedGame(StringIO(output.getvalue()), checkpoint_interval=3)
+        revealed = []
+        for player in saved_game.players:
+            player.bind("secret_revealed", lambda secret: revealed.append(secret.name))
+        saved_game.seek(0)
+        for turn_hash in hashes:
+            self.assertEqual(turn_hash, saved_game.calculate_state_hash(True))
+            saved_game.play_single_turn()
+        self.assertIn("Misdirection", revealed)
+        for turn in list(range(last_turn - 1, -1, -2)) + list(range(0, last_turn, 3)):
+            saved_game.seek(turn)
+            self.assertEqual(hashes[turn], saved_game.calculate_state_hash(True), turn)
@@ -25,9 +25,7 @@ class StackedDeck(Deck):
     def draw(self, random_func):
         for card_index in range(0, 30):
             if not self.used[card_index]:
-                self.used[card_index] = True
-                self.left -= 1
-                return self.cards[card_index]
+                return self.take(card_index)
 
 
 def generate_game_for(card1, card2, first_agent_type, second_agent_type):
@@ -0,0 +1,20 @@
+import unittest
+
+from hearthbreaker import zobrist
+
+
+class TestZobrist(unittest.TestCase):
+    def test_known_values(self):
+        # These must not change between interpreters or platforms, or the replay goldens would only pass on some
+        self.assertEqual(0xe220a8397b1dcdaf, zobrist.mix(()))
+        self.assertEqual(0x61b32789536498aa, zobrist.mix((1, -2, True, False)))
+        self.assertEqual(0xbf65bcd4388ab2a1, zobrist.key(("minion", 0, 1, "Wisp")))
+
+    def test_mix(self):
+        self.assertEqual(zobrist.mix((1, 2)), zobrist.mix((1, 2)))
+        self.assertEqual(zobrist.mix((1, True)), zobrist.mix((1, 1)))
+        self.assertNotEqual(zobrist.mix((1, 2)), zobrist.mix((2, 1)))
+        self.assertNotEqual(zobrist.mix((0,)), zobrist.mix((0, 0)))
+        self.assertNotEqual(zobrist.mix((-1,)), zobrist.mix((1,)))
+        for value in [zobrist.mix(()), zobrist.mix((-1, 1 << 70))]:
+            self.assertEqual(value, value & zobrist.MASK)